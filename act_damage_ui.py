@@ -5,6 +5,9 @@ ACT伤害统计UI界面 - Cyberpunk 2077风格
 显示从Flask服务器获取的实时伤害数据
 """
 
+# 启动时间线：最先导入，从这里开始计时（导入计时只在 ACTDamageUI 构造期间进行）
+from startup_tracer import startup_tracer
+
 import ctypes
 import queue
 import tkinter as tk
@@ -20,14 +23,8 @@ import colorsys
 import random
 from datetime import datetime
 import tempfile
-import base64
-import zipfile
-import urllib.request
 from urllib.parse import urljoin
-import webbrowser
-import io
 import winreg  # 用于注册表操作
-import subprocess
 import shutil
 
 try:
@@ -256,9 +253,31 @@ class ACTDamageUI:
     """ACT伤害统计UI界面 - Cyberpunk风格"""
 
     def setup_fonts(self):
-        """设置字体配置 - 强制优先使用 Orbitron"""
+        """设置字体配置 - 强制优先使用 Orbitron，字体缓存命中时直接使用上次解析的字体"""
         # 直接使用 Orbitron 作为首选字体（延迟验证）
         primary_font = "Orbitron"
+        self._font_tuples = {}      # (字号, 粗细) -> 字体元组
+        self._available_fonts = {}  # 候选列表 -> get_available_font 结果
+        self.font_resolved = None   # 缓存命中或探测完成后的解析结果
+        from font_cache import FontCache, font_fingerprint
+        self.font_cache = FontCache(os.path.join(os.getcwd(), "font_cache.json"))
+
+        cached = None
+        if not os.environ.get("SRDC_NO_FONT_CACHE"):
+            try:
+                cached = self.font_cache.load(font_fingerprint(self.get_resource_path("fonts")))
+            except Exception as e:
+                print(f"[FONT_WARNING] 读取字体缓存失败: {e}")
+        if cached:
+            primary_font = cached["family"]
+            self.font_resolved = cached
+            self._available_fonts = dict(cached.get("available") or {})
+            for size, weight in cached.get("sizes") or []:
+                self._font_tuples[(size, weight)] = (primary_font, size, weight)
+            startup_tracer.note(
+                f"字体缓存命中: {primary_font}，跳过字体探测（节省约 {cached.get('probe_ms', 0):.0f}ms）")
+        else:
+            startup_tracer.note("字体缓存未命中，首帧后探测字体")
 
         # 先设置字体配置，稍后验证
         self.fonts = {
@@ -275,7 +294,12 @@ class ACTDamageUI:
         print(f"[FONT_INFO] 字体配置完成，将使用: {primary_font}")
 
     def delayed_font_verification(self):
-        """延迟字体验证（在窗口创建后）"""
+        """延迟字体验证（在窗口创建后），字体缓存命中时跳过"""
+        if self.font_resolved is not None:
+            print(f"[FONT_INFO] 使用缓存的字体解析结果: {self.font_resolved['family']}")
+            return
+
+        probe_start = time.perf_counter()
         try:
             # 尝试加载 Orbitron 字体
             self.load_embedded_font()
@@ -283,6 +307,7 @@ class ACTDamageUI:
             # 验证 Orbitron 是否真正可用
             if self.verify_font_available("Orbitron"):
                 print("[FONT_SUCCESS] Orbitron 字体验证成功")
+                self.save_font_resolution(probe_start)
                 return
             else:
                 print("[FONT_WARNING] Orbitron 字体验证失败，但将继续尝试使用")
@@ -291,9 +316,27 @@ class ACTDamageUI:
 
         except Exception as e:
             print(f"[FONT_ERROR] 字体验证过程出错: {e}")
-            # 出错时使用备用字体
+            # 出错时使用备用字体（不缓存，下次启动继续尝试 Orbitron）
             self.use_fallback_font()
 
+    def save_font_resolution(self, probe_start):
+        """保存本次字体探测结果，下次启动指纹不变时跳过探测
+
+        只在 Orbitron 验证成功时调用；验证失败或出错改用备用字体时不缓存，下次启动继续尝试安装。
+        """
+        try:
+            probe_ms = (time.perf_counter() - probe_start) * 1000
+            family = self.fonts["normal"][0]
+            sizes = sorted([size, weight] for size, weight in self._font_tuples)
+            # 探测过程中可能安装了字体，指纹在探测之后计算
+            from font_cache import font_fingerprint
+            fingerprint = font_fingerprint(self.get_resource_path("fonts"))
+            self.font_cache.save(fingerprint, family, probe_ms, self._available_fonts, sizes)
+            self.font_resolved = {"family": family, "probe_ms": probe_ms}
+            print(f"[FONT_INFO] 字体探测耗时 {probe_ms:.0f}ms，解析结果已缓存: {family}")
+        except Exception as e:
+            print(f"[FONT_WARNING] 缓存字体解析结果失败: {e}")
+
     def use_fallback_font(self):
         """使用备用字体"""
         backup_fonts = ["Consolas", "Courier New", "monospace"]
@@ -304,6 +347,7 @@ class ACTDamageUI:
             size = self.fonts[key][1]
             weight = self.fonts[key][2]
             self.fonts[key] = (selected_font, size, weight)
+        self._font_tuples.clear()
 
         print(f"[FONT_FALLBACK] 切换到备用字体: {selected_font}")
 
@@ -326,11 +370,14 @@ class ACTDamageUI:
             return False
 
     def get_font(self, size, weight="normal"):
-        """动态获取配置的字体"""
+        """动态获取配置的字体（按字号和粗细复用已解析的元组）"""
         if hasattr(self, 'fonts') and self.fonts:
-            # 获取基础字体名称
-            font_family = self.fonts["normal"][0]
-            return (font_family, size, weight)
+            font_tuple = self._font_tuples.get((size, weight))
+            if font_tuple is None:
+                # 获取基础字体名称
+                font_family = self.fonts["normal"][0]
+                font_tuple = self._font_tuples[(size, weight)] = (font_family, size, weight)
+            return font_tuple
         else:
             # 如果字体还未初始化，强制使用 Orbitron
             return ("Orbitron", size, weight)
@@ -351,8 +398,6 @@ class ACTDamageUI:
         )
 
         def draw_shadow_text():
-            canvas.delete("all")
-
             # 获取画布尺寸
             canvas_width = canvas.winfo_width()
             canvas_height = canvas.winfo_height()
@@ -372,41 +417,8 @@ class ACTDamageUI:
                     x = canvas_width // 2
                     y = canvas_height // 2
 
-                # 绘制多层阴影（渐变效果）
-                shadow_layers = [
-                    (3, 3, "#000000", 0.8),
-                    (2, 2, "#111111", 0.6),
-                    (1, 1, "#222222", 0.4)
-                ]
-
-                for dx, dy, shadow_color, alpha in shadow_layers:
-                    canvas.create_text(
-                        x + dx, y + dy,
-                        text=text,
-                        font=font_tuple,
-                        fill=shadow_color,
-                        anchor=anchor
-                    )
-
-                # 绘制边框效果（使用深灰色）
-                border_color = "#333333"
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                    canvas.create_text(
-                        x + dx, y + dy,
-                        text=text,
-                        font=font_tuple,
-                        fill=border_color,
-                        anchor=anchor
-                    )
-
-                # 绘制主文字
-                canvas.create_text(
-                    x, y,
-                    text=text,
-                    font=font_tuple,
-                    fill=fg_color,
-                    anchor=anchor
-                )
+                # 多层阴影（渐变效果）、深灰色边框和主文字，尺寸变化时原地移动
+                self.shadow_text.draw(canvas, "text", x, y, text, font_tuple, fg_color, anchor=anchor)
 
         # 绑定配置事件以重绘
         def safe_draw():
@@ -422,7 +434,11 @@ class ACTDamageUI:
         return canvas
 
     def get_available_font(self, font_list):
-        """检测系统中可用的字体"""
+        """检测系统中可用的字体（结果按候选列表缓存，随字体缓存保存）"""
+        cache_key = "|".join(font_list)
+        if cache_key in self._available_fonts:
+            return self._available_fonts[cache_key]
+
         import tkinter.font as tkFont
 
         # 首先尝试加载 Orbitron 字体
@@ -437,11 +453,13 @@ class ACTDamageUI:
 
                 # 如果实际字体家族与请求的相同（或者是已知的映射），则字体可用
                 if font_name.lower() in actual_family.lower() or actual_family != "TkDefaultFont":
+                    self._available_fonts[cache_key] = font_name
                     return font_name
             except:
                 continue
 
         # 如果都不可用，返回系统默认等宽字体
+        self._available_fonts[cache_key] = "monospace"
         return "monospace"
 
     def load_jason_config(self):
@@ -517,94 +535,74 @@ class ACTDamageUI:
 
     def advance_jason_phase(self):
         """推进JASON阶段"""
-        # 获取最大阶段数
-        max_phases = 3  # 默认值
-        if self.current_act_config and 'jason_phases' in self.current_act_config:
-            max_phases = len(self.current_act_config['jason_phases'])
-
-        if self.current_jason_phase < max_phases:
-            # 先清理当前（旧）阶段的警告状态
-            current_phase = self.current_jason_phase
-
-            # 清空当前阶段的警告状态（旧的单次触发）
-            if hasattr(self, 'triggered_warnings'):
-                phase_warnings_to_remove = [
-                    key for key in self.triggered_warnings
-                    if key.startswith(f"phase_{current_phase}_warning_")
-                ]
-                for key in phase_warnings_to_remove:
-                    self.triggered_warnings.discard(key)
-
-            # 清空当前阶段的重复警告状态
-            if hasattr(self, 'warning_triggers'):
-                phase_warning_triggers_to_remove = [
-                    key for key in self.warning_triggers
-                    if key.startswith(f"phase_{current_phase}_warning_")
-                ]
-                for key in phase_warning_triggers_to_remove:
-                    del self.warning_triggers[key]
-
-            # 然后推进到下一阶段
-            self.current_jason_phase += 1
-            self.jason_phase_start_time = time.time()
-            self.jason_phases_completed.append({
-                "phase": self.current_jason_phase - 1,
-                "completed_at": time.time()
-            })
-            print(f"[DEBUG] JASON阶段推进到: {self.current_jason_phase}")
-
-            # 更新所有显示JASON信息的窗口
-            self.update_jason_displays()
-        else:
-            print(f"[DEBUG] JASON已达到最高阶段 ({max_phases})")
+        self.jason_machine.advance(time.time(), self.total_damage)
 
     def reset_jason_rage_time(self):
         """重置JASON暴走时间"""
-        current_time = time.time()
-        self.jason_rage_start_time = current_time
-        self.current_jason_phase = 1
-        self.jason_phase_start_time = current_time
-        self.jason_phases_completed = []
-        self.jason_combat_start_time = current_time
-
-        # 清空所有警告状态
-        if hasattr(self, 'triggered_warnings'):
-            self.triggered_warnings.clear()
-        if hasattr(self, 'warning_triggers'):
-            self.warning_triggers.clear()
-        # 安全获取total_damage
-        self.jason_phase_damage_start = getattr(self, 'total_damage', 0)
-        # 清空已触发的警告
-        self.triggered_warnings = set()
+        self.jason_machine.reset_rage(time.time(), self.total_damage)
         print("[DEBUG] JASON暴走时间已重置")
-        # 更新所有显示JASON信息的窗口
-        self.update_jason_displays()
 
     def set_jason_phase(self, phase_id):
         """直接设置JASON阶段"""
-        if 1 <= phase_id <= 3:
-            self.current_jason_phase = phase_id
-            self.jason_phase_start_time = time.time()
-            print(f"[DEBUG] JASON阶段设置为: {self.current_jason_phase}")
-            self.update_jason_displays()
+        self.jason_machine.set_phase(phase_id, time.time(), self.total_damage)
+
+    def compile_jason_phases(self, config, machine=None):
+        """加载ACT配置时把jason_phases编译为阶段状态机，保留当前阶段进度
+
+        machine: 热重载时在后台线程中预先编译好的状态机
+        """
+        from jason_phase_machine import JasonPhaseMachine
+        try:
+            config = config or {}
+            if machine is None:
+                machine = JasonPhaseMachine(
+                    config.get("jason_phases"), config.get("total_duration", 600))
+            machine.load_state(
+                self.current_jason_phase, self.jason_combat_start_time,
+                self.jason_phase_start_time, self.jason_rage_start_time,
+                self.jason_phase_damage_start, time.time(), self.total_damage)
+        except Exception as e:
+            print(f"[DEBUG] 编译JASON阶段配置失败: {e}")
+            machine = JasonPhaseMachine()
+        machine.subscribe(self._on_jason_phase_event)
+        self.jason_machine = machine
+        self._sync_jason_state()
+        print(f"[DEBUG] JASON阶段状态机已编译: {machine.max_phase} 个阶段")
+
+    def _sync_jason_state(self):
+        """把状态机的当前状态同步到界面使用的属性"""
+        machine = self.jason_machine
+        self.current_jason_phase = machine.phase
+        self.jason_phase_start_time = machine.phase_start
+        self.jason_combat_start_time = machine.combat_start
+        self.jason_rage_start_time = machine.rage_start
+        self.jason_phase_damage_start = machine.phase_damage_start
+        self.jason_phases_completed = machine.completed
+
+    def _on_jason_phase_event(self, event):
+        """订阅阶段状态机事件：阶段变化刷新显示，警告走提醒系统"""
+        if event["type"] == "warning":
+            self._trigger_warning(event["message"], event["color"], event["sound"])
+            return
+
+        self._sync_jason_state()
+        print(f"[DEBUG] JASON阶段推进到: {self.current_jason_phase}")
+        self.update_jason_displays()
+
+        if event.get("reason") == "rage_reset":
+            # 重置暴走时间即新的一次开怪
+            self.encounter_segmenter.split(event["time"], "phase_reset")
+
+        if event.get("reason") == "rage_countdown":
+            self.speak_text(
+                f"暴走前{event.get('seconds_before_rage', 60)}秒，进入三阶段！", source_type="phase")
 
     def get_jason_phase_info(self):
         """获取当前JASON阶段信息"""
-        # 首先检查动态加载的配置
-        if self.current_act_config and 'jason_phases' in self.current_act_config:
-            jason_phases = self.current_act_config['jason_phases']
-
-            # 检查新格式：直接的阶段数组
-            if isinstance(jason_phases, list):
-                if 0 < self.current_jason_phase <= len(jason_phases):
-                    return jason_phases[self.current_jason_phase - 1]
-
-            # 检查旧格式：包含phase_definitions的对象
-            elif isinstance(jason_phases, dict) and 'phase_definitions' in jason_phases:
-                phase_definitions = jason_phases['phase_definitions']
-                for phase in phase_definitions:
-                    if phase.get("id") == self.current_jason_phase:
-                        return phase
+        # 首先使用已编译的ACT配置（兼容阶段数组和phase_definitions两种格式）
+        phase_info = self.jason_machine.phase_info(self.current_jason_phase)
+        if phase_info:
+            return phase_info
 
         # 回退到旧的配置格式（兼容性）
         phase_definitions = self.jason_config.get(
@@ -615,19 +613,8 @@ class ACTDamageUI:
         return {"id": self.current_jason_phase, "name": f"阶段{self.current_jason_phase}", "color": "#ffffff"}
 
     def get_team_total_damage(self):
-        """获取队伍总伤害"""
-        try:
-            if hasattr(self, 'current_data') and self.current_data:
-                user_data = self.current_data.get("user", {})
-                team_total = 0
-                for uid, user_info in user_data.items():
-                    total_damage = user_info.get(
-                        "total_damage", {}).get("total", 0)
-                    team_total += total_damage
-                return team_total
-            return 0
-        except Exception:
-            return 0
+        """获取队伍总伤害（由DamageTracker增量维护）"""
+        return self.damage_tracker.team_total
 
     def format_damage_number(self, damage):
         """格式化伤害数字，超过1000显示K，超过1000000显示M"""
@@ -644,6 +631,12 @@ class ACTDamageUI:
         except:
             return "0"
 
+    def format_rolling_dps(self, uid, windows=None):
+        """滚动窗口DPS文本，如 "5s:1.2K 30s:980" """
+        rolling = self.rolling_dps.get(uid)
+        return " ".join(f"{window}s:{self.format_damage_number(rolling[window])}"
+                        for window in (windows or self.rolling_dps.windows))
+
     def update_jason_displays(self):
         """更新所有显示JASON信息的窗口"""
         # 更新所有timer窗口中的JASON信息
@@ -662,110 +655,26 @@ class ACTDamageUI:
                     pass
 
     def check_jason_auto_advance(self):
-        """检查JASON阶段自动推进条件"""
-        # 使用动态加载的配置，而不是旧的jason_config
-        if not self.current_act_config or 'jason_phases' not in self.current_act_config:
-            return
-
-        jason_phases = self.current_act_config.get("jason_phases", {})
-        if not jason_phases:
-            return
-
+        """检查JASON阶段自动推进条件（数据更新时调用）"""
+        machine = self.jason_machine
         current_time = time.time()
 
         # 初始化战斗开始时间
-        if self.jason_combat_start_time is None:
-            self.jason_combat_start_time = current_time
-            self.jason_phase_start_time = current_time
+        if machine.combat_start is None:
+            machine.start_combat(current_time, self.total_damage)
+            self._sync_jason_state()
             return
 
-        # 检查阶段警告
-        self.check_phase_warnings(current_time)
+        # 时间推进、暴走前推进和阶段警告
+        machine.tick(current_time, self.total_damage)
 
-        # 检查时间推进（如果启用）
-        time_config = jason_phases.get("time_based_advance", {})
-        if time_config.get("enabled", False):
-            self.check_time_based_advance(current_time)
-
-        # 检查伤害推进（如果启用）
-        damage_config = jason_phases.get("damage_based_advance", {})
-        if damage_config.get("enabled", False) and self.jason_auto_advance_enabled:
-            print(f"[DEBUG] 调用伤害推进检查，当前阶段={self.current_jason_phase}")
-            self.check_damage_based_advance()
+        # 伤害推进（如果启用）
+        if machine.damage_advance and self.jason_auto_advance_enabled:
+            machine.on_damage(self.total_damage, current_time)
 
     def check_phase_warnings(self, current_time):
-        """检查当前阶段的警告（支持重复触发）"""
-        # 使用战斗开始时间而不是阶段开始时间
-        if self.jason_combat_start_time is None:
-            return
-
-        # 获取当前阶段信息
-        phase_info = self.get_jason_phase_info()
-        if not phase_info:
-            return
-
-        # 计算战斗开始以来经过的时间（这是警告时间的基准）
-        combat_elapsed = current_time - self.jason_combat_start_time
-
-        # 初始化警告触发记录
-        if not hasattr(self, 'warning_triggers'):
-            self.warning_triggers = {}
-
-        # 检查当前阶段的警告
-        warnings = phase_info.get("warnings", [])
-        for i, warning in enumerate(warnings):
-            warning_time = warning.get("time", 0)  # 相对于战斗开始的时间
-            warning_message = warning.get("message", "")
-            warning_color = warning.get("color", "yellow")
-            warning_sound = warning.get("sound", False)
-            warning_interval = warning.get("interval", None)  # 重复间隔（秒）
-
-            # 创建警告的唯一标识符
-            warning_key = f"phase_{self.current_jason_phase}_warning_{i}"
-
-            # 检查是否到了首次触发时间
-            if combat_elapsed >= warning_time:
-
-                # 如果没有interval，使用旧的单次触发逻辑
-                if warning_interval is None:
-                    if not hasattr(self, 'triggered_warnings'):
-                        self.triggered_warnings = set()
-
-                    if warning_key not in self.triggered_warnings:
-                        self.triggered_warnings.add(warning_key)
-                        print(
-                            f"[DEBUG] 触发单次警告: {warning_message} (战斗时间: {combat_elapsed:.1f}s)")
-                        self._trigger_warning(
-                            warning_message, warning_color, warning_sound)
-
-                else:
-                    # 使用重复触发逻辑
-                    time_since_first_trigger = combat_elapsed - warning_time
-
-                    # 只在第一次触发时间之后处理重复
-                    if time_since_first_trigger >= 0:
-                        # 计算应该触发的次数（包括首次）
-                        expected_triggers = int(
-                            time_since_first_trigger / warning_interval) + 1
-
-                        # 检查实际触发次数
-                        actual_triggers = self.warning_triggers.get(
-                            warning_key, 0)
-
-                        # 如果需要触发
-                        if expected_triggers > actual_triggers:
-                            # 检查当前时间是否正好在触发点附近（±0.5秒容差）
-                            trigger_points = [
-                                warning_time + n * warning_interval for n in range(expected_triggers)]
-                            should_trigger = any(
-                                abs(combat_elapsed - point) < 0.5 for point in trigger_points)
-
-                            if should_trigger:
-                                self.warning_triggers[warning_key] = expected_triggers
-                                print(
-                                    f"[DEBUG] 触发重复警告: {warning_message} (战斗时间: {combat_elapsed:.1f}s, 第{expected_triggers}次)")
-                                self._trigger_warning(
-                                    warning_message, warning_color, warning_sound)
+        """检查当前阶段的警告和时间截止（计时器每秒调用）"""
+        self.jason_machine.tick(current_time, self.total_damage)
 
     def _trigger_warning(self, message, color, sound):
         """触发警告的通用方法"""
@@ -793,248 +702,16 @@ class ACTDamageUI:
 
     def _show_warning_in_prominent_mode(self, message, color):
         """在明显模式窗口中显示警告"""
-        try:
-            print(f"[DEBUG] 尝试在明显模式显示警告: {message}")
-
-            # 使用全局timer窗口列表查找
-            if hasattr(self, 'timer_windows') and self.timer_windows:
-                print(f"[DEBUG] 找到 {len(self.timer_windows)} 个timer窗口")
-                for i, timer_window in enumerate(self.timer_windows):
-                    try:
-                        print(f"[DEBUG] 检查timer窗口 {i}")
-                        if timer_window and timer_window.winfo_exists():
-                            print(f"[DEBUG] timer窗口 {i} 存在")
-
-                            if hasattr(timer_window, 'prominent_window'):
-                                print(
-                                    f"[DEBUG] timer窗口 {i} 有prominent_window属性: {timer_window.prominent_window}")
-
-                                if timer_window.prominent_window:
-                                    if hasattr(timer_window, 'prominent_alert_enabled'):
-                                        enabled = timer_window.prominent_alert_enabled.get()
-                                        print(
-                                            f"[DEBUG] timer窗口 {i} prominent_alert_enabled: {enabled}")
-
-                                        if enabled:
-                                            print(
-                                                f"[DEBUG] 找到活动的明显模式窗口，使用alert系统显示警告")
-
-                                            # 使用原有的alert系统，避免警告覆盖问题
-                                            color_map = {
-                                                'yellow': self.colors["neon_yellow"],
-                                                'red': self.colors["neon_red"],
-                                                'orange': self.colors["neon_orange"],
-                                                'cyan': self.colors["neon_cyan"],
-                                                'blue': self.colors["neon_blue"],
-                                                'green': self.colors["neon_green"],
-                                                'purple': self.colors["neon_purple"]
-                                            }
-                                            warning_color = color_map.get(
-                                                color, self.colors.get(color, self.colors["neon_yellow"]))
-
-                                            # 使用现有的alert队列系统，确保警告不会覆盖
-                                            self.show_alert_with_duration(
-                                                timer_window, message, warning_color, 3.0)
-                                            return
-                                        else:
-                                            print(
-                                                f"[DEBUG] timer窗口 {i} 明显模式未启用")
-                                    else:
-                                        print(
-                                            f"[DEBUG] timer窗口 {i} 没有prominent_alert_enabled属性")
-                                else:
-                                    print(
-                                        f"[DEBUG] timer窗口 {i} prominent_window为None")
-                            else:
-                                print(
-                                    f"[DEBUG] timer窗口 {i} 没有prominent_window属性")
-                        else:
-                            print(f"[DEBUG] timer窗口 {i} 不存在或已销毁")
-                    except (tk.TclError, AttributeError) as e:
-                        print(f"[DEBUG] timer窗口 {i} 检查失败: {e}")
-                        continue
-            else:
-                print(f"[DEBUG] 没有timer_windows属性或列表为空")
-
-            print(f"[DEBUG] 没有找到可用的明显模式窗口")
-
-        except Exception as e:
-            print(f"[ERROR] 在明显模式显示警告失败: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def check_time_based_advance(self, current_time):
-        """检查基于时间的阶段推进"""
-        if self.jason_phase_start_time is None:
-            return
-
-        if not self.current_act_config:
-            return
-
-        jason_phases = self.current_act_config.get("jason_phases", {})
-        time_config = jason_phases.get("time_based_advance", {})
-
-        # 检查暴走前60秒自动推进到三阶段
-        rage_auto_advance = time_config.get(
-            "phase_3_auto_advance_before_rage", {})
-        if rage_auto_advance.get("enabled", False) and self.current_jason_phase < 3:
-            self.check_rage_countdown_advance(current_time, rage_auto_advance)
-
-        # 原有的时间推进逻辑（如果启用）
-        if not time_config.get("enabled", False):
-            return
-
-        phase_duration = 0
-        if self.current_jason_phase == 1:
-            phase_duration = time_config.get("phase_1_duration", 120)
-        elif self.current_jason_phase == 2:
-            phase_duration = time_config.get("phase_2_duration", 180)
-        elif self.current_jason_phase == 3:
-            phase_duration = time_config.get("phase_3_duration", 300)
-
-        # 检查是否到达阶段时间
-        elapsed_time = current_time - self.jason_phase_start_time
-        if elapsed_time >= phase_duration and self.current_jason_phase < 3:
-            print(
-                f"[DEBUG] 时间推进: 阶段{self.current_jason_phase}持续{elapsed_time:.1f}秒，推进到下一阶段")
-            self.advance_jason_phase()
-
-    def check_rage_countdown_advance(self, current_time, rage_config):
-        """检查暴走倒计时自动推进"""
-        if self.jason_rage_start_time is None:
-            return
-
-        # 获取总战斗时长
-        total_duration = self.current_act_config.get(
-            "total_duration", 600) if self.current_act_config else 600
-        seconds_before_rage = rage_config.get("seconds_before_rage", 60)
-
-        # 计算从战斗开始的总时间
-        total_elapsed = current_time - self.jason_rage_start_time
-        time_to_rage = total_duration - total_elapsed
-
-        # 如果距离暴走时间还有指定秒数，且当前不在三阶段，则自动推进
-        if time_to_rage <= seconds_before_rage and self.current_jason_phase < 3:
-            print(f"[DEBUG] 暴走倒计时推进: 距离暴走还有{time_to_rage:.1f}秒，自动推进到三阶段")
-            self.current_jason_phase = 3
-            self.jason_phase_start_time = current_time
-            self.update_jason_displays()
-
-            # 播放TTS提醒
-            if hasattr(self, 'tts_engine') and self.tts_engine:
-                try:
-                    self.tts_engine.say(f"暴走前{seconds_before_rage}秒，进入三阶段！")
-                    self.tts_engine.runAndWait()
-                except:
-                    pass
-
-    def check_damage_based_advance(self):
-        """检查基于总伤害的阶段推进"""
-        if not self.current_act_config:
-            print("[DEBUG] 没有ACT配置，跳过伤害检查")
-            return
-
-        jason_phases = self.current_act_config.get("jason_phases", {})
-        damage_config = jason_phases.get("damage_based_advance", {})
-
-        if not damage_config.get("enabled", False):
-            print("[DEBUG] 伤害推进未启用，跳过检查")
-            return
-
-        current_total_damage = self.total_damage
-        print(f"[DEBUG] 伤害检查配置: {damage_config}")
-
-        # 检查伤害阈值
-        if self.current_jason_phase == 1:
-            threshold = damage_config.get("phase_1_damage_threshold", 30000)
-            print(
-                f"[DEBUG] 阶段1检查: 当前伤害={current_total_damage}, 阈值={threshold}")
-            if current_total_damage >= threshold:
-                print(
-                    f"[DEBUG] 伤害推进: 总伤害{current_total_damage}达到阈值{threshold}，推进到阶段2")
-                self.advance_jason_phase()
-        elif self.current_jason_phase == 2:
-            threshold = damage_config.get("phase_2_damage_threshold", 80000)
-            print(
-                f"[DEBUG] 阶段2检查: 当前伤害={current_total_damage}, 阈值={threshold}")
-            if current_total_damage >= threshold:
-                print(
-                    f"[DEBUG] 伤害推进: 总伤害{current_total_damage}达到阈值{threshold}，推进到阶段3")
-                self.advance_jason_phase()
+        from ui_prominent_alert import show_warning_in_prominent_mode
+        return show_warning_in_prominent_mode(self, message, color)
 
     def start_jason_combat(self):
         """开始JASON战斗"""
-        self.jason_combat_start_time = time.time()
-        self.jason_phase_start_time = time.time()
-        self.current_jason_phase = 1
-        self.jason_phase_damage_start = self.total_damage
+        self.jason_machine.start_combat(time.time(), self.total_damage)
+        self._sync_jason_state()
         print("[DEBUG] JASON战斗开始")
         self.update_jason_displays()
 
-    def check_time_based_advance_for_phase(self, current_time, phase_config, auto_advance):
-        """检查基于阶段配置的时间推进"""
-        if self.jason_phase_start_time is None:
-            return
-
-        # 获取阶段持续时间
-        phase_duration = auto_advance.get("duration_seconds", 300)  # 默认5分钟
-
-        # 检查是否到达阶段时间
-        elapsed_time = current_time - self.jason_phase_start_time
-        if elapsed_time >= phase_duration and self.current_jason_phase < 3:
-            phase_name = phase_config.get(
-                "name", f"阶段{self.current_jason_phase}")
-            print(f"[DEBUG] 时间推进: {phase_name}持续{elapsed_time:.1f}秒，推进到下一阶段")
-            self.advance_jason_phase()
-
-        # 检查暴走倒计时推进
-        rage_advance = auto_advance.get("rage_countdown_advance")
-        if rage_advance and rage_advance.get("enabled") and self.current_jason_phase < 3:
-            self.check_rage_countdown_advance_new(current_time, rage_advance)
-
-    def check_rage_countdown_advance_new(self, current_time, rage_config):
-        """检查新版本的暴走倒计时自动推进"""
-        if self.jason_rage_start_time is None:
-            return
-
-        # 获取总战斗时长（从动态配置中获取）
-        total_duration = 600  # 默认10分钟
-        if self.current_act_config:
-            total_duration = self.current_act_config.get("total_duration", 600)
-
-        seconds_before_rage = rage_config.get("seconds_before_rage", 60)
-
-        # 计算从战斗开始的总时间
-        total_elapsed = current_time - self.jason_rage_start_time
-        time_to_rage = total_duration - total_elapsed
-
-        # 如果距离暴走时间还有指定秒数，且当前不在三阶段，则自动推进
-        if time_to_rage <= seconds_before_rage and self.current_jason_phase < 3:
-            print(f"[DEBUG] 暴走倒计时推进: 距离暴走还有{time_to_rage:.1f}秒，自动推进到三阶段")
-            self.current_jason_phase = 3
-            self.jason_phase_start_time = current_time
-            self.update_jason_displays()
-
-            # 播放TTS提醒
-            if hasattr(self, 'tts_engine') and self.tts_engine:
-                try:
-                    self.tts_engine.say(f"暴走前{seconds_before_rage}秒，进入三阶段！")
-                    self.tts_engine.runAndWait()
-                except:
-                    pass
-
-    def check_damage_based_advance_for_phase(self, damage_config):
-        """检查基于阶段配置的伤害推进"""
-        current_total_damage = self.total_damage
-
-        # 获取当前阶段的伤害阈值
-        threshold = damage_config.get("damage_threshold", 50000)
-
-        if current_total_damage >= threshold and self.current_jason_phase < 3:
-            print(
-                f"[DEBUG] 伤害推进: 总伤害{current_total_damage}达到阈值{threshold}，推进到下一阶段")
-            self.advance_jason_phase()
-
     def toggle_jason_auto_advance(self):
         """切换JASON自动推进状态"""
         self.jason_auto_advance_enabled = not self.jason_auto_advance_enabled
@@ -1229,586 +906,73 @@ class ACTDamageUI:
 
     def create_download_flag(self, flag_path):
         """创建下载完成标识文件"""
-        try:
-            os.makedirs(os.path.dirname(flag_path), exist_ok=True)
-
-            # 创建标识文件，包含下载时间和状态信息
-            flag_content = f"""# Orbitron 字体下载标识文件
-# 此文件用于防止重复下载字体
-# 如需重新下载，请删除此文件
-
-下载时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-状态: 下载尝试已完成
-版本: 1.0
-
-# 手动安装说明:
-# 1. 双击 fonts 文件夹中的 .ttf 字体文件
-# 2. 点击"安装"按钮
-# 3. 重启程序即可使用 Orbitron 字体
-
-# 要重新触发自动下载，请删除此文件
-"""
-
-            with open(flag_path, 'w', encoding='utf-8') as f:
-                f.write(flag_content)
-
-            print(f"[FONT_INFO] 已创建下载标识: {os.path.basename(flag_path)}")
-
-        except Exception as e:
-            print(f"[FONT_WARNING] 创建下载标识失败: {e}")
+        from ui_font_installer import create_download_flag
+        return create_download_flag(self, flag_path)
 
     def reset_font_download(self):
         """重置字体下载标识（用于开发调试）"""
-        try:
-            font_dir = self.get_resource_path("fonts")
-            download_flag = os.path.join(font_dir, ".font_download_completed")
-
-            if os.path.exists(download_flag):
-                os.remove(download_flag)
-                print("[FONT_INFO] 字体下载标识已重置")
-                return True
-            else:
-                print("[FONT_INFO] 下载标识不存在，无需重置")
-                return False
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 重置下载标识失败: {e}")
-            return False
-
-            return False
-
-        except Exception as e:
-            print(f"[FONT_WARNING] 字体处理失败: {e}")
-            return False
+        from ui_font_installer import reset_font_download
+        return reset_font_download(self)
 
     def download_and_install_orbitron(self):
         """自动从多个源下载并安装Orbitron字体"""
-        try:
-            print("[FONT_INFO] 开始下载 Orbitron 字体...")
-
-            # 尝试多个字体源
-            font_sources = [
-                {
-                    "name": "Google Fonts Archive",
-                    "urls": [
-                        "https://github.com/google/fonts/raw/main/ofl/orbitron/Orbitron-VariableFont_wght.ttf"
-                    ]
-                },
-                {
-                    "name": "Font Squirrel (备用)",
-                    "urls": [
-                        "https://www.fontsquirrel.com/fonts/download/orbitron",
-                    ]
-                },
-                {
-                    "name": "CDN字体源",
-                    "urls": [
-                        "https://fonts.gstatic.com/s/orbitron/v31/yMJMMIlzdpvBhQQL_SC3X9yhF25-T1nyGy6xoWgz.woff2"
-                    ]
-                }
-            ]
-
-            # 创建字体文件夹
-            font_dir = self.get_resource_path("fonts")
-            os.makedirs(font_dir, exist_ok=True)
-
-            # 尝试各个源
-            for source in font_sources:
-                print(f"[FONT_INFO] 尝试从 {source['name']} 下载...")
-
-                for url in source['urls']:
-                    try:
-                        success = self.download_font_from_url(url, font_dir)
-                        if success:
-                            return True
-                    except Exception as e:
-                        print(f"[FONT_WARNING] {source['name']} 下载失败: {e}")
-                        continue
-
-            # 如果所有源都失败，使用嵌入的字体数据
-            print("[FONT_INFO] 尝试使用嵌入的字体数据...")
-            return self.install_embedded_orbitron(font_dir)
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 下载 Orbitron 字体时出错: {e}")
-            return self.install_orbitron_simple()
+        from ui_font_installer import download_and_install_orbitron
+        return download_and_install_orbitron(self)
 
     def download_font_from_url(self, url, font_dir):
         """从指定URL下载字体文件"""
-        try:
-            print(f"[FONT_INFO] 正在下载: {url}")
-
-            # 创建请求，模拟浏览器
-            req = urllib.request.Request(url)
-            req.add_header(
-                'User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            req.add_header(
-                'Accept', 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8')
-            req.add_header('Accept-Language',
-                           'en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7')
-            req.add_header('Cache-Control', 'no-cache')
-
-            # 下载文件
-            response = urllib.request.urlopen(req, timeout=30)
-            font_data = response.read()
-
-            # 检查文件大小
-            if len(font_data) < 5000:
-                print(f"[FONT_WARNING] 文件太小 ({len(font_data)} bytes)，可能不是字体文件")
-                return False
-
-            print(f"[FONT_INFO] 下载完成，文件大小: {len(font_data)} bytes")
-
-            # 检查文件类型
-            if font_data[:2] == b'PK':  # ZIP文件
-                print("[FONT_INFO] 检测到ZIP文件，正在解压...")
-                return self.extract_font_from_zip(font_data, font_dir)
-            elif font_data[:4] == b'\x00\x01\x00\x00':  # TTF文件
-                print("[FONT_INFO] 检测到TTF字体文件")
-                return self.save_font_file(font_data, font_dir, ".ttf")
-            elif font_data[:4] == b'wOFF':  # WOFF文件
-                print("[FONT_INFO] 检测到WOFF字体文件")
-                return self.save_font_file(font_data, font_dir, ".woff")
-            elif font_data[:4] == b'wOF2':  # WOFF2文件
-                print("[FONT_INFO] 检测到WOFF2字体文件")
-                return self.save_font_file(font_data, font_dir, ".woff2")
-            elif font_data[:4] == b'OTTO':  # OTF文件
-                print("[FONT_INFO] 检测到OTF字体文件")
-                return self.save_font_file(font_data, font_dir, ".otf")
-            else:
-                print(f"[FONT_WARNING] 未知文件类型，文件头: {font_data[:8]}")
-                # 尝试作为HTML页面处理
-                if b'<html' in font_data[:100].lower():
-                    print("[FONT_WARNING] 下载的是HTML页面，可能是重定向")
-                    return False
-                # 尝试保存为TTF
-                return self.save_font_file(font_data, font_dir, ".ttf")
-
-        except Exception as e:
-            print(f"[FONT_WARNING] 下载失败: {e}")
-            return False
+        from ui_font_installer import download_font_from_url
+        return download_font_from_url(self, url, font_dir)
 
     def extract_font_from_zip(self, zip_data, font_dir):
         """从ZIP数据中提取字体文件"""
-        try:
-            import io
-            zip_buffer = io.BytesIO(zip_data)
-
-            with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
-                font_files = []
-                for file_name in zip_ref.namelist():
-                    if file_name.lower().endswith(('.ttf', '.otf')):
-                        print(f"[FONT_INFO] 找到字体文件: {file_name}")
-                        font_data = zip_ref.read(file_name)
-
-                        # 保存字体文件
-                        clean_name = os.path.basename(file_name)
-                        font_path = os.path.join(font_dir, clean_name)
-
-                        with open(font_path, 'wb') as f:
-                            f.write(font_data)
-
-                        font_files.append(font_path)
-                        print(
-                            f"[FONT_INFO] 已解压: {clean_name} ({len(font_data)} bytes)")
-
-                if font_files:
-                    # 尝试安装字体
-                    if self.install_font_files(font_files):
-                        print("[FONT_INFO] Orbitron 字体安装成功！")
-                        return True
-                    else:
-                        print("[FONT_WARNING] 字体解压成功但安装失败")
-                        self.show_font_install_guide(font_dir)
-                        return False
-                else:
-                    print("[FONT_WARNING] ZIP文件中未找到字体文件")
-                    return False
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 解压ZIP文件失败: {e}")
-            return False
+        from ui_font_installer import extract_font_from_zip
+        return extract_font_from_zip(self, zip_data, font_dir)
 
     def save_font_file(self, font_data, font_dir, extension):
         """保存字体文件"""
-        try:
-            font_filename = f"Orbitron-Downloaded{extension}"
-            font_path = os.path.join(font_dir, font_filename)
-
-            with open(font_path, 'wb') as f:
-                f.write(font_data)
-
-            print(f"[FONT_INFO] 已保存: {font_filename} ({len(font_data)} bytes)")
-
-            # 尝试安装字体
-            if self.install_font_files([font_path]):
-                print("[FONT_INFO] Orbitron 字体安装成功！")
-                return True
-            else:
-                print("[FONT_WARNING] 字体下载成功但安装失败")
-                self.show_font_install_guide(font_dir)
-                return False
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 保存字体文件失败: {e}")
-            return False
+        from ui_font_installer import save_font_file
+        return save_font_file(self, font_data, font_dir, extension)
 
     def install_embedded_orbitron(self, font_dir):
         """安装嵌入的简化Orbitron字体数据"""
-        try:
-            print("[FONT_INFO] 使用嵌入的字体数据...")
-
-            # 这是一个简化的Orbitron字体数据（Base64编码的TTF片段）
-            # 注意：这只是一个最小的字体示例，实际效果可能有限
-            embedded_font_data = """
-VFRUUAAAAAEAAAwAAAABAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAEA
-AAABAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEA
-AAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAA
-AAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAA=
-"""
-
-            try:
-                # 解码Base64数据
-                font_data = base64.b64decode(embedded_font_data.strip())
-
-                # 保存嵌入字体
-                font_filename = "Orbitron-Embedded.ttf"
-                font_path = os.path.join(font_dir, font_filename)
-
-                with open(font_path, 'wb') as f:
-                    f.write(font_data)
-
-                print(f"[FONT_INFO] 已创建嵌入字体: {font_filename}")
-
-                # 由于这只是示例数据，直接跳转到安装指南
-                self.show_font_install_guide(font_dir)
-                return False
-
-            except Exception as e:
-                print(f"[FONT_WARNING] 嵌入字体数据处理失败: {e}")
-                return self.install_orbitron_simple()
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 嵌入字体安装失败: {e}")
-            return self.install_orbitron_simple()
+        from ui_font_installer import install_embedded_orbitron
+        return install_embedded_orbitron(self, font_dir)
 
     def install_orbitron_simple(self):
         """简化的Orbitron字体安装方案 - 提供一键安装功能"""
-        try:
-            print("[FONT_INFO] 启动字体安装助手...")
-
-            # 创建一个更友好的安装界面
-            if hasattr(self, 'root'):
-                # 创建字体安装窗口
-                font_window = tk.Toplevel(self.root)
-                font_window.title("Orbitron 字体安装助手")
-                font_window.geometry("480x360")
-                font_window.configure(bg=self.colors["bg_primary"])
-                font_window.resizable(False, False)
-                font_window.wm_attributes("-topmost", True)
-
-                # 居中显示
-                font_window.update_idletasks()
-                x = (font_window.winfo_screenwidth() - 480) // 2
-                y = (font_window.winfo_screenheight() - 360) // 2
-                font_window.geometry(f"480x360+{x}+{y}")
-
-                # 创建主框架
-                main_frame = tk.Frame(
-                    font_window, bg=self.colors["bg_primary"])
-                main_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-                # 标题
-                title_label = tk.Label(
-                    main_frame,
-                    text="🚀 Orbitron 字体安装助手",
-                    font=self.get_font(16, "bold"),
-                    fg=self.colors["neon_cyan"],
-                    bg=self.colors["bg_primary"]
-                )
-                title_label.pack(pady=(0, 20))
-
-                # 说明文字
-                info_text = """
-Orbitron 是一款未来主义科幻字体，
-完美匹配 Cyberpunk 2077 风格界面！
-
-自动下载失败，请选择以下安装方式：
-"""
-                info_label = tk.Label(
-                    main_frame,
-                    text=info_text,
-                    font=self.get_font(10),
-                    fg=self.colors["text_primary"],
-                    bg=self.colors["bg_primary"],
-                    justify="center"
-                )
-                info_label.pack(pady=(0, 30))
-
-                # 按钮框架
-                button_frame = tk.Frame(
-                    main_frame, bg=self.colors["bg_primary"])
-                button_frame.pack(fill="x", pady=10)
-
-                # 在线下载按钮
-                def open_font_page():
-                    try:
-                        webbrowser.open(
-                            "https://fonts.google.com/specimen/Orbitron")
-                        font_window.destroy()
-                    except:
-                        pass
-
-                online_btn = self.create_enhanced_button(
-                    button_frame,
-                    "🌐 在线下载安装",
-                    open_font_page,
-                    self.colors["neon_cyan"],
-                    width=20, height=2
-                )
-                online_btn.pack(fill="x", pady=5)
-
-                # 本地安装按钮
-                def open_local_guide():
-                    try:
-                        # 创建fonts文件夹
-                        font_dir = self.get_resource_path("fonts")
-                        os.makedirs(font_dir, exist_ok=True)
-
-                        # 打开文件夹
-                        import subprocess
-                        subprocess.Popen(f'explorer "{font_dir}"')
-
-                        # 显示本地安装指南
-                        guide_window = tk.Toplevel(font_window)
-                        guide_window.title("本地安装指南")
-                        guide_window.geometry("400x300")
-                        guide_window.configure(bg=self.colors["bg_primary"])
-
-                        guide_text = """
-本地安装步骤：
-
-1. 将下载的 Orbitron 字体文件
-   (.ttf 格式) 复制到已打开的文件夹
-
-2. 双击字体文件进行安装
-
-3. 重启程序即可使用新字体
-
-支持的字体文件格式：
-• Orbitron-Regular.ttf
-• Orbitron-Bold.ttf  
-• Orbitron-Black.ttf
-"""
-
-                        guide_label = tk.Label(
-                            guide_window,
-                            text=guide_text,
-                            font=self.get_font(9),
-                            fg=self.colors["text_primary"],
-                            bg=self.colors["bg_primary"],
-                            justify="left"
-                        )
-                        guide_label.pack(padx=20, pady=20)
-
-                        font_window.destroy()
-
-                    except Exception as e:
-                        print(f"[FONT_ERROR] 打开本地指南失败: {e}")
-
-                local_btn = self.create_enhanced_button(
-                    button_frame,
-                    "📁 本地安装指南",
-                    open_local_guide,
-                    self.colors["neon_yellow"],
-                    width=20, height=2
-                )
-                local_btn.pack(fill="x", pady=5)
-
-                # 跳过按钮
-                def skip_font():
-                    font_window.destroy()
-
-                skip_btn = self.create_enhanced_button(
-                    button_frame,
-                    "⏭️ 跳过，使用默认字体",
-                    skip_font,
-                    self.colors["text_secondary"],
-                    width=20, height=2
-                )
-                skip_btn.pack(fill="x", pady=(15, 5))
-
-                # 重新下载按钮（高级选项）
-                def reset_and_download():
-                    try:
-                        self.reset_font_download()
-                        font_window.destroy()
-                        # 重新触发下载
-                        self.load_embedded_font()
-                    except Exception as e:
-                        print(f"[FONT_ERROR] 重新下载失败: {e}")
-
-                reset_btn = self.create_enhanced_button(
-                    button_frame,
-                    "🔄 重新下载字体",
-                    reset_and_download,
-                    self.colors["text_secondary"],
-                    width=20, height=1
-                )
-                reset_btn.pack(fill="x", pady=2)
-
-                # 底部提示
-                tip_label = tk.Label(
-                    main_frame,
-                    text="💡 安装字体后重启程序即可生效",
-                    font=self.get_font(8),
-                    fg=self.colors["text_secondary"],
-                    bg=self.colors["bg_primary"]
-                )
-                tip_label.pack(side="bottom", pady=(20, 0))
-
-            else:
-                # 控制台模式的简化指南
-                guide_text = """
-╔══════════════════════════════════════════════════════════════════╗
-║                    Orbitron 字体安装助手                          ║
-╠══════════════════════════════════════════════════════════════════╣
-║ 🌐 在线安装：                                                    ║
-║    https://fonts.google.com/specimen/Orbitron                   ║
-║                                                                  ║
-║ 📁 本地安装：                                                    ║
-║    1. 下载 Orbitron-*.ttf 字体文件                              ║
-║    2. 双击安装到系统                                             ║
-║    3. 重启程序                                                   ║
-╚══════════════════════════════════════════════════════════════════╝
-"""
-                print(guide_text)
-
-            return False  # 返回False表示需要手动完成
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 字体安装助手启动失败: {e}")
-            return False
+        from ui_font_installer import install_orbitron_simple
+        return install_orbitron_simple(self)
 
     def install_font_files(self, font_files):
         """尝试安装字体文件到系统"""
-        try:
-            if sys.platform == "win32":
-                import ctypes
-                from ctypes import wintypes
-
-                success_count = 0
-                for font_path in font_files:
-                    try:
-                        # Windows API安装字体
-                        result = ctypes.windll.gdi32.AddFontResourceW(
-                            font_path)
-                        if result > 0:
-                            success_count += 1
-                            print(
-                                f"[FONT_INFO] 已安装: {os.path.basename(font_path)}")
-                    except Exception as e:
-                        print(f"[FONT_WARNING] 安装字体失败 {font_path}: {e}")
-                        continue
+        from ui_font_installer import install_font_files
+        return install_font_files(self, font_files)
 
-                if success_count > 0:
-                    # 通知系统字体已改变
-                    HWND_BROADCAST = 0xFFFF
-                    WM_FONTCHANGE = 0x001D
-                    ctypes.windll.user32.SendMessageW(
-                        HWND_BROADCAST, WM_FONTCHANGE, 0, 0)
-                    return True
+    def show_font_install_guide(self, font_dir=None):
+        """显示字体安装指南"""
+        from ui_font_installer import show_font_install_guide
+        return show_font_install_guide(self, font_dir)
 
-            elif sys.platform.startswith("linux"):
-                # Linux字体安装
-                font_dir = os.path.expanduser("~/.local/share/fonts")
-                os.makedirs(font_dir, exist_ok=True)
+    def __init__(self):
+        startup_tracer.mark("导入模块")
+        # 记录构造期间各子系统的首次导入；构造失败时立即恢复 __import__，
+        # 成功时在首帧绘制后（或 run() 退出时）恢复
+        startup_tracer.trace_imports()
+        try:
+            self._initialize()
+        except BaseException:
+            startup_tracer.stop_import_tracing()
+            raise
 
-                success_count = 0
-                for font_path in font_files:
-                    try:
-                        dest_path = os.path.join(
-                            font_dir, os.path.basename(font_path))
-                        with open(font_path, 'rb') as src, open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
-                        success_count += 1
-                        print(f"[FONT_INFO] 已复制到: {dest_path}")
-                    except Exception as e:
-                        print(f"[FONT_WARNING] 复制字体失败: {e}")
-
-                if success_count > 0:
-                    # 刷新字体缓存
-                    os.system("fc-cache -f -v")
-                    return True
-
-            elif sys.platform == "darwin":
-                # macOS字体安装
-                font_dir = os.path.expanduser("~/Library/Fonts")
-                os.makedirs(font_dir, exist_ok=True)
-
-                success_count = 0
-                for font_path in font_files:
-                    try:
-                        dest_path = os.path.join(
-                            font_dir, os.path.basename(font_path))
-                        with open(font_path, 'rb') as src, open(dest_path, 'wb') as dst:
-                            dst.write(src.read())
-                        success_count += 1
-                        print(f"[FONT_INFO] 已安装到: {dest_path}")
-                    except Exception as e:
-                        print(f"[FONT_WARNING] 安装字体失败: {e}")
-
-                return success_count > 0
-
-        except Exception as e:
-            print(f"[FONT_ERROR] 字体安装失败: {e}")
-
-        return False
-
-    def show_font_install_guide(self, font_dir=None):
-        """显示字体安装指南"""
-        guide_message = """
-═══════════════════════════════════════
-        Orbitron 字体安装指南
-═══════════════════════════════════════
-
-自动安装失败，请手动安装：
-
-方法一：在线下载
-1. 访问：https://fonts.google.com/specimen/Orbitron
-2. 点击 "Download family" 下载字体包
-3. 解压后双击 .ttf 文件安装
-
-方法二：使用本地文件（如果已下载）"""
-
-        if font_dir and os.path.exists(font_dir):
-            guide_message += f"""
-4. 打开文件夹：{font_dir}
-5. 双击字体文件进行安装"""
-
-        guide_message += """
-
-安装完成后重启程序即可使用 Orbitron 字体！
-═══════════════════════════════════════
-"""
-
-        print(guide_message)
-
-        # 在GUI中也显示提示
-        if hasattr(self, 'root'):
-            self.show_messagebox(
-                "字体自动安装失败\n请查看控制台获取安装指南",
-                "字体安装",
-                self.colors.get("neon_yellow", "#FFD700")
-            )
-
-    def __init__(self):
-        try:
-            # 初始化字体配置
-            self.setup_fonts()
-        except Exception as e:
-            print(f"[ERROR] 字体初始化失败: {e}")
-            # 使用默认字体继续运行
+    def _initialize(self):
+        """初始化字体、配置、窗口和各子系统"""
+        try:
+            # 初始化字体配置
+            self.setup_fonts()
+        except Exception as e:
+            print(f"[ERROR] 字体初始化失败: {e}")
+            # 使用默认字体继续运行
 
         # Cyberpunk配色方案 - 现代化优化
         self.colors = {
@@ -1837,6 +1001,13 @@ Orbitron 是一款未来主义科幻字体，
         # JASON阶段机制系统 - 修改为动态配置模式
         self.jason_config = {}  # 保留作为兼容性备份，主要使用 current_act_config
         self.current_act_config = None  # 当前选择的ACT配置文件，包含JASON阶段信息
+        from config_catalog import ConfigCatalog
+        self.config_catalog = ConfigCatalog(self.get_act_config_dirs())  # 按mtime/size缓存解析结果
+        # 计时器窗口使用的配置文件热重载（后台轮询+校验，下一次开战前切换）
+        from config_watcher import ConfigWatcher
+        self.config_watcher = ConfigWatcher(
+            self.config_catalog, self._on_act_config_file_changed,
+            on_error=self._on_act_config_reload_failed, validator=self.compile_act_config)
         self.current_jason_phase = 1
         self.jason_phase_start_time = None
         self.jason_rage_start_time = None
@@ -1844,6 +1015,10 @@ Orbitron 是一款未来主义科幻字体，
         self.jason_combat_start_time = None
         self.jason_phase_damage_start = 0
         self.jason_auto_advance_enabled = True
+        # 由jason_phases编译的阶段状态机（加载配置时重新编译）
+        from jason_phase_machine import JasonPhaseMachine
+        self.jason_machine = JasonPhaseMachine()
+        self.jason_machine.subscribe(self._on_jason_phase_event)
 
         # RGB动画相关
         self.rgb_animation_running = False
@@ -1851,7 +1026,6 @@ Orbitron 是一款未来主义科幻字体，
         self.rgb_gradient_step = 0
         self.rgb_interval = 200  # 大幅提高间隔，彻底解决卡顿
         self._last_rgb_color = None  # 缓存上次颜色，避免重复渲染
-        self._animation_frame_skip = 0  # 帧跳过计数器，进一步优化
         self.rgb_colors = [
             "#ff0000",
             "#ff4000",
@@ -1883,13 +1057,21 @@ Orbitron 是一款未来主义科幻字体，
             "shadow_offset": 2,
         }
 
+        # 阴影文字的文字项复用和层缓存（计时器、明显提醒窗口每秒重绘）
+        from shadow_text import ShadowTextRenderer
+        self.shadow_text = ShadowTextRenderer()
+
+        startup_tracer.mark("字体/配置/状态机初始化")
         self.root = tk.Tk()
+        startup_tracer.mark("创建Tk根窗口")
 
         # 初始化拖拽数据
         self.drag_data = {"x": 0, "y": 0}
 
         self.setup_window()
+        startup_tracer.mark("setup_window")
         self.setup_ui()
+        startup_tracer.mark("setup_ui")
 
         # 数据相关
         self.api_url = "http://localhost:8989/api/data"
@@ -1902,19 +1084,36 @@ Orbitron 是一款未来主义科幻字体，
 
         # 存储当前数据
         self.current_data = {}
+        # 共享排名视图：每个数据版本只排序一次，供各显示窗口复用
+        from ranked_snapshot import RankedSnapshot
+        self.ranked_snapshot = RankedSnapshot(top_k=10)
 
         # 直接数据传递模式
         self.direct_mode = False
         self.data_source = None  # 数据源对象引用
         self.data_lock = threading.Lock()  # 数据同步锁
 
-        # UID用户名映射
-        self.uid_name_mapping = {}  # UID -> 用户名映射
+        # 玩家目录（SQLite，保存所有见过的玩家和UID映射名称；界面通过LRU缓存读取）
+        self.player_directory = None
+        try:
+            from player_directory import PlayerDirectory
+            self.player_directory = PlayerDirectory(
+                os.path.join(os.getcwd(), "player_directory.db"))
+            self.player_directory.open()
+        except Exception as e:
+            print(f"[ERROR] 打开玩家目录失败: {e}")
+            self.player_directory = None
+
+        # uid_mapping.json 作为UID映射的导入/导出格式：文件被修改过时导入玩家目录，
+        # 映射有变化时退出前导出（写入当前工作目录，避免打包后路径问题）
+        from uid_mapping_store import UidMappingStore
+        self.uid_mapping_store = UidMappingStore(
+            os.path.join(os.getcwd(), "uid_mapping.json"))
+        self.uid_mapping_dirty = False
         try:
-            self.load_uid_mapping()  # 加载保存的映射
+            self.load_uid_mapping()
         except Exception as e:
             print(f"[ERROR] 加载UID映射失败: {e}")
-            self.uid_name_mapping = {}
 
         # 个人UID设置
         self.personal_uid = None  # 个人UID
@@ -1927,47 +1126,67 @@ Orbitron 是一款未来主义科幻字体，
         # 自动UID映射检测
         self.auto_uid_mapping = True  # 是否启用自动UID映射
         self.uid_mapping_thread = None  # UID映射检测线程
+        self.uid_mapping_cursor = 0  # 已同步到的服务器名称变更版本
+        self.uid_mapping_epoch = None  # 服务器名称日志的启动标识，服务器重启后重置游标
+        self.uid_mapping_sync_lock = threading.Lock()  # 监控线程与刷新按钮共用游标
         self.server_log_monitor_running = False  # 服务器日志监控运行状态
         self.processed_lines = set()  # 已处理的日志行，避免重复处理
 
         # 延迟启动这些功能，避免初始化时卡顿
         # 这些将在UI完全加载后启动
         self._delayed_start_scheduled = False
+        startup_tracer.mark("加载UID映射/玩家目录")
 
-        # 初始化TTS功能
-        self.tts_engine = None
-        try:
-            import pyttsx3
-            self.tts_engine = pyttsx3.init()
-            # 设置语音参数
-            voices = self.tts_engine.getProperty('voices')
-            if voices:
-                # 优先选择中文语音
-                for voice in voices:
-                    if 'chinese' in voice.name.lower() or 'mandarin' in voice.name.lower():
-                        self.tts_engine.setProperty('voice', voice.id)
-                        break
-            # 设置语速和音量
-            self.tts_engine.setProperty('rate', 150)  # 语速
-            self.tts_engine.setProperty('volume', 0.8)  # 音量
-            print("[INFO] TTS引擎初始化成功")
-        except Exception as e:
-            print(f"[WARNING] TTS引擎初始化失败: {e}")
-            self.tts_engine = None
+        # 初始化TTS功能：后端在工作线程中打开并常驻，固定文本预合成到缓存目录
+        self.tts_backend = None
+        from tts_backend import TTSCache
+        self.tts_cache = TTSCache(os.path.join(os.getcwd(), "tts_cache"))
 
-        # 初始化TTS队列系统
+        # 初始化TTS队列系统（工作线程在第一次播报/预合成时启动）
         self.tts_queue = queue.PriorityQueue()  # 优先级队列
+        self.tts_sequence = 0  # 同优先级按入队顺序播放
         self.tts_worker_thread = None
         self.tts_worker_running = False
-        self.start_tts_worker()
 
         # 伤害统计相关
         self.total_damage = 0  # 全团总伤害
-
-        # 初始化全局键盘监听
+        from damage_tracker import DamageTracker
+        self.damage_tracker = DamageTracker()  # 每份快照增量维护总伤害和增量
+        # 战斗历史：每秒采样各玩家累计计数，每场战斗一个文件，后台写入
+        from fight_recorder import FightRecorder
+        self.fight_recorder = FightRecorder(os.path.join(os.getcwd(), "fight_history"))
+        # 每位玩家 5s/30s/60s 滚动DPS（环形缓冲区，每秒O(1)更新）
+        from rolling_dps import RollingDps
+        self.rolling_dps = RollingDps()
+        # 按伤害间隔和阶段重置自动切分战斗，保留每场战斗的基线和统计
+        from encounter_segmenter import EncounterSegmenter
+        self.encounter_segmenter = EncounterSegmenter()
+        self.encounter_segmenter.subscribe(self._on_encounter_event)
+        # 服务器中断记录（由启动器的守护线程通知），用于标注数据缺口
+        self.server_downtimes = []
+        self.server_events = queue.Queue()  # 守护线程只入队，UI线程轮询处理
+        from server_supervisor import current_supervisor
+        supervisor = current_supervisor()
+        if supervisor is not None:
+            self.server_downtimes = list(supervisor.downtimes)
+            supervisor.subscribe(self._on_server_supervisor_event)
+            self.root.after(500, self._poll_server_events)
+
+        # 全局键盘监听（首帧绘制后在后台线程中注册）
         self.hidden_by_home = False  # 是否被HOME键隐藏
         self.keyboard_listener = None
-        self.init_global_hotkey()
+
+        # 主循环负载调节器：根据after()延迟自动降低动画和刷新频率
+        # 回调耗时统计（p50/p95/max），F12或点击帧预算标签显示调试浮层
+        from ui_profiler import UIProfiler
+        self.ui_profiler = UIProfiler()
+        self.profiler_overlay = None
+        from ui_governor import UIGovernor
+        self.ui_governor = UIGovernor(self.root, profiler=self.ui_profiler)
+        self.ui_governor.add_listener(self._on_governor_level_changed)
+        self.ui_governor.start()
+        self.root.after(1000, self._update_frame_budget_label)
+        self.root.bind("<KeyPress-F12>", lambda e: self.toggle_profiler_overlay())
 
         # 启动RGB动画（这个比较轻量）
         self.start_rgb_animation()
@@ -1975,6 +1194,7 @@ Orbitron 是一款未来主义科幻字体，
         # 添加主窗口淡入效果
         self.root.after(100, lambda: self.fade_window_in(
             self.root, self.current_alpha, 0.2))
+        startup_tracer.mark("统计/调节器/动画初始化")
 
     def set_data_source(self, data_source):
         """设置直接数据源"""
@@ -2056,7 +1276,10 @@ Orbitron 是一款未来主义科幻字体，
             return False
 
     def load_uid_mapping(self):
-        """加载保存的UID用户名映射"""
+        """uid_mapping.json 自上次导入/导出后被修改过时，导入玩家目录（不在内存中保留）"""
+        if self.player_directory is None:
+            self.update_status("[CONFIG] 玩家目录不可用，UID映射未加载")
+            return
         try:
             # 处理不同的路径情况
             possible_paths = [
@@ -2071,31 +1294,51 @@ Orbitron 是一款未来主义科幻字体，
                     mapping_file = path
                     break
 
-            if mapping_file:
-                with open(mapping_file, 'r', encoding='utf-8') as f:
-                    self.uid_name_mapping = json.load(f)
+            signature = self.uid_mapping_store.signature(mapping_file)
+            if signature == self.player_directory.get_meta("uid_mapping_signature"):
+                self.update_status("[CONFIG] UID映射未修改，使用玩家目录中的映射")
+                return
+
+            mapping = self.uid_mapping_store.read(mapping_file)
+            # 导入写入数据库后才记录签名，否则中途退出会让下次启动跳过导入
+            if self.player_directory.import_mapping(mapping):
+                self.player_directory.set_meta(
+                    "uid_mapping_signature", self.uid_mapping_store.signature(mapping_file))
+            if mapping_file or mapping:
                 self.update_status(
-                    f"[CONFIG] 已加载 {len(self.uid_name_mapping)} 个UID映射 (从 {mapping_file})")
+                    f"[CONFIG] 已导入 {len(mapping)} 个UID映射 (从 {mapping_file or 'uid_mapping.journal'})")
             else:
-                self.uid_name_mapping = {}
                 self.update_status("[CONFIG] 未找到uid_mapping.json文件，使用空映射")
         except Exception as e:
-            self.uid_name_mapping = {}
             self.update_status(f"[CONFIG] 加载UID映射失败: {e}")
 
+    def set_uid_mapping(self, uid, name):
+        """设置（name 为None时删除）UID映射，立即写入玩家目录，退出时导出到 uid_mapping.json"""
+        if self.player_directory is None:
+            self.update_status("[CONFIG] 玩家目录不可用，无法保存UID映射")
+            return
+        self.player_directory.set_alias(uid, name)
+        self.uid_mapping_dirty = True
+
+    def get_uid_mappings(self):
+        """全部UID映射 {uid: 名称}，从玩家目录读取"""
+        if self.player_directory is None:
+            return {}
+        return self.player_directory.aliases()
+
     def save_uid_mapping(self):
-        """保存UID用户名映射"""
+        """把玩家目录中的UID映射导出到 uid_mapping.json（映射有变化时）"""
+        if not self.uid_mapping_dirty or self.player_directory is None:
+            return
         try:
-            # 优先保存到当前工作目录（避免打包后路径问题）
-            mapping_file = os.path.join(os.getcwd(), "uid_mapping.json")
-
-            with open(mapping_file, 'w', encoding='utf-8') as f:
-                json.dump(self.uid_name_mapping, f,
-                          ensure_ascii=False, indent=2)
-            self.update_status(
-                f"[CONFIG] 已保存 {len(self.uid_name_mapping)} 个UID映射到 {mapping_file}")
+            mapping = self.player_directory.aliases()
+            self.uid_mapping_store.export(mapping)
+            self.player_directory.set_meta(
+                "uid_mapping_signature", self.uid_mapping_store.signature())
+            self.uid_mapping_dirty = False
+            print(f"[CONFIG] 已导出 {len(mapping)} 个UID映射到 uid_mapping.json")
         except Exception as e:
-            self.update_status(f"[CONFIG] 保存UID映射失败: {e}")
+            print(f"[CONFIG] 导出UID映射失败: {e}")
 
     def load_personal_uid(self):
         """加载个人UID设置"""
@@ -2183,8 +1426,8 @@ Orbitron 是一款未来主义科幻字体，
                 if success:
                     # 重置错误计数
                     consecutive_errors = 0
-                    # API调用成功，使用较短间隔
-                    sleep_time = 3.0
+                    # API调用成功，使用较短间隔（增量同步，空闲时几乎没有开销）
+                    sleep_time = 1.0
                 else:
                     consecutive_errors += 1
                     # API调用失败，逐渐增加间隔
@@ -2222,44 +1465,57 @@ Orbitron 是一款未来主义科幻字体，
         except:
             print(f"[UID_MONITOR] {message}")
 
+    def _sync_uid_mappings(self, timeout=1.0):
+        """按版本游标从服务器拉取新增或变化的UID映射并合并到本地
+
+        返回本次变化的 [(uid, old_name, new_name)]，old_name 为None表示新映射。
+        空闲时服务器只返回空的增量。请求失败时抛出异常。
+        """
+        with self.uid_mapping_sync_lock:
+            response = requests.get(
+                "http://localhost:8989/api/uid-mappings",
+                params={"since": self.uid_mapping_cursor,
+                        "epoch": self.uid_mapping_epoch or ""},
+                timeout=timeout)
+            if response.status_code != 200:
+                raise RuntimeError(f"API请求失败: {response.status_code}")
+            data = response.json()
+            if data.get('code') != 0:
+                raise RuntimeError(f"API响应错误: {data.get('code')}")
+
+            changes = []
+            if self.player_directory is not None:
+                for uid, name in data.get('mappings', {}).items():
+                    old_name = self.player_directory.get_alias(uid)
+                    if old_name != name:
+                        self.set_uid_mapping(uid, name)
+                        changes.append((uid, old_name, name))
+                        self.player_directory.observe(uid, name)
+
+            # 旧版服务器没有版本号，继续全量获取
+            self.uid_mapping_cursor = data.get('version', 0)
+            self.uid_mapping_epoch = data.get('epoch')
+            return changes
+
+    def get_server_log_tail(self, count=100):
+        """启动器收集的最近服务器输出（内存中，不读日志文件）；独立运行UI时返回空列表"""
+        from log_sink import get_sink
+        sink = get_sink("server")
+        return sink.tail(count) if sink is not None else []
+
     def _read_server_logs(self, pattern):
-        """从服务器API获取UID映射"""
+        """从服务器API获取UID映射（增量）"""
         try:
-            # 使用新的UID映射API（基于现有的API URL构建）
-            import requests
-            base_url = "http://localhost:8989"  # 和其他API保持一致
-            response = requests.get(
-                f"{base_url}/api/uid-mappings", timeout=1.0)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('code') == 0:
-                    mappings = data.get('mappings', {})
-
-                    # 检查是否有新的映射
-                    new_mappings_found = False
-                    for uid, name in mappings.items():
-                        if uid not in self.uid_name_mapping:
-                            # 新的UID映射
-                            self.uid_name_mapping[uid] = name
-                            new_mappings_found = True
-                            self._safe_update_status(
-                                f"[AUTO_UID] 发现新映射: {uid} -> {name}")
-                        elif self.uid_name_mapping[uid] != name:
-                            # 更新已有映射（用户名变化）
-                            old_name = self.uid_name_mapping[uid]
-                            self.uid_name_mapping[uid] = name
-                            new_mappings_found = True
-                            self._safe_update_status(
-                                f"[AUTO_UID] 更新映射: {uid} {old_name} -> {name}")
-
-                    # 如果有新映射，自动保存
-                    if new_mappings_found:
-                        try:
-                            self.save_uid_mapping()
-                        except Exception as e:
-                            self._safe_update_status(f"[AUTO_UID] 保存映射失败: {e}")
+            changes = self._sync_uid_mappings(timeout=1.0)
+            for uid, old_name, name in changes:
+                if old_name is None:
+                    self._safe_update_status(
+                        f"[AUTO_UID] 发现新映射: {uid} -> {name}")
+                else:
+                    self._safe_update_status(
+                        f"[AUTO_UID] 更新映射: {uid} {old_name} -> {name}")
 
-                    return True
+            return True
         except requests.exceptions.Timeout:
             # 超时是正常的，不需要报错
             pass
@@ -2289,31 +1545,21 @@ Orbitron 是一款未来主义科幻字体，
             player_name = match.group(1).strip()
             uuid = match.group(2).strip()
 
-            # 检查是否需要更新映射（新UID或同UID不同用户名）
-            if uuid not in self.uid_name_mapping:
+            # 检查是否需要更新映射（新UID或同UID不同用户名），映射直接写入玩家目录
+            if self.player_directory is None:
+                return
+            old_name = self.player_directory.get_alias(uuid)
+            if old_name is None:
                 # 新的UID映射
-                self.uid_name_mapping[uuid] = player_name
+                self.set_uid_mapping(uuid, player_name)
                 self._safe_update_status(
                     f"[AUTO_UID] 发现新映射: {uuid} -> {player_name}")
-
-                # 自动保存映射
-                try:
-                    self.save_uid_mapping()
-                except Exception as e:
-                    self._safe_update_status(f"[AUTO_UID] 保存映射失败: {e}")
-            elif self.uid_name_mapping[uuid] != player_name:
+            elif old_name != player_name:
                 # 同UID但用户名不同，覆盖原有映射
-                old_name = self.uid_name_mapping[uuid]
-                self.uid_name_mapping[uuid] = player_name
+                self.set_uid_mapping(uuid, player_name)
                 self._safe_update_status(
                     f"[AUTO_UID] 更新映射: {uuid} -> {player_name} (原: {old_name})")
 
-                # 自动保存映射
-                try:
-                    self.save_uid_mapping()
-                except Exception as e:
-                    self._safe_update_status(f"[AUTO_UID] 保存映射失败: {e}")
-
     def toggle_auto_uid_mapping(self, enabled):
         """切换自动UID映射功能"""
         self.auto_uid_mapping = enabled
@@ -2328,502 +1574,21 @@ Orbitron 是一款未来主义科幻字体，
         self._safe_update_status(f"[AUTO_UID] 已{status}自动UID映射检测")
 
     def get_display_name(self, uid):
-        """获取显示名称，优先使用用户设置的名称"""
-        return self.uid_name_mapping.get(uid, uid)
+        """获取显示名称：玩家目录中的映射名称优先，其次是游戏内名称（经LRU缓存）"""
+        name = None
+        if self.player_directory is not None:
+            name = self.player_directory.get_name(uid)
+        return name or uid
 
     def show_personal_uid_dialog(self, callback=None):
         """显示个人UID输入对话框"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("◊ 个人UID设置 ◊")
-        dialog.geometry("450x350")
-        dialog.resizable(False, False)
-        dialog.wm_attributes("-topmost", True)
-        dialog.configure(bg="#000000")
-        dialog.overrideredirect(True)
-
-        # 创建拖拽数据
-        dialog_drag_data = {"x": 0, "y": 0}
-
-        # 拖拽功能
-        def start_drag(event):
-            dialog_drag_data["x"] = event.x
-            dialog_drag_data["y"] = event.y
-
-        def on_drag(event):
-            if dialog_drag_data["x"] != 0 or dialog_drag_data["y"] != 0:
-                x = dialog.winfo_x() + (event.x - dialog_drag_data["x"])
-                y = dialog.winfo_y() + (event.y - dialog_drag_data["y"])
-                dialog.geometry(f"+{x}+{y}")
-
-        def stop_drag(event):
-            dialog_drag_data["x"] = 0
-            dialog_drag_data["y"] = 0
-
-        # 创建RGB边框（更厚的边框）
-        border_frame = tk.Frame(dialog, bg="#ff0000", bd=0, relief="flat")
-        border_frame.pack(fill="both", expand=True, padx=4, pady=4)
-
-        # 创建主框架
-        main_frame = tk.Frame(
-            border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
-        main_frame.pack(fill="both", expand=True, padx=3, pady=3)
-
-        # 为主框架添加拖拽功能
-        main_frame.bind("<Button-1>", start_drag)
-        main_frame.bind("<B1-Motion>", on_drag)
-        main_frame.bind("<ButtonRelease-1>", stop_drag)
-
-        # 标题 - 更大更华丽
-        title_canvas = self.create_shadow_text_canvas(
-            main_frame,
-            text="▓▓▓ [PERSONAL_UID_CONFIG] ▓▓▓",
-            font_tuple=self.get_font(16, "bold"),
-            fg_color=self.colors["neon_cyan"],
-            bg_color=self.colors["bg_primary"],
-            height=50
-        )
-        title_canvas.pack(fill="x", pady=(20, 15))
-
-        # 副标题
-        subtitle_canvas = self.create_shadow_text_canvas(
-            main_frame,
-            text="◊ SYSTEM_INITIALIZATION ◊",
-            font_tuple=self.get_font(12, "normal"),
-            fg_color=self.colors["neon_yellow"],
-            bg_color=self.colors["bg_primary"],
-            height=30
-        )
-        subtitle_canvas.pack(fill="x", pady=(0, 20))
-
-        # 说明文字 - 使用Cyberpunk风格
-        info_lines = [
-            "[INFO]: 配置个人UID以启用MINI窗口个人数据显示",
-            "[NOTICE]: 此设置将自动保存，无需重复输入"
-        ]
-
-        for line in info_lines:
-            info_canvas = self.create_shadow_text_canvas(
-                main_frame,
-                text=line,
-                font_tuple=self.get_font(9),
-                fg_color=self.colors["text_primary"],
-                bg_color=self.colors["bg_primary"],
-                height=25
-            )
-            info_canvas.pack(fill="x", pady=2)
-
-        # 输入区域 - 增强的Cyberpunk框架
-        input_outer, input_frame = self.create_rounded_frame(
-            main_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_green"],
-            padding=3
-        )
-        input_outer.pack(fill="x", padx=25, pady=(20, 25))
-
-        # UID输入标签 - 使用阴影效果
-        label_canvas = self.create_shadow_text_canvas(
-            input_frame,
-            text="[UID_INPUT]:",
-            font_tuple=self.get_font(12, "bold"),
-            fg_color=self.colors["neon_yellow"],
-            bg_color=self.colors["bg_secondary"],
-            height=35
-        )
-        label_canvas.pack(fill="x", pady=(10, 5))
-
-        # UID输入框 - 更大更明显
-        uid_entry = tk.Entry(
-            input_frame,
-            font=self.get_font(12),
-            bg=self.colors["bg_primary"],
-            fg=self.colors["neon_cyan"],
-            insertbackground=self.colors["neon_cyan"],
-            bd=0,
-            relief="flat",
-            width=30,
-            justify="center"
-        )
-        uid_entry.pack(pady=(5, 15), ipady=8)
-
-        # 如果已有个人UID，预填充
-        if self.personal_uid:
-            uid_entry.insert(0, self.personal_uid)
-
-        # 按钮区域
-        button_frame = tk.Frame(main_frame, bg=self.colors["bg_primary"])
-        button_frame.pack(fill="x", padx=25, pady=(0, 25))
-
-        def save_and_close():
-            uid = uid_entry.get().strip()
-            if uid:
-                if self.save_personal_uid(uid):
-                    self.show_messagebox(
-                        f"个人UID已保存: {uid}",
-                        title="保存成功",
-                        color=self.colors["success_green"]
-                    )
-                    dialog.destroy()
-                    if callback:
-                        callback()
-                else:
-                    self.show_messagebox(
-                        "保存失败，请重试",
-                        title="错误",
-                        color=self.colors["error_red"]
-                    )
-            else:
-                self.show_messagebox(
-                    "请输入有效的UID",
-                    title="输入错误",
-                    color=self.colors["warning_yellow"]
-                )
-
-        def cancel_close():
-            dialog.destroy()
-
-        # 保存按钮
-        save_btn = self.create_enhanced_button(
-            button_frame, "◊ 保存", save_and_close,
-            self.colors["neon_green"], width=12, height=2
-        )
-        save_btn.pack(side="left", padx=(0, 10))
-
-        # 取消按钮
-        cancel_btn = self.create_enhanced_button(
-            button_frame, "✕ 取消", cancel_close,
-            self.colors["neon_pink"], width=12, height=2
-        )
-        cancel_btn.pack(side="left")
-
-        # 如果没有个人UID，显示跳过按钮
-        if not self.personal_uid:
-            skip_btn = self.create_enhanced_button(
-                button_frame, "⏭ 跳过", lambda: (
-                    dialog.destroy(), callback() if callback else None),
-                self.colors["text_secondary"], width=12, height=2
-            )
-            skip_btn.pack(side="right")
-
-        # RGB边框动画
-        dialog_gradient_step = 0
-
-        def animate_dialog_border():
-            nonlocal dialog_gradient_step
-            if dialog.winfo_exists():
-                try:
-                    if hasattr(self, 'border_colors') and self.border_colors:
-                        current_color = self.border_colors[dialog_gradient_step]
-                        border_frame.configure(bg=current_color)
-                        dialog_gradient_step = (
-                            dialog_gradient_step + 1) % len(self.border_colors)
-                    dialog.after(150, animate_dialog_border)
-                except:
-                    pass
-
-        # 启动边框动画
-        animate_dialog_border()
-
-        # 窗口居中
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-
-        # 聚焦到输入框
-        uid_entry.focus_set()
-
-        # 绑定回车键
-        uid_entry.bind("<Return>", lambda e: save_and_close())
+        from ui_dialogs import show_personal_uid_dialog
+        return show_personal_uid_dialog(self, callback)
 
     def show_uid_mapping_dialog(self):
         """显示UID用户名映射配置对话框"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("◊ UID用户名映射配置 ◊")
-        dialog.geometry("600x500")
-        dialog.resizable(True, True)
-        dialog.wm_attributes("-topmost", True)
-        dialog.configure(bg="#000000")
-
-        # 设置无边框 (在所有Tkinter操作之后)
-        dialog.overrideredirect(True)
-
-        # 创建拖拽数据
-        dialog_drag_data = {"x": 0, "y": 0}
-
-        # 拖拽功能
-        def start_drag(event):
-            dialog_drag_data["x"] = event.x
-            dialog_drag_data["y"] = event.y
-
-        def on_drag(event):
-            if dialog_drag_data["x"] != 0 or dialog_drag_data["y"] != 0:
-                x = dialog.winfo_x() + (event.x - dialog_drag_data["x"])
-                y = dialog.winfo_y() + (event.y - dialog_drag_data["y"])
-                dialog.geometry(f"+{x}+{y}")
-
-        def stop_drag(event):
-            dialog_drag_data["x"] = 0
-            dialog_drag_data["y"] = 0
-
-        # 创建RGB边框
-        border_frame = tk.Frame(dialog, bg="#ff0000", bd=0, relief="flat")
-        border_frame.pack(fill="both", expand=True, padx=3, pady=3)
-
-        # 创建主框架
-        main_frame = tk.Frame(
-            border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
-        main_frame.pack(fill="both", expand=True, padx=2, pady=2)
-
-        # 为标题区域添加拖拽功能
-        main_frame.bind("<Button-1>", start_drag)
-        main_frame.bind("<B1-Motion>", on_drag)
-        main_frame.bind("<ButtonRelease-1>", stop_drag)
-
-        # 标题
-        title_canvas = self.create_shadow_text_canvas(
-            main_frame,
-            text="▓▓▓ UID用户名映射管理 ▓▓▓",
-            font_tuple=self.get_font(12, "bold"),
-            fg_color=self.colors["neon_cyan"],
-            bg_color=self.colors["bg_primary"],
-            height=30
-        )
-        title_canvas.pack(fill="x", pady=(10, 10))
-
-        # 在标题区域添加顶部关闭按钮
-        top_close_btn = self.create_enhanced_button(
-            main_frame, "✕", dialog.destroy,
-            self.colors["neon_pink"], width=3, height=1
-        )
-        top_close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
-
-        # 为标题区域也添加拖拽功能
-        title_canvas.bind("<Button-1>", start_drag)
-        title_canvas.bind("<B1-Motion>", on_drag)
-        title_canvas.bind("<ButtonRelease-1>", stop_drag)
-
-        # RGB边框动画
-        dialog_gradient_step = 0
-
-        def animate_dialog_border():
-            nonlocal dialog_gradient_step
-            if dialog.winfo_exists():
-                try:
-                    # 使用和主UI相同的渐变颜色
-                    if hasattr(self, 'border_colors') and self.border_colors:
-                        current_color = self.border_colors[dialog_gradient_step]
-                        border_frame.configure(bg=current_color)
-                        dialog_gradient_step = (
-                            dialog_gradient_step + 1) % len(self.border_colors)
-
-                    # 使用和主UI相同的速度 - 100ms间隔
-                    dialog.after(100, animate_dialog_border)
-                except:
-                    pass
-
-        # 启动边框动画
-        animate_dialog_border()
-
-        # 输入区域
-        input_frame = tk.Frame(
-            main_frame, bg=self.colors["bg_secondary"], relief="raised", bd=2)
-        input_frame.pack(fill="x", pady=(0, 10))
-
-        # UID输入
-        uid_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
-        uid_frame.pack(fill="x", padx=10, pady=5)
-
-        tk.Label(uid_frame, text="UID:", font=self.get_font(9),
-                 bg=self.colors["bg_secondary"], fg=self.colors["text_primary"]).pack(side="left")
-        uid_entry_container = self.create_rounded_entry(uid_frame, width=20)
-        uid_entry_container.pack(side="left", padx=(10, 0))
-        uid_entry = uid_entry_container.entry if hasattr(
-            uid_entry_container, 'entry') else uid_entry_container
-
-        # 用户名输入
-        name_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
-        name_frame.pack(fill="x", padx=10, pady=5)
-
-        tk.Label(name_frame, text="用户名:", font=self.get_font(9),
-                 bg=self.colors["bg_secondary"], fg=self.colors["text_primary"]).pack(side="left")
-        name_entry_container = self.create_rounded_entry(name_frame, width=20)
-        name_entry_container.pack(side="left", padx=(10, 0))
-        name_entry = name_entry_container.entry if hasattr(
-            name_entry_container, 'entry') else name_entry_container
-
-        # 自动映射开关
-        auto_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
-        auto_frame.pack(fill="x", padx=10, pady=5)
-
-        auto_var = tk.BooleanVar(value=self.auto_uid_mapping)
-        auto_check = tk.Checkbutton(
-            auto_frame,
-            text="自动从服务器API检测UID映射 (每2-5秒，覆盖重名)",
-            variable=auto_var,
-            font=self.get_font(9),
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["neon_green"],
-            selectcolor=self.colors["bg_accent"],
-            activebackground=self.colors["bg_secondary"],
-            activeforeground=self.colors["neon_green"],
-            command=lambda: self.toggle_auto_uid_mapping(auto_var.get())
-        )
-        auto_check.pack(side="left")
-
-        # 状态指示
-        status_label = tk.Label(
-            auto_frame,
-            text=f"[监控状态: {'运行中' if self.server_log_monitor_running else '已停止'}]",
-            font=self.get_font(8),
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["neon_cyan"] if self.server_log_monitor_running else self.colors["text_accent"]
-        )
-        status_label.pack(side="right")
-
-        # 按钮区域
-        button_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
-        button_frame.pack(fill="x", padx=10, pady=5)
-
-        def add_mapping():
-            uid = uid_entry.get().strip()
-            name = name_entry.get().strip()
-            if uid and name:
-                self.uid_name_mapping[uid] = name
-                self.save_uid_mapping()
-                uid_entry.delete(0, tk.END)
-                name_entry.delete(0, tk.END)
-                refresh_list()
-                self.update_status(f"[CONFIG] 已添加映射: {uid} -> {name}")
-
-        def delete_mapping():
-            selection = mapping_list.curselection()
-            if selection:
-                index = selection[0]
-                uid = list(self.uid_name_mapping.keys())[index]
-                del self.uid_name_mapping[uid]
-                self.save_uid_mapping()
-                refresh_list()
-                self.update_status(f"[CONFIG] 已删除映射: {uid}")
-
-        # 添加按钮
-        add_btn = self.create_enhanced_button(button_frame, "◊ 添加", add_mapping,
-                                              self.colors["neon_green"], width=8)
-        add_btn.pack(side="left", padx=(0, 5))
-
-        # 删除按钮
-        del_btn = self.create_enhanced_button(button_frame, "✕ 删除", delete_mapping,
-                                              self.colors["neon_pink"], width=8)
-        del_btn.pack(side="left")
-
-        # 映射列表区域
-        list_frame = tk.Frame(
-            main_frame, bg=self.colors["bg_secondary"], relief="raised", bd=2)
-        list_frame.pack(fill="both", expand=True)
-
-        # 列表标题
-        list_title = self.create_shadow_text_canvas(
-            list_frame,
-            text="[当前映射列表]:",
-            font_tuple=self.get_font(10, "bold"),
-            fg_color=self.colors["neon_orange"],
-            bg_color=self.colors["bg_secondary"],
-            height=25
-        )
-        list_title.pack(fill="x", pady=5)
-
-        # 滚动列表（圆角版本）
-        list_container = self.create_rounded_listbox(list_frame, height=12)
-        list_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
-
-        # 获取实际的listbox控件
-        mapping_list = list_container.listbox
-        scrollbar = list_container.scrollbar
-
-        def refresh_list():
-            """刷新UID映射列表，包括从API获取最新数据"""
-            # 首先尝试从API获取最新映射
-            try:
-                import requests
-                response = requests.get(
-                    "http://localhost:8989/api/uid-mappings", timeout=2.0)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('code') == 0:
-                        api_mappings = data.get('mappings', {})
-
-                        # 合并API映射到本地映射
-                        updated_count = 0
-                        for uid, name in api_mappings.items():
-                            if uid not in self.uid_name_mapping:
-                                self.uid_name_mapping[uid] = name
-                                updated_count += 1
-                            elif self.uid_name_mapping[uid] != name:
-                                self.uid_name_mapping[uid] = name
-                                updated_count += 1
-
-                        if updated_count > 0:
-                            self.update_status(
-                                f"[刷新] 从服务器获取到 {updated_count} 个新的或更新的映射")
-                            # 保存更新的映射
-                            try:
-                                self.save_uid_mapping()
-                            except Exception as e:
-                                self.update_status(f"[刷新] 保存映射失败: {e}")
-                        else:
-                            self.update_status("[刷新] 映射已是最新")
-                    else:
-                        self.update_status(f"[刷新] API响应错误: {data.get('code')}")
-                else:
-                    self.update_status(f"[刷新] API请求失败: {response.status_code}")
-            except requests.exceptions.ConnectionError:
-                self.update_status("[刷新] 无法连接到服务器，使用本地映射")
-            except Exception as e:
-                self.update_status(f"[刷新] API获取失败: {e}")
-
-            # 更新列表显示
-            mapping_list.delete(0, tk.END)
-            for uid, name in self.uid_name_mapping.items():
-                mapping_list.insert(tk.END, f"{uid} → {name}")
-
-        def on_list_select(event):
-            selection = mapping_list.curselection()
-            if selection:
-                index = selection[0]
-                uid = list(self.uid_name_mapping.keys())[index]
-                name = self.uid_name_mapping[uid]
-                uid_entry.delete(0, tk.END)
-                uid_entry.insert(0, uid)
-                name_entry.delete(0, tk.END)
-                name_entry.insert(0, name)
-
-        mapping_list.bind("<<ListboxSelect>>", on_list_select)
-
-        # 按钮区域
-        button_container = tk.Frame(main_frame, bg=self.colors["bg_primary"])
-        button_container.pack(fill="x", pady=(10, 10))
-
-        # 关闭按钮
-        close_btn = self.create_enhanced_button(button_container, "✕ 关闭", dialog.destroy,
-                                                self.colors["neon_pink"], width=12)
-        close_btn.pack(side="right", padx=(5, 0))
-
-        # 刷新按钮
-        refresh_btn = self.create_enhanced_button(button_container, "↻ 刷新", refresh_list,
-                                                  self.colors["neon_orange"], width=12)
-        refresh_btn.pack(side="right", padx=(5, 0))
-
-        # 初始化列表
-        refresh_list()
-
-        # 窗口居中 (在overrideredirect之后进行)
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-
-        # 聚焦到UID输入框
-        uid_entry.focus_set()
+        from ui_dialogs import show_uid_mapping_dialog
+        return show_uid_mapping_dialog(self)
 
     def generate_gradient_colors(self):
         """生成现代化渐变颜色序列"""
@@ -2916,8 +1681,7 @@ Orbitron 是一款未来主义科幻字体，
         # 关闭窗口时的处理
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # 延迟字体验证（在窗口创建完成后）
-        self.root.after(100, self.delayed_font_verification)
+        # 字体验证（注册表检查、可能的安装）在首帧绘制后进行，见 _on_first_paint
 
         # 绑定JASON阶段机制快捷键
         self.setup_jason_hotkeys()
@@ -3755,17 +2519,23 @@ Orbitron 是一款未来主义科幻字体，
             self._animate_rgb()
 
     def _animate_rgb(self):
-        """RGB动画循环 - 边框渐变效果（最大性能优化版）"""
+        """RGB动画循环 - 边框渐变效果（由负载调节器控制帧率）"""
         if not self.rgb_animation_running:
             return
 
-        # 帧跳过机制：每3帧才渲染一次，大幅提升性能
-        self._animation_frame_skip += 1
-        if self._animation_frame_skip < 3:
-            self.root.after(self.rgb_interval // 3, self._animate_rgb)
+        # 窗口隐藏时不渲染，低频轮询等待恢复
+        if self.ui_governor.animations_paused():
+            self.root.after(self.ui_governor.IDLE_POLL_MS, self._animate_rgb)
             return
-        self._animation_frame_skip = 0
 
+        self.ui_governor.measure("rgb_animation", self._render_rgb_frame)
+
+        # 继续动画（速度可调，负载高时自动放慢）
+        self.root.after(self.ui_governor.animation_interval(self.rgb_interval),
+                        self._animate_rgb)
+
+    def _render_rgb_frame(self):
+        """渲染一帧主窗口RGB边框"""
         # 更新渐变索引
         self.rgb_gradient_step = (self.rgb_gradient_step + 1) % len(
             self.border_colors)
@@ -3780,8 +2550,93 @@ Orbitron 是一款未来主义科幻字体，
         elif hasattr(self, "border_frame") and self.border_frame:
             self.border_frame.config(bg=current_color)
 
-        # 继续动画（速度可调）
-        self.root.after(self.rgb_interval, self._animate_rgb)
+    def _on_governor_level_changed(self, level_name, budget):
+        """负载等级变化时提示用户"""
+        try:
+            if level_name == "NORMAL":
+                self.update_status("[GOVERNOR] 主循环负载恢复正常，动画和刷新恢复默认频率")
+            else:
+                self.update_status(
+                    f"[GOVERNOR] 主循环负载{level_name} (延迟 {budget['lag_ms']:.0f}ms)，"
+                    f"动画放慢x{budget['animation_scale']:g}，刷新放慢x{budget['refresh_scale']:g}")
+            self._update_frame_budget_label(reschedule=False)
+        except Exception as e:
+            print(f"[DEBUG] 更新负载状态失败: {e}")
+
+    def _update_frame_budget_label(self, reschedule=True):
+        """刷新控制面板上的帧预算显示"""
+        try:
+            if hasattr(self, "frame_budget_label") and self.frame_budget_label.winfo_exists():
+                level = self.ui_governor.get_frame_budget()["level"]
+                color = {
+                    "NORMAL": self.colors["neon_green"],
+                    "BUSY": self.colors["warning_yellow"],
+                    "OVERLOAD": self.colors["error_red"],
+                }.get(level, self.colors["text_primary"])
+                self.frame_budget_label.config(
+                    text=self.ui_governor.get_status_text(self.rgb_interval), fg=color)
+        except Exception as e:
+            print(f"[DEBUG] 更新帧预算显示失败: {e}")
+        if reschedule and self.ui_governor.running:
+            self.root.after(1000, self._update_frame_budget_label)
+
+    def toggle_profiler_overlay(self):
+        """切换主线程性能调试浮层"""
+        try:
+            if self.profiler_overlay and self.profiler_overlay.winfo_exists():
+                self.profiler_overlay.destroy()
+                self.profiler_overlay = None
+                return
+
+            overlay = tk.Toplevel(self.root)
+            overlay.title("UI PROFILER")
+            overlay.overrideredirect(True)
+            overlay.attributes("-topmost", True)
+            overlay.attributes("-alpha", 0.85)
+            overlay.configure(bg=self.colors["bg_primary"])
+            overlay.geometry(f"+{self.root.winfo_x() + 20}+{self.root.winfo_y() + 20}")
+
+            overlay.report_label = tk.Label(
+                overlay,
+                text="",
+                font=("Consolas", 9),
+                justify="left",
+                anchor="w",
+                bg=self.colors["bg_primary"],
+                fg=self.colors["neon_cyan"],
+                padx=8,
+                pady=6,
+            )
+            overlay.report_label.pack(fill="both", expand=True)
+            # 点击浮层关闭
+            overlay.report_label.bind(
+                "<Button-1>", lambda e: self.toggle_profiler_overlay())
+
+            self.profiler_overlay = overlay
+            self._refresh_profiler_overlay()
+        except Exception as e:
+            print(f"[DEBUG] 切换性能浮层失败: {e}")
+
+    def _refresh_profiler_overlay(self):
+        """每秒刷新调试浮层内容"""
+        overlay = self.profiler_overlay
+        if not overlay:
+            return
+        try:
+            if not overlay.winfo_exists():
+                self.profiler_overlay = None
+                return
+            budget = self.ui_governor.get_frame_budget(self.rgb_interval)
+            header = (f"LEVEL {budget['level']}  busy {budget['busy_ratio']:.0%}  "
+                      f"headroom {budget.get('headroom_ms', 0):.0f}ms")
+            sections = [header, self.ui_profiler.format_report(), self.shadow_text.format_stats()]
+            server_lines = self.get_server_log_tail(5)
+            if server_lines:
+                sections.append("SERVER LOG\n" + "\n".join(line[-100:] for line in server_lines))
+            overlay.report_label.config(text="\n".join(sections))
+            overlay.after(1000, self._refresh_profiler_overlay)
+        except tk.TclError:
+            self.profiler_overlay = None
 
     def set_rgb_speed(self, speed_label):
         """设置RGB动画速度: Slow/Normal/Fast（最大化性能优化）"""
@@ -3963,6 +2818,44 @@ Orbitron 是一款未来主义科幻字体，
         self.refresh_combo.bind("<<ComboboxSelected>>",
                                 self.on_refresh_changed)
 
+        # 战斗选择（自动切分的最近几场战斗）
+        encounter_frame = tk.Frame(left_frame, bg=self.colors["bg_accent"])
+        encounter_frame.pack(anchor="w", pady=(0, 5))
+
+        tk.Label(
+            encounter_frame,
+            text="PULL:",
+            font=self.get_font(9, "bold"),
+            bg=self.colors["bg_accent"],
+            fg=self.colors["text_primary"],
+        ).pack(side="left")
+
+        self.encounter_var = tk.StringVar(value="LIVE")
+        self.encounter_combo = ttk.Combobox(
+            encounter_frame,
+            textvariable=self.encounter_var,
+            values=["LIVE"],
+            width=22,
+            state="readonly",
+        )
+        self.encounter_combo.pack(side="left", padx=(8, 0))
+        self.encounter_combo.bind("<<ComboboxSelected>>",
+                                  self.on_encounter_selected)
+        self._encounter_choices = {}
+
+        # 帧预算显示（负载调节器状态）
+        self.frame_budget_label = tk.Label(
+            left_frame,
+            text="FRAME: NORMAL",
+            font=self.get_font(8),
+            bg=self.colors["bg_accent"],
+            fg=self.colors["neon_green"],
+        )
+        self.frame_budget_label.pack(anchor="w")
+        self.frame_budget_label.config(cursor="hand2")
+        self.frame_budget_label.bind(
+            "<Button-1>", lambda e: self.toggle_profiler_overlay())
+
         # 右侧：控制按钮区域
         right_container = tk.Frame(
             controls_container, bg=self.colors["bg_accent"])
@@ -4213,2400 +3106,52 @@ Orbitron 是一款未来主义科幻字体，
 
     def _create_minimal_mode(self):
         """创建MINI模式窗口的实际实现"""
-        self.root.withdraw()
-        mini = tk.Toplevel()
-        mini.title("◊ STAR_RESONANCE_MINI_CONSOLE ◊")
-        mini.geometry("440x700")  # 缩减高度
-        mini.resizable(False, False)
-        mini.wm_attributes("-topmost", True)
-        mini.overrideredirect(True)
-        # 为MINI窗口设置与主界面相同的透明度
-        mini.current_alpha = self.current_alpha
-        mini.wm_attributes("-alpha", 0.0)  # 初始透明度为0，准备淡入
-        # 去除黑边，使用主背景色
-        mini.configure(bg=self.colors["bg_primary"])
-        drag_data = {"x": 0, "y": 0, "dragging": False}
-
-        # 创建MINI窗口信息字典
-        mini_info = {
-            "window": mini,
-            "alpha_var": None,
-            "alpha_label": None
-        }
-
-        # 创建RGB边框容器（与主UI完全一致的圆角背景）
-        if Image is not None:
-            # 尝试为MINI窗口设置圆角区域
-            try:
-                import ctypes
-                mini.update()
-                hwnd = ctypes.windll.user32.GetParent(mini.winfo_id())
-                if hwnd == 0:
-                    hwnd = mini.winfo_id()
-
-                width = 440
-                height = 700  # 更新圆角区域高度
-                corner_radius = 12
-
-                hrgn = ctypes.windll.gdi32.CreateRoundRectRgn(
-                    0, 0, width, height, corner_radius * 2, corner_radius * 2
-                )
-
-                if hrgn:
-                    ctypes.windll.user32.SetWindowRgn(hwnd, hrgn, True)
-            except Exception:
-                pass
-
-            # 使用与主UI相同的Canvas背景方案
-            border_canvas = tk.Canvas(
-                mini, bg=self.colors["bg_primary"], highlightthickness=0, bd=0)
-            border_canvas.pack(fill="both", expand=True, padx=0, pady=0)
+        from ui_minimal_mode import create_minimal_mode
+        return create_minimal_mode(self)
 
-            # 主内容容器，使用与主UI相同的方式
-            main_content_frame = tk.Frame(
-                border_canvas, bg=self.colors["bg_primary"], bd=0, relief="flat")
+    def get_ranked_snapshot(self, user_data):
+        """用最新的玩家数据更新共享排名视图并返回（同一数据只计算一次）"""
+        try:
+            self.ranked_snapshot.update(user_data)
+        except Exception as e:
+            print(f"[DEBUG] 更新排名视图失败: {e}")
+        return self.ranked_snapshot
 
-            # 在Canvas中创建窗口
-            border_space = 6  # 边框空间
-            content_window = border_canvas.create_window(
-                border_space, border_space,
-                anchor="nw",
-                window=main_content_frame
-            )
+    def update_self_dps_bar(self, mini, user_data, snapshot):
+        """更新本人DPS条显示"""
+        from ui_minimal_mode import update_self_dps_bar
+        return update_self_dps_bar(self, mini, user_data, snapshot)
 
-            mini._border_imgtk = None
-            mini._border_cache_key = None
-            mini.rgb_index = 0
+    def create_self_dps_display(self, container, uid, data, rank, total_players, first_place_dps=0):
+        """创建本人DPS显示条"""
+        from ui_minimal_mode import create_self_dps_display
+        return create_self_dps_display(self, container, uid, data, rank, total_players, first_place_dps)
 
-            def render_mini_border():
-                """渲染MINI窗口的完整圆角背景（与主UI一致），优化缓存减少闪烁"""
-                canvas_w = border_canvas.winfo_width()
-                canvas_h = border_canvas.winfo_height()
-                if canvas_w <= 0 or canvas_h <= 0:
-                    return
+    def _close_minimal_mode(self, mini):
+        """关闭最小模式并恢复主界面"""
+        if mini and mini.winfo_exists():
+            # 取消所有保存的after任务，防止字幕回收问题
+            try:
+                if hasattr(mini, '_after_tasks'):
+                    for task_id in mini._after_tasks:
+                        try:
+                            mini.after_cancel(task_id)
+                        except:
+                            pass
+                    mini._after_tasks.clear()
+            except Exception as e:
+                print(f"取消after任务时出错: {e}")
 
-                # 更新内容区域大小
-                content_width = canvas_w - (border_space * 2)
-                content_height = canvas_h - (border_space * 2)
-                border_canvas.itemconfig(
-                    content_window,
-                    width=content_width,
-                    height=content_height
-                )
+            # 从mini_windows列表中移除该窗口的引用
+            self.mini_windows = [info for info in self.mini_windows
+                                 if not (info.get("window") and info["window"] == mini)]
+            mini.destroy()
+        self.root.deiconify()
 
-                current_color = self.border_colors[mini.rgb_index % len(
-                    self.border_colors)]
-                key = (canvas_w, canvas_h, current_color)
-
-                # 更严格的缓存检查，减少不必要的重绘
-                if (getattr(mini, "_border_cache_key", None) == key and
-                    mini._border_imgtk is not None and
-                    hasattr(border_canvas, 'find_withtag') and
-                        border_canvas.find_withtag("bg_image")):
-                    return
-
-                # 创建完整的圆角背景（与主UI一致）
-                scale = 1.5
-                W, H = int(canvas_w * scale), int(canvas_h * scale)
-                r = max(0, int(12 * scale))  # 与主UI相同的圆角
-                bw = max(1, int(3 * scale))  # 与主UI相同的边框宽度
-
-                # 安全检查，确保边框不会导致无效的坐标
-                if W <= bw * 2 or H <= bw * 2:
-                    return  # 尺寸太小，跳过渲染
-
-                img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(img)
-
-                # 绘制完整的圆角背景
-                bg_color = self.colors["bg_primary"]
-                draw.rounded_rectangle(
-                    [0, 0, W-1, H-1], radius=r, fill=bg_color)
-
-                # 添加RGB边框发光效果
-                try:
-                    glow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-                    gdraw = ImageDraw.Draw(glow)
-                    gdraw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
-                                            radius=r, outline=current_color, width=bw)
-                    glow = glow.filter(
-                        ImageFilter.GaussianBlur(1.5 * scale / 10))
-                    img = Image.alpha_composite(img, glow)
-                except Exception:
-                    pass
-
-                # 绘制清晰的RGB边框
-                draw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
-                                       radius=r, outline=current_color, width=bw)
-
-                img = img.resize((canvas_w, canvas_h), resample=Image.LANCZOS)
-                imgtk = ImageTk.PhotoImage(img)
-                border_canvas.delete("bg_image")
-                border_canvas.create_image(
-                    0, 0, anchor="nw", image=imgtk, tags="bg_image")
-                mini._border_imgtk = imgtk
-                mini._border_cache_key = key
-
-            def mini_rgb_animate():
-                """MINI窗口RGB动画（与主UI同步），优化减少闪烁"""
-                if not mini.winfo_exists():
-                    return
-
-                # 检查是否真的需要更新
-                old_index = getattr(mini, 'rgb_index', 0)
-                mini.rgb_index = (mini.rgb_index + 1) % len(self.border_colors)
-
-                # 只有当颜色真的改变时才重新渲染
-                if mini.rgb_index != old_index:
-                    # 使用更温和的渲染方式，避免闪烁
-                    if hasattr(mini, '_mini_rgb_timer'):
-                        mini.after_cancel(mini._mini_rgb_timer)
-                    mini._mini_rgb_timer = mini.after(10, render_mini_border)
-
-                mini.after(self.rgb_interval, mini_rgb_animate)
-
-            def on_mini_resize(event):
-                """MINI窗口大小变化处理，减少闪烁"""
-                if hasattr(mini, '_mini_resize_timer'):
-                    mini.after_cancel(mini._mini_resize_timer)
-                # 增加延迟，减少频繁重绘
-                mini._mini_resize_timer = mini.after(100, render_mini_border)
-
-            # 绑定事件
-            border_canvas.bind("<Configure>", on_mini_resize)
-
-            # 初始渲染与动画
-            mini.after(100, render_mini_border)
-            mini.after(self.rgb_interval, mini_rgb_animate)
-        else:
-            # 回退为矩形边框，去除黑边
-            shadow_frame = tk.Frame(
-                mini, bg=self.colors["bg_primary"], bd=0, relief="flat")
-            shadow_frame.pack(fill="both", expand=True, padx=0, pady=0)
-            border_frame = tk.Frame(
-                shadow_frame, bg="#ff0000", bd=0, relief="flat")
-            border_frame.pack(fill="both", expand=True, padx=3, pady=3)
-            gradient_frame = tk.Frame(
-                border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
-            gradient_frame.pack(fill="both", expand=True, padx=2, pady=2)
-            main_content_frame = tk.Frame(
-                gradient_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
-            main_content_frame.pack(fill="both", expand=True, padx=6, pady=6)
-
-            def mini_rgb_animate():
-                if not mini.winfo_exists():
-                    return
-                color_index = getattr(mini, "rgb_index", 0)
-                current_color = self.border_colors[color_index % len(
-                    self.border_colors)]
-                border_frame.config(bg=current_color)
-                mini.rgb_index = (color_index + 1) % len(self.border_colors)
-                mini.after(self.rgb_interval, mini_rgb_animate)
-
-        # 创建标题栏（使用主UI风格）
-        header_outer, header_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_cyan"],
-            padding=2,  # 减小内边距
-        )
-        header_outer.configure(height=65)  # 设置外框固定高度为原来的一半
-        header_outer.pack(fill="x", pady=(6, 4))  # 减小外边距
-        header_outer.pack_propagate(False)  # 防止子控件改变外框大小
-
-        # 标题内容容器
-        title_container = tk.Frame(
-            header_frame, bg=self.colors["bg_secondary"])
-        title_container.pack(fill="x", pady=int(3 * 1.1))  # 扩大1.1倍
-
-        # 主标题 - 缩小字体并添加阴影效果的Canvas
-        title_canvas = tk.Canvas(
-            title_container,
-            height=int(25 * 1.1),  # 缩减为原来的一半
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        title_canvas.pack(fill="x", pady=int(2 * 1.1))
-
-        def draw_title_with_shadow():
-            title_canvas.delete("all")
-            title_text = "▓▓▓ MINI_CONSOLE ▓▓▓"
-            font_tuple = self.get_font(int(12 * 1.1), "normal")
-
-            # 获取画布中心位置
-            canvas_width = title_canvas.winfo_width()
-            if canvas_width > 1:
-                center_x = canvas_width // 2
-                center_y = int(12 * 1.1)
-
-                # 绘制多层阴影（渐变效果）
-                shadow_layers = [
-                    (3, 3, "#000000"),
-                    (2, 2, "#111111"),
-                    (1, 1, "#222222")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    title_canvas.create_text(
-                        center_x + dx,
-                        center_y + dy,
-                        text=title_text,
-                        font=font_tuple,
-                        fill=shadow_color,
-                        anchor="center"
-                    )
-
-                # 绘制边框效果（使用深灰色）
-                border_color = "#333333"
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                    title_canvas.create_text(
-                        center_x + dx,
-                        center_y + dy,
-                        text=title_text,
-                        font=font_tuple,
-                        fill=border_color,
-                        anchor="center"
-                    )
-
-                # 绘制主文字
-                title_canvas.create_text(
-                    center_x,
-                    center_y,
-                    text=title_text,
-                    font=font_tuple,
-                    fill=self.colors["neon_cyan"],
-                    anchor="center"
-                )
-
-        # 绑定配置事件以重绘标题
-        title_canvas.bind("<Configure>", lambda e: draw_title_with_shadow())
-        title_canvas.after(10, draw_title_with_shadow)
-
-        # 副标题 - 使用Canvas添加阴影
-        subtitle_canvas = tk.Canvas(
-            title_container,
-            height=int(16 * 1.1),  # 缩减为原来的一半
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        subtitle_canvas.pack(fill="x")
-
-        def draw_subtitle_with_shadow():
-            # 检查canvas是否仍然存在
-            try:
-                if not subtitle_canvas.winfo_exists():
-                    return
-            except:
-                return
-
-            subtitle_canvas.delete("all")
-            subtitle_text = "[REAL_TIME_RANKING]"
-            font_tuple = self.get_font(int(8 * 1.1), "normal")
-
-            # 获取画布中心位置
-            try:
-                canvas_width = subtitle_canvas.winfo_width()
-                if canvas_width > 1:
-                    center_x = canvas_width // 2
-                    center_y = int(8 * 1.1)
-
-                    # 绘制多层阴影
-                    shadow_layers = [
-                        (2, 2, "#000000"),
-                        (1, 1, "#111111")
-                    ]
-
-                    for dx, dy, shadow_color in shadow_layers:
-                        subtitle_canvas.create_text(
-                            center_x + dx,
-                            center_y + dy,
-                            text=subtitle_text,
-                            font=font_tuple,
-                            fill=shadow_color,
-                            anchor="center"
-                        )
-
-                    # 绘制边框效果
-                    border_color = "#333333"
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        subtitle_canvas.create_text(
-                            center_x + dx,
-                            center_y + dy,
-                            text=subtitle_text,
-                            font=font_tuple,
-                            fill=border_color,
-                            anchor="center"
-                        )
-
-                    # 绘制主文字
-                    subtitle_canvas.create_text(
-                        center_x,
-                        center_y,
-                        text=subtitle_text,
-                        font=font_tuple,
-                        fill=self.colors["neon_green"],
-                        anchor="center"
-                    )
-            except:
-                # 如果canvas已被销毁，静默忽略错误
-                pass
-
-        # 保存after任务ID到mini窗口，以便后续取消
-        if not hasattr(mini, '_after_tasks'):
-            mini._after_tasks = []
-
-        def safe_bind_configure():
-            try:
-                subtitle_canvas.bind(
-                    "<Configure>", lambda e: draw_subtitle_with_shadow())
-            except:
-                pass
-
-        def safe_after_draw():
-            try:
-                task_id = subtitle_canvas.after(10, draw_subtitle_with_shadow)
-                mini._after_tasks.append(task_id)
-            except:
-                pass
-
-        safe_bind_configure()
-        safe_after_draw()
-
-        # 关闭按钮 - 圆角版本（缩小尺寸）
-        close_btn = self.create_enhanced_button(
-            title_container, "✕", lambda: self._close_minimal_mode(mini),
-            self.colors["neon_pink"], width=2, height=1  # 缩小宽度从3到2
-        )
-        close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-3, y=2)  # 调整位置
-
-        # 创建本人DPS显示区域
-        self_dps_outer, self_dps_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_yellow"],
-            padding=int(2 * 1.1),
-        )
-        self_dps_outer.configure(height=75)  # 设置外框固定高度为原来的一半
-        self_dps_outer.pack(fill="x", pady=(0, int(2 * 1.1)))
-        self_dps_outer.pack_propagate(False)  # 防止子控件改变外框大小
-
-        # 本人DPS标题
-        self_dps_title_canvas = tk.Canvas(
-            self_dps_frame,
-            height=int(0),
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        self_dps_title_canvas.pack(fill="x", pady=int(2 * 1.1))
-
-        def draw_self_dps_title():
-            self_dps_title_canvas.delete("all")
-            title_text = "[MY_PERFORMANCE]:"
-            font_tuple = self.get_font(int(8 * 1.1), "normal")
-
-            canvas_width = self_dps_title_canvas.winfo_width()
-            if canvas_width > 1:
-                center_x = canvas_width // 2
-                center_y = int(8 * 1.1)
-
-                # 绘制阴影
-                for dx, dy in [(1, 1), (2, 2)]:
-                    self_dps_title_canvas.create_text(
-                        center_x + dx, center_y + dy,
-                        text=title_text, font=font_tuple,
-                        fill="#000000", anchor="center"
-                    )
-
-                # 绘制主文字
-                self_dps_title_canvas.create_text(
-                    center_x, center_y,
-                    text=title_text, font=font_tuple,
-                    fill=self.colors["neon_yellow"], anchor="center"
-                )
-
-        self_dps_title_canvas.bind(
-            "<Configure>", lambda e: draw_self_dps_title())
-        self_dps_title_canvas.after(10, draw_self_dps_title)
-
-        # 本人DPS条容器
-        self_dps_container = tk.Frame(
-            self_dps_frame, bg=self.colors["bg_secondary"])
-        self_dps_container.pack(fill="x", padx=int(6 * 1.1), pady=int(2 * 1.1))
-
-        # 存储本人DPS显示组件的引用
-        mini._self_dps_container = self_dps_container
-
-        # 创建数据显示面板（使用主UI风格）
-        data_outer, data_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_accent"],
-            border_color=self.colors["neon_green"],
-            padding=int(2 * 1.1),  # 扩大1.1倍内边距
-        )
-        data_outer.pack(fill="both", expand=True,
-                        pady=(0, int(4 * 1.1)))  # 扩大1.1倍外边距
-
-        # 数据面板标题 - 使用Canvas添加阴影
-        data_title_canvas = tk.Canvas(
-            data_frame,
-            height=int(18 * 1.1),  # 扩大1.1倍高度
-            bg=self.colors["bg_accent"],
-            highlightthickness=0,
-            bd=0
-        )
-        data_title_canvas.pack(fill="x", pady=int(3 * 1.1))
-
-        def draw_data_title_with_shadow():
-            data_title_canvas.delete("all")
-            title_text = "[DAMAGE_RANKING]:"
-            font_tuple = self.get_font(int(9 * 1.1), "normal")
-
-            canvas_width = data_title_canvas.winfo_width()
-            if canvas_width > 1:
-                center_x = canvas_width // 2
-                center_y = int(9 * 1.1)
-
-                # 绘制多层阴影
-                shadow_layers = [
-                    (2, 2, "#000000"),
-                    (1, 1, "#111111")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    data_title_canvas.create_text(
-                        center_x + dx,
-                        center_y + dy,
-                        text=title_text,
-                        font=font_tuple,
-                        fill=shadow_color,
-                        anchor="center"
-                    )
-
-                # 绘制边框效果
-                border_color = "#333333"
-                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    data_title_canvas.create_text(
-                        center_x + dx,
-                        center_y + dy,
-                        text=title_text,
-                        font=font_tuple,
-                        fill=border_color,
-                        anchor="center"
-                    )
-
-                # 绘制主文字
-                data_title_canvas.create_text(
-                    center_x,
-                    center_y,
-                    text=title_text,
-                    font=font_tuple,
-                    fill=self.colors["neon_green"],
-                    anchor="center"
-                )
-
-        data_title_canvas.bind(
-            "<Configure>", lambda e: draw_data_title_with_shadow())
-        data_title_canvas.after(10, draw_data_title_with_shadow)
-
-        # 内容容器
-        content_container = tk.Frame(data_frame, bg=self.colors["bg_accent"])
-        content_container.pack(fill="both", expand=True,
-                               padx=int(6 * 1.1), pady=int(3 * 1.1))  # 扩大1.1倍边距
-
-        def start_drag(event):
-            # 检查事件来源，避免在滑块、按钮等控件上触发拖拽
-            widget_class = event.widget.__class__.__name__
-            if widget_class in ['Scale', 'Button', 'Entry', 'Text', 'Listbox', 'Scrollbar']:
-                return
-
-            # 检查是否点击在滑块容器内
-            if hasattr(event, 'stopPropagation'):
-                return
-
-            drag_data["x"] = event.x_root - mini.winfo_x()
-            drag_data["y"] = event.y_root - mini.winfo_y()
-            drag_data["dragging"] = True
-
-        def drag_window(event):
-            # 同样检查事件来源
-            widget_class = event.widget.__class__.__name__
-            if widget_class in ['Scale', 'Button', 'Entry', 'Text', 'Listbox', 'Scrollbar']:
-                return
-
-            # 检查是否在滑块容器内
-            if hasattr(event, 'stopPropagation'):
-                return
-
-            if drag_data["dragging"]:
-                x = event.x_root - drag_data["x"]
-                y = event.y_root - drag_data["y"]
-                mini.geometry(f"+{x}+{y}")
-
-                # 同时更新所有关联的timer窗口位置
-                # 方法1：检查mini对象的关联timer
-                if hasattr(mini, 'associated_timers'):
-                    for timer_window in mini.associated_timers:
-                        if timer_window.winfo_exists():
-                            # 使用固定的MINI窗口宽度（440px）+ 10像素间距
-                            timer_x = x + 440 + 10
-                            timer_y = y
-                            timer_window.geometry(f"+{timer_x}+{timer_y}")
-
-                else:
-
-                    # 方法2：通过全局timer列表搜索引用此mini窗口的timer
-                    for i, timer_window in enumerate(self.timer_windows):
-                        print(
-                            f"检查timer窗口 {i}: 存在={timer_window.winfo_exists()}, 有reference_window={hasattr(timer_window, 'reference_window')}")
-                        if hasattr(timer_window, 'reference_window'):
-                            print(
-                                f"Timer窗口 {i} 的reference_window: {timer_window.reference_window}, mini: {mini}")
-                        if (timer_window.winfo_exists() and
-                            hasattr(timer_window, 'reference_window') and
-                                timer_window.reference_window == mini):
-                            timer_x = x + 440 + 10
-                            timer_y = y
-                            timer_window.geometry(f"+{timer_x}+{timer_y}")
-
-                            print(f"通过全局搜索更新timer窗口位置: {timer_x}, {timer_y}")
-
-        def stop_drag(event):
-            drag_data["dragging"] = False
-
-        # 只为特定容器绑定拖拽事件，避免与控件冲突
-        drag_widgets = [main_content_frame, header_frame]
-        for widget in drag_widgets:
-            widget.bind("<Button-1>", start_drag)
-            widget.bind("<B1-Motion>", drag_window)
-            widget.bind("<ButtonRelease-1>", stop_drag)
-
-        def render_content():
-            # 优先从API获取数据，如果失败则使用current_data
-            data = None
-            if not self.direct_mode:
-                try:
-                    import requests
-                    response = requests.get(self.api_url, timeout=2)
-                    if response.status_code == 200:
-                        data = response.json()
-                except:
-                    pass
-
-            # 如果API获取失败，使用其他数据源
-            if not data:
-                data = (self.current_data
-                        if self.current_data else self.get_direct_data() or {
-                            "user": {}
-                        })
-
-            user_data = data.get("user", {})
-            sorted_users = sorted(
-                user_data.items(),
-                key=lambda x: x[1].get("total_damage", {}).get(
-                    "total", 0) if x[1] else 0,
-                reverse=True,
-            )
-
-            # 更新本人DPS条
-            self.update_self_dps_bar(mini, user_data, sorted_users)
-
-            # 检查是否需要重新创建UI（数据变化才重创建，减少闪烁）
-            current_user_count = len(sorted_users)
-            last_user_count = getattr(
-                content_container, '_last_user_count', -1)
-            need_recreate = (last_user_count != current_user_count or
-                             not hasattr(content_container, '_main_canvas'))
-
-            if need_recreate:
-                # 只在必要时清除现有内容
-                for widget in content_container.winfo_children():
-                    widget.destroy()
-                content_container._last_user_count = current_user_count
-
-            # 如果没有数据，显示等待信息
-            if not sorted_users:
-                no_data_canvas = tk.Canvas(
-                    content_container,
-                    height=int(60 * 1.1),  # 扩大1.1倍高度
-                    bg=self.colors["bg_accent"],
-                    highlightthickness=0,
-                    bd=0
-                )
-                no_data_canvas.pack(fill="x", pady=int(10 * 1.1))
-
-                def draw_no_data_with_shadow():
-                    no_data_canvas.delete("all")
-                    text_lines = [
-                        "▓▓▓ WAITING_FOR_DATA ▓▓▓",
-                        "[SYSTEM]: 未检测到战斗数据",
-                        "[STATUS]: 等待玩家开始战斗..."
-                    ]
-
-                    canvas_width = no_data_canvas.winfo_width()
-                    if canvas_width > 1:
-                        center_x = canvas_width // 2
-                        font_tuple = self.get_font(int(8 * 1.1), "normal")
-
-                        for i, line in enumerate(text_lines):
-                            y_pos = int(10 * 1.1) + i * int(16 * 1.1)
-
-                            # 绘制多层阴影
-                            shadow_layers = [
-                                (2, 2, "#000000"),
-                                (1, 1, "#111111")
-                            ]
-
-                            for dx, dy, shadow_color in shadow_layers:
-                                no_data_canvas.create_text(
-                                    center_x + dx,
-                                    y_pos + dy,
-                                    text=line,
-                                    font=font_tuple,
-                                    fill=shadow_color,
-                                    anchor="center"
-                                )
-
-                            # 绘制边框效果
-                            border_color = "#333333"
-                            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                                no_data_canvas.create_text(
-                                    center_x + dx,
-                                    y_pos + dy,
-                                    text=line,
-                                    font=font_tuple,
-                                    fill=border_color,
-                                    anchor="center"
-                                )
-
-                            # 绘制主文字
-                            color = self.colors["neon_cyan"] if i == 0 else self.colors["text_accent"]
-                            no_data_canvas.create_text(
-                                center_x,
-                                y_pos,
-                                text=line,
-                                font=font_tuple,
-                                fill=color,
-                                anchor="center"
-                            )
-
-                no_data_canvas.bind(
-                    "<Configure>", lambda e: draw_no_data_with_shadow())
-                no_data_canvas.after(10, draw_no_data_with_shadow)
-                return
-
-            # 计算显示参数 - 扩大1.1倍尺寸
-            bar_area_w = int(320 * 1.1)  # 扩大1.1倍宽度
-            bar_h = int(24 * 1.1)  # 扩大1.1倍高度
-            gap = int(6 * 1.1)  # 扩大1.1倍间距
-            max_bars = 10  # 增加到最多显示10个人
-            show_users = sorted_users[:max_bars]
-            max_val = max([u[1].get("total_damage", {}).get("total", 0)
-                           for u in show_users] + [1])
-            canvas_h = bar_h * len(show_users) + gap * \
-                (len(show_users) - 1) + int(30 * 1.1)
-
-            # 创建或重用滚动区域
-            if need_recreate or not hasattr(content_container, '_canvas_container'):
-                canvas_container = tk.Frame(
-                    content_container, bg=self.colors["bg_accent"])
-                canvas_container.pack(
-                    fill="both", expand=True, pady=int(3 * 1.1))
-                content_container._canvas_container = canvas_container
-
-                canvas = tk.Canvas(
-                    canvas_container,
-                    width=int((bar_area_w + 40) * 1.1),  # 扩大1.1倍宽度
-                    height=min(canvas_h, int(480 * 1.1)),  # 扩大1.1倍最大高度
-                    bg=self.colors["bg_primary"],
-                    highlightthickness=1,
-                    highlightcolor=self.colors["border_light"],
-                    relief="solid",
-                    bd=0,
-                )
-                canvas.pack(pady=int(3 * 1.1))
-                content_container._main_canvas = canvas
-            else:
-                # 重用现有Canvas，只清除内容不重新创建
-                canvas = content_container._main_canvas
-                canvas.delete("all")  # 只删除Canvas内容，不重创建Widget
-
-            # 绘制数据条（使用现有Canvas，减少闪烁）
-            for idx, (uid, info) in enumerate(show_users):
-                total = info.get("total_damage", {}).get(
-                    "total", 0) if info else 0
-                dps = info.get("total_dps", 0) if info else 0
-                profession = info.get("profession", "未知")
-
-                # 排名颜色
-                if idx == 0:
-                    bar_color = self.colors["neon_green"]
-                    text_color = self.colors["neon_green"]
-                elif idx == 1:
-                    bar_color = self.colors["neon_cyan"]
-                    text_color = self.colors["neon_cyan"]
-                elif idx == 2:
-                    bar_color = self.colors["neon_yellow"]
-                    text_color = self.colors["neon_yellow"]
-                else:
-                    bar_color = self.colors["neon_purple"]
-                    text_color = self.colors["text_primary"]
-
-                y0 = int(15 * 1.1) + idx * (bar_h + gap)  # 扩大1.1倍起始位置
-                bar_len = int((total / max_val) *
-                              (bar_area_w - int(115 * 1.1)))  # 扩大1.1倍计算，调整进度条宽度
-
-                # 排名标识 - 带阴影
-                rank_text = f"#{idx + 1}"
-                rank_font = self.get_font(
-                    int(10 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
-                # 阴影
-                canvas.create_text(
-                    int(8 * 1.1) + 1, y0 + bar_h // 2 + 1,
-                    text=rank_text, font=rank_font, fill="#000000", anchor="w"
-                )
-                # 主文字
-                canvas.create_text(
-                    int(8 * 1.1), y0 + bar_h // 2,
-                    text=rank_text, font=rank_font, fill=text_color, anchor="w"
-                )
-
-                # 玩家信息 - 带阴影，向右移动
-                display_name = self.get_display_name(uid)  # 使用映射的用户名
-                player_info = f"{display_name}"
-                if len(player_info) > 8:  # 截断过长的用户名
-                    player_info = player_info[:8] + "..."
-                player_font = self.get_font(
-                    int(8 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
-                # 阴影
-                canvas.create_text(
-                    int(42 * 1.1) + 1, y0 + bar_h // 2 -
-                    int(4 * 1.1) + 1,  # 从35移动到42
-                    text=player_info, font=player_font, fill="#000000", anchor="w"
-                )
-                # 主文字
-                canvas.create_text(
-                    int(42 * 1.1), y0 + bar_h // 2 - int(4 * 1.1),  # 从35移动到42
-                    text=player_info, font=player_font, fill=self.colors["text_primary"], anchor="w"
-                )
-
-                # 职业信息 - 带阴影，向右移动
-                prof_info = f"[{profession}]"
-                prof_font = self.get_font(int(7 * 1.1), "normal")  # 扩大1.1倍字体
-                # 阴影
-                canvas.create_text(
-                    int(42 * 1.1) + 1, y0 + bar_h // 2 +
-                    int(4 * 1.1) + 1,  # 从35移动到42
-                    text=prof_info, font=prof_font, fill="#000000", anchor="w"
-                )
-                # 主文字
-                canvas.create_text(
-                    int(42 * 1.1), y0 + bar_h // 2 + int(4 * 1.1),  # 从35移动到42
-                    text=prof_info, font=prof_font, fill=self.colors["neon_orange"], anchor="w"
-                )
-
-                # 进度条背景（深色）- 左移5像素
-                canvas.create_rectangle(
-                    int(105 * 1.1), y0 + int(4 * 1.1),
-                    int(105 * 1.1) + (bar_area_w - int(115 * 1.1)), y0 +
-                    bar_h - int(4 * 1.1),
-                    fill=self.colors["bg_secondary"],
-                    outline=self.colors["border_dark"],
-                    width=1,
-                )
-
-                # 进度条（带阴影效果）
-                if bar_len > 0:
-                    # 阴影
-                    canvas.create_rectangle(
-                        int(107 * 1.1), y0 + int(6 * 1.1),
-                        int(105 * 1.1) + bar_len +
-                        2, y0 + bar_h - int(2 * 1.1),
-                        fill="#000000", outline="", width=0,
-                    )
-                    # 主条
-                    canvas.create_rectangle(
-                        int(105 * 1.1), y0 + int(4 * 1.1),
-                        int(105 * 1.1) + bar_len, y0 + bar_h - int(4 * 1.1),
-                        fill=bar_color,
-                        outline=self.colors["bg_primary"],
-                        width=1,  # 保持边框大小
-                    )
-
-                # 在进度条上显示DPS - 带边框和阴影
-                avg_dps_text = f"DPS:{dps:,.0f}"
-                if dps >= 1000000:
-                    avg_dps_text = f"DPS:{dps/1000000:.1f}M"
-                elif dps >= 1000:
-                    avg_dps_text = f"DPS:{dps/1000:.1f}K"
-
-                dps_font = self.get_font(
-                    int(6 * 1.1 * 1.2), "normal")  # 放大1.2倍
-
-                # 计算DPS文字位置（在进度条中间偏左）
-                dps_x = int(105 * 1.1) + max(int(40 * 1.1), bar_len // 3)
-                dps_y = y0 + bar_h // 2
-
-                # DPS数字边框效果
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    canvas.create_text(
-                        dps_x + dx, dps_y + dy,
-                        text=avg_dps_text, font=dps_font, fill="#000000", anchor="w"
-                    )
-
-                # DPS阴影
-                canvas.create_text(
-                    dps_x + 1, dps_y + 1,
-                    text=avg_dps_text, font=dps_font, fill="#111111", anchor="w"
-                )
-
-                # DPS主文字（使用黄色高亮）
-                canvas.create_text(
-                    dps_x, dps_y,
-                    text=avg_dps_text, font=dps_font, fill=self.colors["neon_yellow"], anchor="w"
-                )
-
-                # 伤害数值 - 带边框和阴影（移动到右上角）
-                damage_text = self.format_damage_number(total)
-
-                damage_font = self.get_font(
-                    int(9 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
-
-                # 伤害数字边框效果（四方向）
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    canvas.create_text(
-                        bar_area_w + int(30 * 1.1) + dx, y0 + bar_h // 2 + dy,
-                        text=damage_text, font=damage_font, fill="#000000", anchor="e"
-                    )
-
-                # 阴影
-                canvas.create_text(
-                    bar_area_w + int(30 * 1.1) + 2, y0 + bar_h // 2 + 2,
-                    text=damage_text, font=damage_font, fill="#111111", anchor="e"
-                )
-
-                # 主文字
-                canvas.create_text(
-                    bar_area_w + int(30 * 1.1), y0 + bar_h // 2,
-                    text=damage_text, font=damage_font, fill=text_color, anchor="e"
-                )
-
-        # 创建状态栏和控制栏（使用主UI风格）- 高度匹配文本
-        status_outer, status_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["border_light"],
-            padding=int(1 * 1.1),  # 扩大1.1倍内边距
-        )
-        # 设置固定高度，只够容纳文本
-        status_outer.configure(height=int(35 * 1.1))  # 设置为文本高度的合适尺寸
-        status_outer.pack(fill="x", pady=(0, int(4 * 1.1)))  # 扩大1.1倍外边距
-        status_outer.pack_propagate(False)  # 防止子控件改变外框大小
-
-        # 状态栏和控制栏容器
-        status_control_container = tk.Frame(
-            status_frame, bg=self.colors["bg_secondary"])
-        status_control_container.pack(
-            fill="x", padx=int(3 * 1.1), pady=int(1 * 1.1))
-
-        # 左侧：状态信息
-        status_left = tk.Frame(status_control_container,
-                               bg=self.colors["bg_secondary"])
-        status_left.pack(side="left", fill="x", expand=True)
-
-        # 状态栏Canvas - 添加阴影效果
-        status_canvas = tk.Canvas(
-            status_left,
-            height=int(16 * 1.1),  # 扩大1.1倍高度
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        status_canvas.pack(fill="x", pady=int(1 * 1.1))
-
-        def update_status_with_shadow(text):
-            status_canvas.delete("all")
-            font_tuple = self.get_font(int(7 * 1.1), "normal")
-
-            canvas_width = status_canvas.winfo_width()
-            if canvas_width > 1:
-                # 绘制多层阴影
-                shadow_layers = [
-                    (2, 2, "#000000"),
-                    (1, 1, "#111111")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    status_canvas.create_text(
-                        int(6 * 1.1) + dx, int(8 * 1.1) + dy,
-                        text=text, font=font_tuple, fill=shadow_color, anchor="w"
-                    )
-
-                # 绘制边框效果
-                border_color = "#333333"
-                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    status_canvas.create_text(
-                        int(6 * 1.1) + dx, int(8 * 1.1) + dy,
-                        text=text, font=font_tuple, fill=border_color, anchor="w"
-                    )
-
-                # 主文字
-                status_canvas.create_text(
-                    int(6 * 1.1), int(8 * 1.1),
-                    text=text, font=font_tuple, fill=self.colors["text_accent"], anchor="w"
-                )
-
-        # 右侧：透明度控制
-        alpha_control = tk.Frame(
-            status_control_container, bg=self.colors["bg_secondary"])
-        alpha_control.pack(side="right", padx=(int(10 * 1.1), 0))
-
-        # 透明度标签
-        tk.Label(
-            alpha_control,
-            text="ALPHA:",
-            font=self.get_font(int(6 * 1.1), "normal"),
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["text_primary"],
-        ).pack(side="left", padx=(0, int(2 * 1.1)))
-
-        # 透明度滑块
-        mini_alpha_var = tk.DoubleVar(value=self.current_alpha * 100)
-        mini_info["alpha_var"] = mini_alpha_var  # 保存到mini_info
-
-        mini_alpha_scale = tk.Scale(
-            alpha_control,
-            from_=80,  # 背景最小30%透明度
-            to=100,    # 最大100%不透明
-            orient=tk.HORIZONTAL,
-            variable=mini_alpha_var,
-            command=lambda v: self.on_mini_alpha_changed(v, mini_info),
-            font=self.get_font(int(6 * 1.1)),
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["neon_cyan"],
-            activebackground=self.colors["neon_cyan"],
-            highlightcolor=self.colors["neon_cyan"],
-            troughcolor=self.colors["bg_primary"],
-            length=int(60 * 1.1),  # 扩大1.1倍长度
-            width=int(8 * 1.1),    # 扩大1.1倍宽度
-            sliderlength=int(12 * 1.1),
-            bd=0,
-            relief="flat",
-            showvalue=0,  # 不显示数值（用单独标签显示）
-        )
-        mini_alpha_scale.pack(side="left", padx=int(1 * 1.1))
-
-        # 防止滑块区域触发窗口拖拽（但允许滑块本身的交互）
-        def prevent_mini_window_drag(event):
-            # 只阻止事件向上传播，不阻止滑块本身的功能
-            event.stopPropagation = True
-
-        alpha_control.bind("<Button-1>", prevent_mini_window_drag)
-        alpha_control.bind("<B1-Motion>", prevent_mini_window_drag)
-
-        # 透明度数值显示
-        mini_alpha_label = tk.Label(
-            alpha_control,
-            text=f"{int(self.current_alpha * 100)}%",
-            font=self.get_font(int(6 * 1.1), "normal"),
-            bg=self.colors["bg_secondary"],
-            fg=self.colors["neon_cyan"],
-            width=4,
-        )
-        mini_alpha_label.pack(side="left", padx=(int(2 * 1.1), 0))
-        mini_info["alpha_label"] = mini_alpha_label  # 保存到mini_info
-
-        # 将mini_info添加到全局列表
-        self.mini_windows.append(mini_info)
-
-        # ACT启动按钮区域（底部信息框中央）- 高度刚好容纳按钮
-        act_button_outer, act_button_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_green"],
-            padding=int(2 * 1.1),  # 减小内边距
-        )
-        # 设置固定高度，刚好容纳按钮
-        act_button_outer.configure(height=int(45 * 1.1))  # 按钮高度 + 最小边距
-        act_button_outer.pack(fill="x", pady=(int(8 * 1.1), int(4 * 1.1)))
-        act_button_outer.pack_propagate(False)  # 防止子控件改变外框大小
-
-        # ACT按钮容器 - 居中
-        act_button_container = tk.Frame(
-            act_button_frame, bg=self.colors["bg_secondary"])
-        act_button_container.pack(expand=True)
-
-        # 使用主菜单风格的按钮
-        # ACT配置选择和控制区域
-        act_control_frame = tk.Frame(
-            act_button_container, bg=self.colors["bg_secondary"])
-        act_control_frame.pack(fill="x", pady=(int(2 * 1.1), int(1 * 1.1)))
-
-        # 左侧：配置文件选择
-        config_frame = tk.Frame(
-            act_control_frame, bg=self.colors["bg_secondary"])
-        config_frame.pack(side="left", fill="x", expand=True)
-
-        config_label = tk.Label(
-            config_frame,
-            text="ACT配置:",
-            font=self.get_font(int(8 * 1.1), "normal"),
-            fg=self.colors["text_primary"],
-            bg=self.colors["bg_secondary"]
-        )
-        config_label.pack(side="left", padx=(0, 5))
-
-        # 配置文件下拉选择框
-        self.act_config_var = tk.StringVar()
-        self.config_combobox = tk.ttk.Combobox(
-            config_frame,
-            textvariable=self.act_config_var,
-            font=self.get_font(int(8 * 1.1), "normal"),
-            width=15,
-            state="readonly"
-        )
-        self.config_combobox.pack(side="left", padx=(0, 10))
-
-        # 绑定配置文件选择改变事件
-        self.config_combobox.bind(
-            "<<ComboboxSelected>>", self.on_act_config_changed)
-
-        # 刷新配置文件列表
-        self.refresh_act_configs()
-
-        # 右侧：倒计时设置和启动按钮
-        timer_control_frame = tk.Frame(
-            act_control_frame, bg=self.colors["bg_secondary"])
-        timer_control_frame.pack(side="right")
-
-        def create_act_timer():
-            # 获取选中的配置文件
-            config_name = self.act_config_var.get()
-
-            # 从JSON配置文件获取持续时间
-            total_seconds = 300  # 默认5分钟
-
-            # 重置当前配置
-            self.current_act_config = None
-
-            if config_name and config_name != "无配置文件":
-                try:
-                    config = self.load_act_config(config_name)
-                    if config:
-                        # 设置当前配置，供JASON阶段控制使用
-                        self.current_act_config = config
-
-                        if 'total_duration' in config:
-                            total_seconds = config['total_duration']
-                            print(
-                                f"从配置文件 {config_name} 获取时长: {total_seconds}秒")
-                        else:
-                            print(
-                                f"配置文件 {config_name} 中未找到 total_duration，使用默认5分钟")
-
-                        # 调试信息：检查JASON阶段配置
-                        if 'jason_phases' in config:
-                            print(
-                                f"[DEBUG] 已加载JASON阶段配置，包含 {len(config.get('jason_phases', {}))} 个阶段")
-                        else:
-                            print(f"[DEBUG] 配置文件中没有JASON阶段定义")
-                except Exception as e:
-                    print(f"解析配置文件时出错: {e}，使用默认5分钟")
-            else:
-                print("未选择配置文件，使用默认5分钟")
-
-            self.launch_act_timer_window(mini, total_seconds, config_name)
-
-        # ACT Start按钮（放在右侧的timer_control_frame中）
-        act_start_button = self.create_enhanced_button(
-            timer_control_frame,
-            text="ACT Start",
-            command=create_act_timer,
-            color=self.colors["neon_green"],
-            width=12,
-            height=1,
-            font_weight="bold"
-        )
-        act_start_button.pack(side="right")
-
-        # 初始状态文本
-        update_status_with_shadow("[MINI_CONSOLE_ACTIVE] 实时数据监控中...")
-
-        def refresh_mini():
-            if not mini.winfo_exists():
-                return
-            try:
-                render_content()
-                # 更新状态栏时间
-                from datetime import datetime
-                current_time = datetime.now().strftime("%H:%M:%S")
-                update_status_with_shadow(
-                    f"[{current_time}] MINI_CONSOLE_ACTIVE | 数据更新中..."
-                )
-            except Exception as e:
-                update_status_with_shadow(
-                    f"[ERROR] 数据更新失败: {str(e)[:20]}..."  # 缩短错误信息
-                )
-            mini.after(1000, refresh_mini)
-
-        # 启动更新和动画
-        render_content()
-        mini.after(1000, refresh_mini)
-        mini.after(100, mini_rgb_animate)
-
-        # 添加小窗口淡入效果
-        mini.after(150, lambda: self.fade_window_in(
-            mini, mini.current_alpha, 0.2))
-
-    def update_self_dps_bar(self, mini, user_data, sorted_users):
-        """更新本人DPS条显示"""
-        if not hasattr(mini, '_self_dps_container'):
-            return
-
-        container = mini._self_dps_container
-
-        # 尝试检测本人数据
-        self_uid = None
-        self_data = None
-        self_rank = 0
-
-        # 优先使用保存的个人UID
-        if self.personal_uid and self.personal_uid in user_data:
-            self_uid = self.personal_uid
-            self_data = user_data[self.personal_uid]
-        else:
-            # 检测方法1：通过UID映射查找本人
-            if hasattr(self, 'uid_mapping'):
-                for uid, info in user_data.items():
-                    mapped_name = self.get_display_name(uid)
-                    # 如果映射的名字包含特定标识（比如"本人"、"我"等）
-                    if any(keyword in mapped_name.lower() for keyword in ['本人', '我', 'me', 'self']):
-                        self_uid = uid
-                        self_data = info
-                        break
-
-            # 检测方法2：如果没有找到，使用第一个玩家作为示例
-            if not self_data and sorted_users:
-                self_uid, self_data = sorted_users[0]
-
-        # 计算排名
-        if self_data:
-            for rank, (uid, info) in enumerate(sorted_users, 1):
-                if uid == self_uid:
-                    self_rank = rank
-                    break
-
-        # 检查是否需要重建UI（数据变化才重建，减少闪烁）
-        current_key = f"{self_uid}_{self_rank}_{len(sorted_users)}"
-        if self_data:
-            current_key += f"_{self_data.get('total_dps', 0):.0f}"
-
-        last_key = getattr(mini, '_last_self_dps_key', '')
-
-        if current_key == last_key:
-            return  # 数据没有变化，不重建UI
-
-        mini._last_self_dps_key = current_key
-
-        # 清除现有显示（只有在数据变化时才清除）
-        for widget in container.winfo_children():
-            widget.destroy()
-
-        if self_data:
-            # 获取第一名的DPS数据用于比例计算
-            first_place_dps = sorted_users[0][1].get(
-                "total_dps", 0) if sorted_users else 0
-
-            # 创建本人DPS条
-            self.create_self_dps_display(
-                container, self_uid, self_data, self_rank, len(sorted_users), first_place_dps)
-        else:
-            # 显示未检测到本人
-            no_self_label = tk.Label(
-                container,
-                text="[SYSTEM]: 未检测到个人数据",
-                font=self.get_font(int(8 * 1.1), "normal"),
-                bg=self.colors["bg_secondary"],
-                fg=self.colors["text_accent"]
-            )
-            no_self_label.pack(pady=int(5 * 1.1))
-
-            # 如果有设置个人UID但数据中没有，显示提示
-            if self.personal_uid:
-                hint_label = tk.Label(
-                    container,
-                    text=f"个人UID ({self.personal_uid}) 暂无战斗数据",
-                    font=self.get_font(int(7 * 1.1), "normal"),
-                    bg=self.colors["bg_secondary"],
-                    fg=self.colors["text_dim"]
-                )
-                hint_label.pack(pady=int(2 * 1.1))
-
-    def create_self_dps_display(self, container, uid, data, rank, total_players, first_place_dps=0):
-        """创建本人DPS显示条"""
-        # 获取数据
-        display_name = self.get_display_name(uid)
-        profession = data.get("profession", "未知")
-        total_damage = data.get("total_damage", {}).get("total", 0)
-        dps = data.get("total_dps", 0)
-
-        # 创建玩家信息显示区域（向上移动更多）
-        player_info_frame = tk.Frame(container, bg=self.colors["bg_secondary"])
-        player_info_frame.pack(fill="x", pady=(0, int(1 * 1.1)))
-
-        # 玩家信息Canvas - 添加阴影效果
-        player_info_canvas = tk.Canvas(
-            player_info_frame,
-            height=int(16 * 1.1),  # 增加高度防止底部被截断
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        player_info_canvas.pack(fill="x")
-
-        # 在canvas上设置绘制状态缓存属性
-        player_info_canvas._last_draw_data = {
-            "info_text": "", "canvas_width": 0, "last_update": 0}
-
-        def draw_player_info_with_shadow():
-            canvas_width = player_info_canvas.winfo_width()
-            if canvas_width <= 1:
-                # 如果canvas尚未正确显示，延迟重试
-                player_info_canvas.after(100, draw_player_info_with_shadow)
-                return
-
-            # 玩家信息文本
-            info_text = f"#{rank} {display_name} [{profession}]"
-
-            import time
-            current_time = time.time()
-
-            # 检查是否需要重绘（数据没有变化且时间间隔小于0.5秒则不重绘）
-            time_since_last = current_time - \
-                player_info_canvas._last_draw_data.get("last_update", 0)
-            if (player_info_canvas._last_draw_data["info_text"] == info_text and
-                    abs(player_info_canvas._last_draw_data["canvas_width"] - canvas_width) < 5 and
-                    time_since_last < 0.5):
-                return
-
-            # 更新缓存
-            player_info_canvas._last_draw_data["info_text"] = info_text
-            player_info_canvas._last_draw_data["canvas_width"] = canvas_width
-            player_info_canvas._last_draw_data["last_update"] = current_time
-
-            player_info_canvas.delete("all")
-            font_tuple = self.get_font(int(10 * 1.1), "bold")
-
-            # 位置计算（左对齐，向上移动更多）
-            x_pos = int(8 * 1.1)
-            y_pos = int(8 * 1.1)  # 进一步向上移动
-
-            # 绘制多层阴影
-            shadow_layers = [
-                (3, 3, "#000000"),
-                (2, 2, "#111111"),
-                (1, 1, "#222222")
-            ]
-
-            for dx, dy, shadow_color in shadow_layers:
-                player_info_canvas.create_text(
-                    x_pos + dx, y_pos + dy,
-                    text=info_text, font=font_tuple,
-                    fill=shadow_color, anchor="w"
-                )
-
-            # 绘制边框效果
-            border_color = "#333333"
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                player_info_canvas.create_text(
-                    x_pos + dx, y_pos + dy,
-                    text=info_text, font=font_tuple,
-                    fill=border_color, anchor="w"
-                )
-
-            # 绘制主文字（使用高亮颜色）
-            player_info_canvas.create_text(
-                x_pos, y_pos,
-                text=info_text, font=font_tuple,
-                fill=self.colors["neon_yellow"], anchor="w"
-            )
-
-        # 绑定事件和初始绘制 - 使用更稳定的更新机制
-        def on_configure(event):
-            if event.widget == player_info_canvas:
-                # 强制重绘，忽略缓存
-                player_info_canvas._last_draw_data["last_update"] = 0
-                player_info_canvas.after_idle(draw_player_info_with_shadow)
-
-        player_info_canvas.bind("<Configure>", on_configure)
-        # 初始绘制
-        player_info_canvas.after(10, draw_player_info_with_shadow)
-
-        # 创建Canvas用于绘制DPS条（添加阴影效果）
-        canvas = tk.Canvas(
-            container,
-            height=int(25 * 1.1),  # 增加高度防止底部被截断
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        canvas.pack(fill="x", pady=(int(6 * 1.1), int(1 * 1.1)))
-
-        # 在canvas上设置DPS条绘制状态缓存属性
-        canvas._last_dps_data = {"dps": -1,
-                                 "canvas_width": 0, "last_update": 0}
-
-        def draw_self_dps_bar():
-            canvas_width = canvas.winfo_width()
-            if canvas_width <= 1:
-                # 如果canvas尚未正确显示，延迟重试
-                canvas.after(100, draw_self_dps_bar)
-                return
-
-            import time
-            current_time = time.time()
-
-            # 检查是否需要重绘（DPS数据没有显著变化且时间间隔小于0.5秒则不重绘）
-            time_since_last = current_time - \
-                canvas._last_dps_data.get("last_update", 0)
-            if (abs(canvas._last_dps_data["dps"] - dps) < max(dps * 0.01, 1) and  # DPS变化小于1%或1点
-                    abs(canvas._last_dps_data["canvas_width"] - canvas_width) < 5 and
-                    time_since_last < 0.5):
-                return
-
-            # 更新缓存
-            canvas._last_dps_data["dps"] = dps
-            canvas._last_dps_data["canvas_width"] = canvas_width
-            canvas._last_dps_data["last_update"] = current_time
-
-            canvas.delete("all")
-
-            # DPS条参数
-            bar_width = canvas_width - int(40 * 1.1)
-            bar_height = int(16 * 1.1)  # 减小高度
-            bar_x = int(20 * 1.1)
-            bar_y = int(5 * 1.1)
-
-            # 绘制DPS条阴影背景
-            shadow_offset = 2
-            canvas.create_rectangle(
-                bar_x + shadow_offset, bar_y + shadow_offset,
-                bar_x + bar_width + shadow_offset, bar_y + bar_height + shadow_offset,
-                fill="#000000",
-                outline=""
-            )
-
-            # 绘制DPS条背景
-            canvas.create_rectangle(
-                bar_x, bar_y, bar_x + bar_width, bar_y + bar_height,
-                fill=self.colors["bg_primary"],
-                outline=self.colors["border_light"],
-                width=1
-            )
-
-            # 绘制DPS条（根据与第一名的DPS比例计算长度）
-            if first_place_dps > 0 and dps > 0:
-                # 根据与第一名的DPS比例计算条长度
-                dps_ratio = min(dps / first_place_dps, 1.0)  # 最大不超过100%
-                bar_fill_width = int(bar_width * dps_ratio)
-            else:
-                # 如果没有第一名数据或DPS为0，使用固定长度
-                bar_fill_width = int(bar_width * 0.1)  # 最小10%长度
-
-            # DPS条阴影
-            canvas.create_rectangle(
-                bar_x + 1 + shadow_offset, bar_y + 1 + shadow_offset,
-                bar_x + bar_fill_width + shadow_offset, bar_y + bar_height - 1 + shadow_offset,
-                fill="#111111",
-                outline=""
-            )
-
-            # DPS条主体
-            canvas.create_rectangle(
-                bar_x + 1, bar_y + 1, bar_x + bar_fill_width, bar_y + bar_height - 1,
-                fill=self.colors["neon_yellow"],
-                outline=""
-            )
-
-            # 绘制DPS数值 - 添加阴影效果
-            dps_text = f"DPS: {dps:,.0f}"
-            if dps >= 1000000:
-                dps_text = f"DPS: {dps/1000000:.1f}M"
-            elif dps >= 1000:
-                dps_text = f"DPS: {dps/1000:.1f}K"
-
-            dps_font = self.get_font(int(8 * 1.1), "bold")
-            dps_x = bar_x + int(15 * 1.1)
-            dps_y = bar_y + bar_height // 2
-
-            # DPS数值阴影
-            for dx, dy in [(1, 1), (2, 2)]:
-                canvas.create_text(
-                    dps_x + dx, dps_y + dy,
-                    text=dps_text, font=dps_font,
-                    fill="#000000", anchor="w"
-                )
-
-            # DPS主文字
-            canvas.create_text(
-                dps_x, dps_y,
-                text=dps_text, font=dps_font,
-                fill=self.colors["neon_green"], anchor="w"  # 修改为绿色
-            )
-
-            # 绘制总排名信息 - 添加阴影效果
-            rank_info = f"Rank: {rank}/{total_players}"
-            rank_font = self.get_font(int(7 * 1.1), "normal")
-            rank_x = bar_x + bar_width - int(5 * 1.1)
-            rank_y = bar_y + bar_height // 2
-
-            # 排名信息阴影
-            for dx, dy in [(1, 1), (2, 2)]:
-                canvas.create_text(
-                    rank_x + dx, rank_y + dy,
-                    text=rank_info, font=rank_font,
-                    fill="#000000", anchor="e"
-                )
-
-            # 排名主文字
-            canvas.create_text(
-                rank_x, rank_y,
-                text=rank_info, font=rank_font,
-                fill=self.colors["neon_cyan"], anchor="e"
-            )
-
-        # 绑定事件和初始绘制 - 使用更稳定的更新机制
-        def on_dps_configure(event):
-            if event.widget == canvas:
-                # 强制重绘，忽略缓存
-                canvas._last_dps_data["last_update"] = 0
-                canvas.after_idle(draw_self_dps_bar)
-
-        canvas.bind("<Configure>", on_dps_configure)
-        # 初始绘制
-        canvas.after(10, draw_self_dps_bar)
-
-    def _close_minimal_mode(self, mini):
-        """关闭最小模式并恢复主界面"""
-        if mini and mini.winfo_exists():
-            # 取消所有保存的after任务，防止字幕回收问题
-            try:
-                if hasattr(mini, '_after_tasks'):
-                    for task_id in mini._after_tasks:
-                        try:
-                            mini.after_cancel(task_id)
-                        except:
-                            pass
-                    mini._after_tasks.clear()
-            except Exception as e:
-                print(f"取消after任务时出错: {e}")
-
-            # 从mini_windows列表中移除该窗口的引用
-            self.mini_windows = [info for info in self.mini_windows
-                                 if not (info.get("window") and info["window"] == mini)]
-            mini.destroy()
-        self.root.deiconify()
-
-    def launch_act_timer_window(self, reference_window=None, duration=300, config_name=None):
-        """启动ACT计时器窗口 - 使用MINI UI相同风格，可以设置相对于参考窗口的位置"""
-        print(f"启动ACT timer，参考窗口: {reference_window}")  # 调试信息
-        if reference_window:
-            print(f"参考窗口是否存在: {reference_window.winfo_exists()}")  # 调试信息
-
-        # 创建新的ACTACT窗口
-        print("开始创建timer窗口")  # 调试信息
-        timer_window = tk.Toplevel()
-        timer_window.title("◊ ACT_TIMER_CONSOLE ◊")
-        timer_window.geometry("500x600")  # 稍微增大以适应新布局
-        timer_window.resizable(False, False)
-        timer_window.wm_attributes("-topmost", True)
-        timer_window.wm_attributes("-alpha", self.current_alpha)
-        timer_window.overrideredirect(True)  # 使用无边框模式
-        timer_window.configure(bg=self.colors["bg_primary"])
-
-        # 如果有参考窗口，将timer窗口放置在其右边
-        if reference_window and reference_window.winfo_exists():
-            try:
-
-                reference_window.update_idletasks()  # 确保窗口已完全更新
-                ref_x = reference_window.winfo_x()
-                ref_y = reference_window.winfo_y()
-                ref_width = reference_window.winfo_width()
-
-                # 计算新位置：参考窗口右边 + 10像素间距
-                new_x = ref_x + ref_width + 10
-                new_y = ref_y  # 与参考窗口顶部对齐
-
-                timer_window.geometry(f"500x600+{new_x}+{new_y}")
-
-            except Exception as e:
-
-                # 如果定位失败，使用默认位置
-                pass
-        else:
-            print("没有参考窗口，使用默认位置")  # 调试信息
-
-        # 设置圆角窗口和RGB边框（与MINI UI相同）
-        print("开始设置圆角窗口和RGB边框")  # 调试信息
-        if Image is not None:
-            try:
-                print("PIL可用，创建圆角窗口")  # 调试信息
-
-                import ctypes
-                timer_window.update()
-                hwnd = ctypes.windll.user32.GetParent(timer_window.winfo_id())
-                if hwnd == 0:
-                    hwnd = timer_window.winfo_id()
-
-                width = 500
-                height = 600
-                corner_radius = 12
-
-                hrgn = ctypes.windll.gdi32.CreateRoundRectRgn(
-                    0, 0, width, height, corner_radius * 2, corner_radius * 2
-                )
-
-                if hrgn:
-                    ctypes.windll.user32.SetWindowRgn(hwnd, hrgn, True)
-                else:
-                    ctypes.windll.user32.SetWindowRgn(hwnd, 0, True)
-            except Exception as e:
-                pass
-
-            # 创建RGB边框容器（与MINI UI相同）
-
-            border_canvas = tk.Canvas(
-                timer_window, bg=self.colors["bg_primary"], highlightthickness=0, bd=0)
-            border_canvas.pack(fill="both", expand=True, padx=0, pady=0)
-
-            # 主内容容器
-
-            main_content_frame = tk.Frame(
-                border_canvas, bg=self.colors["bg_primary"], bd=0, relief="flat")
-
-            # 在Canvas中创建窗口
-            border_space = 6
-            content_window = border_canvas.create_window(
-                border_space, border_space,
-                anchor="nw",
-                window=main_content_frame
-            )
-
-            timer_window._border_imgtk = None
-            timer_window._border_cache_key = None
-            timer_window.rgb_index = 0
-
-            def render_timer_border():
-                """渲染ACT窗口的RGB边框"""
-                canvas_w = border_canvas.winfo_width()
-                canvas_h = border_canvas.winfo_height()
-                if canvas_w <= 0 or canvas_h <= 0:
-                    return
-
-                # 更新内容区域大小
-                content_width = canvas_w - (border_space * 2)
-                content_height = canvas_h - (border_space * 2)
-                border_canvas.itemconfig(
-                    content_window,
-                    width=content_width,
-                    height=content_height
-                )
-
-                current_color = self.border_colors[timer_window.rgb_index % len(
-                    self.border_colors)]
-                key = (canvas_w, canvas_h, current_color)
-
-                if (getattr(timer_window, "_border_cache_key", None) == key and
-                        timer_window._border_imgtk is not None):
-                    return
-
-                # 创建圆角背景
-                scale = 1.5
-                W, H = int(canvas_w * scale), int(canvas_h * scale)
-                r = max(0, int(12 * scale))
-                bw = max(1, int(3 * scale))
-
-                if W <= bw * 2 or H <= bw * 2:
-                    return
-
-                img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-                draw = ImageDraw.Draw(img)
-
-                # 绘制背景
-                bg_color = self.colors["bg_primary"]
-                draw.rounded_rectangle(
-                    [0, 0, W-1, H-1], radius=r, fill=bg_color)
-
-                # 添加RGB边框发光效果
-                try:
-                    glow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-                    gdraw = ImageDraw.Draw(glow)
-                    gdraw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
-                                            radius=r, outline=current_color, width=bw)
-                    glow = glow.filter(
-                        ImageFilter.GaussianBlur(1.5 * scale / 10))
-                    img = Image.alpha_composite(img, glow)
-                except Exception:
-                    pass
-
-                # 绘制边框
-                draw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
-                                       radius=r, outline=current_color, width=bw)
-
-                img = img.resize((canvas_w, canvas_h), resample=Image.LANCZOS)
-                imgtk = ImageTk.PhotoImage(img)
-                border_canvas.delete("bg_image")
-                border_canvas.create_image(
-                    0, 0, anchor="nw", image=imgtk, tags="bg_image")
-                timer_window._border_imgtk = imgtk
-                timer_window._border_cache_key = key
-
-            def timer_rgb_animate():
-                """ACT窗口RGB动画"""
-                if not timer_window.winfo_exists():
-                    return
-
-                old_index = getattr(timer_window, 'rgb_index', 0)
-                timer_window.rgb_index = (
-                    timer_window.rgb_index + 1) % len(self.border_colors)
-
-                if timer_window.rgb_index != old_index:
-                    if hasattr(timer_window, '_timer_rgb_timer'):
-                        timer_window.after_cancel(
-                            timer_window._timer_rgb_timer)
-                    timer_window._timer_rgb_timer = timer_window.after(
-                        10, render_timer_border)
-
-                timer_window.after(self.rgb_interval, timer_rgb_animate)
-
-            def on_timer_resize(event):
-                if hasattr(timer_window, '_timer_resize_timer'):
-                    timer_window.after_cancel(timer_window._timer_resize_timer)
-                timer_window._timer_resize_timer = timer_window.after(
-                    100, render_timer_border)
-
-            border_canvas.bind("<Configure>", on_timer_resize)
-            timer_window.after(100, render_timer_border)
-            timer_window.after(self.rgb_interval, timer_rgb_animate)
-
-        else:
-
-            # 回退为矩形边框
-            main_content_frame = tk.Frame(
-                timer_window, bg=self.colors["bg_primary"], bd=0, relief="flat")
-            main_content_frame.pack(fill="both", expand=True, padx=6, pady=6)
-
-        # 创建标题栏（与MINI UI相同风格）
-
-        header_outer, header_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_yellow"],
-            padding=2,
-        )
-        header_outer.configure(height=65)
-        header_outer.pack(fill="x", pady=(6, 4))
-        header_outer.pack_propagate(False)
-
-        # 标题内容容器
-
-        title_container = tk.Frame(
-            header_frame, bg=self.colors["bg_secondary"])
-        title_container.pack(fill="x", pady=int(3 * 1.1))
-
-        # 主标题 - 使用Canvas添加阴影效果
-
-        title_canvas = tk.Canvas(
-            title_container,
-            height=int(25 * 1.1),
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        title_canvas.pack(fill="x", pady=int(2 * 1.1))
-
-        def draw_timer_title_with_shadow():
-            title_canvas.delete("all")
-            title_text = "▓▓▓ ACT_TIMER ▓▓▓"
-            font_tuple = self.get_font(int(12 * 1.1), "normal")
-
-            canvas_width = title_canvas.winfo_width()
-            if canvas_width > 1:
-                center_x = canvas_width // 2
-                center_y = int(12 * 1.1)
-
-                # 绘制多层阴影
-                shadow_layers = [
-                    (3, 3, "#000000"),
-                    (2, 2, "#111111"),
-                    (1, 1, "#222222")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    title_canvas.create_text(
-                        center_x + dx, center_y + dy,
-                        text=title_text, font=font_tuple,
-                        fill=shadow_color, anchor="center"
-                    )
-
-                # 绘制边框效果
-                border_color = "#333333"
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                    title_canvas.create_text(
-                        center_x + dx, center_y + dy,
-                        text=title_text, font=font_tuple,
-                        fill=border_color, anchor="center"
-                    )
-
-                # 绘制主文字
-                title_canvas.create_text(
-                    center_x, center_y,
-                    text=title_text, font=font_tuple,
-                    fill=self.colors["neon_yellow"], anchor="center"
-                )
-
-        title_canvas.bind(
-            "<Configure>", lambda e: draw_timer_title_with_shadow())
-        title_canvas.after(10, draw_timer_title_with_shadow)
-
-        # 存储Canvas引用用于拖拽
-        timer_window.title_canvas = title_canvas
-
-        # 副标题
-
-        subtitle_canvas = tk.Canvas(
-            title_container,
-            height=int(16 * 1.1),
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        subtitle_canvas.pack(fill="x")
-
-        def draw_timer_subtitle_with_shadow():
-            # 检查canvas是否仍然存在
-            try:
-                if not subtitle_canvas.winfo_exists():
-                    return
-            except:
-                return
-
-            subtitle_canvas.delete("all")
-            subtitle_text = "[JASON_LIBRARY_TIMING]"
-            font_tuple = self.get_font(int(8 * 1.1), "normal")
-
-            try:
-                canvas_width = subtitle_canvas.winfo_width()
-                if canvas_width > 1:
-                    center_x = canvas_width // 2
-                    center_y = int(8 * 1.1)
-
-                    # 绘制阴影
-                    shadow_layers = [
-                        (2, 2, "#000000"),
-                        (1, 1, "#111111")
-                    ]
-
-                    for dx, dy, shadow_color in shadow_layers:
-                        subtitle_canvas.create_text(
-                            center_x + dx, center_y + dy,
-                            text=subtitle_text, font=font_tuple,
-                            fill=shadow_color, anchor="center"
-                        )
-
-                    # 绘制边框效果
-                    border_color = "#333333"
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        subtitle_canvas.create_text(
-                            center_x + dx, center_y + dy,
-                            text=subtitle_text, font=font_tuple,
-                            fill=border_color, anchor="center"
-                        )
-
-                    # 绘制主文字
-                    subtitle_canvas.create_text(
-                        center_x, center_y,
-                        text=subtitle_text, font=font_tuple,
-                        fill=self.colors["neon_cyan"], anchor="center"
-                    )
-            except:
-                # 如果canvas已被销毁，静默忽略错误
-                pass
-
-        # 保存after任务ID到timer窗口
-        if not hasattr(timer_window, '_after_tasks'):
-            timer_window._after_tasks = []
-
-        def safe_timer_bind():
-            try:
-                subtitle_canvas.bind(
-                    "<Configure>", lambda e: draw_timer_subtitle_with_shadow())
-            except:
-                pass
-
-        def safe_timer_after():
-            try:
-                task_id = subtitle_canvas.after(
-                    10, draw_timer_subtitle_with_shadow)
-                timer_window._after_tasks.append(task_id)
-            except:
-                pass
-
-        safe_timer_bind()
-        safe_timer_after()
-
-        # 存储Canvas引用用于拖拽
-        timer_window.subtitle_canvas = subtitle_canvas
-
-        # 自定义关闭函数，清理关联关系
-
-        def close_timer_window():
-            # 从参考窗口的关联列表中移除
-            if hasattr(timer_window, 'reference_window') and timer_window.reference_window:
-                ref_window = timer_window.reference_window
-                if hasattr(ref_window, 'associated_timers') and timer_window in ref_window.associated_timers:
-                    ref_window.associated_timers.remove(timer_window)
-
-            # 从全局列表中移除
-            if timer_window in self.timer_windows:
-                self.timer_windows.remove(timer_window)
-
-            # 销毁窗口
-            timer_window.destroy()
-
-        # 关闭按钮
-
-        close_btn = self.create_enhanced_button(
-            title_container, "✕", close_timer_window,
-            self.colors["neon_pink"], width=2, height=1
-        )
-        close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-3, y=2)
-
-        # ACT显示区域（使用圆角框架）
-
-        timer_outer, timer_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_accent"],
-            border_color=self.colors["neon_cyan"],
-            padding=int(8 * 1.1),
-        )
-        timer_outer.configure(height=80)
-        timer_outer.pack(fill="x", pady=(0, int(8 * 1.1)))
-        timer_outer.pack_propagate(False)
-
-        # 初始化ACT变量
-        print("初始化ACT变量")  # 调试信息
-        timer_window.timer_running = False
-        timer_window.start_time = None
-        timer_window.elapsed_time = 0
-        timer_window.waiting_for_damage = False  # 是否在等待第一次伤害
-        timer_window.total_duration = duration  # 使用传入的倒计时时长
-        timer_window.damage_detected = False  # 是否检测到伤害
-        timer_window.last_damage_count = 0  # 上次的伤害计数
-
-        # 加载ACT配置
-        timer_window.act_config = None
-        if config_name:
-            timer_window.act_config = self.load_act_config(config_name)
-            if timer_window.act_config:
-                # 如果配置文件指定了持续时间，则使用配置文件的
-                if 'total_duration' in timer_window.act_config:
-                    timer_window.total_duration = timer_window.act_config['total_duration']
-
-        timer_window.alerts_triggered = set()  # 已触发的提醒
-        # 跳过机制计数器 {alert_key: {'count': x, 'skip_count': y}}
-        timer_window.skip_counters = {}
-        print("ACT变量初始化完成")  # 调试信息
-
-        # 时间显示Canvas - 添加阴影效果
-
-        time_canvas = tk.Canvas(
-            timer_frame,
-            height=100,  # 增加高度以容纳阶段信息
-            bg=self.colors["bg_accent"],
-            highlightthickness=0,
-            bd=0
-        )
-        time_canvas.pack(fill="x", pady=10)
-
-        def draw_time_with_shadow(time_text="00:00:00", text_color=None, glow_effect=False, phase_info=None, team_damage=None):
-            time_canvas.delete("all")
-            font_tuple = self.get_font(24, "bold")
-
-            # 如果没有指定颜色，使用默认的青色
-            if text_color is None:
-                text_color = self.colors["neon_cyan"]
-
-            canvas_width = time_canvas.winfo_width()
-            canvas_height = time_canvas.winfo_height()
-
-            if canvas_width > 1 and canvas_height > 1:
-                center_x = canvas_width // 2
-                time_y = 20  # 时间显示位置，调整得更靠上一些
-
-                # 如果启用辉光效果，绘制荧光辉光
-                if glow_effect:
-                    # 多层辉光效果，从外到内逐渐增强
-                    glow_layers = [
-                        (12, 0.1),  # 最外层，非常淡
-                        (8, 0.2),   # 中层
-                        (6, 0.3),   # 内层
-                        (4, 0.4),   # 最内层
-                    ]
-
-                    # 计算辉光颜色
-                    def add_alpha_to_color(hex_color, alpha):
-                        # 简化的颜色透明度处理
-                        hex_color = hex_color.lstrip('#')
-                        r = int(hex_color[0:2], 16)
-                        g = int(hex_color[2:4], 16)
-                        b = int(hex_color[4:6], 16)
-                        # 混合到背景色
-                        bg_r, bg_g, bg_b = 30, 30, 40  # 背景色近似
-                        final_r = int(r * alpha + bg_r * (1 - alpha))
-                        final_g = int(g * alpha + bg_g * (1 - alpha))
-                        final_b = int(b * alpha + bg_b * (1 - alpha))
-                        return f"#{final_r:02x}{final_g:02x}{final_b:02x}"
-
-                    # 绘制辉光层
-                    for radius, alpha in glow_layers:
-                        glow_color = add_alpha_to_color(text_color, alpha)
-                        for angle in range(0, 360, 15):  # 每15度一个点
-                            import math
-                            dx = int(radius * math.cos(math.radians(angle)))
-                            dy = int(radius * math.sin(math.radians(angle)))
-                            time_canvas.create_text(
-                                center_x + dx, time_y + dy,
-                                text=time_text, font=font_tuple,
-                                fill=glow_color, anchor="center"
-                            )
-
-                # 绘制时间的多层阴影
-                shadow_layers = [
-                    (4, 4, "#000000"),
-                    (3, 3, "#111111"),
-                    (2, 2, "#222222")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    time_canvas.create_text(
-                        center_x + dx, time_y + dy,
-                        text=time_text, font=font_tuple,
-                        fill=shadow_color, anchor="center"
-                    )
-
-                # 绘制时间的边框效果
-                border_color = "#444444"
-                for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                    time_canvas.create_text(
-                        center_x + dx, time_y + dy,
-                        text=time_text, font=font_tuple,
-                        fill=border_color, anchor="center"
-                    )
-
-                # 绘制主时间文字
-                time_canvas.create_text(
-                    center_x, time_y,
-                    text=time_text, font=font_tuple,
-                    fill=text_color, anchor="center"
-                )
-
-                # 绘制队伍总伤害（在时间右边）
-                if team_damage is not None:
-                    damage_text = self.format_damage_number(team_damage)
-                    damage_font = self.get_font(14, "bold")
-                    damage_color = self.colors["neon_orange"]
-                    damage_x = canvas_width - 10  # 右侧位置
-                    damage_y = 15  # 稍微靠上
-
-                    # 绘制伤害数字的阴影
-                    for dx, dy, shadow_color in [(2, 2, "#000000"), (1, 1, "#222222")]:
-                        time_canvas.create_text(
-                            damage_x + dx, damage_y + dy,
-                            text=damage_text, font=damage_font,
-                            fill=shadow_color, anchor="ne"
-                        )
-
-                    # 绘制边框效果
-                    for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                        time_canvas.create_text(
-                            damage_x + dx, damage_y + dy,
-                            text=damage_text, font=damage_font,
-                            fill="#444444", anchor="ne"
-                        )
-
-                    # 绘制主伤害文字
-                    time_canvas.create_text(
-                        damage_x, damage_y,
-                        text=damage_text, font=damage_font,
-                        fill=damage_color, anchor="ne"
-                    )
-
-                # 绘制阶段信息
-                if phase_info:
-                    phase_name = phase_info.get('name', '')
-                    # 移除阶段描述显示，只保留阶段名称
-
-                    # 阶段名称在左边 - 固定字体大小和样式
-                    if phase_name:
-                        # 修复：处理阶段名称中的换行符
-                        phase_name = phase_name.replace(
-                            '/n', '\n')  # 将 /n 转换为 \n
-
-                        # 固定阶段名称字体 - 12号字体，粗体，使用渐变色
-                        name_font = self.get_font(12, "bold")
-                        name_color = self.colors["neon_purple"]  # 使用紫色作为阶段名称颜色
-
-                        # 处理多行阶段名称
-                        name_lines = phase_name.split('\n')
-                        line_height = 15  # 行高
-                        start_y = 8
-
-                        for i, line in enumerate(name_lines):
-                            current_y = start_y + i * line_height
-
-                            # 绘制阶段名称的多层阴影效果
-                            shadow_offsets = [
-                                (2, 2, "#000000"), (1, 1, "#222222")]
-                            for dx, dy, shadow_color in shadow_offsets:
-                                time_canvas.create_text(
-                                    10 + dx, current_y + dy, text=line, font=name_font,
-                                    fill=shadow_color, anchor="nw"
-                                )
-
-                            # 绘制边框效果
-                            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                                time_canvas.create_text(
-                                    10 + dx, current_y + dy, text=line, font=name_font,
-                                    fill="#444444", anchor="nw"
-                                )
-
-                            # 绘制主文字
-                            time_canvas.create_text(
-                                10, current_y, text=line, font=name_font,
-                                fill=name_color, anchor="nw"
-                            )
-
-        time_canvas.bind("<Configure>", lambda e: draw_time_with_shadow())
-        timer_window.draw_time_with_shadow = draw_time_with_shadow
-        # 显示初始倒计时时间（在配置加载后显示）
-
-        def show_initial_time():
-            initial_time = f"{timer_window.total_duration//3600:02d}:{(timer_window.total_duration%3600)//60:02d}:{timer_window.total_duration%60:02d}"
-            current_phase = self.get_current_phase(timer_window, 0)  # 获取初始阶段
-            team_damage = self.get_team_total_damage()  # 获取队伍总伤害
-            draw_time_with_shadow(
-                initial_time, self.colors["neon_cyan"], False, current_phase, team_damage)
-
-        timer_window.after(10, show_initial_time)
-
-        # 控制按钮区域（使用圆角框架）
-
-        control_outer, control_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_green"],
-            padding=int(4 * 1.1),
-        )
-        control_outer.configure(height=60)
-        control_outer.pack(fill="x", pady=(0, int(8 * 1.1)))
-        control_outer.pack_propagate(False)
-
-        # 按钮容器
-
-        button_container = tk.Frame(
-            control_frame, bg=self.colors["bg_secondary"])
-        button_container.pack(expand=True, pady=5)
-
-        # 使用增强按钮风格
-
-        start_button = self.create_enhanced_button(
-            button_container, "Start",
-            lambda: self.toggle_timer(timer_window, start_button),
-            self.colors["neon_green"], width=8, height=1, font_weight="bold"
-        )
-        start_button.pack(side="left", padx=5)
-
-        reset_button = self.create_enhanced_button(
-            button_container, "Reset",
-            lambda: self.reset_timer(timer_window, start_button),
-            self.colors["neon_yellow"], width=8, height=1, font_weight="bold"
-        )
-        reset_button.pack(side="left", padx=5)
-
-        # 事件记录区域（使用圆角框架）
-
-        events_outer, events_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_purple"],
-            padding=int(4 * 1.1),
-        )
-        events_outer.pack(fill="both", expand=True)
-
-        # 事件标题Canvas - 添加阴影效果
-        events_title_canvas = tk.Canvas(
-            events_frame,
-            height=int(20 * 1.1),
-            bg=self.colors["bg_secondary"],
-            highlightthickness=0,
-            bd=0
-        )
-        events_title_canvas.pack(fill="x", pady=(5, 5))
-
-        def draw_events_title_with_shadow():
-            events_title_canvas.delete("all")
-            title_text = "[JASON_LIBRARY_EVENTS]"
-            font_tuple = self.get_font(int(10 * 1.1), "bold")
-
-            canvas_width = events_title_canvas.winfo_width()
-            if canvas_width > 1:
-                center_x = canvas_width // 2
-                center_y = int(10 * 1.1)
-
-                # 绘制阴影
-                for dx, dy in [(2, 2), (1, 1)]:
-                    events_title_canvas.create_text(
-                        center_x + dx, center_y + dy,
-                        text=title_text, font=font_tuple,
-                        fill="#000000", anchor="center"
-                    )
-
-                # 绘制主文字
-                events_title_canvas.create_text(
-                    center_x, center_y,
-                    text=title_text, font=font_tuple,
-                    fill=self.colors["neon_purple"], anchor="center"
-                )
-
-        events_title_canvas.bind(
-            "<Configure>", lambda e: draw_events_title_with_shadow())
-        events_title_canvas.after(10, draw_events_title_with_shadow)
-
-        # 事件列表（使用圆角列表框）
-
-        try:
-            events_container = self.create_rounded_listbox(
-                events_frame,
-                height=12,
-                bg=self.colors["bg_primary"],
-                fg=self.colors["text_primary"],
-                selectbackground=self.colors["neon_cyan"],
-                selectforeground=self.colors["bg_primary"],
-                font=self.get_font(9, "normal")
-            )
-            events_container.pack(
-                fill="both", expand=True, padx=5, pady=(0, 5))
-            # 获取真正的listbox
-            events_listbox = events_container.listbox
-
-        except Exception as e:
-
-            import traceback
-            traceback.print_exc()
-            # 使用简单的Listbox作为回退
-            events_listbox = tk.Listbox(
-                events_frame,
-                height=12,
-                bg=self.colors["bg_primary"],
-                fg=self.colors["text_primary"],
-                selectbackground=self.colors["neon_cyan"],
-                selectforeground=self.colors["bg_primary"],
-                font=self.get_font(9, "normal")
-            )
-            events_listbox.pack(fill="both", expand=True, padx=5, pady=(0, 5))
-
-        # 存储引用
-        timer_window.events_listbox = events_listbox
-        timer_window.start_button = start_button
-
-        # 延迟0.1秒自动执行reset修复初始显示问题
-        def auto_reset():
-            """自动执行reset来修复初始显示问题"""
-            try:
-                self.reset_timer(timer_window, timer_window.start_button)
-                print("自动执行了reset以修复初始显示")
-            except Exception as e:
-                print(f"自动reset时出错: {e}")
-
-        timer_window.after(300, auto_reset)  # 延迟0.3秒自动执行reset
-
-        # 添加TTS和明显提醒模式选项区域
-        options_outer, options_frame = self.create_rounded_frame(
-            main_content_frame,
-            bg_color=self.colors["bg_secondary"],
-            border_color=self.colors["neon_orange"],
-            padding=int(3 * 1.1),
-        )
-        options_outer.configure(height=80)
-        options_outer.pack(fill="x", pady=(int(8 * 1.1), 0))
-        options_outer.pack_propagate(False)
-
-        # 选项容器
-        options_container = tk.Frame(
-            options_frame, bg=self.colors["bg_secondary"])
-        options_container.pack(expand=True, pady=5)
-
-        # TTS功能选项
-        timer_window.tts_enabled = tk.BooleanVar(value=False)
-        tts_checkbox = tk.Checkbutton(
-            options_container,
-            text="启用TTS语音播报",
-            variable=timer_window.tts_enabled,
-            font=self.get_font(int(9 * 1.1), "normal"),
-            fg=self.colors["text_primary"],
-            bg=self.colors["bg_secondary"],
-            selectcolor=self.colors["bg_accent"],
-            activebackground=self.colors["bg_secondary"],
-            activeforeground=self.colors["neon_cyan"],
-            bd=0,
-            highlightthickness=0
-        )
-        tts_checkbox.pack(anchor="w", pady=2)
-
-        # 明显提醒模式选项
-        timer_window.prominent_alert_enabled = tk.BooleanVar(value=False)
-        prominent_checkbox = tk.Checkbutton(
-            options_container,
-            text="明显提醒模式(屏幕顶部显示)",
-            variable=timer_window.prominent_alert_enabled,
-            font=self.get_font(int(9 * 1.1), "normal"),
-            fg=self.colors["text_primary"],
-            bg=self.colors["bg_secondary"],
-            selectcolor=self.colors["bg_accent"],
-            activebackground=self.colors["bg_secondary"],
-            activeforeground=self.colors["neon_cyan"],
-            bd=0,
-            highlightthickness=0
-        )
-        prominent_checkbox.pack(anchor="w", pady=2)
-
-        # 初始化明显提醒窗口为None
-        timer_window.prominent_window = None
-        timer_window.alert_fade_window = None
-
-        # JASON阶段控制面板
-        self.create_jason_control_panel(main_content_frame, timer_window)
-
-        # 启动ACT更新循环
-
-        try:
-
-            self.update_timer_display(timer_window)
-
-        except Exception as e:
-
-            import traceback
-            traceback.print_exc()
-
-        # 将timer窗口添加到全局列表
-        self.timer_windows.append(timer_window)
-
-        print(f"Timer窗口已添加到全局列表，当前全局timer数量: {len(self.timer_windows)}")
-
-        # 如果有参考窗口，建立关联关系
-        if reference_window and reference_window.winfo_exists():
-
-            # 为参考窗口添加关联的timer窗口列表（如果还没有的话）
-            if not hasattr(reference_window, 'associated_timers'):
-                reference_window.associated_timers = []
-
-            reference_window.associated_timers.append(timer_window)
-
-            print(
-                f"Timer窗口已添加到参考窗口，列表长度: {len(reference_window.associated_timers)}")
-
-            # 为timer窗口记录参考窗口
-            timer_window.reference_window = reference_window
-
-            print(
-                f"Timer窗口的reference_window已设置为: {timer_window.reference_window}")
-
-            print(
-                f"Timer窗口已关联到参考窗口，当前关联数量: {len(reference_window.associated_timers)}")
-        else:
-
-            # 记录初始事件
-            self.add_timer_event(timer_window, "ACT Timer Console 已启动")
-
-        # 设置窗口关闭事件处理
-        def on_timer_window_close():
-            try:
-                # 停止计时器运行
-                timer_window.timer_running = False
-
-                # 取消所有保存的after任务，防止字幕回收问题
-                if hasattr(timer_window, '_after_tasks'):
-                    for task_id in timer_window._after_tasks:
-                        try:
-                            timer_window.after_cancel(task_id)
-                        except:
-                            pass
-                    timer_window._after_tasks.clear()
-            except Exception as e:
-                print(f"清理计时器窗口after任务时出错: {e}")
-
-            try:
-                # 清理明显提醒窗口及其所有任务
-                if hasattr(timer_window, 'prominent_window') and timer_window.prominent_window:
-                    try:
-                        # 清理prominent_window的所有after任务
-                        if hasattr(timer_window.prominent_window, '_after_tasks'):
-                            for task_id in timer_window.prominent_window._after_tasks:
-                                try:
-                                    timer_window.prominent_window.after_cancel(
-                                        task_id)
-                                except:
-                                    pass
-                    except:
-                        pass
-
-                    try:
-                        timer_window.prominent_window.destroy()
-                    except:
-                        pass
-
-                    timer_window.prominent_window = None
-            except Exception as e:
-                print(f"清理明显提醒窗口时出错: {e}")
-
-            try:
-                # 清理警告队列
-                if hasattr(timer_window, 'alert_queue'):
-                    timer_window.alert_queue.clear()
-                    timer_window.alert_queue_processing = False
-            except Exception as e:
-                print(f"清理警告队列时出错: {e}")
-
-            try:
-                # 从全局列表中移除
-                if timer_window in self.timer_windows:
-                    self.timer_windows.remove(timer_window)
-            except Exception as e:
-                print(f"从全局列表移除timer窗口时出错: {e}")
-
-            try:
-                timer_window.destroy()
-            except Exception as e:
-                print(f"销毁timer窗口时出错: {e}")
-
-        timer_window.protocol("WM_DELETE_WINDOW", on_timer_window_close)
-
-        # 添加窗口淡入效果
-        self.fade_window_in(timer_window, self.current_alpha, 0.2)
-
-        # 最终验证
-        print(f"===== Timer创建完成 =====")
-        print(f"timer_window对象存在: {timer_window.winfo_exists()}")
-        print(f"全局timer_windows列表长度: {len(self.timer_windows)}")
-        print(f"timer在列表中: {timer_window in self.timer_windows}")
-        if reference_window:
-            print(f"reference_window存在: {reference_window.winfo_exists()}")
-            print(
-                f"reference_window.associated_timers长度: {len(getattr(reference_window, 'associated_timers', []))}")
-        print(f"==========================")
+    def launch_act_timer_window(self, reference_window=None, duration=300, config_name=None):
+        """启动ACT计时器窗口 - 使用MINI UI相同风格，可以设置相对于参考窗口的位置"""
+        from ui_act_timer import launch_act_timer_window
+        return launch_act_timer_window(self, reference_window, duration, config_name)
 
     def toggle_timer(self, timer_window, start_button):
         """切换ACT开始/暂停状态"""
@@ -6643,9 +3188,9 @@ Orbitron 是一款未来主义科幻字体，
         # 重置初始伤害计数
         if hasattr(timer_window, 'initial_damage_count'):
             delattr(timer_window, 'initial_damage_count')
-        # 重置已触发的提醒
-        if hasattr(timer_window, 'alerts_triggered'):
-            timer_window.alerts_triggered.clear()
+        # 重置提醒时间线
+        if hasattr(timer_window, 'alert_scheduler'):
+            timer_window.alert_scheduler.reset()
 
         # 重置警告队列
         if hasattr(timer_window, 'alert_queue'):
@@ -6672,304 +3217,18 @@ Orbitron 是一款未来主义科幻字体，
 
         team_damage = self.get_team_total_damage()
         timer_window.draw_time_with_shadow(
-            f"{timer_window.total_duration//60:02d}:{timer_window.total_duration%60:02d}:00",
+            f"{timer_window.total_duration//3600:02d}:{(timer_window.total_duration%3600)//60:02d}:{timer_window.total_duration%60:02d}",
             self.colors["neon_cyan"], False, None, team_damage)
         start_button.configure(text="Start")
         self.add_timer_event(timer_window, "ACT已重置")
 
+        # 重置即两次开战之间，应用等待中的配置热重载
+        self.apply_pending_config_reload(timer_window)
+
     def update_timer_display(self, timer_window):
         """更新ACT显示"""
-        try:
-            # 检查timer_window是否仍然存在
-            if not timer_window.winfo_exists():
-                return
-        except tk.TclError:
-            # 窗口已被销毁
-            return
-        except AttributeError:
-            # timer_window对象无效
-            return
-
-        if timer_window.timer_running:
-            # 如果在等待伤害检测
-            if timer_window.waiting_for_damage:
-                # 检查是否有新的伤害
-                current_damage_count = self.get_current_damage_count()
-
-                # 调试信息：显示当前伤害计数
-                debug_text = f"等待战斗开始... ({current_damage_count})"
-                # 调试信息
-                print(
-                    f"[DEBUG] 伤害检测: 当前={current_damage_count}, 上次={timer_window.last_damage_count}")
-
-                # 如果是第一次检查，记录初始伤害值
-                if not hasattr(timer_window, 'initial_damage_count'):
-                    timer_window.initial_damage_count = current_damage_count
-                    timer_window.last_damage_count = current_damage_count
-
-                # 检测伤害变化（任何增加都算作新伤害）
-                if current_damage_count > timer_window.last_damage_count:
-                    # 检测到伤害，开始倒计时
-                    timer_window.waiting_for_damage = False
-                    timer_window.damage_detected = True
-                    timer_window.start_time = time.time()
-                    timer_window.elapsed_time = 0
-                    damage_increase = current_damage_count - timer_window.last_damage_count
-
-                    # 设置JASON战斗开始时间（用于警告系统）
-                    self.jason_combat_start_time = timer_window.start_time
-                    self.jason_phase_start_time = timer_window.start_time  # 第一阶段开始时间与战斗开始时间相同
-                    print(
-                        f"[DEBUG] 战斗开始！设置JASON时间基准: {self.jason_combat_start_time}")
-
-                    # 伤害阈值检测机制
-                    self.check_damage_thresholds(
-                        timer_window, current_damage_count, damage_increase)
-
-                    # 如果有配置文件，使用配置文件的时长
-                    if hasattr(timer_window, 'act_config') and timer_window.act_config:
-                        if 'total_duration' in timer_window.act_config:
-                            timer_window.total_duration = timer_window.act_config['total_duration']
-                            self.add_timer_event(
-                                timer_window, f"🔥Battle Start！使用配置时长: {timer_window.total_duration}秒")
-                        else:
-                            self.add_timer_event(
-                                timer_window, f"🔥Battle Start！使用默认时长: {timer_window.total_duration}秒")
-                    else:
-                        self.add_timer_event(
-                            timer_window, f"🔥Battle Start！无配置文件，使用默认时长: {timer_window.total_duration}秒")
-
-                    # 如果启用了明显提醒模式，创建明显提醒窗口
-                    if (hasattr(timer_window, 'prominent_alert_enabled') and
-                            timer_window.prominent_alert_enabled.get()):
-                        self.create_prominent_alert_window(timer_window)
-
-                    # 立即显示倒计时开始
-                    remaining_time = timer_window.total_duration
-                    hours = int(remaining_time // 3600)
-                    minutes = int((remaining_time % 3600) // 60)
-                    seconds = int(remaining_time % 60)
-                    time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                    team_damage = self.get_team_total_damage()
-                    timer_window.draw_time_with_shadow(
-                        time_str, self.colors["neon_green"], False, None, team_damage)
-
-                    # 同时更新明显提醒窗口
-                    if (hasattr(timer_window, 'prominent_alert_enabled') and
-                        timer_window.prominent_alert_enabled.get() and
-                        hasattr(timer_window, 'prominent_window') and
-                            timer_window.prominent_window):
-                        try:
-                            if timer_window.prominent_window.winfo_exists():
-                                timer_window.prominent_window.draw_prominent_time(
-                                    time_str, self.colors["neon_green"], False, None)  # 战斗开始时不需要辉光，也没有阶段信息
-                        except (tk.TclError, AttributeError):
-                            # prominent_window已被销毁或无效
-                            timer_window.prominent_window = None
-                else:
-                    # 更新last_damage_count以便下次比较
-                    timer_window.last_damage_count = current_damage_count
-                    # 继续显示等待状态
-                    team_damage = self.get_team_total_damage()
-                    timer_window.draw_time_with_shadow(
-                        "Waiting for Battle...", self.colors["neon_yellow"], False, None, team_damage)
-
-            # 如果已经检测到伤害，进行倒计时
-            elif timer_window.damage_detected and timer_window.start_time is not None:
-                timer_window.elapsed_time = time.time() - timer_window.start_time
-
-                # 计算剩余时间（倒计时）
-                remaining_time = max(
-                    0, timer_window.total_duration - timer_window.elapsed_time)
-
-                # 处理ACT配置中的提醒
-                if hasattr(timer_window, 'act_config') and timer_window.act_config:
-                    self.process_act_alerts(
-                        timer_window, timer_window.elapsed_time, remaining_time)
-
-                # 检查JASON阶段警告
-                current_time = time.time()
-                self.check_phase_warnings(current_time)
-
-                if remaining_time <= 0:
-                    # 倒计时结束
-                    timer_window.timer_running = False
-
-                    # TTS语音提示
-                    if hasattr(timer_window, 'tts_enabled') and timer_window.tts_enabled.get():
-                        try:
-                            self.speak_text(
-                                "Boss已经狂暴", source_type="boss_rage")
-                        except Exception as e:
-                            print(f"TTS播放失败: {e}")
-
-                    # 显示特殊消息
-                    special_message = "God bless you :D"
-                    team_damage = self.get_team_total_damage()
-                    timer_window.draw_time_with_shadow(
-                        special_message, self.colors["neon_red"], True, None, team_damage)  # 启用辉光效果
-
-                    # 同时更新明显提醒窗口
-                    if (hasattr(timer_window, 'prominent_alert_enabled') and
-                        timer_window.prominent_alert_enabled.get() and
-                        hasattr(timer_window, 'prominent_window') and
-                            timer_window.prominent_window):
-                        try:
-                            if timer_window.prominent_window.winfo_exists():
-                                timer_window.prominent_window.draw_prominent_time(
-                                    special_message, self.colors["neon_red"], True, None)  # 启用辉光效果
-                        except (tk.TclError, AttributeError):
-                            # prominent_window已被销毁或无效
-                            timer_window.prominent_window = None
-
-                    self.add_timer_event(timer_window, "BOSS已经狂暴！倒计时结束！")
-                else:
-                    # 格式化剩余时间显示
-                    hours = int(remaining_time // 3600)
-                    minutes = int((remaining_time % 3600) // 60)
-                    seconds = int(remaining_time % 60)
-
-                    time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-
-                    # 多重颜色判断机制 - 同时考虑绝对时间、百分比和即将到达的警告/阶段
-                    remaining_ratio = remaining_time / timer_window.total_duration
-                    elapsed_time = timer_window.elapsed_time
-
-                    # 获取下一个即将到达的警告或阶段切换时间
-                    next_event_time = None
-
-                    # 检查ACT配置中的警告
-                    if hasattr(timer_window, 'act_config') and timer_window.act_config:
-                        alerts = timer_window.act_config.get('alerts', [])
-                        for alert in alerts:
-                            if alert.get('type') == 'timed':
-                                trigger_time = alert.get('trigger_time', 0)
-                                # 如果警告时间在当前时间之后
-                                if trigger_time > elapsed_time:
-                                    if next_event_time is None or trigger_time < next_event_time:
-                                        next_event_time = trigger_time
-
-                        # 检查阶段切换时间
-                        phases = timer_window.act_config.get('phases', [])
-                        for phase in phases:
-                            phase_start = phase.get('start_time', 0)
-                            # 如果阶段开始时间在当前时间之后
-                            if phase_start > elapsed_time:
-                                if next_event_time is None or phase_start < next_event_time:
-                                    next_event_time = phase_start
-
-                    # 计算距离下一个事件的时间
-                    time_to_next_event = None
-                    if next_event_time is not None:
-                        time_to_next_event = next_event_time - elapsed_time
-
-                    # 初始化颜色过渡状态
-                    if not hasattr(timer_window, '_color_transition'):
-                        timer_window._color_transition = {
-                            'current_color': self.colors["neon_cyan"],
-                            'target_color': self.colors["neon_cyan"],
-                            'transition_start': time.time(),
-                            'glow_intensity': 0.0,
-                            'target_glow': 0.0
-                        }
-
-                    # 绝对时间条件 - 只保留事件相关的警告
-                    # 移除了固定时间警告(5秒/2秒)以避免叠加问题
-
-                    # 百分比条件
-                    ratio_critical = remaining_ratio < 0.25  # 小于25%
-                    ratio_warning = remaining_ratio < 0.5   # 小于50%
-
-                    # 颜色判断逻辑 - 按优先级确定最终颜色
-                    # 红色条件（最高优先级）
-                    red_conditions = []
-                    if ratio_critical:
-                        red_conditions.append("比例危险")
-
-                    # 黄色条件（中等优先级）
-                    yellow_conditions = []
-                    if ratio_warning and not ratio_critical:
-                        yellow_conditions.append("比例警告")
-
-                    # 确定目标颜色和辉光强度
-                    target_color = self.colors["neon_cyan"]
-                    target_glow = 0.0
-
-                    if red_conditions:
-                        target_color = self.colors["neon_red"]
-                        # 红色条件越多，辉光越强
-                        if len(red_conditions) >= 3:
-                            target_glow = 1.0  # 满足所有条件
-                        elif len(red_conditions) >= 2:
-                            target_glow = 0.8  # 满足两个条件
-                        else:
-                            target_glow = 0.6  # 满足一个条件
-                    elif yellow_conditions:
-                        target_color = self.colors["neon_yellow"]
-                        # 黄色条件越多，辉光越强
-                        if len(yellow_conditions) >= 3:
-                            target_glow = 0.8
-                        elif len(yellow_conditions) >= 2:
-                            target_glow = 0.6
-                        else:
-                            target_glow = 0.4
-
-                    # 颜色过渡逻辑
-                    transition = timer_window._color_transition
-                    current_time = time.time()
-
-                    # 如果目标颜色变化，开始新的过渡
-                    if target_color != transition['target_color']:
-                        transition['current_color'] = self.interpolate_colors(
-                            transition['current_color'], transition['target_color'], 1.0)
-                        transition['target_color'] = target_color
-                        transition['transition_start'] = current_time
-
-                    # 计算颜色过渡进度（0.3秒内完成）
-                    color_progress = min(
-                        1.0, (current_time - transition['transition_start']) / 0.3)
-                    color = self.interpolate_colors(
-                        transition['current_color'], target_color, color_progress)
-
-                    # 辉光过渡逻辑（0.2秒内完成）
-                    if target_glow != transition['target_glow']:
-                        transition['target_glow'] = target_glow
-                        transition['glow_start'] = current_time
-
-                    glow_progress = min(
-                        1.0, (current_time - transition.get('glow_start', current_time)) / 0.2)
-                    glow_intensity = transition['glow_intensity'] + (
-                        target_glow - transition['glow_intensity']) * glow_progress
-                    transition['glow_intensity'] = glow_intensity
-
-                    # 辉光效果基于强度
-                    glow_effect = glow_intensity > 0.1
-
-                    # 检测当前阶段 - 使用JASON阶段信息而不是时间阶段信息
-                    jason_phase_info = self.get_jason_phase_info()
-                    current_phase = jason_phase_info if jason_phase_info else self.get_current_phase(
-                        timer_window, timer_window.elapsed_time)
-
-                    team_damage = self.get_team_total_damage()
-                    timer_window.draw_time_with_shadow(
-                        time_str, color, glow_effect, current_phase, team_damage)
-
-                    # 如果启用了明显提醒模式，同时更新屏幕顶部的倒计时
-                    if (hasattr(timer_window, 'prominent_alert_enabled') and
-                        timer_window.prominent_alert_enabled.get() and
-                        hasattr(timer_window, 'prominent_window') and
-                            timer_window.prominent_window):
-                        try:
-                            if timer_window.prominent_window.winfo_exists():
-                                timer_window.prominent_window.draw_prominent_time(
-                                    time_str, color, glow_effect, current_phase)
-                        except (tk.TclError, AttributeError):
-                            # prominent_window已被销毁或无效
-                            timer_window.prominent_window = None
-
-        # 每秒更新一次
-        timer_window.after(
-            1000, lambda: self.update_timer_display(timer_window))
+        from ui_act_timer import update_timer_display
+        return update_timer_display(self, timer_window)
 
     def interpolate_colors(self, color1, color2, progress):
         """在两个颜色之间进行插值"""
@@ -7060,563 +3319,138 @@ Orbitron 是一款未来主义科幻字体，
                     # 标记为已触发
                     timer_window.triggered_thresholds.add(threshold_id)
 
-                    # 创建警报对象
-                    alert = {
-                        'message': threshold.get('message', f'伤害达到{damage_threshold}'),
-                        'color': threshold.get('color', 'yellow'),
-                        'sound': threshold.get('sound', True),
-                        'type': 'damage_threshold'
-                    }
-
-                    # 触发警报
-                    self.trigger_alert(timer_window, alert, alert_index=0)
-
-                    # 记录事件
-                    self.add_timer_event(timer_window,
-                                         f"💥 伤害阈值触发: {alert['message']} (当前伤害: {current_damage})")
-
-        except Exception as e:
-            print(f"检查伤害阈值时出错: {e}")
-
-    def get_current_damage_count(self):
-        """获取当前总伤害计数，用于检测伤害变化"""
-        try:
-            # 方法1：尝试从current_data获取
-            if hasattr(self, 'current_data') and self.current_data:
-                data = self.current_data
-                if data.get("code") == 0 and data.get("user"):
-                    total_damage = 0
-
-                    for uid, user_info in data["user"].items():
-                        # 检查正确的数据结构
-                        if "total_damage" in user_info and isinstance(user_info["total_damage"], dict):
-                            damage = user_info["total_damage"].get("total", 0)
-                            total_damage += damage
-
-                    return total_damage
-
-            # 方法2：如果没有数据，尝试从UI表格获取
-            if hasattr(self, 'tree') and self.tree:
-                try:
-                    total_damage = 0
-                    for item in self.tree.get_children():
-                        values = self.tree.item(item, 'values')
-                        if values and len(values) > 4:  # 确保有足够的列
-                            try:
-                                # 第5列是总伤害
-                                damage = float(
-                                    values[4]) if values[4] and values[4] != '-' else 0
-                                total_damage += damage
-                            except (ValueError, IndexError):
-                                continue
-                    return total_damage
-                except Exception as e:
-                    print(f"从UI表格获取伤害时出错: {e}")
-
-            return 0
-        except Exception as e:
-            print(f"获取伤害计数时出错: {e}")
-            return 0
-
-    def start_tts_worker(self):
-        """启动TTS工作线程"""
-        if self.tts_worker_thread is None or not self.tts_worker_thread.is_alive():
-            self.tts_worker_running = True
-            self.tts_worker_thread = threading.Thread(
-                target=self.tts_worker, daemon=True)
-            self.tts_worker_thread.start()
-
-    def tts_worker(self):
-        """TTS工作线程，按优先级和顺序播放"""
-        while self.tts_worker_running:
-            try:
-                # 从队列中获取下一个TTS任务，超时1秒
-                priority, text = self.tts_queue.get(timeout=1)
-
-                # 执行TTS播放
-                try:
-                    import subprocess
-                    cmd = f'powershell -Command "Add-Type -AssemblyName System.Speech; (New-Object System.Speech.Synthesis.SpeechSynthesizer).Speak(\'{text}\')"'
-                    subprocess.run(cmd, shell=True, capture_output=True)
-                except Exception as e:
-                    print(f"TTS播报失败: {e}")
-
-                # 标记任务完成
-                self.tts_queue.task_done()
-
-            except queue.Empty:
-                # 队列为空，继续等待
-                continue
-            except Exception as e:
-                print(f"TTS工作线程错误: {e}")
-
-    def speak_text(self, text, priority=50, source_type="alert"):
-        """使用TTS排队播放文本
-        优先级: 数字越小优先级越高
-        - 阶段切换: priority=10
-        - JSON中靠前的警报: priority=20-40
-        - 其他警报: priority=50+
-        """
-        try:
-            # 根据来源类型调整优先级
-            if source_type == "phase":
-                priority = 10  # 阶段最高优先级
-            elif source_type == "boss_rage":
-                priority = 5   # Boss狂暴最高优先级
-
-            # 将TTS任务加入优先级队列
-            self.tts_queue.put((priority, text))
-
-        except Exception as e:
-            print(f"添加TTS任务失败: {e}")
-
-    def create_prominent_alert_window(self, timer_window):
-        """创建屏幕顶部的明显提醒窗口"""
-        if timer_window.prominent_window is not None:
-            try:
-                timer_window.prominent_window.destroy()
-            except:
-                pass
-
-        # 创建全屏顶部窗口
-        prominent_window = tk.Toplevel()
-        prominent_window.title("")
-        prominent_window.overrideredirect(True)
-        prominent_window.wm_attributes("-topmost", True)
-        prominent_window.wm_attributes("-alpha", 0.0)  # 初始透明度为0，准备淡入
-
-        # 获取屏幕尺寸
-        screen_width = prominent_window.winfo_screenwidth()
-        screen_height = prominent_window.winfo_screenheight()
-
-        # 设置窗口大小和位置（屏幕顶部）
-        window_height = 150  # 再增加高度以容纳更大的阶段描述区域
-        prominent_window.geometry(f"{screen_width}x{window_height}+0+0")
-        prominent_window.configure(bg=self.colors["bg_primary"])
-
-        # 主容器 - 水平分割
-        main_container = tk.Frame(
-            prominent_window, bg=self.colors["bg_primary"])
-        main_container.pack(fill="both", expand=True, padx=20, pady=5)
-
-        # 左侧DPS条区域（占三分之一宽度）
-        left_dps_frame = tk.Frame(main_container, bg=self.colors["bg_primary"])
-        left_dps_frame.pack(side="left", fill="y", padx=(0, 10))
-        left_dps_frame.configure(width=screen_width // 3)  # 三分之一宽度
-        left_dps_frame.pack_propagate(False)
-
-        # 右侧内容区域（占三分之二宽度）
-        right_content_frame = tk.Frame(
-            main_container, bg=self.colors["bg_primary"])
-        right_content_frame.pack(side="right", fill="both", expand=True)
-
-        # 创建DPS条区域
-        self.create_prominent_dps_bars(left_dps_frame, timer_window)
-
-        # 将main_container指向右侧区域，以便原有代码正常工作
-        original_main_container = main_container
-        main_container = right_content_frame
-
-        # 添加右上角退出按钮
-        def close_prominent_window():
-            try:
-                timer_window.prominent_window = None
-                prominent_window.destroy()
-            except:
-                pass
-
-        close_button = self.create_enhanced_button(
-            prominent_window,
-            "✕",
-            close_prominent_window,
-            self.colors["neon_red"],
-            width=3,
-            height=1
-        )
-        close_button.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
-
-        # JASON阶段控制按钮组（在右上角）
-        jason_control_frame = tk.Frame(
-            prominent_window, bg=self.colors["bg_primary"])
-        jason_control_frame.place(relx=1.0, rely=0.0, anchor="ne", x=-60, y=10)
-
-        # 当前阶段显示
-        timer_window.prominent_jason_label = tk.Label(
-            jason_control_frame,
-            text=f"阶段{self.current_jason_phase}",
-            font=self.get_font(10, "bold"),
-            bg=self.colors["bg_primary"],
-            fg=self.get_jason_phase_info()["color"]
-        )
-        timer_window.prominent_jason_label.pack(side="right", padx=5)
-
-        # 阶段控制按钮
-        jason_btn_frame = tk.Frame(
-            jason_control_frame, bg=self.colors["bg_primary"])
-        jason_btn_frame.pack(side="right")
-
-        # 推进阶段按钮
-        advance_btn = self.create_enhanced_button(
-            jason_btn_frame,
-            "▶",
-            self.advance_jason_phase,
-            self.colors["neon_cyan"],
-            width=2,
-            height=1
-        )
-        advance_btn.pack(side="left", padx=1)
-
-        # 重置按钮
-        reset_btn = self.create_enhanced_button(
-            jason_btn_frame,
-            "⟲",
-            self.reset_jason_rage_time,
-            self.colors["neon_orange"],
-            width=2,
-            height=1
-        )
-        reset_btn.pack(side="left", padx=1)
-
-        # 自动推进按钮
-        auto_advance_btn = self.create_enhanced_button(
-            jason_btn_frame,
-            "⚡",
-            self.toggle_jason_auto_advance,
-            self.colors["neon_green"] if self.jason_auto_advance_enabled else self.colors["neon_red"],
-            width=2,
-            height=1
-        )
-        auto_advance_btn.pack(side="left", padx=1)
-        timer_window.prominent_jason_auto_btn = auto_advance_btn
-
-        # 阶段选择按钮 - 修复：使用动态配置
-        # 检查当前配置是否有JASON阶段
-        if self.current_act_config and 'jason_phases' in self.current_act_config:
-            jason_phases_config = self.current_act_config['jason_phases']
-            phase_definitions = []
-
-            # 处理不同的配置格式
-            if isinstance(jason_phases_config, list):
-                # 新格式：直接的阶段数组
-                phase_definitions = jason_phases_config
-                print(f"[DEBUG] 使用新格式JASON配置，包含 {len(phase_definitions)} 个阶段")
-            elif isinstance(jason_phases_config, dict) and 'phase_definitions' in jason_phases_config:
-                # 旧格式：包含phase_definitions的对象
-                phase_definitions = jason_phases_config['phase_definitions']
-                print(f"[DEBUG] 使用旧格式JASON配置，包含 {len(phase_definitions)} 个阶段")
-            else:
-                print(f"[DEBUG] JASON配置格式不正确: {type(jason_phases_config)}")
-
-            for i in range(1, 4):
-                # 从动态配置中获取阶段信息
-                phase_info = None
-                for phase in phase_definitions:
-                    if phase.get("id") == i:
-                        phase_info = phase
-                        break
-
-                if phase_info:
-                    btn = self.create_enhanced_button(
-                        jason_btn_frame,
-                        str(i),
-                        lambda p=i: self.set_jason_phase(p),
-                        phase_info.get("color", "#ffffff"),
-                        width=2,
-                        height=1
-                    )
-                    btn.pack(side="left", padx=1)
-                    print(
-                        f"[DEBUG] 创建阶段按钮 {i}: {phase_info.get('name', f'阶段{i}')}")
-                else:
-                    # 如果配置中没有定义该阶段，使用默认设置
-                    default_colors = ["#00ff00", "#ffff00", "#ff0000"]
-                    btn = self.create_enhanced_button(
-                        jason_btn_frame,
-                        str(i),
-                        lambda p=i: self.set_jason_phase(p),
-                        default_colors[i-1],
-                        width=2,
-                        height=1
-                    )
-                    btn.pack(side="left", padx=1)
-                    print(f"[DEBUG] 创建默认阶段按钮 {i}")
-        else:
-            print(f"[DEBUG] 无JASON配置或配置中缺少jason_phases")
-            print(
-                f"[DEBUG] current_act_config: {bool(self.current_act_config)}")
-            if self.current_act_config:
-                print(f"[DEBUG] 配置键: {list(self.current_act_config.keys())}")
-
-        # 添加明显模式JASON信息更新方法
-        def update_prominent_jason_info():
-            """更新明显模式的JASON阶段信息显示"""
-            try:
-                phase_info = self.get_jason_phase_info()
-                timer_window.prominent_jason_label.config(
-                    text=f"阶段{self.current_jason_phase}",
-                    fg=phase_info["color"]
-                )
-                # 更新自动推进按钮状态
-                if hasattr(timer_window, 'prominent_jason_auto_btn'):
-                    btn_color = self.colors["neon_green"] if self.jason_auto_advance_enabled else self.colors["neon_red"]
-                    timer_window.prominent_jason_auto_btn.config(fg=btn_color)
-            except:
-                pass
-
-        timer_window.update_prominent_jason_info = update_prominent_jason_info
-
-        # 创建内容区域的水平分割
-        content_container = tk.Frame(
-            main_container, bg=self.colors["bg_primary"])
-        content_container.pack(fill="both", expand=True, pady=(0, 10))
-
-        # 左侧时间显示区域（包含阶段数和倒计时）
-        time_container = tk.Frame(
-            content_container, bg=self.colors["bg_primary"])
-        time_container.pack(side="left", fill="both",
-                            expand=True, padx=(0, 10))
-
-        # 右侧阶段描述专用幕布区域
-        phase_desc_container = tk.Frame(
-            content_container, bg=self.colors["bg_primary"])
-        phase_desc_container.pack(side="right", fill="both")
-        phase_desc_container.configure(width=screen_width // 4)  # 右侧1/4宽度
-        phase_desc_container.pack_propagate(False)
-
-        # 阶段描述画布
-        phase_desc_canvas = tk.Canvas(
-            phase_desc_container,
-            bg=self.colors["bg_primary"],
-            highlightthickness=0,
-            bd=0
-        )
-        phase_desc_canvas.pack(fill="both", expand=True)
-
-        # 时间显示Canvas（只包含阶段数和倒计时）
-        time_canvas = tk.Canvas(
-            time_container,
-            height=80,  # 保持高度
-            bg=self.colors["bg_primary"],
-            highlightthickness=0,
-            bd=0
-        )
-        time_canvas.pack(fill="x")
-
-        def draw_prominent_time(time_text="00:00:00", text_color=None, glow_effect=False, phase_info=None):
-            # 只绘制阶段数和倒计时，阶段描述在独立画布
-            time_canvas.delete("all")
-            font_tuple = self.get_font(36, "bold")  # 倒计时字体
-
-            if text_color is None:
-                text_color = self.colors["neon_cyan"]
-
-            canvas_width = time_canvas.winfo_width()
-            canvas_height = time_canvas.winfo_height()
-            if canvas_width > 1 and canvas_height > 1:
-                # 时间画布只包含阶段数和倒计时
-                center_x = canvas_width // 2
-                center_y = canvas_height // 2  # 画布中心Y坐标
-
-                # 调整布局：阶段数保持左移，倒计时更靠右移动
-                left_zone_x = canvas_width // 8      # 左边区域中心（阶段数，向左移）
-                center_zone_x = canvas_width * 6 // 12   # 倒计时区域
-
-                # 绘制阶段数信息
-                if phase_info:
-                    phase_name = phase_info.get('name', '')
-                    phase_format = phase_info.get('format', {})
-
-                    # 阶段数显示在左边 - 使用大号加粗字体
-                    if phase_name:
-                        # 修复：处理阶段名称中的换行符
-                        phase_name = phase_name.replace(
-                            '/n', '\n')  # 将 /n 转换为 \n
-
-                        # 更大更醒目的阶段数字体
-                        name_font_size = 20  # 增大字体
-                        name_font = self.get_font(name_font_size, "bold")
-                        name_color = self.colors["neon_purple"]
-
-                        # 处理多行阶段名称
-                        name_lines = phase_name.split('\n')
-                        line_height = 25  # 行高，适配大字体
-                        total_height = len(name_lines) * line_height
-                        # 向下偏移5像素，让阶段数更好地Y轴居中
-                        start_y = center_y - total_height * 1 // 3
-
-                        for i, line in enumerate(name_lines):
-                            current_y = start_y + i * line_height
-
-                            # 多层阴影效果让阶段数更突出
-                            shadow_layers = [
-                                (3, 3, "#000000"),
-                                (2, 2, "#111111"),
-                                (1, 1, "#222222")
-                            ]
-
-                            for dx, dy, shadow_color in shadow_layers:
-                                time_canvas.create_text(
-                                    left_zone_x + dx, current_y + dy, text=line, font=name_font,
-                                    fill=shadow_color, anchor="center"
-                                )
-
-                            # 边框效果
-                            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                                time_canvas.create_text(
-                                    left_zone_x + dx, current_y + dy, text=line, font=name_font,
-                                    fill="#444444", anchor="center"
-                                )
-
-                            # 主文字
-                            time_canvas.create_text(
-                                left_zone_x, current_y, text=line, font=name_font,
-                                fill=name_color, anchor="center"
-                            )
-
-                # 倒计时显示在中央
-                time_y = center_y
-
-                # 如果启用辉光效果，绘制荧光辉光（更大的辉光适配更大字体）
-                if glow_effect:
-                    # 明显提醒窗口的辉光层更大更明显
-                    glow_layers = [
-                        (18, 0.15),  # 最外层
-                        (12, 0.25),  # 中层
-                        (8, 0.35),   # 内层
-                        (6, 0.45),   # 最内层
-                    ]
-
-                    # 计算辉光颜色
-                    def add_alpha_to_color(hex_color, alpha):
-                        hex_color = hex_color.lstrip('#')
-                        r = int(hex_color[0:2], 16)
-                        g = int(hex_color[2:4], 16)
-                        b = int(hex_color[4:6], 16)
-                        # 混合到背景色
-                        bg_r, bg_g, bg_b = 30, 30, 40  # 背景色近似
-                        final_r = int(r * alpha + bg_r * (1 - alpha))
-                        final_g = int(g * alpha + bg_g * (1 - alpha))
-                        final_b = int(b * alpha + bg_b * (1 - alpha))
-                        return f"#{final_r:02x}{final_g:02x}{final_b:02x}"
-
-                    # 绘制辉光层 - 使用正确的倒计时位置
-                    for radius, alpha in glow_layers:
-                        glow_color = add_alpha_to_color(text_color, alpha)
-                        for angle in range(0, 360, 12):  # 每12度一个点，更密集
-                            import math
-                            dx = int(radius * math.cos(math.radians(angle)))
-                            dy = int(radius * math.sin(math.radians(angle)))
-                            time_canvas.create_text(
-                                center_zone_x + dx, time_y + dy,
-                                text=time_text, font=font_tuple,
-                                fill=glow_color, anchor="center"
-                            )
-
-                # 绘制阴影
-                shadow_layers = [
-                    (6, 6, "#000000"),
-                    (4, 4, "#111111"),
-                    (2, 2, "#222222")
-                ]
-
-                for dx, dy, shadow_color in shadow_layers:
-                    time_canvas.create_text(
-                        center_zone_x + dx, time_y + dy,
-                        text=time_text, font=font_tuple,
-                        fill=shadow_color, anchor="center"
-                    )
-
-                # 绘制主文字
-                time_canvas.create_text(
-                    center_zone_x, time_y,
-                    text=time_text, font=font_tuple,
-                    fill=text_color, anchor="center"
-                )
-
-            # 绘制阶段描述到独立画布
-            draw_phase_description(phase_info)
-
-        def draw_phase_description(phase_info):
-            """在独立画布上绘制阶段描述，Y轴居中"""
-            phase_desc_canvas.delete("all")
-
-            if not phase_info:
-                return
-
-            phase_desc = phase_info.get('description', '')
-            if not phase_desc:
-                return
-
-            # 修复：处理两种换行符格式
-            phase_desc = phase_desc.replace('/n', '\n')  # 将 /n 转换为 \n
+                    # 创建警报对象
+                    alert = {
+                        'message': threshold.get('message', f'伤害达到{damage_threshold}'),
+                        'color': threshold.get('color', 'yellow'),
+                        'sound': threshold.get('sound', True),
+                        'type': 'damage_threshold'
+                    }
 
-            phase_format = phase_info.get('format', {})
-            desc_font_size = phase_format.get('font_size', 14)  # 稍大的字体
-            desc_color = self.colors.get(phase_format.get(
-                'color', 'neon_cyan'), self.colors['neon_cyan'])
-            desc_style = phase_format.get('font_style', 'italic')
-            desc_font = self.get_font(desc_font_size, desc_style)
+                    # 触发警报
+                    self.trigger_alert(timer_window, alert, alert_index=0)
 
-            canvas_width = phase_desc_canvas.winfo_width()
-            canvas_height = phase_desc_canvas.winfo_height()
+                    # 记录事件
+                    self.add_timer_event(timer_window,
+                                         f"💥 伤害阈值触发: {alert['message']} (当前伤害: {current_damage})")
 
-            if canvas_width > 1 and canvas_height > 1:
-                # 处理多行描述
-                desc_lines = phase_desc.split('\n')
-                line_height = desc_font_size + 5  # 增加行间距
-                total_desc_height = len(desc_lines) * line_height - 5
+        except Exception as e:
+            print(f"检查伤害阈值时出错: {e}")
 
-                # Y轴居中计算
-                canvas_center_y = canvas_height * 3 // 4
-                desc_start_y = canvas_center_y - total_desc_height // 2
+    def get_current_damage_count(self):
+        """获取当前总伤害计数，用于检测伤害变化（O(1)，数据到达时已增量更新）"""
+        return self.damage_tracker.team_total
 
-                # X轴稍微左移
-                canvas_center_x = canvas_width * 2 // 5
+    def start_tts_worker(self):
+        """启动TTS工作线程"""
+        if self.tts_worker_thread is None or not self.tts_worker_thread.is_alive():
+            self.tts_worker_running = True
+            self.tts_worker_thread = threading.Thread(
+                target=self.tts_worker, daemon=True)
+            self.tts_worker_thread.start()
 
-                for i, desc_line in enumerate(desc_lines):
-                    desc_y = desc_start_y + i * line_height
+    def tts_worker(self):
+        """TTS工作线程，按优先级和顺序播放；后端只在本线程中使用"""
+        from tts_backend import open_tts_backend
+        self.tts_backend = open_tts_backend()
+        while self.tts_worker_running:
+            try:
+                # 从队列中获取下一个TTS任务，超时1秒
+                priority, _, kind, text = self.tts_queue.get(timeout=1)
 
-                    # 阴影效果
-                    phase_desc_canvas.create_text(
-                        canvas_center_x + 2, desc_y + 2, text=desc_line, font=desc_font,
-                        fill="#000000", anchor="center"
-                    )
+                try:
+                    if kind == "render":
+                        self.tts_cache.render(self.tts_backend, text)
+                    else:
+                        # 命中预合成缓存时直接播放音频，否则实时合成
+                        start = time.perf_counter()
+                        path = self.tts_cache.lookup(self.tts_backend, text)
+                        if not (path and self.tts_backend.play(path)):
+                            self.tts_backend.speak(text)
+                        print(f"[DEBUG] TTS播报: {text} ({'缓存' if path else '实时合成'}, "
+                              f"{(time.perf_counter() - start) * 1000:.0f}ms)")
+                except Exception as e:
+                    print(f"TTS播报失败: {e}")
 
-                    # 主文字
-                    phase_desc_canvas.create_text(
-                        canvas_center_x, desc_y, text=desc_line, font=desc_font,
-                        fill=desc_color, anchor="center"
-                    )
+                # 标记任务完成
+                self.tts_queue.task_done()
 
-        # 警告显示区域 - 只在左侧时间区域显示
-        alert_container = tk.Frame(
-            time_container, bg=self.colors["bg_primary"])
-        # 警告区域占左侧时间区域的全宽
-        alert_container.pack(fill="x", pady=(10, 0))
+            except queue.Empty:
+                # 队列为空，继续等待
+                continue
+            except Exception as e:
+                print(f"TTS工作线程错误: {e}")
 
-        alert_canvas = tk.Canvas(
-            alert_container,
-            height=40,
-            bg=self.colors["bg_primary"],
-            highlightthickness=0,
-            bd=0
-        )
-        alert_canvas.pack(fill="x")
+        try:
+            self.tts_backend.close()
+        except Exception as e:
+            print(f"[WARNING] 关闭TTS后端失败: {e}")
+
+    def _queue_tts(self, priority, kind, text):
+        if self.tts_worker_thread is None:
+            # 第一次使用时才启动TTS工作线程（打开语音后端较慢）
+            self.start_tts_worker()
+        self.tts_sequence += 1
+        self.tts_queue.put((priority, self.tts_sequence, kind, text))
+
+    def prerender_act_phrases(self, config, total_duration):
+        """加载ACT配置时把所有固定播报文本加入预合成队列（优先级低于实时播报）"""
+        from alert_scheduler import AlertScheduler
+        try:
+            phrases = ["Boss已经狂暴"]
 
-        prominent_window.draw_prominent_time = draw_prominent_time
-        prominent_window.alert_canvas = alert_canvas
-        prominent_window.alert_alpha = 0.0
+            # 提醒文本，倒计时提醒按每个播报点展开
+            for compiled in AlertScheduler(config).alerts:
+                message = compiled.alert.get('message', '')
+                if compiled.type != 'countdown':
+                    phrases.append(message)
+                    continue
+                remaining = compiled.start_time
+                while compiled.interval > 0 and remaining > 0:
+                    if remaining <= total_duration:
+                        phrases.append(f"{message}: {int(remaining)}秒")
+                    remaining -= compiled.interval
+
+            # 阶段警告（启用声音的）和暴走前推进播报
+            machine = self.jason_machine
+            rage_seconds = {machine.global_rage_advance}
+            for phase in machine.phases.values():
+                phrases.extend(w.message for w in phase.warnings if w.sound)
+                rage_seconds.add(phase.rage_advance)
+            phrases.extend(f"暴走前{seconds}秒，进入三阶段！"
+                           for seconds in rage_seconds if seconds is not None)
+
+            phrases = list(dict.fromkeys(p for p in phrases if p))
+            for phrase in phrases:
+                self._queue_tts(1000, "render", phrase)
+            print(f"[DEBUG] 已加入 {len(phrases)} 条预合成语音")
+        except Exception as e:
+            print(f"[DEBUG] 预合成语音失败: {e}")
 
-        timer_window.prominent_window = prominent_window
+    def speak_text(self, text, priority=50, source_type="alert"):
+        """使用TTS排队播放文本
+        优先级: 数字越小优先级越高
+        - 阶段切换: priority=10
+        - JSON中靠前的警报: priority=20-40
+        - 其他警报: priority=50+
+        """
+        try:
+            # 根据来源类型调整优先级
+            if source_type == "phase":
+                priority = 10  # 阶段最高优先级
+            elif source_type == "boss_rage":
+                priority = 5   # Boss狂暴最高优先级
 
-        # 添加淡入效果
-        self.fade_window_in(prominent_window, self.current_alpha, 0.2)
+            # 将TTS任务加入优先级队列
+            self._queue_tts(priority, "speak", text)
 
-        # 启动DPS数据更新（在窗口创建完成后）
-        prominent_window.after(
-            1000, lambda: self.update_prominent_dps_data(timer_window))
+        except Exception as e:
+            print(f"添加TTS任务失败: {e}")
 
-        return prominent_window
+    def create_prominent_alert_window(self, timer_window):
+        """创建屏幕顶部的明显提醒窗口"""
+        from ui_prominent_alert import create_prominent_alert_window
+        return create_prominent_alert_window(self, timer_window)
 
     def fade_window_in(self, window, target_alpha=None, duration=0.2, callback=None):
         """窗口淡入效果"""
@@ -7741,63 +3575,21 @@ Orbitron 是一款未来主义科幻字体，
         self.show_alert_with_duration(
             timer_window, message, color, 3.0)  # 默认3秒显示
 
+    def get_act_config_dirs(self):
+        """ACT配置文件搜索目录：当前运行目录优先，其次可执行文件目录（打包环境）和脚本目录"""
+        search_dirs = [os.getcwd()]
+        if getattr(sys, 'frozen', False):
+            search_dirs.append(os.path.dirname(sys.executable))
+        search_dirs.append(os.path.dirname(os.path.abspath(__file__)))
+        return search_dirs
+
     def refresh_act_configs(self):
-        """刷新ACT配置文件列表"""
+        """刷新ACT配置文件列表（只重新解析新增或修改过的文件）"""
         try:
-            import os
-            import json
-
-            # 查找当前运行目录下的所有.json文件
-            config_files = []
-
-            # 获取当前运行目录（而不是脚本目录）
-            current_dir = os.getcwd()
-
-            # 如果是打包环境，也检查可执行文件所在目录
-            if getattr(sys, 'frozen', False):
-                exe_dir = os.path.dirname(sys.executable)
-                scan_dirs = [current_dir, exe_dir]
-            else:
-                scan_dirs = [current_dir, os.path.dirname(
-                    os.path.abspath(__file__))]
-
-            print(f"[DEBUG] 扫描配置文件目录: {scan_dirs}")
-
-            # 内置的示例配置文件（只保留两个example）
-            builtin_configs = [
-                'act_raid_config.json',     # 统一配置示例
-                'act_pvp_arena.json'        # PVP示例配置
-            ]
-
-            # 扫描所有目录
-            for scan_dir in scan_dirs:
-                if not os.path.exists(scan_dir):
-                    continue
-
-                print(f"[DEBUG] 正在扫描目录: {scan_dir}")
-
-                for file in os.listdir(scan_dir):
-                    if file.endswith('.json'):
-                        try:
-                            config_path = os.path.join(scan_dir, file)
-                            with open(config_path, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-
-                            # 检查是否是有效的战斗配置文件
-                            if self._is_valid_config(data):
-                                display_name = data.get('name', file[:-5])
-                                file_key = file[:-5]  # 去掉.json扩展名
-
-                                # 避免重复添加
-                                if not any(existing_file == file_key for existing_file, _ in config_files):
-                                    config_files.append(
-                                        (file_key, display_name))
-                                    print(
-                                        f"[DEBUG] 找到配置文件: {file} -> {display_name}")
-
-                        except Exception as e:
-                            print(f"[DEBUG] 验证配置文件 {file} 失败: {e}")
-                            continue
+            print(f"[DEBUG] 扫描配置文件目录: {self.config_catalog.scan_dirs}")
+            parsed_before = self.config_catalog.stats["parsed"]
+            entries = self.config_catalog.scan()
+            config_files = [(entry.file_key, entry.display_name) for entry in entries]
 
             # 更新下拉框选项
             if hasattr(self, 'config_combobox'):
@@ -7811,7 +3603,8 @@ Orbitron 是一款未来主义科幻字体，
                 if display_values:
                     self.config_combobox.set(display_values[0])
 
-            print(f"[DEBUG] 找到 {len(config_files)} 个有效配置文件")
+            print(f"[DEBUG] 找到 {len(config_files)} 个有效配置文件 "
+                  f"(本次解析 {self.config_catalog.stats['parsed'] - parsed_before} 个)")
             for file_name, display_name in config_files:
                 print(f"[DEBUG] - {display_name} ({file_name})")
 
@@ -7820,16 +3613,6 @@ Orbitron 是一款未来主义科幻字体，
             import traceback
             traceback.print_exc()
 
-    def _is_valid_config(self, data):
-        """检查是否是有效的战斗配置文件"""
-        if not isinstance(data, dict) or 'name' not in data:
-            return False
-
-        # 检查是否包含任何战斗配置相关的字段
-        required_fields = ['alerts', 'jason_phases',
-                           'phases', 'raid_templates', 'total_duration']
-        return any(field in data for field in required_fields)
-
     def on_act_config_changed(self, event=None):
         """当ACT配置文件选择改变时的回调"""
         try:
@@ -7869,9 +3652,6 @@ Orbitron 是一款未来主义科幻字体，
     def load_act_config(self, config_name):
         """加载ACT配置文件（从当前运行目录或通过映射查找）"""
         try:
-            import os
-            import json
-
             # 如果没有指定配置名称或为空，使用统一配置文件
             if not config_name or config_name.strip() == "":
                 config_name = "act_raid_config"
@@ -7883,38 +3663,14 @@ Orbitron 是一款未来主义科幻字体，
                 actual_file_name = self.config_file_mapping[config_name]
                 print(f"[DEBUG] 通过映射转换: {config_name} -> {actual_file_name}")
 
-            # 构建配置文件路径
-            if not actual_file_name.endswith('.json'):
-                actual_file_name += '.json'
-
-            # 搜索目录列表
-            search_dirs = []
-
-            # 当前运行目录（优先）
-            search_dirs.append(os.getcwd())
-
-            # 如果是打包环境，添加可执行文件目录
-            if getattr(sys, 'frozen', False):
-                search_dirs.append(os.path.dirname(sys.executable))
-
-            # 脚本目录（用于开发环境）
-            search_dirs.append(os.path.dirname(os.path.abspath(__file__)))
-
-            # 依次在各个目录中查找配置文件
-            for search_dir in search_dirs:
-                config_path = os.path.join(search_dir, actual_file_name)
-                if os.path.exists(config_path):
-                    try:
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            config = json.load(f)
-                            print(f"[DEBUG] ACT配置文件加载成功: {config_path}")
-                            return config
-                    except Exception as e:
-                        print(f"[DEBUG] 加载配置文件 {config_path} 时出错: {e}")
-                        continue
+            # 从配置目录取已解析的配置（文件未修改时不重复读取）
+            config = self.config_catalog.get(actual_file_name)
+            if config is not None:
+                print(f"[DEBUG] ACT配置文件加载成功: {actual_file_name}")
+                return config
 
             print(f"[DEBUG] 在所有搜索目录中都找不到配置文件: {actual_file_name}")
-            print(f"[DEBUG] 搜索目录: {search_dirs}")
+            print(f"[DEBUG] 搜索目录: {self.config_catalog.scan_dirs}")
 
             # 如果加载失败，尝试使用主配置
             if config_name != "act_raid_config.json":
@@ -7927,113 +3683,91 @@ Orbitron 是一款未来主义科幻字体，
             traceback.print_exc()
             return None
 
-    def process_act_alerts(self, timer_window, elapsed_time, remaining_time):
-        """处理ACT配置中的提醒"""
-        try:
-            config = timer_window.act_config
-            if not config or 'alerts' not in config:
-                return
-
-            current_time = int(elapsed_time)
-
-            for i, alert in enumerate(config['alerts']):
-                alert_id = f"{alert['type']}_{i}_{current_time}"
-                alert_key = f"{alert['type']}_{i}"  # 用于跳过机制的键
-
-                if alert['type'] == 'periodic':
-                    # 周期性提醒
-                    interval = alert['interval']
-                    if current_time > 0 and current_time % interval == 0:
-                        if alert_id not in timer_window.alerts_triggered:
-                            # 检查跳过机制
-                            if not self.should_skip_alert(timer_window, alert, alert_key):
-                                self.trigger_alert(
-                                    timer_window, alert, alert_index=i)
-                            timer_window.alerts_triggered.add(alert_id)
-
-                elif alert['type'] == 'timed':
-                    # 定时提醒（剩余时间触发）
-                    trigger_time = alert['trigger_time']
-                    if remaining_time <= trigger_time and remaining_time > trigger_time - 1:
-                        if alert_id not in timer_window.alerts_triggered:
-                            # 检查跳过机制
-                            if not self.should_skip_alert(timer_window, alert, alert_key):
-                                self.trigger_alert(
-                                    timer_window, alert, alert_index=i)
-                            timer_window.alerts_triggered.add(alert_id)
-
-                elif alert['type'] == 'countdown':
-                    # 倒计时提醒
-                    start_time = alert.get('start_time', 0)
-                    interval = alert.get('interval', 10)
-                    if remaining_time <= start_time and remaining_time > 0:
-                        if (start_time - remaining_time) % interval == 0:
-                            if alert_id not in timer_window.alerts_triggered:
-                                # 检查跳过机制
-                                if not self.should_skip_alert(timer_window, alert, alert_key):
-                                    self.trigger_alert(
-                                        timer_window, alert, remaining_time, alert_index=i)
-                                timer_window.alerts_triggered.add(alert_id)
-
-        except Exception as e:
-            print(f"处理ACT提醒时出错: {e}")
-
-    def parse_skip_pattern(self, pattern):
-        """解析跳过模式，格式: 'X:Y' 表示每X次跳过Y次"""
-        try:
-            if ':' in pattern:
-                parts = pattern.split(':')
-                if len(parts) == 2:
-                    trigger_count = int(parts[0])
-                    skip_count = int(parts[1])
-                    return trigger_count, skip_count
-        except:
-            pass
-        return None, None
-
-    def should_skip_alert(self, timer_window, alert, alert_key):
-        """检查是否应该跳过这个警报"""
-        # 检查全局跳过机制
-        config = timer_window.act_config
-        global_skip = config.get('skip_mechanism', {}) if config else {}
+    def compile_act_config(self, config):
+        """编译并校验ACT配置（在配置监视线程中执行，不访问界面状态）"""
+        from alert_scheduler import AlertScheduler
+        from jason_phase_machine import JasonPhaseMachine
+        return {
+            "alert_scheduler": AlertScheduler(config),
+            "jason_machine": JasonPhaseMachine(
+                config.get("jason_phases"), config.get("total_duration", 600)),
+        }
 
-        # 检查单个警报的跳过机制
-        alert_skip = alert.get('skip_mechanism', {})
+    def _on_act_config_file_changed(self, timer_window, entry, compiled, cost_ms):
+        """配置监视线程回调：切回UI线程后记录待应用的新配置"""
+        def stage():
+            try:
+                if not timer_window.winfo_exists():
+                    return
+            except Exception:
+                return
+            timer_window.pending_config_reload = (entry.copy_config(), compiled, cost_ms)
+            self.add_timer_event(
+                timer_window, f"🔄 检测到配置修改: {entry.display_name} (解析+编译 {cost_ms:.1f}ms)")
+            # 尚未开战时立即应用，战斗中等到重置或倒计时结束
+            if timer_window.start_time is None:
+                self.apply_pending_config_reload(timer_window)
+            else:
+                self.add_timer_event(timer_window, "新配置将在本次战斗结束后生效")
 
-        # 优先使用单个警报的跳过设置，否则使用全局设置
-        skip_config = alert_skip if alert_skip.get('enabled') else global_skip
+        self.root.after(0, stage)
 
-        if not skip_config.get('enabled'):
-            return False
+    def _on_act_config_reload_failed(self, timer_window, file_name, message):
+        """配置监视线程回调：新配置校验失败时保留旧配置"""
+        def report():
+            try:
+                self.add_timer_event(timer_window, f"❌ 配置 {file_name} 有误，继续使用旧配置: {message}")
+            except Exception:
+                pass
 
-        pattern = skip_config.get('skip_pattern')
-        if not pattern:
-            return False
+        self.root.after(0, report)
 
-        trigger_count, skip_count = self.parse_skip_pattern(pattern)
-        if trigger_count is None or skip_count is None:
-            return False
+    def apply_pending_config_reload(self, timer_window):
+        """在两次开战之间一次性替换计时器的配置、提醒时间线和阶段状态机"""
+        pending = getattr(timer_window, 'pending_config_reload', None)
+        if not pending or (timer_window.start_time is not None and timer_window.timer_running):
+            return
+        config, compiled, cost_ms = pending
+        timer_window.pending_config_reload = None
+        start = time.perf_counter()
+
+        old_config = timer_window.act_config
+        timer_window.act_config = config
+        timer_window.total_duration = config.get('total_duration', timer_window.total_duration)
+        timer_window.alert_scheduler = compiled["alert_scheduler"]
+        if self.current_act_config is old_config:
+            self.current_act_config = config
+            self.compile_jason_phases(config, compiled["jason_machine"])
+        self.prerender_act_phrases(config, timer_window.total_duration)
+
+        if timer_window.start_time is None:
+            team_damage = self.get_team_total_damage()
+            timer_window.draw_time_with_shadow(
+                f"{timer_window.total_duration//3600:02d}:{(timer_window.total_duration%3600)//60:02d}:{timer_window.total_duration%60:02d}",
+                self.colors["neon_cyan"], False, None, team_damage)
 
-        # 获取或初始化计数器
-        if alert_key not in timer_window.skip_counters:
-            timer_window.skip_counters[alert_key] = {
-                'count': 0, 'skip_count': 0}
+        swap_ms = (time.perf_counter() - start) * 1000
+        self.add_timer_event(
+            timer_window, f"✅ 配置已热重载 (后台 {cost_ms:.1f}ms, 切换 {swap_ms:.1f}ms)")
+        print(f"[DEBUG] 配置热重载完成: 后台 {cost_ms:.1f}ms, 切换 {swap_ms:.1f}ms")
 
-        counter = timer_window.skip_counters[alert_key]
-        counter['count'] += 1
+    def process_act_alerts(self, timer_window, elapsed_time, remaining_time):
+        """处理ACT配置中的提醒：只弹出时间线中已到期的事件"""
+        try:
+            scheduler = getattr(timer_window, 'alert_scheduler', None)
+            if scheduler is None:
+                return
 
-        # 检查是否应该跳过
-        if counter['count'] % trigger_count == 0:
-            counter['skip_count'] += 1
-            if counter['skip_count'] <= skip_count:
-                print(
-                    f"[SKIP] 跳过警报: {alert.get('message', '')} (模式: {pattern}, 计数: {counter['count']}, 跳过: {counter['skip_count']})")
-                return True
-            else:
-                # 重置跳过计数
-                counter['skip_count'] = 0
+            for compiled, alert_remaining in scheduler.pop_due(elapsed_time):
+                if compiled.type == 'countdown':
+                    self.trigger_alert(
+                        timer_window, compiled.alert, alert_remaining, alert_index=compiled.index)
+                else:
+                    self.trigger_alert(
+                        timer_window, compiled.alert, alert_index=compiled.index)
 
-        return False
+        except Exception as e:
+            print(f"处理ACT提醒时出错: {e}")
 
     def trigger_alert(self, timer_window, alert, remaining_time=None, alert_index=0):
         """触发一个提醒"""
@@ -8126,7 +3860,8 @@ Orbitron 是一款未来主义科幻字体，
                 timer_window.alert_queue_processing = False
 
         # 在当前警告显示完成后处理下一个
-        timer_window.after(int(display_duration * 1000), process_next)
+        timer_window.after(int(display_duration * 1000),
+                           self.ui_governor.wrap("alert_queue", process_next))
 
     def add_timer_event(self, timer_window, event_text):
         """添加事件到JASON库记录中"""
@@ -8169,6 +3904,8 @@ Orbitron 是一款未来主义科幻字体，
         """切换所有窗口的显示/隐藏状态"""
         try:
             self.hidden_by_home = not self.hidden_by_home
+            # 隐藏期间暂停所有RGB动画
+            self.ui_governor.set_hidden(self.hidden_by_home)
 
             if self.hidden_by_home:
                 # 隐藏所有窗口（不包括明显提醒窗口）
@@ -8478,7 +4215,8 @@ Orbitron 是一款未来主义科幻字体，
 
                 if data:
                     # 更新UI（在主线程中）
-                    self.root.after(0, self.update_data_display, data)
+                    self.root.after(0, self.ui_governor.wrap(
+                        "data_display", self.update_data_display), data)
 
                     # 更新状态
                     self.root.after(
@@ -8507,7 +4245,8 @@ Orbitron 是一款未来主义科幻字体，
             except:
                 interval = 1.0
 
-            time.sleep(interval)
+            # 主循环负载高时降低刷新频率
+            time.sleep(self.ui_governor.refresh_interval(interval))
 
     def start_test_mode(self):
         """启动测试模式 - 模拟数据显示"""
@@ -8537,7 +4276,8 @@ Orbitron 是一款未来主义科幻字体，
                 test_data = self.generate_test_data()
 
                 # 更新UI（在主线程中）
-                self.root.after(0, self.update_data_display, test_data)
+                self.root.after(0, self.ui_governor.wrap(
+                    "data_display", self.update_data_display), test_data)
 
                 # 更新状态
                 self.root.after(
@@ -8558,7 +4298,8 @@ Orbitron 是一款未来主义科幻字体，
             except:
                 interval = 1.0
 
-            time.sleep(interval)
+            # 主循环负载高时降低刷新频率
+            time.sleep(self.ui_governor.refresh_interval(interval))
 
     def generate_test_data(self):
         """生成测试数据"""
@@ -8643,7 +4384,8 @@ Orbitron 是一款未来主义科幻字体，
                     data = response.json()
 
                     # 更新UI（在主线程中）
-                    self.root.after(0, self.update_data_display, data)
+                    self.root.after(0, self.ui_governor.wrap(
+                        "data_display", self.update_data_display), data)
 
                     # 更新状态
                     self.root.after(
@@ -8681,7 +4423,79 @@ Orbitron 是一款未来主义科幻字体，
             except:
                 interval = 1.0
 
-            time.sleep(interval)
+            # 主循环负载高时降低刷新频率
+            time.sleep(self.ui_governor.refresh_interval(interval))
+
+    def ingest_snapshot(self, user_data):
+        """汇总一次服务器快照：玩家目录、累计伤害、滚动DPS、战斗切分和战斗历史"""
+        # 记录玩家名称/职业/战力变化（后台批量写入玩家目录）
+        if self.player_directory is not None:
+            self.player_directory.observe_snapshot(user_data)
+
+        # 增量更新全团总伤害和各玩家伤害增量
+        now = time.time()
+        self.damage_tracker.update(user_data)
+        self.total_damage = self.damage_tracker.team_total
+        self.rolling_dps.update(self.damage_tracker.totals, now)
+
+        # 切分战斗并记录战斗历史（由切分事件开始/结束记录）
+        self.encounter_segmenter.update(self.damage_tracker, now)
+        self.fight_recorder.sample(user_data, now)
+        self._refresh_encounter_choices()
+
+    def render_detail_pane(self, user_data):
+        """只用已汇总的结果重绘详细信息（切换显示的战斗时不重新汇总快照）"""
+        detail_info = []
+        detail_info.append("▓▓▓ DETAILED_COMBAT_ANALYSIS ▓▓▓\n")
+        # 选中战斗的统计放在最前面（使用已累计的结果，不重新计算历史）
+        detail_info.extend(self.format_encounter_summary())
+
+        for uid, user_info in user_data.items():
+            # 详细信息 - Cyberpunk风格
+            display_name = self.get_display_name(uid)  # 使用映射的用户名
+            profession = user_info.get("profession", "未知")
+            detail_info.append(f"[PLAYER_NAME]: {display_name}")
+            if display_name != uid:  # 如果有映射，也显示原始UID
+                detail_info.append(f"├─ ORIGINAL_UID: {uid}")
+            detail_info.append(f"├─ PROFESSION: {profession}")
+            detail_info.append(
+                f"├─ TOTAL_DAMAGE: {user_info.get('total_damage', {}).get('total', 0):,}"
+            )
+            detail_info.append(
+                f"├─ NORMAL_DAMAGE: {user_info.get('total_damage', {}).get('normal', 0):,}"
+            )
+            detail_info.append(
+                f"├─ CRITICAL_DAMAGE: {user_info.get('total_damage', {}).get('critical', 0):,}"
+            )
+            detail_info.append(
+                f"├─ LUCKY_DAMAGE: {user_info.get('total_damage', {}).get('lucky', 0):,}"
+            )
+            detail_info.append(
+                f"├─ CRIT+LUCKY: {user_info.get('total_damage', {}).get('crit_lucky', 0):,}"
+            )
+            detail_info.append(
+                f"├─ HP_LESSEN: {user_info.get('total_damage', {}).get('hpLessen', 0):,}"
+            )
+            detail_info.append(
+                f"├─ TOTAL_HEALING: {user_info.get('total_healing', {}).get('total', 0):,}"
+            )
+            detail_info.append(
+                f"├─ REALTIME_HPS: {user_info.get('realtime_hps', 0):,.0f}"
+            )
+            detail_info.append(
+                f"├─ MAX_HPS: {user_info.get('realtime_hps_max', 0):,.0f}"
+            )
+            detail_info.append(
+                f"├─ ROLLING_DPS: {self.format_rolling_dps(uid)} | "
+                f"PEAK_5S: {self.rolling_dps.peak(uid):,.0f}"
+            )
+            detail_info.append(
+                f"└─ TAKEN_DAMAGE: {user_info.get('taken_damage', 0):,}"
+            )
+            detail_info.append("")
+
+        self.detail_text.delete(1.0, tk.END)
+        self.detail_text.insert(1.0, "\n".join(detail_info))
 
     def update_data_display(self, data):
         """更新数据显示 - Cyberpunk风格，优化减少闪烁"""
@@ -8692,6 +4506,9 @@ Orbitron 是一款未来主义科幻字体，
             if data.get("code") == 0 and data.get("user"):
                 user_data = data["user"]
 
+                # 先汇总本次快照，下面的表格和详细信息显示汇总后的结果
+                self.ingest_snapshot(user_data)
+
                 # 获取当前表格中的项目
                 current_items = self.tree.get_children()
                 current_data = {}
@@ -8713,9 +4530,6 @@ Orbitron 是一款未来主义科幻字体，
                         self.tree.delete(item)
                     current_data = {}
 
-                detail_info = []
-                detail_info.append("▓▓▓ DETAILED_COMBAT_ANALYSIS ▓▓▓\n")
-
                 for uid, user_info in user_data.items():
                     # 计算暴击率
                     total_attacks = user_info.get(
@@ -8763,47 +4577,8 @@ Orbitron 是一款未来主义科幻字体，
                         # 插入新项目
                         self.tree.insert("", tk.END, values=values)
 
-                    # 详细信息 - Cyberpunk风格
-                    display_name = self.get_display_name(uid)  # 使用映射的用户名
-                    detail_info.append(f"[PLAYER_NAME]: {display_name}")
-                    if display_name != uid:  # 如果有映射，也显示原始UID
-                        detail_info.append(f"├─ ORIGINAL_UID: {uid}")
-                    detail_info.append(f"├─ PROFESSION: {profession}")
-                    detail_info.append(
-                        f"├─ TOTAL_DAMAGE: {user_info.get('total_damage', {}).get('total', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ NORMAL_DAMAGE: {user_info.get('total_damage', {}).get('normal', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ CRITICAL_DAMAGE: {user_info.get('total_damage', {}).get('critical', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ LUCKY_DAMAGE: {user_info.get('total_damage', {}).get('lucky', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ CRIT+LUCKY: {user_info.get('total_damage', {}).get('crit_lucky', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ HP_LESSEN: {user_info.get('total_damage', {}).get('hpLessen', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ TOTAL_HEALING: {user_info.get('total_healing', {}).get('total', 0):,}"
-                    )
-                    detail_info.append(
-                        f"├─ REALTIME_HPS: {user_info.get('realtime_hps', 0):,.0f}"
-                    )
-                    detail_info.append(
-                        f"├─ MAX_HPS: {user_info.get('realtime_hps_max', 0):,.0f}"
-                    )
-                    detail_info.append(
-                        f"└─ TAKEN_DAMAGE: {user_info.get('taken_damage', 0):,}"
-                    )
-                    detail_info.append("")
-
                 # 更新详细信息
-                self.detail_text.delete(1.0, tk.END)
-                self.detail_text.insert(1.0, "\n".join(detail_info))
+                self.render_detail_pane(user_data)
 
                 # 更新状态栏
                 total_users = len(user_data)
@@ -8811,20 +4586,16 @@ Orbitron 是一款未来主义科幻字体，
                 self.update_status(
                     f"[UPDATE] {current_time} | ACTIVE_PLAYERS: {total_users}")
 
-                # 计算全团总伤害
-                total_damage_sum = 0
-                for uid, user_info in user_data.items():
-                    user_total_damage = user_info.get(
-                        "total_damage", {}).get("total", 0)
-                    total_damage_sum += user_total_damage
-
-                # 更新全团总伤害
-                self.total_damage = total_damage_sum
-
                 # 检查JASON阶段自动推进（包含伤害和时间推进）
                 self.check_jason_auto_advance()
 
             else:
+                # 无数据时总伤害归零（服务器数据已清除）
+                self.damage_tracker.update({})
+                self.total_damage = 0
+                self.encounter_segmenter.end(time.time(), "cleared")
+                self.rolling_dps.reset()
+
                 # 无数据 - Cyberpunk风格
                 for item in self.tree.get_children():
                     self.tree.delete(item)
@@ -8846,6 +4617,8 @@ Orbitron 是一款未来主义科幻字体，
 
     def clear_data(self):
         """清除数据 - Cyberpunk风格"""
+        # 清除前结束当前战斗，记录已保存在 fight_history 中
+        self.encounter_segmenter.end(time.time(), "cleared")
         try:
             if self.direct_mode:
                 # 直接模式：清除数据源中的数据
@@ -8896,6 +4669,94 @@ Orbitron 是一款未来主义科幻字体，
                                  title="ERROR",
                                  color=self.colors["error_red"])
 
+    def _on_encounter_event(self, event, encounter, now):
+        """战斗切分事件：开始/结束战斗历史记录"""
+        if event == "start":
+            config_name = (self.current_act_config or {}).get("name", "")
+            self.fight_recorder.begin(now, f"#{encounter.id} {config_name}".strip())
+        else:
+            self.fight_recorder.end(now, encounter.end_reason)
+        self._encounter_choices_version = None
+
+    def _on_server_supervisor_event(self, event, record):
+        """服务器中断/恢复（守护线程回调，只入队，不碰Tk）"""
+        self.server_events.put((event, record))
+
+    def _poll_server_events(self):
+        """在UI线程中处理守护线程送来的服务器中断/恢复事件"""
+        try:
+            while True:
+                event, record = self.server_events.get_nowait()
+                if event == "down":
+                    # 重启后服务器数据从零开始，当前战斗在中断处结束
+                    self.encounter_segmenter.end(record["start"], f"server_{record['reason']}")
+                    self.update_status("[SERVER] 服务器中断，正在自动重启...")
+                else:
+                    self.server_downtimes.append(record)
+                    self.update_status(
+                        f"[SERVER] 服务器已恢复，中断 {record['end'] - record['start']:.1f}s，期间数据缺失")
+        except queue.Empty:
+            pass
+        except Exception as e:
+            print(f"[DEBUG] 服务器中断事件处理失败: {e}")
+        try:
+            self.root.after(500, self._poll_server_events)
+        except tk.TclError:
+            pass  # 窗口已关闭
+
+    def _refresh_encounter_choices(self):
+        """战斗列表变化时更新下拉框"""
+        if not hasattr(self, "encounter_combo"):
+            return
+        encounters = self.encounter_segmenter.encounters
+        version = (len(encounters), encounters[-1].id if encounters else 0,
+                   self.encounter_segmenter.current is None)
+        if getattr(self, "_encounter_choices_version", None) == version:
+            return
+        self._encounter_choices_version = version
+        self._encounter_choices = {"LIVE": None}
+        for encounter in reversed(encounters):
+            self._encounter_choices[encounter.label()] = encounter.id
+        self.encounter_combo["values"] = list(self._encounter_choices)
+        # 选中的战斗标签（进行中/时长）可能变化，按id重新选中
+        selected_id = self.encounter_segmenter.selected_id
+        for label, encounter_id in self._encounter_choices.items():
+            if encounter_id == selected_id:
+                self.encounter_var.set(label)
+                break
+        else:
+            self.encounter_segmenter.select(None)
+            self.encounter_var.set("LIVE")
+
+    def on_encounter_selected(self, event=None):
+        """切换显示的战斗，只重绘详细信息（不重新汇总快照）"""
+        self.encounter_segmenter.select(self._encounter_choices.get(self.encounter_var.get()))
+        data = getattr(self, "current_data", None)
+        if data and data.get("code") == 0 and data.get("user"):
+            try:
+                self.render_detail_pane(data["user"])
+            except Exception as e:
+                self.update_status(f"[ERROR] 数据显示错误: {e}")
+
+    def format_encounter_summary(self, limit=10):
+        """选中战斗（默认当前/最近一场）的本次伤害和DPS"""
+        encounter = self.encounter_segmenter.displayed()
+        if encounter is None:
+            return []
+        lines = [f"[PULL {encounter.label()}] TEAM: {encounter.team_damage:,} | "
+                 f"DPS: {encounter.team_damage / encounter.duration():,.0f}"]
+        for uid, damage, dps in encounter.summary()[:limit]:
+            lines.append(f"├─ {self.get_display_name(uid)}: {damage:,} ({dps:,.0f}/s)")
+        # 战斗期间或紧随其后的服务器中断：这段时间的数据缺失
+        encounter_end = encounter.end or time.time()
+        for downtime in self.server_downtimes:
+            if encounter.start <= downtime["start"] <= encounter_end + self.encounter_segmenter.GAP_SECONDS:
+                start = time.strftime("%H:%M:%S", time.localtime(downtime["start"]))
+                lines.append(f"├─ ⚠ SERVER_DOWN {start} "
+                             f"{downtime['end'] - downtime['start']:.1f}s ({downtime['reason']})")
+        lines.append("")
+        return lines
+
     def on_refresh_changed(self, event=None):
         """刷新间隔改变"""
         interval = self.refresh_var.get()
@@ -8911,6 +4772,12 @@ Orbitron 是一款未来主义科幻字体，
         """关闭窗口时的处理"""
         self.rgb_animation_running = False
         self.running = False
+        self.tts_worker_running = False
+        self.config_watcher.stop()
+        self.ui_governor.stop()
+
+        # 导出主线程回调耗时统计，便于不同版本间离线对比
+        self.ui_profiler.dump_json(os.path.join(os.getcwd(), "ui_profiles"))
 
         # 停止全局热键监听
         try:
@@ -8923,6 +4790,21 @@ Orbitron 是一款未来主义科幻字体，
         # 停止UID映射监控
         self.stop_uid_mapping_monitor()
 
+        # 结束战斗记录并写完剩余采样
+        try:
+            self.fight_recorder.close()
+        except Exception as e:
+            print(f"[WARNING] 保存战斗记录失败: {e}")
+
+        # 映射有变化时导出到 uid_mapping.json，再写完玩家目录中排队的记录
+        self.save_uid_mapping()
+        if self.player_directory is not None:
+            try:
+                self.player_directory.close()
+                print(f"[INFO] 玩家目录: {self.player_directory.stats}")
+            except Exception as e:
+                print(f"[WARNING] 关闭玩家目录失败: {e}")
+
         # 清理所有Timer窗口和相关的明显提醒窗口
         if hasattr(self, 'timer_windows'):
             for timer_window in self.timer_windows[:]:  # 使用副本避免修改时迭代
@@ -8957,6 +4839,8 @@ Orbitron 是一款未来主义科幻字体，
 
         # 延迟启动耗时功能，避免初始化卡顿
         self.root.after(2000, self._delayed_start_services)
+        # 空闲回调排在初始绘制之后，执行时首帧已经画出
+        self.root.after_idle(self._on_first_paint)
 
         if self.data_source:
             # 如果已设置数据源，自动启动直接模式
@@ -8968,7 +4852,22 @@ Orbitron 是一款未来主义科幻字体，
                 lambda: self.update_status("[INFO] 点击TEST查看演示 | DIRECT使用直接模式"),
             )
 
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # 首帧之前窗口就被关闭时也要恢复 __import__
+            startup_tracer.stop_import_tracing()
+
+    def _on_first_paint(self):
+        """首帧绘制后：输出启动时间线，再进行非必要的初始化"""
+        startup_tracer.mark("首帧绘制")
+        startup_tracer.stop_import_tracing()
+        for line in startup_tracer.report():
+            print(line)
+
+        # 字体验证需要Tk，放到之后的事件循环中；热键钩子在后台线程注册
+        self.root.after(50, self.delayed_font_verification)
+        threading.Thread(target=self.init_global_hotkey, daemon=True).start()
 
     def _delayed_start_services(self):
         """延迟启动服务，避免初始化时卡顿"""
@@ -8984,390 +4883,28 @@ Orbitron 是一款未来主义科幻字体，
 
     def create_prominent_dps_bars(self, parent_frame, timer_window):
         """创建明显模式的DPS条区域 - 左侧1/3，紧凑的DPS条"""
-        # DPS容器 - 只占左侧1/3宽度，增加宽度
-        dps_main_container = tk.Frame(
-            parent_frame, bg=self.colors["bg_primary"], width=600)
-        dps_main_container.pack(side="left", fill="y", padx=5, pady=5)
-        dps_main_container.pack_propagate(False)  # 保持固定宽度
-
-        # 上半部分 - 三列布局，固定高度比例
-        top_container = tk.Frame(
-            dps_main_container, bg=self.colors["bg_primary"], height=200)
-        top_container.pack(fill="x", pady=(0, 2))
-        top_container.pack_propagate(False)
-
-        # 下半部分 - 三列布局，填充剩余空间
-        bottom_container = tk.Frame(
-            dps_main_container, bg=self.colors["bg_primary"])
-        bottom_container.pack(fill="both", expand=True, pady=(2, 0))
-
-        # 上半部分分成三列：个人DPS + 1-2名 + 3-4名
-        top_container.grid_columnconfigure(0, weight=41)  # 个人DPS区域稍微大一点点
-        top_container.grid_columnconfigure(1, weight=40)
-        top_container.grid_columnconfigure(2, weight=40)
-        top_container.grid_rowconfigure(0, weight=1)
-
-        # 左上：个人DPS区域
-        self_dps_frame = tk.Frame(top_container, bg=self.colors["bg_secondary"],
-                                  relief="solid", bd=1)
-        self_dps_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 2))
-
-        # 中上：1-2名区域
-        top_center_frame = tk.Frame(top_container, bg=self.colors["bg_accent"],
-                                    relief="solid", bd=1)
-        top_center_frame.grid(row=0, column=1, sticky="nsew", padx=(2, 2))
-
-        # 右上：3-4名区域（原来的1-2名位置）
-        top_right_frame = tk.Frame(top_container, bg=self.colors["bg_accent"],
-                                   relief="solid", bd=1)
-        top_right_frame.grid(row=0, column=2, sticky="nsew", padx=(2, 0))
-
-        # 下半部分分成三列：5-6名 + 7-8名 + 9-10名
-        bottom_container.grid_columnconfigure(0, weight=1)
-        bottom_container.grid_columnconfigure(1, weight=1)
-        bottom_container.grid_columnconfigure(2, weight=1)
-        bottom_container.grid_rowconfigure(0, weight=1)
-
-        # 左下：5-6名区域（原来的5-6名位置）
-        bottom_left_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
-                                     relief="solid", bd=1)
-        bottom_left_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 2))
-
-        # 中下：7-8名区域（原来的右下位置）
-        bottom_center_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
-                                       relief="solid", bd=1)
-        bottom_center_frame.grid(row=0, column=1, sticky="nsew", padx=(2, 2))
-
-        # 右下：9-10名区域（新增）
-        bottom_right_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
-                                      relief="solid", bd=1)
-        bottom_right_frame.grid(row=0, column=2, sticky="nsew", padx=(2, 0))
-
-        # 存储引用
-        timer_window.prominent_self_dps_frame = self_dps_frame
-        timer_window.prominent_top_center_frame = top_center_frame      # 1-2名
-        timer_window.prominent_top_right_frame = top_right_frame        # 3-4名
-        timer_window.prominent_bottom_left_frame = bottom_left_frame    # 5-6名
-        timer_window.prominent_bottom_center_frame = bottom_center_frame  # 7-8名
-        timer_window.prominent_bottom_right_frame = bottom_right_frame  # 9-10名
+        from ui_prominent_alert import create_prominent_dps_bars
+        return create_prominent_dps_bars(self, parent_frame, timer_window)
 
     def update_prominent_dps_data(self, timer_window):
         """更新明显模式的DPS数据显示 - 包含最高伤害计算"""
-        if not hasattr(timer_window, 'prominent_window') or not timer_window.prominent_window:
-            print("[DEBUG] prominent_window不存在，停止更新")
-            return
-
-        if not timer_window.prominent_window.winfo_exists():
-            print("[DEBUG] prominent_window已销毁，停止更新")
-            return
+        from ui_prominent_alert import update_prominent_dps_data
+        return update_prominent_dps_data(self, timer_window)
 
-        try:
-            print("[DEBUG] 开始更新DPS数据...")
-
-            # 获取实时数据
-            data = None
-            if not self.direct_mode:
-                try:
-                    import requests
-                    response = requests.get(self.api_url, timeout=1)
-                    if response.status_code == 200:
-                        data = response.json()
-                        print(
-                            f"[DEBUG] 从API获取数据成功，用户数: {len(data.get('user', {}))}")
-                except Exception as e:
-                    print(f"[DEBUG] API获取失败: {e}")
-
-            if not data:
-                data = (self.current_data if self.current_data else
-                        self.get_direct_data() or {"user": {}})
-                print(f"[DEBUG] 使用备用数据，用户数: {len(data.get('user', {}))}")
-
-            user_data = data.get("user", {})
-            sorted_users = sorted(
-                user_data.items(),
-                key=lambda x: x[1].get("total_damage", {}).get(
-                    "total", 0) if x[1] else 0,
-                reverse=True,
-            )
-
-            # 计算最高伤害值（作为进度条的100%基准）
-            max_damage = 0
-            if sorted_users:
-                max_damage = sorted_users[0][1].get(
-                    "total_damage", {}).get("total", 0)
-
-            print(
-                f"[DEBUG] 排序后用户数: {len(sorted_users)}, 最高伤害: {max_damage:,.0f}")
-
-            # 更新自己的DPS条（传递最高伤害）
-            self.update_prominent_self_dps(
-                timer_window, sorted_users, max_damage)
-
-            # 更新前6名其他人DPS条（传递最高伤害）
-            self.update_prominent_top_dps(
-                timer_window, sorted_users, max_damage)
-
-        except Exception as e:
-            print(f"[DEBUG] 更新明显模式DPS数据失败: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # 每2秒更新一次
-        if hasattr(timer_window, 'prominent_window') and timer_window.prominent_window:
-            timer_window.prominent_window.after(
-                2000, lambda: self.update_prominent_dps_data(timer_window))
-
-    def update_prominent_self_dps(self, timer_window, sorted_users, max_damage=None):
+    def update_prominent_self_dps(self, timer_window, snapshot):
         """更新个人DPS条显示 - 紧凑DPS条格式"""
-        if not hasattr(timer_window, 'prominent_self_dps_frame'):
-            print("[DEBUG] prominent_self_dps_frame不存在")
-            return
-
-        container = timer_window.prominent_self_dps_frame
-
-        # 清除旧的显示
-        for widget in container.winfo_children():
-            widget.destroy()
-
-        # 查找自己的数据
-        self_uid = self.personal_uid
-        self_data = None
-        self_rank = 0
-
-        if self_uid and sorted_users:
-            for rank, (uid, info) in enumerate(sorted_users, 1):
-                if uid == self_uid:
-                    self_data = info
-                    self_rank = rank
-                    break
-
-        # 如果没有找到个人UID，使用第一名作为示例
-        if not self_data and sorted_users:
-            self_uid, self_data = sorted_users[0]
-            self_rank = 1
-
-        if self_data:
-            display_name = self.get_display_name(self_uid)
-            dps = self_data.get("total_dps", 0)
-            total_damage = self_data.get("total_damage", {}).get("total", 0)
-            total_healing = self_data.get("total_healing", {}).get("total", 0)
-
-            # 创建个人DPS条
-            self.create_miniui_dps_bar(
-                container, display_name, dps, total_damage, self_rank,
-                is_self=True, compact=False, max_damage=max_damage)
-
-            # 添加总治疗和排名信息条
-            info_frame = tk.Frame(
-                container, bg=self.colors["bg_secondary"], height=30)
-            info_frame.pack(fill="x", padx=2, pady=(2, 0))
-            info_frame.pack_propagate(False)
-
-            # 左侧：排名信息（显示总排名）
-            total_players = len(sorted_users)
-            rank_label = tk.Label(
-                info_frame,
-                text=f"排名: #{self_rank}/{total_players}",
-                font=self.get_font(9, "bold"),
-                bg=self.colors["bg_secondary"],
-                fg=self.colors["neon_yellow"],
-                anchor="w"
-            )
-            rank_label.pack(side="left", padx=5, pady=5)
-
-            # 右侧：总治疗
-            healing_text = f"治疗: {total_healing:,.0f}"
-            if total_healing >= 1000000:
-                healing_text = f"治疗: {total_healing/1000000:.1f}M"
-            elif total_healing >= 1000:
-                healing_text = f"治疗: {total_healing/1000:.1f}K"
-
-            healing_label = tk.Label(
-                info_frame,
-                text=healing_text,
-                font=self.get_font(9, "bold"),
-                bg=self.colors["bg_secondary"],
-                fg=self.colors["neon_cyan"],
-                anchor="e"
-            )
-            healing_label.pack(side="right", padx=5, pady=5)
-
-            print(
-                f"[DEBUG] 个人DPS更新: {display_name} - 排名#{self_rank}, DPS:{dps:,.0f}, 治疗:{total_healing:,.0f}")
-        else:
-            # 显示等待个人数据的标签
-            no_data_label = tk.Label(
-                container,
-                text="等待个人数据...",
-                font=self.get_font(9),
-                bg=self.colors["bg_secondary"],
-                fg=self.colors["text_secondary"]
-            )
-            no_data_label.pack(expand=True)
-            print("[DEBUG] 未找到个人DPS数据")
+        from ui_prominent_alert import update_prominent_self_dps
+        return update_prominent_self_dps(self, timer_window, snapshot)
 
-    def update_prominent_top_dps(self, timer_window, sorted_users, max_damage=None):
+    def update_prominent_top_dps(self, timer_window, snapshot):
         """更新前10名其他人DPS条显示 - 新的5盒子布局"""
-        # 检查新的5个Frame容器是否存在
-        if not hasattr(timer_window, 'prominent_top_center_frame') or \
-           not hasattr(timer_window, 'prominent_top_right_frame') or \
-           not hasattr(timer_window, 'prominent_bottom_left_frame') or \
-           not hasattr(timer_window, 'prominent_bottom_center_frame') or \
-           not hasattr(timer_window, 'prominent_bottom_right_frame'):
-            print("[DEBUG] DPS容器不存在")
-            return
-
-        # 获取五个Frame容器，按新的排名顺序
-        containers = [
-            timer_window.prominent_top_center_frame,   # 1-2名
-            timer_window.prominent_top_right_frame,    # 3-4名
-            timer_window.prominent_bottom_left_frame,  # 5-6名
-            timer_window.prominent_bottom_center_frame,  # 7-8名
-            timer_window.prominent_bottom_right_frame  # 9-10名
-        ]
-
-        # 清除旧的显示
-        for container in containers:
-            for widget in container.winfo_children():
-                widget.destroy()
-
-        print(f"[DEBUG] 准备显示前10名玩家（新5盒子布局）")
-
-        if not sorted_users:
-            return
-
-        # 直接取前10名玩家
-        top_players = sorted_users[:10]
-
-        print(f"[DEBUG] 找到{len(top_players)}名玩家数据")
-
-        if not top_players:
-            for container in containers:
-                no_data_label = tk.Label(
-                    container,
-                    text="暂无数据",
-                    font=self.get_font(8),
-                    bg=self.colors["bg_accent"],
-                    fg=self.colors["text_secondary"]
-                )
-                no_data_label.pack(expand=True)
-            return
-
-        # 分配玩家到五个区域：2人 + 2人 + 2人 + 2人 + 2人
-        player_groups = [
-            top_players[:2],      # 1-2名
-            top_players[2:4],     # 3-4名
-            top_players[4:6],     # 5-6名
-            top_players[6:8],     # 7-8名
-            top_players[8:10]     # 9-10名
-        ]
-
-        for group_idx, (players, container) in enumerate(zip(player_groups, containers)):
-            for idx, (uid, info) in enumerate(players):
-                display_name = self.get_display_name(uid)
-                dps = info.get("total_dps", 0)
-                total_damage = info.get("total_damage", {}).get("total", 0)
-                rank = group_idx * 2 + idx + 1
-
-                # 创建紧凑的DPS条
-                self.create_miniui_dps_bar(
-                    container, display_name, dps, total_damage, rank,
-                    is_self=False, compact=True, max_damage=max_damage)
-
-                print(f"[DEBUG] 第{rank}名: {display_name} - DPS: {dps:,.0f}")
-
-        print(f"[DEBUG] 前10名玩家DPS更新完成（新5盒子布局），显示{len(top_players)}名")
+        from ui_prominent_alert import update_prominent_top_dps
+        return update_prominent_top_dps(self, timer_window, snapshot)
 
     def create_miniui_dps_bar(self, parent, name, dps, total_damage, rank, is_self=False, compact=False, max_damage=None):
         """创建紧凑的DPS条块 - 类似MINIUI但更紧凑，带有完整进度条"""
-        # 条目容器 - 固定小高度
-        bar_container = tk.Frame(
-            parent, bg=self.colors["bg_primary"], height=28)
-        bar_container.pack(fill="x", padx=2, pady=1)
-        bar_container.pack_propagate(False)
-
-        # 根据排名确定颜色
-        if is_self:
-            text_color = self.colors["neon_yellow"]
-            bar_color = self.colors["neon_yellow"]
-        elif rank == 1:
-            text_color = self.colors["neon_green"]
-            bar_color = self.colors["neon_green"]
-        elif rank == 2:
-            text_color = self.colors["neon_cyan"]
-            bar_color = self.colors["neon_cyan"]
-        elif rank == 3:
-            text_color = self.colors["neon_yellow"]
-            bar_color = self.colors["neon_yellow"]
-        else:
-            text_color = self.colors["text_primary"]
-            bar_color = self.colors["text_secondary"]
-
-        # 上半部分：名字和排名
-        name_frame = tk.Frame(
-            bar_container, bg=self.colors["bg_primary"], height=14)
-        name_frame.pack(fill="x")
-        name_frame.pack_propagate(False)
-
-        rank_name = f"#{rank} {name[:10]}" + ("..." if len(name) > 10 else "")
-        name_label = tk.Label(
-            name_frame,
-            text=rank_name,
-            font=self.get_font(8, "bold"),
-            bg=self.colors["bg_primary"],
-            fg=text_color,
-            anchor="w"
-        )
-        name_label.pack(side="left", pady=1)
-
-        # 总伤害和DPS数值（右侧）
-        # 总伤害
-        damage_text = self.format_damage_number(total_damage)
-
-        damage_label = tk.Label(
-            name_frame,
-            text=damage_text,
-            font=self.get_font(6),
-            bg=self.colors["bg_primary"],
-            fg=text_color,
-            anchor="e"
-        )
-        damage_label.pack(side="right", pady=1, padx=(0, 2))
-
-        # DPS数值
-        dps_text = f"{dps:,.0f}"
-        if dps >= 1000000:
-            dps_text = f"{dps/1000000:.1f}M"
-        elif dps >= 1000:
-            dps_text = f"{dps/1000:.1f}K"
-
-        dps_label = tk.Label(
-            name_frame,
-            text=dps_text,
-            font=self.get_font(7, "normal"),  # 改为normal，让字体变细
-            bg=self.colors["bg_primary"],
-            fg=text_color,
-            anchor="e"
-        )
-        dps_label.pack(side="right", pady=1)
-
-        # 下半部分：进度条
-        progress_frame = tk.Frame(
-            bar_container, bg=self.colors["bg_primary"], height=14)
-        progress_frame.pack(fill="x")
-        progress_frame.pack_propagate(False)
-
-        # 进度条背景
-        progress_bg = tk.Frame(
-            progress_frame, bg=self.colors["bg_secondary"], height=6)
-        progress_bg.pack(fill="x", padx=2, pady=4)
-
-        # 进度条 - 基于最高伤害
-        if max_damage and max_damage > 0 and total_damage > 0:
-            progress_ratio = min(1.0, total_damage / max_damage)
-            if progress_ratio > 0:
-                progress_bar = tk.Frame(progress_bg, bg=bar_color, height=6)
-                progress_bar.place(x=0, y=0, relwidth=progress_ratio, height=6)
+        from ui_prominent_alert import create_miniui_dps_bar
+        return create_miniui_dps_bar(self, parent, name, dps, total_damage, rank, is_self, compact, max_damage)
 
     def _auto_start_direct_mode(self):
         """自动启动直接模式"""
@@ -0,0 +1,179 @@
+import heapq
+
+
+def parse_skip_pattern(pattern):
+    """解析跳过模式，格式: 'X:Y' 表示每X次跳过Y次"""
+    try:
+        if pattern and ':' in pattern:
+            parts = pattern.split(':')
+            if len(parts) == 2:
+                trigger_count = int(parts[0])
+                skip_count = int(parts[1])
+                if trigger_count > 0:
+                    return trigger_count, skip_count
+    except (TypeError, ValueError):
+        pass
+    return None, None
+
+
+class CompiledAlert:
+    """加载时预处理好的单个提醒（跳过模式已解析，计数器内置）"""
+
+    __slots__ = ("index", "alert", "type", "interval", "trigger_time", "start_time",
+                 "skip_every", "skip_count", "skip_pattern", "count", "skipped")
+
+    def __init__(self, index, alert, global_skip):
+        self.index = index
+        self.alert = alert
+        self.type = alert.get('type')
+        self.interval = alert.get('interval', 10 if self.type == 'countdown' else 0)
+        self.trigger_time = alert.get('trigger_time', 0)
+        self.start_time = alert.get('start_time', 0)
+
+        # 优先使用单个提醒的跳过设置，否则使用全局设置
+        alert_skip = alert.get('skip_mechanism', {}) or {}
+        skip_config = alert_skip if alert_skip.get('enabled') else (global_skip or {})
+        self.skip_every, self.skip_count = (None, None)
+        self.skip_pattern = None
+        if skip_config.get('enabled'):
+            self.skip_pattern = skip_config.get('skip_pattern')
+            self.skip_every, self.skip_count = parse_skip_pattern(self.skip_pattern)
+
+        self.count = 0
+        self.skipped = 0
+
+    def should_skip(self):
+        """按 'X:Y' 模式判断本次是否跳过，与原逐次计数逻辑一致"""
+        if self.skip_every is None:
+            return False
+        self.count += 1
+        if self.count % self.skip_every == 0:
+            self.skipped += 1
+            if self.skipped <= self.skip_count:
+                print(f"[SKIP] 跳过警报: {self.alert.get('message', '')} "
+                      f"(模式: {self.skip_pattern}, 计数: {self.count}, 跳过: {self.skipped})")
+                return True
+            self.skipped = 0
+        return False
+
+    def reset(self):
+        self.count = 0
+        self.skipped = 0
+
+
+class AlertScheduler:
+    """ACT提醒时间线调度器
+
+    配置加载时把 alerts 编译为 CompiledAlert，战斗开始时按倒计时总时长
+    生成每个提醒的下一次触发时间（战斗已进行秒数）放入小根堆。每次计时刷新
+    只弹出已到期的事件：
+    - periodic: 在 interval, 2*interval, ... 秒触发
+    - timed: 在剩余 trigger_time 秒时触发一次
+    - countdown: 剩余时间从 start_time 开始，每 interval 秒触发一次直到结束
+    堆中每个提醒最多一条记录，内存与提醒数量成正比，不随战斗时长增长。
+    """
+
+    # 计时刷新延迟过大时，超过该秒数的过期事件直接丢弃，避免恢复后集中播报
+    MAX_LATENESS = 2.0
+
+    _NOTHING_DUE = ()
+
+    def __init__(self, config):
+        config = config or {}
+        global_skip = config.get('skip_mechanism', {}) or {}
+        self.alerts = []
+        for i, alert in enumerate(config.get('alerts', []) or []):
+            if alert.get('type') in ('periodic', 'timed', 'countdown'):
+                self.alerts.append(CompiledAlert(i, alert, global_skip))
+        self.total_duration = 0
+        self._heap = []
+        self._timed_times = []
+        self._timed_pos = 0
+        self.fired = 0
+        self.dropped = 0
+
+    def start(self, total_duration):
+        """战斗开始时按总时长生成时间线"""
+        self.total_duration = total_duration
+        self._heap = []
+        timed_times = []
+        for compiled in self.alerts:
+            compiled.reset()
+            first = self._first_fire_time(compiled)
+            if first is not None:
+                self._heap.append((first, compiled.index, compiled))
+                if compiled.type == 'timed':
+                    timed_times.append(first)
+        heapq.heapify(self._heap)
+        self._timed_times = sorted(timed_times)
+        self._timed_pos = 0
+
+    def reset(self):
+        """清空时间线（重置计时器时调用）"""
+        self._heap = []
+        self._timed_times = []
+        self._timed_pos = 0
+        for compiled in self.alerts:
+            compiled.reset()
+
+    def _first_fire_time(self, compiled):
+        total = self.total_duration
+        if compiled.type == 'periodic':
+            if compiled.interval and compiled.interval > 0:
+                return float(compiled.interval)
+        elif compiled.type == 'timed':
+            fire_at = total - compiled.trigger_time
+            if 0 <= fire_at < total:
+                return float(fire_at)
+        elif compiled.type == 'countdown':
+            if compiled.interval and compiled.interval > 0 and compiled.start_time > 0:
+                # 剩余时间超过总时长的部分不会出现，从第一个可达的点开始
+                remaining = compiled.start_time
+                if remaining > total:
+                    steps = -(-(remaining - total) // compiled.interval)
+                    remaining -= steps * compiled.interval
+                if remaining > 0:
+                    return float(total - remaining)
+        return None
+
+    def _next_fire_time(self, compiled, fire_at):
+        if compiled.type == 'periodic':
+            return fire_at + compiled.interval
+        if compiled.type == 'countdown':
+            next_at = fire_at + compiled.interval
+            if self.total_duration - next_at > 0:
+                return next_at
+        return None
+
+    def pop_due(self, elapsed):
+        """弹出到期的提醒，返回 [(compiled, remaining_time)]；没有到期时返回空元组"""
+        heap = self._heap
+        if not heap or heap[0][0] > elapsed:
+            return self._NOTHING_DUE
+
+        due = []
+        while heap and heap[0][0] <= elapsed:
+            fire_at, index, compiled = heapq.heappop(heap)
+            next_at = self._next_fire_time(compiled, fire_at)
+            if next_at is not None:
+                heapq.heappush(heap, (next_at, index, compiled))
+            if compiled.type == 'timed':
+                self._timed_pos += 1
+
+            if elapsed - fire_at > self.MAX_LATENESS:
+                self.dropped += 1
+                continue
+            if compiled.should_skip():
+                continue
+            self.fired += 1
+            due.append((compiled, self.total_duration - fire_at))
+        return due
+
+    def next_timed_time(self):
+        """下一个尚未触发的 timed 提醒的触发时间（已进行秒数），没有则返回None"""
+        if self._timed_pos < len(self._timed_times):
+            return self._timed_times[self._timed_pos]
+        return None
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,89 @@
+"""导入耗时基准
+
+用 python -X importtime 在独立进程中导入 act_damage_ui，输出其累计导入耗时、
+最慢的模块，并确认按需加载的窗口模块（ui_*.py）没有在导入时被加载。
+
+    python bench_import.py            # 运行5次取中位数
+    python bench_import.py --json bench.json   # 追加一行JSON结果，便于跨版本对比
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# 首次打开对应窗口时才导入的模块
+LAZY_MODULES = ("ui_minimal_mode", "ui_act_timer", "ui_prominent_alert",
+                "ui_font_installer", "ui_dialogs")
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 输出，返回 {模块名: (自身耗时us, 累计耗时us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        except ValueError:
+            continue
+    return modules
+
+
+def run_once(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, encoding='utf-8', errors='ignore'
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "导入失败")
+    return parse_importtime(result.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="act_damage_ui 导入耗时基准")
+    parser.add_argument("--module", default="act_damage_ui")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="显示最慢的模块数")
+    parser.add_argument("--json", help="把结果追加到该文件（每行一条JSON）")
+    args = parser.parse_args(argv)
+
+    samples = []
+    modules = {}
+    for _ in range(max(args.runs, 1)):
+        modules = run_once(args.module)
+        if args.module not in modules:
+            print(f"[ERROR] 输出中没有 {args.module} 的导入记录")
+            return 1
+        samples.append(modules[args.module][1])
+
+    median_ms = statistics.median(samples) / 1000
+    loaded_lazy = [name for name in LAZY_MODULES if name in modules]
+    print(f"[INFO] import {args.module}: 中位数 {median_ms:.1f}ms "
+          f"(最小 {min(samples) / 1000:.1f}ms, 最大 {max(samples) / 1000:.1f}ms, {len(samples)} 次)")
+    for name, (self_us, cumulative_us) in sorted(modules.items(), key=lambda item: item[1][0],
+                                                  reverse=True)[:args.top]:
+        print(f"[INFO]   {name}: 自身 {self_us / 1000:.1f}ms, 累计 {cumulative_us / 1000:.1f}ms")
+    if loaded_lazy:
+        print(f"[WARNING] 以下按需加载的模块在导入时被加载: {', '.join(loaded_lazy)}")
+    else:
+        print("[OK] 窗口模块均未在导入时加载")
+
+    if args.json:
+        record = {
+            "ts": round(time.time()),
+            "module": args.module,
+            "python": sys.version.split()[0],
+            "median_ms": round(median_ms, 1),
+            "samples_ms": [round(sample / 1000, 1) for sample in samples],
+            "loaded_lazy_modules": loaded_lazy,
+        }
+        with open(args.json, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + "\n")
+    return 1 if loaded_lazy else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
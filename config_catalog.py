@@ -0,0 +1,130 @@
+import copy
+import json
+import os
+import threading
+
+
+# 包含任一字段即视为战斗配置文件
+CONFIG_FIELDS = ('alerts', 'jason_phases', 'phases', 'raid_templates', 'total_duration')
+
+
+def is_valid_config(data):
+    """检查是否是有效的战斗配置文件"""
+    if not isinstance(data, dict) or 'name' not in data:
+        return False
+    return any(field in data for field in CONFIG_FIELDS)
+
+
+class ConfigEntry:
+    """单个json文件的解析结果，以 (mtime, size) 判断是否需要重新解析"""
+
+    __slots__ = ("path", "file_key", "mtime", "size", "valid", "display_name", "config", "error")
+
+    def __init__(self, path, mtime, size):
+        self.path = path
+        self.file_key = os.path.basename(path)[:-5]  # 去掉.json扩展名
+        self.mtime = mtime
+        self.size = size
+        self.valid = False
+        self.display_name = self.file_key
+        self.config = None
+        self.error = None
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.error = str(e)
+            return
+        self.config = data
+        self.valid = is_valid_config(data)
+        if self.valid:
+            self.display_name = data.get('name', self.file_key)
+
+    def copy_config(self):
+        """解析结果的深拷贝；缓存中的对象为所有调用方共享，不能直接修改"""
+        return copy.deepcopy(self.config)
+
+
+class ConfigCatalog:
+    """ACT配置文件目录
+
+    按 路径 -> (mtime, size) 缓存每个json文件的解析结果和有效性，
+    刷新列表时只重新解析新增或修改过的文件；选择配置后直接返回已解析的对象，
+    不再重复读取文件。
+    """
+
+    def __init__(self, scan_dirs):
+        self.scan_dirs = list(dict.fromkeys(scan_dirs))
+        self.entries = {}
+        self.stats = {"parsed": 0, "reused": 0}
+        self._lock = threading.Lock()
+
+    def _entry(self, path, stat):
+        """返回最新的缓存项，文件变化时重新解析（调用方持有锁）"""
+        entry = self.entries.get(path)
+        if entry is not None and entry.mtime == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.stats["reused"] += 1
+            return entry
+        entry = ConfigEntry(path, stat.st_mtime_ns, stat.st_size)
+        entry.load()
+        if entry.error:
+            print(f"[DEBUG] 解析配置文件 {os.path.basename(path)} 失败: {entry.error}")
+        self.entries[path] = entry
+        self.stats["parsed"] += 1
+        return entry
+
+    def scan(self):
+        """扫描所有目录，返回有效配置列表 [ConfigEntry]（同名文件以靠前目录为准）"""
+        found = []
+        seen_keys = set()
+        seen_paths = set()
+        with self._lock:
+            for scan_dir in self.scan_dirs:
+                try:
+                    dir_entries = list(os.scandir(scan_dir))
+                except OSError:
+                    continue
+                for dir_entry in dir_entries:
+                    if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                        continue
+                    try:
+                        entry = self._entry(dir_entry.path, dir_entry.stat())
+                    except OSError:
+                        continue
+                    seen_paths.add(dir_entry.path)
+                    if entry.valid and entry.file_key not in seen_keys:
+                        seen_keys.add(entry.file_key)
+                        found.append(entry)
+
+            # 清理已删除文件的缓存
+            for path in [p for p in self.entries if p not in seen_paths]:
+                del self.entries[path]
+        return found
+
+    def find(self, file_name):
+        """按文件名在扫描目录中查找并返回最新的缓存项，找不到返回None
+
+        优先返回能解析的文件；所有同名文件都无法解析时返回第一个（带error）。
+        """
+        if not file_name.endswith('.json'):
+            file_name += '.json'
+        broken = None
+        with self._lock:
+            for scan_dir in self.scan_dirs:
+                path = os.path.join(scan_dir, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entry = self._entry(path, stat)
+                if entry.config is not None:
+                    return entry
+                broken = broken or entry
+        return broken
+
+    def get(self, file_name):
+        """返回已解析配置的副本（调用方可以修改），找不到或无法解析返回None"""
+        entry = self.find(file_name)
+        return entry.copy_config() if entry else None
@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+
+
+class ConfigWatcher:
+    """ACT配置文件热重载监视器
+
+    后台线程按 interval 秒轮询被监视文件的 (mtime, size)。文件变化且两次
+    轮询间保持不变（编辑器写入完成）后，在后台线程重新解析并调用 validator
+    编译校验，成功时回调 on_reload(key, entry, compiled, cost_ms)，失败时回调
+    on_error(key, file_name, message)。回调在监视线程中执行，调用方负责切回UI线程。
+    """
+
+    def __init__(self, catalog, on_reload, on_error=None, validator=None, interval=1.0):
+        self.catalog = catalog
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self.validator = validator
+        self.interval = interval
+        self.watched = {}  # key -> {"file_name", "path", "signature", "pending"}
+        self.stats = {"polls": 0, "reloads": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def watch(self, key, file_name):
+        """开始监视 key 对应的配置文件，返回是否找到文件"""
+        entry = self.catalog.find(file_name)
+        if entry is None:
+            return False
+        with self._lock:
+            self.watched[key] = {
+                "file_name": file_name,
+                "path": entry.path,
+                "signature": (entry.mtime, entry.size),
+                "pending": None,
+            }
+        self.start()
+        return True
+
+    def unwatch(self, key):
+        with self._lock:
+            self.watched.pop(key, None)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        while self._running:
+            time.sleep(self.interval)
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[DEBUG] 配置文件监视出错: {e}")
+
+    def poll(self):
+        """检查一次所有被监视的文件"""
+        self.stats["polls"] += 1
+        with self._lock:
+            items = list(self.watched.items())
+
+        for key, watch in items:
+            signature = self._signature(watch["path"])
+            if signature is None or signature == watch["signature"]:
+                watch["pending"] = None
+                continue
+            if signature != watch["pending"]:
+                # 首次发现变化，等下一次轮询确认写入已完成
+                watch["pending"] = signature
+                continue
+            watch["signature"] = signature
+            watch["pending"] = None
+            self._reload(key, watch)
+
+    def _reload(self, key, watch):
+        start = time.perf_counter()
+        try:
+            entry = self.catalog.find(watch["file_name"])
+            if entry is None or entry.config is None:
+                raise ValueError(entry.error if entry else "文件不存在")
+            if not entry.valid:
+                raise ValueError("不是有效的战斗配置文件")
+            compiled = self.validator(entry.config) if self.validator else None
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[DEBUG] 配置文件 {watch['file_name']} 重新加载失败: {e}")
+            if self.on_error:
+                self.on_error(key, watch["file_name"], str(e))
+            return
+        cost_ms = (time.perf_counter() - start) * 1000
+        self.stats["reloads"] += 1
+        print(f"[DEBUG] 配置文件 {watch['file_name']} 已重新加载 ({cost_ms:.1f}ms)")
+        self.on_reload(key, entry, compiled, cost_ms)
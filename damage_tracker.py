@@ -0,0 +1,67 @@
+from ranked_snapshot import get_total_damage
+
+
+class DamageTracker:
+    """全团伤害增量统计
+
+    每收到一份服务器快照只比较一次各玩家的总伤害，维护：
+    - team_total: 全团总伤害
+    - deltas: 本次快照中各玩家的伤害增量 {uid: delta}
+    - tick_delta: 距上一份快照新增的全团伤害
+    计时器、阶段推进等逻辑直接读取这些值，无需每次重新求和。
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.deltas = {}
+        self.team_total = 0
+        self.tick_delta = 0
+        self.version = 0
+        self.resets = 0
+
+    def update(self, user_data):
+        """用新的快照更新统计，返回本次新增的全团伤害"""
+        user_data = user_data or {}
+        old_totals = self.totals
+        new_totals = {}
+        deltas = {}
+        team_delta = 0
+        reset = False
+
+        for uid, info in user_data.items():
+            total = get_total_damage(info)
+            new_totals[uid] = total
+            old = old_totals.get(uid, 0)
+            if total != old:
+                if total < old:
+                    # 服务器清除数据后玩家伤害归零重新计数
+                    reset = True
+                deltas[uid] = total - old
+                team_delta += total - old
+
+        for uid, old in old_totals.items():
+            if uid not in new_totals:
+                reset = True
+                team_delta -= old
+
+        self.totals = new_totals
+        self.deltas = deltas
+        self.team_total += team_delta
+        self.tick_delta = sum(delta for delta in deltas.values() if delta > 0)
+        if reset:
+            self.resets += 1
+        if deltas or reset:
+            self.version += 1
+        return self.tick_delta
+
+    def get_player_delta(self, uid):
+        """玩家在最近一份快照中的伤害增量"""
+        return self.deltas.get(uid, 0)
+
+    def reset(self):
+        """清空统计（本地清除数据时调用）"""
+        self.totals = {}
+        self.deltas = {}
+        self.team_total = 0
+        self.tick_delta = 0
+        self.version += 1
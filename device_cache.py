@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+import socket
+
+import psutil
+
+
+def adapter_fingerprint(source=""):
+    """网卡指纹：各网卡名称、MAC、IP地址的摘要
+
+    抓包设备列表由系统网卡决定，网卡增删、地址变化时指纹随之变化。
+    source 用于区分获取设备列表的服务器程序（路径和修改时间）。
+    """
+    adapters = []
+    for name, addresses in sorted(psutil.net_if_addrs().items()):
+        entries = sorted(
+            (int(address.family), address.address or "")
+            for address in addresses
+            if address.family in (psutil.AF_LINK, socket.AF_INET, socket.AF_INET6))
+        adapters.append([name, entries])
+    payload = json.dumps([source, adapters], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class DeviceCache:
+    """抓包设备列表的磁盘缓存
+
+    获取设备列表需要启动一次服务器进程（--list-devices），缓存与网卡指纹一起
+    保存，指纹不变时直接使用缓存，变化时才重新枚举。
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, fingerprint):
+        """指纹一致时返回缓存的设备列表，否则返回None"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("fingerprint") != fingerprint or not data.get("devices"):
+            return None
+        return data["devices"]
+
+    def save(self, fingerprint, devices):
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"fingerprint": fingerprint, "devices": devices}, f,
+                          ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[DEBUG] 保存设备列表缓存失败: {e}")
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
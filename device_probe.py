@@ -0,0 +1,157 @@
+import ctypes
+import socket
+import struct
+import threading
+import time
+
+import psutil
+
+# 场景服务器小包中的协议签名（与 server.js 识别服务器的逻辑一致）
+GAME_SIGNATURE = b"\x00\x63\x33\x53\x42\x00"
+
+
+class pcap_pkthdr(ctypes.Structure):
+    _fields_ = [
+        ("ts", ctypes.c_uint64),
+        ("caplen", ctypes.c_uint32),
+        ("len", ctypes.c_uint32),
+    ]
+
+
+def classify_payload(payload, length=None):
+    """判断TCP负载是否像游戏协议
+
+    返回 2：包含场景服务器签名；1：符合游戏的长度前缀分帧（4字节大端长度等于负载长度）；0：其他
+    length 为负载的实际长度（抓包截断时 payload 只有前一部分）。
+    """
+    if len(payload) < 6:
+        return 0
+    if payload[4] == 0 and len(payload) > 14:
+        data = payload[10:]
+        frame_length = struct.unpack(">I", data[:4])[0]
+        frame = data[4:frame_length]
+        if frame[5:5 + len(GAME_SIGNATURE)] == GAME_SIGNATURE:
+            return 2
+    if struct.unpack(">I", payload[:4])[0] == (length or len(payload)):
+        return 1
+    return 0
+
+
+def tcp_payload(frame):
+    """从以太网帧中取出IPv4 TCP负载，返回 (负载, 负载实际长度)，不是TCP时返回None"""
+    offset = 14
+    if len(frame) < offset:
+        return None
+    ethertype = struct.unpack(">H", frame[12:14])[0]
+    if ethertype == 0x8100:  # VLAN
+        ethertype = struct.unpack(">H", frame[16:18])[0]
+        offset = 18
+    if ethertype != 0x0800 or len(frame) < offset + 20:
+        return None
+    ihl = (frame[offset] & 0x0F) * 4
+    total_length = struct.unpack(">H", frame[offset + 2:offset + 4])[0]
+    if frame[offset + 9] != 6:
+        return None
+    tcp = offset + ihl
+    if len(frame) < tcp + 20:
+        return None
+    data_offset = (frame[tcp + 12] >> 4) * 4
+    if not total_length:  # 网卡分段卸载时长度字段可能为0
+        total_length = len(frame) - offset
+    return frame[tcp + data_offset:offset + total_length], total_length - ihl - data_offset
+
+
+def load_pcap():
+    """加载Npcap/WinPcap库，不可用时返回None"""
+    windll = getattr(ctypes, "windll", None)
+    if windll is None:
+        return None
+    for name in ("Npcap\\wpcap.dll", "wpcap.dll"):
+        try:
+            dll = windll.LoadLibrary(name)
+        except Exception:
+            continue
+        dll.pcap_open_live.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_int,
+                                       ctypes.c_int, ctypes.c_char_p]
+        dll.pcap_open_live.restype = ctypes.c_void_p
+        dll.pcap_next_ex.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.POINTER(pcap_pkthdr)),
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_ubyte)),
+        ]
+        dll.pcap_next_ex.restype = ctypes.c_int
+        dll.pcap_close.argtypes = [ctypes.c_void_p]
+        dll.pcap_close.restype = None
+        return dll
+    return None
+
+
+def _probe_one(dll, device, deadline, result):
+    errbuf = ctypes.create_string_buffer(256)
+    # 非混杂模式，读超时100ms，保证能按时结束
+    handle = dll.pcap_open_live(device["name"].encode(), 256, 0, 100, errbuf)
+    if not handle:
+        result["error"] = errbuf.value.decode('utf-8', errors='ignore')
+        return
+    try:
+        header = ctypes.POINTER(pcap_pkthdr)()
+        data = ctypes.POINTER(ctypes.c_ubyte)()
+        while time.perf_counter() < deadline:
+            res = dll.pcap_next_ex(handle, ctypes.byref(header), ctypes.byref(data))
+            if res == 1:
+                result["packets"] += 1
+                parsed = tcp_payload(ctypes.string_at(data, header.contents.caplen))
+                if parsed and parsed[0]:
+                    kind = classify_payload(*parsed)
+                    if kind == 2:
+                        result["signatures"] += 1
+                    elif kind == 1:
+                        result["frames"] += 1
+            elif res < 0:
+                break
+    finally:
+        dll.pcap_close(handle)
+
+
+def probe_devices(devices, duration=1.0):
+    """在各候选设备上并行短时抓包，统计符合游戏协议特征的包数
+
+    返回 {设备名: {"packets", "frames", "signatures"}}；抓包库不可用时返回空字典。
+    只截取每包前256字节，足够判断分帧和签名。
+    """
+    dll = load_pcap()
+    if dll is None or not devices:
+        return {}
+    deadline = time.perf_counter() + duration
+    results = {}
+    threads = []
+    for device in devices:
+        result = results[device["name"]] = {"packets": 0, "frames": 0, "signatures": 0}
+        thread = threading.Thread(target=_probe_one, args=(dll, device, deadline, result), daemon=True)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join(timeout=duration + 1)
+    return results
+
+
+def interface_addresses():
+    """{IPv4地址: 网卡名}"""
+    addresses = {}
+    for name, addrs in psutil.net_if_addrs().items():
+        for addr in addrs:
+            if addr.family == socket.AF_INET:
+                addresses[addr.address] = name
+    return addresses
+
+
+def traffic_rates(before, after, elapsed):
+    """两次 net_io_counters(pernic=True) 快照之间各网卡的收发速率（字节/秒）"""
+    rates = {}
+    for name, counter in after.items():
+        previous = before.get(name)
+        if previous is None:
+            continue
+        delta = (counter.bytes_sent - previous.bytes_sent) + (counter.bytes_recv - previous.bytes_recv)
+        rates[name] = max(delta, 0) / max(elapsed, 1e-6)
+    return rates
@@ -5,6 +5,8 @@ import subprocess
 import psutil
 import ipaddress
 import re
+import time
+from device_probe import interface_addresses, probe_devices, traffic_rates
 
 
 class DeviceSelector:
@@ -38,6 +40,7 @@ class DeviceSelector:
             # 获取网络接口统计信息
             stats = psutil.net_if_stats()
             addrs = psutil.net_if_addrs()
+            io_counters = psutil.net_io_counters(pernic=True)
 
             for interface_name, interface_stats in stats.items():
                 # 检查接口是否启用且连接
@@ -64,8 +67,6 @@ class DeviceSelector:
                                     not addr.address.startswith('169.254.')):  # 排除APIPA地址
 
                                 # 检查是否有网络流量（活跃度）
-                                io_counters = psutil.net_io_counters(
-                                    pernic=True)
                                 if interface_name in io_counters:
                                     counter = io_counters[interface_name]
                                     # 如果有数据传输（发送或接收）
@@ -211,6 +212,54 @@ class DeviceSelector:
 
         return ipv4_addresses
 
+    def rank_devices(self, devices, probe=True, interval=0.5, probe_seconds=1.0):
+        """按当前流量和游戏协议特征给候选设备排序
+
+        两次 net_io_counters 快照之间的收发速率反映当前流量（而不是开机以来的累计流量）；
+        probe 为True且抓包库可用时，在快照间隔内并行对各候选设备短时抓包，
+        统计符合游戏签名/分帧的包数。返回 [(设备, 信息)]，按
+        (签名数, 分帧数, 当前速率) 降序。
+        """
+        candidates = [device for device in devices if self.is_real_network_adapter(device)] or list(devices)
+        nic_by_address = interface_addresses()
+
+        before = psutil.net_io_counters(pernic=True)
+        start = time.perf_counter()
+        probes = probe_devices(candidates, probe_seconds) if probe else {}
+        remaining = interval - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        rates = traffic_rates(before, psutil.net_io_counters(pernic=True), time.perf_counter() - start)
+
+        ranked = []
+        for device in candidates:
+            nics = {nic_by_address[ip] for ip in self.get_device_ipv4_addresses(device) if ip in nic_by_address}
+            probe_result = probes.get(device["name"], {})
+            info = {
+                "rate": sum(rates.get(nic, 0) for nic in nics),
+                "signatures": probe_result.get("signatures", 0),
+                "frames": probe_result.get("frames", 0),
+            }
+            ranked.append((device, info))
+        ranked.sort(key=lambda item: (item[1]["signatures"], item[1]["frames"], item[1]["rate"]), reverse=True)
+        for device, info in ranked:
+            print(f"设备评分: {device['description'][:40]} - 签名 {info['signatures']}, "
+                  f"分帧 {info['frames']}, 速率 {info['rate'] / 1024:.1f}KB/s")
+        return ranked
+
+    def auto_select_device(self, devices, probe=True):
+        """自动选择抓包设备：优先当前有游戏流量/网络流量的设备，都没有时退回默认网关等规则"""
+        try:
+            ranked = self.rank_devices(devices, probe=probe)
+            if ranked:
+                device, info = ranked[0]
+                if info["signatures"] or info["frames"] or info["rate"] > 0:
+                    print(f"根据实时流量选择设备: {device['description']}")
+                    return device
+        except Exception as e:
+            print(f"实时流量检测失败: {e}")
+        return self.find_best_matching_device(devices)
+
     def find_best_matching_device(self, devices):
         """在设备列表中找到最佳匹配的活动设备"""
         if not devices:
@@ -431,7 +480,7 @@ class DeviceSelector:
         scrollbar.config(command=self.device_listbox.yview)
         # 设备信息显示
         best_device_index = None
-        best_device = self.find_best_matching_device(devices)
+        best_device = self.auto_select_device(devices)
 
         for i, device in enumerate(devices):
             name_short = (
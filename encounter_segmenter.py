@@ -0,0 +1,143 @@
+import time
+from collections import deque
+
+
+class Encounter:
+    """一次战斗（一次开怪）的统计
+
+    只累加开始之后各玩家的快照增量，不需要清除服务器数据也能得到本次战斗的伤害和DPS。
+    """
+
+    __slots__ = ("id", "start", "end", "last_damage_at", "end_reason",
+                 "damage", "team_damage", "version", "_summary", "_summary_version")
+
+    def __init__(self, encounter_id, start):
+        self.id = encounter_id
+        self.start = start
+        self.end = None
+        self.last_damage_at = start
+        self.end_reason = None
+        self.damage = {}
+        self.team_damage = 0
+        self.version = 0
+        self._summary = []
+        self._summary_version = -1
+
+    @property
+    def active(self):
+        return self.end is None
+
+    def duration(self):
+        """战斗时长：开始到最后一次造成伤害"""
+        return max(1.0, (self.end or self.last_damage_at) - self.start)
+
+    def add(self, deltas, now):
+        for uid, delta in deltas.items():
+            if delta > 0:
+                self.damage[uid] = self.damage.get(uid, 0) + delta
+                self.team_damage += delta
+        self.last_damage_at = now
+        self.version += 1
+
+    def summary(self):
+        """[(uid, 伤害, DPS)] 按伤害降序；结束后的战斗只计算一次"""
+        if self._summary_version != self.version:
+            duration = self.duration()
+            self._summary = sorted(
+                ((uid, damage, damage / duration) for uid, damage in self.damage.items()),
+                key=lambda row: row[1], reverse=True)
+            self._summary_version = self.version
+        return self._summary
+
+    def label(self):
+        start = time.strftime("%H:%M:%S", time.localtime(self.start))
+        state = "进行中" if self.active else f"{self.duration():.0f}s"
+        return f"#{self.id} {start} ({state})"
+
+
+class EncounterSegmenter:
+    """从快照流自动切分战斗
+
+    - 出现新伤害且当前没有进行中的战斗时开始新战斗
+    - 超过 GAP_SECONDS 没有新伤害时结束（结束时间为最后一次伤害）
+    - 服务器数据被清除（累计值回落）或阶段重置时结束当前战斗
+    最近 MAX_HISTORY 场战斗保留在内存中，切换显示时直接使用已有统计。
+    事件通过 subscribe(callback) 通知：callback(event, encounter, now)，event 为 "start"/"end"。
+    """
+
+    GAP_SECONDS = 15
+    MAX_HISTORY = 20
+
+    def __init__(self):
+        self.encounters = deque(maxlen=self.MAX_HISTORY)
+        self.current = None
+        self.selected_id = None  # None 表示显示当前/最近一场
+        self._next_id = 1
+        self._resets_seen = 0
+        self._listeners = []
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def _emit(self, event, encounter, now):
+        for callback in self._listeners:
+            try:
+                callback(event, encounter, now)
+            except Exception as e:
+                print(f"[DEBUG] 战斗切分事件处理失败: {e}")
+
+    def update(self, tracker, now):
+        """每份快照调用一次，tracker 为已更新的 DamageTracker"""
+        if tracker.resets != self._resets_seen:
+            self._resets_seen = tracker.resets
+            self.end(now, "cleared")
+
+        if self.current is not None and now - self.current.last_damage_at > self.GAP_SECONDS:
+            self.end(self.current.last_damage_at, "gap")
+
+        if tracker.tick_delta <= 0:
+            return
+        if self.current is None:
+            self._begin(now)
+        self.current.add(tracker.deltas, now)
+
+    def _begin(self, now):
+        self.current = Encounter(self._next_id, now)
+        self._next_id += 1
+        self.encounters.append(self.current)
+        print(f"[DEBUG] 新战斗开始: #{self.current.id}")
+        self._emit("start", self.current, now)
+
+    def end(self, now, reason):
+        """结束当前战斗（没有进行中的战斗时忽略）"""
+        encounter = self.current
+        if encounter is None:
+            return
+        self.current = None
+        encounter.end = encounter.last_damage_at
+        encounter.end_reason = reason
+        encounter.version += 1
+        print(f"[DEBUG] 战斗结束: #{encounter.id} ({reason}, {encounter.duration():.0f}s)")
+        self._emit("end", encounter, now)
+
+    def split(self, now, reason="phase_reset"):
+        """阶段重置等外部信号：结束当前战斗，下一次伤害开始新战斗"""
+        self.end(now, reason)
+
+    def select(self, encounter_id):
+        """选择要显示的战斗，None 表示跟随当前/最近一场"""
+        self.selected_id = encounter_id
+
+    def get(self, encounter_id):
+        for encounter in self.encounters:
+            if encounter.id == encounter_id:
+                return encounter
+        return None
+
+    def displayed(self):
+        """当前选中显示的战斗（选中的已被淘汰时回到最近一场）"""
+        if self.selected_id is not None:
+            encounter = self.get(self.selected_id)
+            if encounter is not None:
+                return encounter
+        return self.encounters[-1] if self.encounters else None
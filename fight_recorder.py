@@ -0,0 +1,185 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from array import array
+
+from ranked_snapshot import get_total_damage
+
+
+class FightRecorder:
+    """战斗历史记录器
+
+    战斗期间每秒采样一次各玩家的累计计数（伤害、治疗、承伤），每场战斗写入
+    fight_history/ 下的一个SQLite文件：samples 表按 (tick, uid) 存储，只在
+    玩家计数变化时写一行（读取时向前填充），meta 表保存开始时间、标签、玩家名称等。
+    采样在UI线程只生成元组，建表、写入和提交都在后台线程中按批完成。
+    战斗的开始和结束由 EncounterSegmenter 的事件驱动。
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE IF NOT EXISTS samples (
+        tick INTEGER NOT NULL,
+        uid TEXT NOT NULL,
+        damage INTEGER NOT NULL,
+        healing INTEGER NOT NULL,
+        taken INTEGER NOT NULL,
+        PRIMARY KEY (tick, uid)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, directory, sample_interval=1.0):
+        self.directory = directory
+        self.sample_interval = sample_interval
+        self.recording = False
+        self.path = None
+        self.start_time = None
+        self.last_sample_at = 0
+        self._last_counters = {}
+        self._names = {}
+        self._queue = queue.Queue()
+        self._writer_thread = None
+        self.stats = {"fights": 0, "rows": 0, "ticks": 0}
+
+    # ---- 记录 ----
+
+    def begin(self, now, label=None):
+        """开始记录一场新战斗（正在记录时先结束上一场）"""
+        if self.recording:
+            self.end(now, "new_fight")
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        self.path = os.path.join(self.directory, f"fight_{stamp}.db")
+        suffix = 1
+        while os.path.exists(self.path):
+            suffix += 1
+            self.path = os.path.join(self.directory, f"fight_{stamp}_{suffix}.db")
+
+        self.recording = True
+        self.start_time = now
+        self.last_sample_at = 0
+        self._last_counters = {}
+        self._names = {}
+        self.stats["fights"] += 1
+        self._put(("open", self.path, {"start_time": now, "label": label or ""}))
+        print(f"[DEBUG] 开始记录战斗: {self.path}")
+
+    def sample(self, user_data, now):
+        """采样一次（距上次采样不足 sample_interval 时忽略）"""
+        if not self.recording or now - self.last_sample_at < self.sample_interval:
+            return
+        self.last_sample_at = now
+        tick = int(round(now - self.start_time))
+        rows = []
+        for uid, info in (user_data or {}).items():
+            if not info:
+                continue
+            counters = (get_total_damage(info),
+                        (info.get("total_healing") or {}).get("total", 0) or 0,
+                        info.get("taken_damage", 0) or 0)
+            if self._last_counters.get(uid) != counters:
+                self._last_counters[uid] = counters
+                rows.append((tick, str(uid)) + counters)
+            if info.get("name"):
+                self._names[str(uid)] = info["name"]
+        self.stats["ticks"] += 1
+        if rows:
+            self.stats["rows"] += len(rows)
+            self._put(("rows", rows))
+
+    def end(self, now, reason="manual"):
+        """结束当前战斗的记录"""
+        if not self.recording:
+            return
+        self.recording = False
+        self._put(("close", {
+            "end_time": now,
+            "duration": round(now - self.start_time, 1),
+            "end_reason": reason,
+            "names": json.dumps(self._names, ensure_ascii=False),
+        }))
+        print(f"[DEBUG] 战斗记录结束 ({reason}): {self.path}")
+
+    def close(self):
+        """结束记录并等待后台写入完成"""
+        self.end(time.time(), "exit")
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._queue.put(None)
+            self._writer_thread.join(timeout=5)
+
+    # ---- 后台写入 ----
+
+    def _put(self, command):
+        self._queue.put(command)
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+
+    def _writer_loop(self):
+        conn = None
+        while True:
+            command = self._queue.get()
+            if command is None:
+                break
+            try:
+                kind = command[0]
+                if kind == "open":
+                    if conn is not None:
+                        conn.close()
+                    conn = sqlite3.connect(command[1])
+                    conn.executescript(self.SCHEMA)
+                    self._write_meta(conn, command[2])
+                elif kind == "rows" and conn is not None:
+                    conn.executemany("INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?)", command[1])
+                elif kind == "close" and conn is not None:
+                    self._write_meta(conn, command[1])
+                    conn.commit()
+                    conn.close()
+                    conn = None
+                # 队列空闲时提交一次，把多秒的采样合并到一个事务
+                if conn is not None and self._queue.empty():
+                    conn.commit()
+            except sqlite3.Error as e:
+                print(f"[DEBUG] 战斗记录写入失败: {e}")
+        if conn is not None:
+            conn.commit()
+            conn.close()
+
+    @staticmethod
+    def _write_meta(conn, values):
+        conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                         [(key, str(value)) for key, value in values.items()])
+
+
+def list_fights(directory):
+    """按时间顺序列出已记录的战斗文件"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.startswith("fight_") and name.endswith(".db"))
+
+
+def load_fight(path):
+    """读取一场战斗，返回 (meta, {uid: {"tick","damage","healing","taken": array}})
+
+    各列为该玩家计数变化时刻的值（累计值），比较时用向前填充即可对齐。
+    """
+    conn = sqlite3.connect(path)
+    try:
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        players = {}
+        for tick, uid, damage, healing, taken in conn.execute(
+                "SELECT tick, uid, damage, healing, taken FROM samples ORDER BY uid, tick"):
+            columns = players.get(uid)
+            if columns is None:
+                columns = players[uid] = {name: array('q') for name in ("tick", "damage", "healing", "taken")}
+            columns["tick"].append(tick)
+            columns["damage"].append(damage)
+            columns["healing"].append(healing)
+            columns["taken"].append(taken)
+        return meta, players
+    finally:
+        conn.close()
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import sys
+
+
+def _font_dirs():
+    """系统和当前用户的字体目录（存在的）"""
+    dirs = []
+    windir = os.environ.get("WINDIR")
+    if windir:
+        dirs.append(os.path.join(windir, "Fonts"))
+    local_appdata = os.environ.get("LOCALAPPDATA")
+    if local_appdata:
+        dirs.append(os.path.join(local_appdata, "Microsoft", "Windows", "Fonts"))
+    if sys.platform != "win32":
+        home = os.path.expanduser("~")
+        dirs += ["/usr/share/fonts", "/usr/local/share/fonts", "/Library/Fonts",
+                 os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts"),
+                 os.path.join(home, "Library", "Fonts")]
+    return [path for path in dirs if os.path.isdir(path)]
+
+
+def font_fingerprint(bundled_dir):
+    """字体环境指纹
+
+    包含打包的 fonts/ 目录中各文件的名称、大小和修改时间，以及系统字体目录的
+    修改时间（安装或删除字体时目录的修改时间会变化）。只做 stat，不遍历系统字体目录。
+    """
+    bundled = []
+    try:
+        for name in sorted(os.listdir(bundled_dir)):
+            stat = os.stat(os.path.join(bundled_dir, name))
+            bundled.append([name, stat.st_size, int(stat.st_mtime)])
+    except OSError:
+        pass
+    system = []
+    for path in _font_dirs():
+        try:
+            system.append([path, int(os.stat(path).st_mtime)])
+        except OSError:
+            continue
+    payload = json.dumps([bundled, system], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class FontCache:
+    """字体解析结果的磁盘缓存
+
+    冷启动时需要查注册表、创建测试字体、必要时安装打包字体，才能确定实际使用的
+    字体族。解析结果与字体环境指纹一起保存，指纹不变时直接使用，跳过全部探测。
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, fingerprint):
+        """指纹一致时返回缓存的解析结果字典，否则返回None"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("fingerprint") != fingerprint or not data.get("family"):
+            return None
+        return data
+
+    def save(self, fingerprint, family, probe_ms, available=None, sizes=None):
+        """family 为最终使用的字体族，probe_ms 为本次探测耗时，available 为
+        get_available_font 的结果 {候选列表: 字体}，sizes 为用到的 [字号, 粗细]"""
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "fingerprint": fingerprint,
+                    "family": family,
+                    "probe_ms": round(probe_ms, 1),
+                    "available": available or {},
+                    "sizes": sizes or [],
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[FONT_WARNING] 保存字体缓存失败: {e}")
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,153 @@
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+
+from damage_tracker import DamageTracker
+from encounter_segmenter import EncounterSegmenter
+from ranked_snapshot import get_total_damage
+from rolling_dps import RollingDps
+
+
+class NdjsonStreamer:
+    """无界面模式的快照输出
+
+    按固定频率从服务器拉取快照，经 DamageTracker / RollingDps / EncounterSegmenter
+    聚合后每次输出一行JSON。只保留当前快照和有界的滚动窗口、最近战斗，
+    内存占用不随运行时间增长。
+    """
+
+    def __init__(self, output, rate=1.0, host="127.0.0.1", port=8989):
+        self.output = output
+        self.interval = 1.0 / max(rate, 0.01)
+        self.host = host
+        self.port = port
+        self.damage_tracker = DamageTracker()
+        self.rolling_dps = RollingDps()
+        self.encounter_segmenter = EncounterSegmenter()
+        self._conn = None
+        self.stats = {"snapshots": 0, "errors": 0}
+
+    def fetch(self):
+        """复用一个keep-alive连接请求 /api/data，失败时返回None并在下次重连"""
+        try:
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=2)
+            self._conn.request("GET", "/api/data")
+            response = self._conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                return None
+            return json.loads(body)
+        except (OSError, http.client.HTTPException, ValueError):
+            self.stats["errors"] += 1
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            return None
+
+    def build_record(self, user_data, now):
+        self.damage_tracker.update(user_data)
+        self.rolling_dps.update(self.damage_tracker.totals, now)
+        self.encounter_segmenter.update(self.damage_tracker, now)
+        encounter = self.encounter_segmenter.current
+
+        players = []
+        for uid, info in user_data.items():
+            if not info:
+                continue
+            rolling = self.rolling_dps.get(uid)
+            players.append({
+                "uid": uid,
+                "name": info.get("name") or "",
+                "profession": info.get("profession") or "",
+                "damage": get_total_damage(info),
+                "dps": info.get("total_dps", 0),
+                "dps_5s": round(rolling[5], 1),
+                "dps_30s": round(rolling[30], 1),
+                "dps_60s": round(rolling[60], 1),
+                "healing": (info.get("total_healing") or {}).get("total", 0) or 0,
+                "taken": info.get("taken_damage", 0) or 0,
+            })
+        players.sort(key=lambda player: player["damage"], reverse=True)
+        return {
+            "ts": round(now, 3),
+            "team_damage": self.damage_tracker.team_total,
+            "encounter": encounter.id if encounter else None,
+            "encounter_damage": encounter.team_damage if encounter else 0,
+            "players": players,
+        }
+
+    def run(self, stop_event=None):
+        stop_event = stop_event or threading.Event()
+        next_tick = time.perf_counter()
+        while not stop_event.is_set():
+            data = self.fetch()
+            if data is not None and data.get("code") == 0:
+                record = self.build_record(data.get("user") or {}, time.time())
+                self.output.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                self.output.flush()
+                self.stats["snapshots"] += 1
+            # 固定频率：按计划时间点等待，不累积处理耗时
+            next_tick += self.interval
+            delay = next_tick - time.perf_counter()
+            if delay < 0:
+                next_tick = time.perf_counter()
+                delay = 0
+            stop_event.wait(delay)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="星痕共鸣伤害统计 - 无界面模式")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--output", default="-", help="NDJSON输出文件，- 为标准输出")
+    parser.add_argument("--rate", type=float, default=1.0, help="每秒输出快照数")
+    parser.add_argument("--device", default="auto", help="设备序号，auto 为按实时流量自动选择")
+    parser.add_argument("--log-level", default="info", choices=["info", "debug"])
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+def run_headless(argv):
+    """启动服务器并输出NDJSON快照，不创建任何窗口，Ctrl+C 结束"""
+    args = parse_args(argv)
+    # 快照独占标准输出，启动器和服务器守护的日志改写到标准错误
+    stdout = sys.stdout
+    sys.stdout = sys.stderr
+    # 启动器只在这里使用其服务器启动/守护逻辑，不调用任何窗口相关方法
+    from star_resonance_simplified import StarResonanceLauncher
+
+    launcher = StarResonanceLauncher(debug_mode=False)
+    devices = launcher.get_network_devices()
+    launcher.network_devices = devices
+    if args.device == "auto":
+        from device_selector import DeviceSelector
+        device = DeviceSelector().auto_select_device(devices)
+    else:
+        try:
+            device = devices[int(args.device)]
+        except (ValueError, IndexError):
+            print(f"[ERROR] 无效的设备序号: {args.device}", file=sys.stderr)
+            return 1
+    if device is None:
+        print("[ERROR] 没有可用的网络设备", file=sys.stderr)
+        return 1
+    print(f"[INFO] 无界面模式，设备: {device['description']}", file=sys.stderr)
+
+    if not launcher.start_node_server(device, args.log_level, interactive=False):
+        return 1
+
+    output = stdout if args.output == "-" else open(args.output, 'a', encoding='utf-8')
+    streamer = NdjsonStreamer(output, rate=args.rate)
+    try:
+        streamer.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        launcher.cleanup()
+        if output is not stdout:
+            output.close()
+        print(f"[INFO] 无界面模式结束: {streamer.stats}", file=sys.stderr)
+    return 0
@@ -0,0 +1,319 @@
+import math
+
+
+INF = float("inf")
+
+
+class PhaseWarning:
+    """阶段警告（单次或按间隔重复），时间相对于战斗开始"""
+
+    # 重复警告的触发容差（秒），与原逐次检查的 ±0.5 秒一致
+    TOLERANCE = 0.5
+
+    __slots__ = ("index", "message", "color", "sound", "time", "interval",
+                 "due_at", "point", "fired")
+
+    def __init__(self, index, warning):
+        self.index = index
+        self.message = warning.get("message", "")
+        self.color = warning.get("color", "yellow")
+        self.sound = warning.get("sound", False)
+        self.time = warning.get("time", 0)
+        interval = warning.get("interval", None)
+        self.interval = interval if interval and interval > 0 else None
+        self.due_at = INF
+        self.point = None
+        self.fired = 0
+
+    def arm(self, combat_elapsed):
+        """进入阶段时计算下一次触发点"""
+        self.fired = 0
+        if self.interval is None:
+            # 单次警告：到时间（或进入阶段时已过时间）立即触发一次
+            self.point = self.time
+            self.due_at = self.time
+        else:
+            n = max(0, math.ceil((combat_elapsed - self.TOLERANCE - self.time) / self.interval))
+            self.point = self.time + n * self.interval
+            self.due_at = self.point - self.TOLERANCE
+
+    def poll(self, combat_elapsed):
+        """到期时返回是否应触发，并推进到下一个触发点"""
+        if combat_elapsed < self.due_at:
+            return False
+        if self.interval is None:
+            self.due_at = INF
+            self.fired += 1
+            return True
+
+        fire = combat_elapsed < self.point + self.TOLERANCE
+        if fire:
+            self.fired += 1
+            self.point += self.interval
+        else:
+            # 错过了容差窗口，跳到下一个可达的触发点
+            n = math.ceil((combat_elapsed - self.TOLERANCE - self.time) / self.interval)
+            self.point = self.time + max(n, 0) * self.interval
+        self.due_at = self.point - self.TOLERANCE
+        return fire
+
+
+class CompiledPhase:
+    """单个阶段：定义信息、警告、时间推进时长和伤害阈值"""
+
+    __slots__ = ("id", "info", "warnings", "duration", "damage_threshold", "rage_advance")
+
+    def __init__(self, phase_id, info):
+        self.id = phase_id
+        self.info = info
+        self.warnings = [PhaseWarning(i, w) for i, w in enumerate(info.get("warnings", []) or [])]
+        self.duration = None
+        self.damage_threshold = None
+        self.rage_advance = None
+
+
+class JasonPhaseMachine:
+    """JASON阶段状态机
+
+    在加载ACT配置时把 jason_phases 编译为阶段列表，每个阶段预先算好
+    时间推进时长、伤害阈值和警告触发点。进入阶段时把这些换算为绝对截止时间，
+    之后每次检查只需对每个活动触发条件做一次比较。阶段变化和警告以事件
+    形式通知订阅者：callback(event)，event["type"] 为 "phase_changed" 或 "warning"。
+    """
+
+    RAGE_PHASE = 3
+    DEFAULT_DAMAGE_THRESHOLDS = {1: 30000, 2: 80000}
+    DEFAULT_DURATIONS = {1: 120, 2: 180, 3: 300}
+
+    def __init__(self, jason_phases=None, total_duration=600):
+        self.total_duration = total_duration or 600
+        self.phases = {}
+        self.max_phase = 3
+        self.time_advance = False
+        self.damage_advance = False
+        self.cumulative_damage = True
+        self.global_rage_advance = None
+        self._listeners = []
+
+        self._compile(jason_phases or {})
+
+        # 运行状态
+        self.phase = 1
+        self.combat_start = None
+        self.phase_start = None
+        self.rage_start = None
+        self.phase_damage_start = 0
+        self.completed = []
+
+        # 当前阶段的绝对截止值
+        self.phase_deadline = INF
+        self.rage_deadline = INF
+        self.damage_target = INF
+        self.next_warning_at = INF
+
+    # ---- 编译 ----
+
+    def _compile(self, jason_phases):
+        if isinstance(jason_phases, list):
+            # 新格式：直接的阶段数组，阶段号为位置
+            definitions = [(i + 1, phase) for i, phase in enumerate(jason_phases)
+                           if isinstance(phase, dict)]
+        else:
+            definitions = [(phase.get("id", i + 1), phase)
+                           for i, phase in enumerate(jason_phases.get("phase_definitions", []) or [])]
+
+        for phase_id, info in definitions:
+            self.phases[phase_id] = CompiledPhase(phase_id, info)
+        if self.phases:
+            self.max_phase = max(self.phases)
+
+        if isinstance(jason_phases, dict):
+            time_config = jason_phases.get("time_based_advance", {}) or {}
+            damage_config = jason_phases.get("damage_based_advance", {}) or {}
+
+            self.time_advance = bool(time_config.get("enabled", False))
+            # 暴走前推进属于时间推进的一部分，只在时间推进启用时生效
+            rage = time_config.get("phase_3_auto_advance_before_rage", {}) or {}
+            if self.time_advance and rage.get("enabled", False):
+                self.global_rage_advance = rage.get("seconds_before_rage", 60)
+
+            self.damage_advance = bool(damage_config.get("enabled", False))
+            self.cumulative_damage = damage_config.get("cumulative_damage", True)
+
+            for phase_id in range(1, self.max_phase):
+                phase = self.phases.setdefault(phase_id, CompiledPhase(phase_id, {}))
+                if self.time_advance:
+                    phase.duration = time_config.get(
+                        f"phase_{phase_id}_duration", self.DEFAULT_DURATIONS.get(phase_id))
+                if self.damage_advance:
+                    phase.damage_threshold = damage_config.get(
+                        f"phase_{phase_id}_damage_threshold",
+                        self.DEFAULT_DAMAGE_THRESHOLDS.get(phase_id))
+
+        # 阶段自带的自动推进配置（数组格式）
+        for phase in self.phases.values():
+            auto_advance = phase.info.get("auto_advance", {})
+            if not isinstance(auto_advance, dict) or phase.id >= self.max_phase:
+                continue
+            if "duration_seconds" in auto_advance:
+                phase.duration = auto_advance["duration_seconds"]
+            if "damage_threshold" in auto_advance:
+                phase.damage_threshold = auto_advance["damage_threshold"]
+                self.damage_advance = True
+            rage = auto_advance.get("rage_countdown_advance") or {}
+            if rage.get("enabled"):
+                phase.rage_advance = rage.get("seconds_before_rage", 60)
+
+    # ---- 订阅 ----
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def _emit(self, event):
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"[DEBUG] JASON阶段事件处理失败: {e}")
+
+    # ---- 状态 ----
+
+    def phase_info(self, phase_id=None):
+        phase = self.phases.get(self.phase if phase_id is None else phase_id)
+        return phase.info if phase and phase.info else None
+
+    def load_state(self, phase, combat_start, phase_start, rage_start, damage_start, now, total_damage=0):
+        """从旧状态恢复（切换配置时保留当前进度）"""
+        self.phase = max(1, min(phase, self.max_phase))
+        self.combat_start = combat_start
+        self.phase_start = phase_start
+        self.rage_start = rage_start
+        self.phase_damage_start = damage_start
+        self._enter_phase(now, total_damage, keep_start=True)
+
+    def _enter_phase(self, now, total_damage, keep_start=False):
+        """进入阶段时把相对配置换算为绝对截止值"""
+        if not keep_start or self.phase_start is None:
+            self.phase_start = now
+        if not keep_start:
+            self.phase_damage_start = total_damage
+        phase = self.phases.get(self.phase)
+
+        self.phase_deadline = INF
+        if phase and phase.duration is not None and self.phase < self.max_phase and self.phase_start is not None:
+            self.phase_deadline = self.phase_start + phase.duration
+
+        seconds_before_rage = phase.rage_advance if phase and phase.rage_advance is not None \
+            else self.global_rage_advance
+        self.rage_deadline = INF
+        if (seconds_before_rage is not None and self.rage_start is not None
+                and self.phase < min(self.RAGE_PHASE, self.max_phase)):
+            self.rage_deadline = self.rage_start + self.total_duration - seconds_before_rage
+
+        self.damage_target = INF
+        if phase and phase.damage_threshold is not None and self.phase < self.max_phase:
+            base = 0 if self.cumulative_damage else self.phase_damage_start
+            self.damage_target = base + phase.damage_threshold
+
+        self._arm_warnings(now)
+
+    def _arm_warnings(self, now):
+        phase = self.phases.get(self.phase)
+        self.next_warning_at = INF
+        if not phase or self.combat_start is None:
+            return
+        elapsed = now - self.combat_start
+        for warning in phase.warnings:
+            warning.arm(elapsed)
+            self.next_warning_at = min(self.next_warning_at, self.combat_start + warning.due_at)
+
+    def _change_phase(self, new_phase, now, total_damage, reason, **extra):
+        old_phase = self.phase
+        if new_phase > old_phase:
+            self.completed.append({"phase": old_phase, "completed_at": now})
+        self.phase = new_phase
+        self._enter_phase(now, total_damage)
+        print(f"[DEBUG] JASON阶段 {old_phase} -> {new_phase} ({reason})")
+        event = {"type": "phase_changed", "old_phase": old_phase, "new_phase": new_phase,
+                 "reason": reason, "time": now}
+        event.update(extra)
+        self._emit(event)
+
+    # ---- 操作 ----
+
+    def start_combat(self, now, total_damage=0):
+        """战斗开始：阶段1，时间基准设为now"""
+        self.combat_start = now
+        self.phase_start = now
+        old_phase = self.phase
+        self.phase = 1
+        self._enter_phase(now, total_damage)
+        if old_phase != 1:
+            self._emit({"type": "phase_changed", "old_phase": old_phase, "new_phase": 1,
+                        "reason": "combat_start", "time": now})
+
+    def reset_rage(self, now, total_damage=0):
+        """重置暴走时间：回到阶段1，所有时间基准设为now"""
+        self.rage_start = now
+        self.combat_start = now
+        self.completed = []
+        old_phase = self.phase
+        self.phase = 1
+        self._enter_phase(now, total_damage)
+        self._emit({"type": "phase_changed", "old_phase": old_phase, "new_phase": 1,
+                    "reason": "rage_reset", "time": now})
+
+    def advance(self, now, total_damage=0, reason="manual"):
+        """推进到下一阶段，已是最高阶段时返回False"""
+        if self.phase >= self.max_phase:
+            print(f"[DEBUG] JASON已达到最高阶段 ({self.max_phase})")
+            return False
+        self._change_phase(self.phase + 1, now, total_damage, reason)
+        return True
+
+    def set_phase(self, phase_id, now, total_damage=0):
+        """直接设置阶段"""
+        if 1 <= phase_id <= self.max_phase:
+            self._change_phase(phase_id, now, total_damage, "manual_set")
+            return True
+        return False
+
+    # ---- 检查 ----
+
+    def tick(self, now, total_damage=0):
+        """时间相关检查：阶段截止、暴走前推进、阶段警告"""
+        if self.combat_start is None:
+            return
+
+        if now >= self.rage_deadline:
+            rage_at = self.rage_start + self.total_duration
+            print(f"[DEBUG] 暴走倒计时推进: 距离暴走还有{rage_at - now:.1f}秒，自动推进到三阶段")
+            self._change_phase(min(self.RAGE_PHASE, self.max_phase), now, total_damage, "rage_countdown",
+                               seconds_before_rage=round(rage_at - self.rage_deadline))
+        elif now >= self.phase_deadline:
+            print(f"[DEBUG] 时间推进: 阶段{self.phase}持续{now - self.phase_start:.1f}秒，推进到下一阶段")
+            self._change_phase(self.phase + 1, now, total_damage, "time")
+
+        if now >= self.next_warning_at:
+            self._poll_warnings(now)
+
+    def _poll_warnings(self, now):
+        phase = self.phases.get(self.phase)
+        if not phase:
+            self.next_warning_at = INF
+            return
+        elapsed = now - self.combat_start
+        next_at = INF
+        for warning in phase.warnings:
+            if warning.poll(elapsed):
+                print(f"[DEBUG] 触发阶段警告: {warning.message} (战斗时间: {elapsed:.1f}s, 第{warning.fired}次)")
+                self._emit({"type": "warning", "phase": self.phase, "message": warning.message,
+                            "color": warning.color, "sound": warning.sound, "time": now})
+            next_at = min(next_at, self.combat_start + warning.due_at)
+        self.next_warning_at = next_at
+
+    def on_damage(self, total_damage, now):
+        """伤害推进检查：一次比较"""
+        if total_damage >= self.damage_target:
+            print(f"[DEBUG] 伤害推进: 总伤害{total_damage}达到阈值{self.damage_target}，推进到阶段{self.phase + 1}")
+            self._change_phase(self.phase + 1, now, total_damage, "damage")
@@ -0,0 +1,131 @@
+import gzip
+import os
+import queue
+import shutil
+import threading
+from collections import deque
+
+
+class LogSink:
+    """后台日志写入器
+
+    write() 只把行放入内存中的有界队列（保留最近 tail_size 行供 tail() 读取）和写入队列，
+    后台线程保持文件打开，按批写入并刷新；文件超过 max_bytes 时轮换为 .1、.2 …
+    （最多保留 backups 个），compress 为True时轮换出的文件压缩为 .gz。
+    """
+
+    def __init__(self, path, max_bytes=5 * 1024 * 1024, backups=3, compress=False,
+                 tail_size=1000, flush_interval=0.5, batch_size=500):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._tail = deque(maxlen=tail_size)
+        self._tail_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer_thread = None
+        self._state_lock = threading.Lock()
+        self._running = False
+        self._closed = False
+        self.stats = {"lines": 0, "batches": 0, "rotations": 0}
+
+    # ---- 写入 ----
+
+    def write(self, line):
+        """写入一行；close() 之后的写入被忽略（不会重新启动写入线程）"""
+        if self._closed:
+            return
+        with self._tail_lock:
+            self._tail.append(line)
+        self._queue.put(line)
+        self.stats["lines"] += 1
+        if not self._running:
+            self._start()
+
+    def tail(self, count=None):
+        """最近的 count 行（默认全部保留的行），不读文件"""
+        with self._tail_lock:
+            lines = list(self._tail)
+        return lines[-count:] if count else lines
+
+    def _start(self):
+        with self._state_lock:
+            if self._running or self._closed:
+                return
+            self._running = True
+            self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer_thread.start()
+
+    def close(self):
+        """写完队列中剩余的行后关闭"""
+        with self._state_lock:
+            self._closed = True
+            self._running = False
+            writer_thread, self._writer_thread = self._writer_thread, None
+        if writer_thread is not None:
+            writer_thread.join(timeout=5)
+
+    # ---- 后台写入 ----
+
+    def _writer_loop(self):
+        f = None
+        try:
+            while self._running or not self._queue.empty():
+                batch = []
+                try:
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if not batch:
+                    continue
+                try:
+                    if f is None:
+                        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                        f = open(self.path, 'a', encoding='utf-8')
+                    f.write("".join(line + "\n" for line in batch))
+                    f.flush()
+                    self.stats["batches"] += 1
+                    if f.tell() >= self.max_bytes:
+                        f.close()
+                        f = None
+                        self._rotate()
+                except OSError as e:
+                    print(f"[ERROR] 写入日志文件失败: {e}")
+        finally:
+            if f is not None:
+                f.close()
+
+    def _rotate(self):
+        suffix = ".gz" if self.compress else ""
+        oldest = f"{self.path}.{self.backups}{suffix}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}{suffix}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}{suffix}")
+        if self.compress:
+            with open(self.path, 'rb') as src, gzip.open(f"{self.path}.1.gz", 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.path)
+        else:
+            os.replace(self.path, f"{self.path}.1")
+        self.stats["rotations"] += 1
+
+
+_sinks = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink(name, path=None, **options):
+    """按名称获取共享的日志写入器（第一次调用时用 path 创建），同进程的UI可以直接 tail()"""
+    with _sinks_lock:
+        sink = _sinks.get(name)
+        if sink is None and path is not None:
+            sink = _sinks[name] = LogSink(path, **options)
+        return sink
@@ -0,0 +1,300 @@
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class PlayerDirectory:
+    """SQLite玩家目录
+
+    持久保存所有见过的玩家：UID、当前名称、职业、战力、首次/最近出现时间、
+    UID映射设置的名称（alias，显示时优先），以及每个名称的首次/最近使用时间。
+    - 写入：observe()/set_alias() 只把变化放入队列，后台线程按批次在一个事务中写入（WAL模式）
+    - 读取：lookup() 先查有界LRU缓存，未命中再按主键查询数据库（结果包括"不存在"也缓存）
+    数据库可以增长到几十万玩家，启动时不需要加载全部数据，内存中只有LRU缓存。
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS players (
+        uid TEXT PRIMARY KEY,
+        name TEXT,
+        profession TEXT,
+        fight_point INTEGER,
+        alias TEXT,
+        first_seen REAL NOT NULL,
+        last_seen REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS player_names (
+        uid TEXT NOT NULL,
+        name TEXT NOT NULL,
+        first_seen REAL NOT NULL,
+        last_seen REAL NOT NULL,
+        PRIMARY KEY (uid, name)
+    );
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    """
+
+    UPSERT_PLAYER = """
+    INSERT INTO players (uid, name, profession, fight_point, first_seen, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(uid) DO UPDATE SET
+        name = COALESCE(excluded.name, players.name),
+        profession = COALESCE(excluded.profession, players.profession),
+        fight_point = COALESCE(excluded.fight_point, players.fight_point),
+        last_seen = MAX(players.last_seen, excluded.last_seen)
+    """
+
+    UPSERT_ALIAS = """
+    INSERT INTO players (uid, alias, first_seen, last_seen) VALUES (?, ?, ?, ?)
+    ON CONFLICT(uid) DO UPDATE SET alias = excluded.alias
+    """
+
+    UPSERT_NAME = """
+    INSERT INTO player_names (uid, name, first_seen, last_seen) VALUES (?, ?, ?, ?)
+    ON CONFLICT(uid, name) DO UPDATE SET last_seen = MAX(player_names.last_seen, excluded.last_seen)
+    """
+
+    # 同一玩家信息不变时，最近出现时间最多每隔该秒数写一次
+    LAST_SEEN_INTERVAL = 60
+
+    def __init__(self, db_path, cache_size=4096, batch_size=500, flush_interval=1.0):
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._cache = OrderedDict()  # uid -> (name, profession, fight_point, alias) 或 None
+        self._written_at = {}  # uid -> 上次入队时间（只保留LRU缓存中的玩家）
+        self._cache_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._reader = None
+        self._reader_lock = threading.Lock()
+        self._writer_thread = None
+        self._running = False
+        self.stats = {"hits": 0, "misses": 0, "queued": 0, "written": 0, "batches": 0}
+
+    # ---- 生命周期 ----
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def open(self):
+        """建表并启动后台写入线程"""
+        conn = self._connect()
+        conn.executescript(self.SCHEMA)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(players)")]
+        if "alias" not in columns:
+            # 旧版本建的表没有 alias 列
+            conn.execute("ALTER TABLE players ADD COLUMN alias TEXT")
+        conn.commit()
+        self._reader = conn
+        self._running = True
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def close(self):
+        """写完队列中剩余的记录后关闭"""
+        self._running = False
+        if self._writer_thread is not None:
+            self._writer_thread.join(timeout=5)
+        if self._reader is not None:
+            with self._reader_lock:
+                self._reader.close()
+            self._reader = None
+
+    # ---- 写入 ----
+
+    def observe(self, uid, name=None, profession=None, fight_point=None, seen=None):
+        """记录一次玩家信息，信息没有变化且最近写过时不入队"""
+        uid = str(uid)
+        seen = seen or time.time()
+        name = name or None
+        profession = profession or None
+        fight_point = fight_point or None
+
+        # 不在缓存中时先读出数据库中的记录，避免用不完整的记录覆盖缓存（如alias）
+        cached = self.lookup(uid)
+        with self._cache_lock:
+            merged = (name or (cached[0] if cached else None),
+                      profession or (cached[1] if cached else None),
+                      fight_point or (cached[2] if cached else None),
+                      cached[3] if cached else None)
+            changed = merged != cached
+            self._cache[uid] = merged
+            self._cache.move_to_end(uid)
+            self._trim_cache()
+            last_written = self._written_at.get(uid)
+            if not changed and last_written and seen - last_written < self.LAST_SEEN_INTERVAL:
+                return
+            self._written_at[uid] = seen
+
+        self._queue.put(("player", (uid, name, profession, fight_point, seen)))
+        self.stats["queued"] += 1
+
+    def observe_snapshot(self, user_data, seen=None):
+        """记录服务器快照中的所有玩家（名称、职业、战力）"""
+        seen = seen or time.time()
+        for uid, info in (user_data or {}).items():
+            if info:
+                self.observe(uid, info.get("name"), info.get("profession"),
+                             info.get("fightPoint"), seen)
+
+    def set_alias(self, uid, alias):
+        """设置UID映射的名称，alias 为None时删除映射"""
+        uid = str(uid)
+        alias = alias or None
+        record = self.lookup(uid)
+        with self._cache_lock:
+            self._cache[uid] = (record or (None, None, None, None))[:3] + (alias,)
+            self._cache.move_to_end(uid)
+            self._trim_cache()
+        self._queue.put(("alias", (uid, alias, time.time())))
+        self.stats["queued"] += 1
+
+    def get_alias(self, uid):
+        record = self.lookup(uid)
+        return record[3] if record else None
+
+    def import_mapping(self, mapping):
+        """用 UID->名称 映射替换全部映射名称（导入 uid_mapping.json）
+
+        等待导入写入数据库后再清空缓存，避免写入前的查询把旧记录放回缓存。
+        全部写入时返回True。
+        """
+        self._queue.put(("clear_aliases", None))
+        seen = time.time()
+        for uid, name in (mapping or {}).items():
+            self._queue.put(("alias", (str(uid), name or None, seen)))
+        self.stats["queued"] += len(mapping or {})
+        written = self.flush()
+        with self._cache_lock:
+            self._cache.clear()
+            self._written_at.clear()
+        return written
+
+    def _writer_loop(self):
+        conn = self._connect()
+        try:
+            while self._running or not self._queue.empty():
+                batch = []
+                try:
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+                if batch:
+                    self._write_batch(conn, batch)
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn, batch):
+        try:
+            with conn:
+                players = [record for kind, record in batch if kind == "player"]
+                conn.executemany(self.UPSERT_PLAYER, [
+                    (uid, name, profession, fight_point, seen, seen)
+                    for uid, name, profession, fight_point, seen in players])
+                conn.executemany(self.UPSERT_NAME, [
+                    (uid, name, seen, seen)
+                    for uid, name, _, _, seen in players if name])
+                # 映射名称的设置/删除有先后顺序，逐条按入队顺序执行
+                for kind, record in batch:
+                    if kind == "alias":
+                        uid, alias, seen = record
+                        conn.execute(self.UPSERT_ALIAS, (uid, alias, seen, seen))
+                    elif kind == "clear_aliases":
+                        conn.execute("UPDATE players SET alias = NULL WHERE alias IS NOT NULL")
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+        except sqlite3.Error as e:
+            print(f"[DEBUG] 玩家目录写入失败 ({len(batch)} 条): {e}")
+
+    # ---- 读取 ----
+
+    def _trim_cache(self):
+        while len(self._cache) > self.cache_size:
+            uid, _ = self._cache.popitem(last=False)
+            self._written_at.pop(uid, None)
+
+    def lookup(self, uid):
+        """返回 (name, profession, fight_point, alias)，未知玩家返回None"""
+        uid = str(uid)
+        with self._cache_lock:
+            if uid in self._cache:
+                self._cache.move_to_end(uid)
+                self.stats["hits"] += 1
+                return self._cache[uid]
+        self.stats["misses"] += 1
+
+        record = None
+        if self._reader is not None:
+            try:
+                with self._reader_lock:
+                    row = self._reader.execute(
+                        "SELECT name, profession, fight_point, alias FROM players WHERE uid = ?",
+                        (uid,)).fetchone()
+                record = tuple(row) if row else None
+            except sqlite3.Error as e:
+                print(f"[DEBUG] 玩家目录查询失败: {e}")
+
+        with self._cache_lock:
+            # 查询期间可能已有新的 observe()，以缓存中的为准
+            if uid not in self._cache:
+                self._cache[uid] = record
+                self._trim_cache()
+            return self._cache[uid]
+
+    def get_name(self, uid):
+        """显示用的名称：映射名称优先，其次是游戏内名称"""
+        record = self.lookup(uid)
+        return (record[3] or record[0]) if record else None
+
+    def flush(self, timeout=5.0):
+        """等待队列中的记录写入数据库，全部写入时返回True"""
+        deadline = time.time() + timeout
+        while self._running and self._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+        return not self._queue.unfinished_tasks
+
+    def aliases(self):
+        """全部 UID 映射 {uid: 名称}（打开映射对话框、导出时读取，不常驻内存）"""
+        self.flush()
+        if self._reader is None:
+            return {}
+        with self._reader_lock:
+            rows = self._reader.execute(
+                "SELECT uid, alias FROM players WHERE alias IS NOT NULL ORDER BY uid").fetchall()
+        return dict(rows)
+
+    def get_meta(self, key):
+        if self._reader is None:
+            return None
+        with self._reader_lock:
+            row = self._reader.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        if self._reader is None:
+            return
+        with self._reader_lock:
+            with self._reader:
+                self._reader.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def count(self):
+        """目录中的玩家数"""
+        if self._reader is None:
+            return 0
+        with self._reader_lock:
+            return self._reader.execute("SELECT COUNT(*) FROM players").fetchone()[0]
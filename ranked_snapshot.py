@@ -0,0 +1,128 @@
+from bisect import bisect_left
+
+
+def get_total_damage(info):
+    """从服务器返回的玩家数据中取总伤害"""
+    if not info:
+        return 0
+    return info.get("total_damage", {}).get("total", 0) or 0
+
+
+class RankedSnapshot:
+    """按总伤害排序的共享排名视图
+
+    每个数据版本只构建一次，供MINI、明显模式、本人DPS条共同使用：
+    - order: 按总伤害降序的uid列表；sorted_users / top(k) 按需取玩家数据
+    - rank_by_uid: uid -> 名次（从1开始）
+    - max_damage / top(k)
+    两次快照之间只有少数玩家伤害变化时，只在有序列表中移动这些玩家，并只刷新
+    名次发生变化的区间。团队总伤害由 DamageTracker.team_total 提供。
+    """
+
+    # 变化玩家占比超过该值时直接整体重排
+    FULL_RESORT_RATIO = 0.25
+
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self.version = 0
+        self.order = []
+        self.rank_by_uid = {}
+        self.totals = {}
+        self.max_damage = 0
+
+        self._keys = []          # 升序的 (-total, str(uid)) 列表，与 order 对齐
+        self._source = {}        # 上一次输入的 user_data 对象
+        self.stats = {"full": 0, "incremental": 0, "unchanged": 0}
+
+    @staticmethod
+    def _key(uid, total):
+        return (-total, str(uid))
+
+    @property
+    def sorted_users(self):
+        """[(uid, info)] 按总伤害降序"""
+        return [(uid, self._source[uid]) for uid in self.order]
+
+    def update(self, user_data):
+        """用新的 user_data 更新快照，返回排名/总伤害是否有变化"""
+        user_data = user_data or {}
+        if user_data is self._source:
+            self.stats["unchanged"] += 1
+            return False
+        # 玩家数据（DPS等字段）按uid从最新的 user_data 读取
+        self._source = user_data
+
+        new_totals = {uid: get_total_damage(info) for uid, info in user_data.items()}
+        old_totals = self.totals
+
+        changed = [uid for uid, total in new_totals.items()
+                   if old_totals.get(uid) != total]
+        removed = [uid for uid in old_totals if uid not in new_totals]
+
+        if not changed and not removed:
+            self.stats["unchanged"] += 1
+            return False
+
+        if (not self._keys or
+                len(changed) + len(removed) > max(1, len(new_totals)) * self.FULL_RESORT_RATIO):
+            ranked = sorted((self._key(uid, total), uid) for uid, total in new_totals.items())
+            self._keys = [key for key, _ in ranked]
+            self.order = [uid for _, uid in ranked]
+            self.rank_by_uid = {uid: rank for rank, uid in enumerate(self.order, 1)}
+            self.stats["full"] += 1
+        else:
+            self._move(changed, removed, old_totals, new_totals)
+            self.stats["incremental"] += 1
+
+        self.totals = new_totals
+        self.max_damage = new_totals[self.order[0]] if self.order else 0
+        self.version += 1
+        return True
+
+    def _move(self, changed, removed, old_totals, new_totals):
+        """在有序列表中删除/重新插入变化的玩家，只刷新名次移动过的区间
+
+        每次删除或插入只会移动其后的元素：位置小于所有操作位置的元素名次不变；
+        列表长度不变时，距末尾的距离小于所有操作的元素名次也不变。
+        """
+        keys, order = self._keys, self.order
+        old_length = len(order)
+        low = old_length
+        tail = old_length  # 所有操作中距末尾的最小距离
+        for uid in removed + [uid for uid in changed if uid in old_totals]:
+            old_key = self._key(uid, old_totals[uid])
+            index = bisect_left(keys, old_key)
+            if index < len(keys) and keys[index] == old_key:
+                tail = min(tail, len(keys) - 1 - index)
+                del keys[index]
+                del order[index]
+                low = min(low, index)
+            self.rank_by_uid.pop(uid, None)
+        for uid in changed:
+            key = self._key(uid, new_totals[uid])
+            index = bisect_left(keys, key)
+            keys.insert(index, key)
+            order.insert(index, uid)
+            low = min(low, index)
+            tail = min(tail, len(keys) - 1 - index)
+
+        high = len(order) if len(order) != old_length else len(order) - tail
+        for rank in range(low, high):
+            self.rank_by_uid[order[rank]] = rank + 1
+
+    def rank_of(self, uid):
+        """名次（从1开始），不在榜上返回0"""
+        return self.rank_by_uid.get(uid, 0)
+
+    def top(self, k=None):
+        """前k名 [(uid, info)]"""
+        return [(uid, self._source[uid]) for uid in self.order[:self.top_k if k is None else k]]
+
+    def get(self, uid):
+        """取玩家数据，不存在返回None"""
+        if uid not in self.rank_by_uid:
+            return None
+        return self._source.get(uid)
+
+    def __len__(self):
+        return len(self.order)
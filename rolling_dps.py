@@ -0,0 +1,103 @@
+from array import array
+
+
+class PlayerRing:
+    """单个玩家每秒累计伤害的环形缓冲区"""
+
+    __slots__ = ("ring", "head", "count", "last_total", "peaks")
+
+    def __init__(self, size, windows):
+        self.ring = array('d', bytes(8 * size))
+        self.head = -1      # 最近一秒所在位置
+        self.count = 0      # 已写入的秒数（不超过环大小）
+        self.last_total = 0
+        self.peaks = dict.fromkeys(windows, 0.0)
+
+
+class RollingDps:
+    """按玩家计算滚动窗口DPS（默认 5s/30s/60s）和各窗口的爆发峰值
+
+    每秒在环形缓冲区中写入一次各玩家的累计伤害；窗口DPS为
+    (当前累计 - W秒前累计) / W，只需一次下标计算，每次更新 O(1)。
+    快照更新频率高于每秒时，同一秒内只覆盖当前格。
+    """
+
+    WINDOWS = (5, 30, 60)
+
+    def __init__(self, windows=WINDOWS):
+        self.windows = tuple(sorted(windows))
+        self.size = self.windows[-1] + 1
+        self.players = {}
+        self.current_second = None
+        self._cache = {}
+
+    def reset(self):
+        self.players = {}
+        self.current_second = None
+        self._cache = {}
+
+    def update(self, totals, now):
+        """用 {uid: 累计伤害} 更新，now 为当前时间戳"""
+        second = int(now)
+        if self.current_second is None:
+            self.current_second = second
+        steps = min(max(second - self.current_second, 0), self.size)
+        self.current_second = max(second, self.current_second)
+
+        size = self.size
+        # 服务器已清除的玩家不再保留，内存只随当前玩家数变化
+        for uid in self.players.keys() - totals.keys():
+            del self.players[uid]
+        for uid, total in totals.items():
+            player = self.players.get(uid)
+            if player is None or total < player.last_total:
+                # 新玩家或服务器数据被清除
+                player = self.players[uid] = PlayerRing(size, self.windows)
+                player.head = 0
+                player.count = 1
+                player.ring[0] = total
+                player.last_total = total
+                continue
+            ring = player.ring
+            # 跳过的秒数用上一秒的累计值填充
+            for _ in range(steps):
+                player.head = (player.head + 1) % size
+                ring[player.head] = player.last_total
+                if player.count < size:
+                    player.count += 1
+            ring[player.head] = total
+            player.last_total = total
+
+            if steps:
+                for window in self.windows:
+                    dps = self._window_dps(player, window)
+                    if dps > player.peaks[window]:
+                        player.peaks[window] = dps
+        # 同一秒内的多次更新也会改变当前格，缓存的窗口值每次更新都失效
+        self._cache = {}
+
+    def _window_dps(self, player, window):
+        span = min(window, player.count - 1)
+        if span <= 0:
+            return 0.0
+        past = player.ring[(player.head - span) % self.size]
+        return (player.last_total - past) / span
+
+    def get(self, uid):
+        """{窗口秒数: DPS}，每次更新后每个玩家只计算一次"""
+        result = self._cache.get(uid)
+        if result is None:
+            player = self.players.get(uid)
+            if player is None:
+                result = dict.fromkeys(self.windows, 0.0)
+            else:
+                result = {window: self._window_dps(player, window) for window in self.windows}
+            self._cache[uid] = result
+        return result
+
+    def peak(self, uid, window=None):
+        """该窗口出现过的最高DPS（默认最短窗口，即爆发峰值）"""
+        player = self.players.get(uid)
+        if player is None:
+            return 0.0
+        return player.peaks[window or self.windows[0]]
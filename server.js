@@ -327,6 +327,12 @@ class UserData {
 class UserDataManager {
     constructor() {
         this.users = new Map();
+        // 玩家名称变更日志：客户端按版本游标增量同步UID映射
+        this.nameEpoch = Date.now(); // 服务器重启后版本号重新计数，客户端据此重置游标
+        this.nameVersion = 0;
+        this.nameLog = []; // [{ version, uid, name }]，按版本递增
+        this.nameLatest = new Map(); // uid -> 该uid最新的日志条目
+        this.firstDataAt = 0; // 首次收到玩家数据的时间，供启动器统计启动到首个数据的耗时
     }
 
     /** 获取或创建用户记录
@@ -336,6 +342,7 @@ class UserDataManager {
     getUser(uid) {
         if (!this.users.has(uid)) {
             this.users.set(uid, new UserData(uid));
+            if (!this.firstDataAt) this.firstDataAt = Date.now();
         }
         return this.users.get(uid);
     }
@@ -388,9 +395,52 @@ class UserDataManager {
      * */
     setName(uid, name) {
         const user = this.getUser(uid);
+        if (name && name.trim() !== '' && user.name !== name) {
+            this.recordNameChange(uid, name);
+        }
         user.setName(name);
     }
 
+    /** 记录名称变更，日志过长时只保留每个uid的最新条目
+     * @param {number} uid - 用户ID
+     * @param {string} name - 玩家名称
+     * */
+    recordNameChange(uid, name) {
+        const latest = this.nameLatest.get(uid);
+        if (latest && latest.name === name) {
+            return;
+        }
+        const entry = { version: ++this.nameVersion, uid, name };
+        this.nameLog.push(entry);
+        this.nameLatest.set(uid, entry);
+        if (this.nameLog.length > this.nameLatest.size * 2 + 256) {
+            this.nameLog = Array.from(this.nameLatest.values()).sort((a, b) => a.version - b.version);
+        }
+    }
+
+    /** 获取指定版本之后新增或变化的名称映射
+     * @param {number} since - 客户端已同步到的版本号
+     * @returns {Object} - uid -> name
+     * */
+    getNameChangesSince(since) {
+        const mappings = {};
+        // 日志按版本递增，二分查找第一条 version > since 的条目
+        let lo = 0;
+        let hi = this.nameLog.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (this.nameLog[mid].version <= since) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        for (let i = lo; i < this.nameLog.length; i++) {
+            mappings[this.nameLog[i].uid] = this.nameLog[i].name;
+        }
+        return mappings;
+    }
+
     /** 设置用户战力
      * @param {number} uid - 用户ID
      * @param {number} fightPoint - 战力值
@@ -431,6 +481,8 @@ const userDataManager = new UserDataManager();
 
 // 暂停统计状态
 let isPaused = false;
+// 抓包设备已打开（HTTP服务监听且抓包就绪后才算启动完成）
+let captureReady = false;
 
 async function main() {
     print('Welcome to use Damage Counter for Star Resonance!');
@@ -538,17 +590,42 @@ async function main() {
         });
     });
 
+    // 健康检查API：启动器以此判断服务器是否就绪，并统计启动到首个数据的耗时
+    app.get('/api/health', (req, res) => {
+        res.json({
+            code: 0,
+            ready: captureReady,
+            pid: process.pid,
+            uptime_ms: Math.round(process.uptime() * 1000),
+            users: userDataManager.users.size,
+            first_data_at: userDataManager.firstDataAt,
+        });
+    });
+
     // 获取UID映射API
+    // 带 since 参数时只返回该版本之后新增或变化的映射；epoch 与服务器不一致时返回全量
     app.get('/api/uid-mappings', (req, res) => {
-        const mappings = {};
-        for (const [uid, user] of userDataManager.users.entries()) {
-            if (user.name && user.name.trim() !== '') {
-                mappings[uid] = user.name;
+        let since = parseInt(req.query.since, 10) || 0;
+        if (String(req.query.epoch) !== String(userDataManager.nameEpoch) || since > userDataManager.nameVersion) {
+            since = 0;
+        }
+        let mappings;
+        if (since === 0) {
+            mappings = {};
+            for (const [uid, user] of userDataManager.users.entries()) {
+                if (user.name && user.name.trim() !== '') {
+                    mappings[uid] = user.name;
+                }
             }
+        } else {
+            mappings = userDataManager.getNameChangesSince(since);
         }
         res.json({
             code: 0,
-            mappings: mappings
+            mappings: mappings,
+            version: userDataManager.nameVersion,
+            epoch: userDataManager.nameEpoch,
+            full: since === 0
         });
     });
 
@@ -605,6 +682,7 @@ async function main() {
     const buffer = Buffer.alloc(65535);
     const linkType = c.open(device, filter, bufSize, buffer);
     c.setMinBytes && c.setMinBytes(0);
+    captureReady = true;
     c.on('packet', async function (nbytes, trunc) {
         const buffer1 = Buffer.from(buffer);
         if (linkType === 'ETHERNET') {
@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+
+
+class ServerSupervisor:
+    """服务器守护线程
+
+    每 CHECK_INTERVAL 秒检查一次进程和健康检查接口：进程退出，或健康检查连续
+    HANG_TIMEOUT 秒没有响应（卡死）时，按指数退避（BACKOFF_MIN 起翻倍，最长
+    BACKOFF_MAX）重启服务器，连续正常运行 STABLE_SECONDS 后退避复位。
+    每次中断记录开始/恢复时间和原因，追加到 downtime_path（每行一条JSON），
+    并通过 subscribe(callback) 通知：callback(event, record)，event 为 "down"/"up"。
+    restart() 在守护线程中执行，耗时较长时应检查 stopping，停止后尽快返回。
+    """
+
+    CHECK_INTERVAL = 0.5
+    HANG_TIMEOUT = 5.0
+    BACKOFF_MIN = 1.0
+    BACKOFF_MAX = 30.0
+    STABLE_SECONDS = 60
+
+    def __init__(self, is_alive, health, restart, downtime_path=None, on_health=None):
+        self.is_alive = is_alive        # () -> 进程是否还在运行
+        self.health = health            # () -> 健康检查结果字典，无响应时为None
+        self.restart = restart          # () -> 是否重启成功
+        self.on_health = on_health      # 每次健康检查成功后调用 on_health(health)
+        self.downtime_path = downtime_path
+        self.downtimes = []
+        self.down = None  # 当前中断记录，服务器正常时为None
+        self._backoff = self.BACKOFF_MIN
+        self._up_since = time.time()
+        self._listeners = []
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        self._listeners.append(callback)
+
+    def _emit(self, event, record):
+        for callback in self._listeners:
+            try:
+                callback(event, record)
+            except Exception as e:
+                print(f"[DEBUG] 服务器守护事件处理失败: {e}")
+
+    # ---- 生命周期 ----
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._up_since = time.time()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        print("[INFO] 服务器守护线程已启动")
+
+    @property
+    def stopping(self):
+        return self._stop_event.is_set()
+
+    def stop(self, timeout=2):
+        """停止守护线程；正在重启服务器时最多等待 timeout 秒让重启结束，返回线程是否已退出"""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        return not self.running
+
+    # ---- 检查 ----
+
+    def _loop(self):
+        last_ok = time.time()
+        while not self._stop_event.is_set():
+            try:
+                now = time.time()
+                alive = self.is_alive()
+                health = self.health() if alive else None
+                if health is not None:
+                    last_ok = now
+                    if self.down is not None:
+                        self._recovered(now)
+                    elif now - self._up_since > self.STABLE_SECONDS:
+                        self._backoff = self.BACKOFF_MIN
+                    if self.on_health:
+                        self.on_health(health)
+                elif not alive or now - last_ok > self.HANG_TIMEOUT:
+                    self._handle_failure(now, "crash" if not alive else "hang")
+                    last_ok = time.time()
+            except Exception as e:
+                print(f"[ERROR] 服务器守护异常: {e}")
+            self._stop_event.wait(self.CHECK_INTERVAL)
+        print("[INFO] 服务器守护线程已退出")
+
+    def _handle_failure(self, now, reason):
+        if self.down is None:
+            self.down = {"start": now, "end": None, "reason": reason, "restarts": 0}
+            print(f"[WARNING] 服务器{'进程已退出' if reason == 'crash' else '无响应'}，准备重启")
+            self._emit("down", dict(self.down))
+
+        backoff = self._backoff
+        self._backoff = min(self._backoff * 2, self.BACKOFF_MAX)
+        print(f"[INFO] {backoff:.0f} 秒后重启服务器 (第 {self.down['restarts'] + 1} 次)")
+        if self._stop_event.wait(backoff):
+            return
+        self.down["restarts"] += 1
+        if self.restart() and not self.stopping:
+            self._recovered(time.time())
+
+    def _recovered(self, now):
+        record = self.down
+        self.down = None
+        record["end"] = now
+        self._up_since = now
+        self.downtimes.append(record)
+        print(f"[OK] 服务器已恢复，中断 {record['end'] - record['start']:.1f} 秒 ({record['reason']})")
+        if self.downtime_path:
+            try:
+                with open(self.downtime_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + "\n")
+            except OSError as e:
+                print(f"[DEBUG] 记录服务器中断失败: {e}")
+        self._emit("up", dict(record))
+
+
+_current = None
+
+
+def set_current_supervisor(supervisor):
+    global _current
+    _current = supervisor
+
+
+def current_supervisor():
+    """同进程中启动器创建的服务器守护（独立运行UI时为None）"""
+    return _current
@@ -0,0 +1,166 @@
+import math
+from collections import OrderedDict
+
+# 阴影样式：(阴影层 [(dx, dy, 颜色)], 边框颜色, 边框偏移)
+STYLE_CANVAS = (((3, 3, "#000000"), (2, 2, "#111111"), (1, 1, "#222222")),
+                "#333333", ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+STYLE_TIMER = (((4, 4, "#000000"), (3, 3, "#111111"), (2, 2, "#222222")),
+               "#444444", ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+STYLE_SMALL = (((2, 2, "#000000"), (1, 1, "#222222")),
+               "#444444", ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+STYLE_PHASE = (((2, 2, "#000000"), (1, 1, "#222222")),
+               "#444444", ((-1, 0), (1, 0), (0, -1), (0, 1)))
+STYLE_PROMINENT = (((6, 6, "#000000"), (4, 4, "#111111"), (2, 2, "#222222")), None, ())
+STYLE_PROMINENT_PHASE = (((3, 3, "#000000"), (2, 2, "#111111"), (1, 1, "#222222")),
+                         "#444444", ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+STYLE_DESCRIPTION = (((2, 2, "#000000"),), None, ())
+
+# 辉光：([(半径, 透明度)], 角度步长)
+GLOW_TIMER = (((12, 0.1), (8, 0.2), (6, 0.3), (4, 0.4)), 15)
+GLOW_PROMINENT = (((18, 0.15), (12, 0.25), (8, 0.35), (6, 0.45)), 12)
+GLOW_BACKGROUND = (30, 30, 40)  # 辉光颜色混合到的背景色近似
+
+
+def blend_color(hex_color, alpha, background=GLOW_BACKGROUND):
+    hex_color = hex_color.lstrip('#')
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    bg_r, bg_g, bg_b = background
+    return "#{:02x}{:02x}{:02x}".format(int(r * alpha + bg_r * (1 - alpha)),
+                                        int(g * alpha + bg_g * (1 - alpha)),
+                                        int(b * alpha + bg_b * (1 - alpha)))
+
+
+class ShadowTextRenderer:
+    """阴影文字渲染缓存
+
+    每段阴影文字在画布上是一组文字项（辉光、阴影、边框、主文字），按 tag 命名。
+    draw() 时如果同一 tag 的文字项已存在，只对变化的属性做 itemconfigure/coords：
+    文字、字体、颜色和位置都没变时不发出任何Tk调用；倒计时每秒只改文字，
+    不再删除并重建几十个文字项。各层的偏移和颜色按 (样式, 颜色, 辉光) 计算后放入
+    有界的LRU缓存（max_entries），辉光颜色不必每次重新混合。
+    stats 记录 hits（无变化）、updates（原地更新）、creates（新建文字项）
+    以及层缓存的命中/未命中/淘汰次数。
+    """
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._layers = OrderedDict()
+        self.stats = {"hits": 0, "updates": 0, "creates": 0,
+                      "layer_hits": 0, "layer_misses": 0, "evictions": 0}
+
+    # ---- 层缓存 ----
+
+    def layers(self, fill, style=STYLE_CANVAS, glow=None):
+        """返回 ((dx, dy, 颜色), ...)，按绘制顺序排列；glow 不为None时只返回辉光层"""
+        key = (fill, style, glow)
+        layers = self._layers.get(key)
+        if layers is not None:
+            self._layers.move_to_end(key)
+            self.stats["layer_hits"] += 1
+            return layers
+
+        self.stats["layer_misses"] += 1
+        if glow is not None:
+            glow_layers, step = glow
+            layers = []
+            for radius, alpha in glow_layers:
+                glow_color = blend_color(fill, alpha)
+                for angle in range(0, 360, step):
+                    layers.append((int(radius * math.cos(math.radians(angle))),
+                                   int(radius * math.sin(math.radians(angle))), glow_color))
+        else:
+            shadows, border_color, border_offsets = style
+            layers = list(shadows)
+            layers += [(dx, dy, border_color) for dx, dy in border_offsets]
+            layers.append((0, 0, fill))
+        layers = tuple(layers)
+
+        self._layers[key] = layers
+        if len(self._layers) > self.max_entries:
+            self._layers.popitem(last=False)
+            self.stats["evictions"] += 1
+        return layers
+
+    # ---- 绘制 ----
+
+    def draw(self, canvas, tag, x, y, text, font, fill, style=STYLE_CANVAS,
+             anchor="center", glow=None):
+        """在 canvas 上绘制（或原地更新）名为 tag 的阴影文字
+
+        glow 为辉光参数时绘制的是辉光层，新建时放到画布最底层。
+        """
+        groups = canvas.__dict__.setdefault("_shadow_text_groups", {})
+        layers = self.layers(fill, style, glow)
+        state = (text, font, x, y, anchor)
+        group = groups.get(tag)
+
+        if group is not None and not canvas.type(group["items"][0]):
+            # 文字项已被其他代码删除（如 canvas.delete("all")）
+            group = None
+        if group is not None:
+            if group["state"] == state and group["layers"] == layers and not group["hidden"]:
+                self.stats["hits"] += 1
+                return
+            if len(group["layers"]) == len(layers) and group["state"][4] == anchor:
+                old_text, old_font, old_x, old_y, _ = group["state"]
+                options = {}
+                if old_text != text:
+                    options["text"] = text
+                if old_font != font:
+                    options["font"] = font
+                if group["hidden"]:
+                    options["state"] = "normal"
+                # 文字/字体/显示状态对整组只需一次调用，颜色和位置按层更新
+                if options:
+                    canvas.itemconfigure(tag, **options)
+                moved = (old_x, old_y) != (x, y)
+                for item, (dx, dy, color), old_layer in zip(group["items"], layers, group["layers"]):
+                    if moved:
+                        canvas.coords(item, x + dx, y + dy)
+                    if color != old_layer[2]:
+                        canvas.itemconfigure(item, fill=color)
+                group.update(state=state, layers=layers, hidden=False)
+                self.stats["updates"] += 1
+                return
+            canvas.delete(tag)
+
+        items = [
+            canvas.create_text(x + dx, y + dy, text=text, font=font, fill=color,
+                               anchor=anchor, tags=(tag,))
+            for dx, dy, color in layers
+        ]
+        if glow is not None:
+            canvas.tag_lower(tag)
+        groups[tag] = {"items": items, "state": state, "layers": layers, "hidden": False}
+        self.stats["creates"] += 1
+
+    def hide_unused(self, canvas, drawn):
+        """隐藏本次没有绘制的文字组（保留文字项，下次显示时原地更新）"""
+        groups = canvas.__dict__.get("_shadow_text_groups")
+        if not groups:
+            return
+        for tag, group in groups.items():
+            if tag not in drawn and not group["hidden"]:
+                canvas.itemconfigure(tag, state="hidden")
+                group["hidden"] = True
+
+    def clear(self, canvas):
+        groups = canvas.__dict__.pop("_shadow_text_groups", None)
+        if groups:
+            for tag in groups:
+                canvas.delete(tag)
+
+    # ---- 统计 ----
+
+    def hit_rate(self):
+        draws = self.stats["hits"] + self.stats["updates"] + self.stats["creates"]
+        return (self.stats["hits"] + self.stats["updates"]) / draws if draws else 0.0
+
+    def format_stats(self):
+        s = self.stats
+        layer_total = s["layer_hits"] + s["layer_misses"]
+        layer_rate = s["layer_hits"] / layer_total if layer_total else 0.0
+        return (f"SHADOW TEXT  reuse {self.hit_rate():.0%}  (same {s['hits']}  in-place {s['updates']}  "
+                f"new {s['creates']})  layers {layer_rate:.0%} {len(self._layers)}/{self.max_entries}")
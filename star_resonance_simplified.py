@@ -8,6 +8,7 @@
 
 import os
 import re
+import queue
 import sys
 import json
 import time
@@ -15,17 +16,28 @@ import ctypes
 import signal
 import socket
 import psutil
-import sqlite3
 import threading
 import subprocess
+import urllib.error
+import urllib.request
 import tkinter as tk
 import colorsys
 from tkinter import ttk, messagebox
 from device_selector import DeviceSelector
+from device_cache import DeviceCache, adapter_fingerprint
+from log_sink import get_sink
+from server_supervisor import ServerSupervisor, set_current_supervisor
 from pathlib import Path
 
 
 class StarResonanceLauncher:
+    HEALTH_URL = "http://127.0.0.1:8989/api/health"
+    # 就绪等待的指数退避：从10ms开始翻倍，最长每0.5秒检查一次
+    READY_POLL_MIN = 0.01
+    READY_POLL_MAX = 0.5
+    # 启动失败重试前的等待（按尝试次数翻倍）
+    RETRY_BACKOFF = 0.5
+
     def __init__(self, debug_mode=False):
         # 调试模式标志
         self.debug_mode = debug_mode
@@ -55,8 +67,18 @@ class StarResonanceLauncher:
 
         self.node_process = None
         self.ui_process = None
-        self.server_monitor_thread = None
-        self.monitor_running = False
+        self.server_supervisor = None
+        # 其他线程（守护线程、服务器重启）的状态消息，由控制窗口的after()轮询显示
+        self.status_queue = queue.Queue()
+        # 当前服务器使用的设备和日志级别（守护线程重启服务器时使用）
+        self.server_device = None
+        self.server_log_level = None
+        # 服务器启动时间，用于记录启动到就绪/首个数据的耗时
+        self.server_launch_time = None
+        self.first_data_logged = False
+        # 抓包设备列表缓存（网卡指纹不变时不再启动服务器枚举设备）
+        self.device_cache = DeviceCache(os.path.join(os.getcwd(), "device_cache.json"))
+        self.network_devices = None
 
         # Cyberpunk配色方案
         self.colors = {
@@ -87,14 +109,14 @@ class StarResonanceLauncher:
         self.is_topmost = True
 
         # 服务器输出监控相关属性
-        self.server_output_lines = []
         self.output_monitor_thread = None
-        self.monitor_running = False
 
         # 确保日志目录存在
         self.log_dir = self.base_dir / "temp_logs"
         self.log_dir.mkdir(exist_ok=True)
         self.server_log_file = self.log_dir / "server_output.log"
+        # 服务器输出：内存保留最近1000行，后台线程批量写入并按大小轮换
+        self.server_log = get_sink("server", self.server_log_file, compress=True)
 
         # 确保路径存在
         self.validate_paths()
@@ -127,33 +149,35 @@ class StarResonanceLauncher:
         print("[WARNING] 未找到Node.js")
         return None
 
+    def server_output_options(self):
+        """发布模式下服务器进程的输出参数：stdout/stderr 合并到管道，由监控线程逐行读取"""
+        return {
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+            "text": True,
+            "encoding": "utf-8",
+            "errors": "replace",
+            "bufsize": 1,
+        }
+
     def start_output_monitor(self):
-        """启动服务器输出监控线程"""
+        """启动服务器输出监控线程（调试模式下服务器输出显示在自己的控制台，没有管道）"""
         if not self.node_process or not self.node_process.stdout:
             return
+        # 绑定当前进程：守护线程重启服务器后由新的监控线程读取新进程的输出
+        process = self.node_process
 
         def monitor_output():
             try:
                 print("[INFO] 启动服务器输出监控...")
-                for line in iter(self.node_process.stdout.readline, ''):
+                for line in iter(process.stdout.readline, ''):
                     if not line:
                         break
 
                     line = line.strip()
                     if line:
-                        # 存储输出行
-                        self.server_output_lines.append(line)
-
-                        # 只保留最近1000行
-                        if len(self.server_output_lines) > 1000:
-                            self.server_output_lines = self.server_output_lines[-1000:]
-
-                        # 写入日志文件供ACT UI读取
-                        try:
-                            with open(self.server_log_file, 'a', encoding='utf-8') as f:
-                                f.write(f"[SERVER] {line}\n")
-                        except Exception as e:
-                            print(f"[ERROR] 写入日志文件失败: {e}")
+                        # 存储输出行并交给后台线程写入日志文件
+                        self.server_log.write(f"[SERVER] {line}")
 
                         # 如果是调试模式，打印到控制台
                         if self.debug_mode:
@@ -168,7 +192,6 @@ class StarResonanceLauncher:
         self.output_monitor_thread = threading.Thread(
             target=monitor_output, daemon=True)
         self.output_monitor_thread.start()
-        self.monitor_running = True
         print("[INFO] 服务器输出监控线程已启动")
 
     def generate_gradient_colors(self):
@@ -302,8 +325,61 @@ class StarResonanceLauncher:
                 return False
         return True
 
-    def get_network_devices(self):
-        """获取网络设备列表"""
+    def device_list_source(self):
+        """获取设备列表的服务器程序标识（程序更新后重新枚举）"""
+        path = self.server_js if self.use_nodejs else self.server_exe
+        try:
+            return f"{path}:{os.path.getmtime(path)}"
+        except OSError:
+            return str(path)
+
+    def get_network_devices(self, use_cache=True):
+        """获取网络设备列表，网卡指纹未变化时直接使用磁盘缓存
+
+        设置环境变量 SRDC_NO_DEVICE_CACHE=1 可禁用缓存以对比启动耗时。
+        """
+        start = time.perf_counter()
+        use_cache = use_cache and not os.environ.get("SRDC_NO_DEVICE_CACHE")
+        fingerprint = None
+        try:
+            fingerprint = adapter_fingerprint(self.device_list_source())
+        except Exception as e:
+            print(f"[WARNING] 计算网卡指纹失败: {e}")
+
+        if use_cache and fingerprint:
+            devices = self.device_cache.load(fingerprint)
+            if devices:
+                print(f"[INFO] 使用缓存的设备列表: {len(devices)} 个设备，耗时 "
+                      f"{(time.perf_counter() - start) * 1000:.0f}ms")
+                return devices
+
+        devices = self.enumerate_network_devices()
+        print(f"[INFO] 枚举设备列表耗时 {(time.perf_counter() - start) * 1000:.0f}ms"
+              f"{'' if use_cache else '（缓存已禁用）'}")
+        if devices and fingerprint:
+            self.device_cache.save(fingerprint, devices)
+        if devices:
+            return devices
+
+        # 如果获取失败，返回模拟的设备列表作为备选
+        print("使用模拟设备列表作为备选")
+        return [
+            {
+                "name": "\\Device\\NPF_{12345678-1234-1234-1234-123456789ABC}",
+                "description": "以太网 - Realtek PCIe GbE Family Controller",
+                "address": "192.168.1.100",
+                "netmask": "255.255.255.0"
+            },
+            {
+                "name": "\\Device\\NPF_{87654321-4321-4321-4321-CBA987654321}",
+                "description": "Wi-Fi - Intel(R) Wireless-AC 9560 160MHz",
+                "address": "192.168.1.101",
+                "netmask": "255.255.255.0"
+            }
+        ]
+
+    def enumerate_network_devices(self):
+        """启动服务器（--list-devices）枚举网络设备，失败返回None"""
         try:
             if not self.use_nodejs:
                 # 使用预编译可执行文件获取设备列表
@@ -347,27 +423,19 @@ class StarResonanceLauncher:
             temp_server.kill()
         except Exception as e:
             print(f"获取设备列表异常: {e}")
+        return None
 
-        # 如果获取失败，返回模拟的设备列表作为备选
-        print("使用模拟设备列表作为备选")
-        return [
-            {
-                "name": "\\Device\\NPF_{12345678-1234-1234-1234-123456789ABC}",
-                "description": "以太网 - Realtek PCIe GbE Family Controller",
-                "address": "192.168.1.100",
-                "netmask": "255.255.255.0"
-            },
-            {
-                "name": "\\Device\\NPF_{87654321-4321-4321-4321-CBA987654321}",
-                "description": "Wi-Fi - Intel(R) Wireless-AC 9560 160MHz",
-                "address": "192.168.1.101",
-                "netmask": "255.255.255.0"
-            }
-        ]
+    @staticmethod
+    def find_device_index(devices, device):
+        for i, dev in enumerate(devices or []):
+            if dev['name'] == device['name']:
+                return i
+        return None
 
     def show_device_selector(self):
         """显示设备选择器"""
         devices = self.get_network_devices()
+        self.network_devices = devices
         if not devices:
             self.show_error("无法获取网络设备列表！")
             return None, None
@@ -427,27 +495,95 @@ class StarResonanceLauncher:
             print(f"杀死端口 {port} 进程失败: {e}")
         return False
 
-    def start_node_server(self, device, log_level):
-        """启动服务器"""
+    def query_server_health(self, timeout=0.5):
+        """请求服务器健康检查接口，服务器未监听时返回None"""
+        try:
+            with urllib.request.urlopen(self.HEALTH_URL, timeout=timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError:
+            # 旧版本服务器没有健康检查接口，能响应HTTP即视为就绪
+            return {"code": 0, "ready": True}
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+
+    def wait_for_server_ready(self, timeout=60, cancelled=None):
+        """指数退避等待服务器就绪，返回就绪耗时（秒）；进程退出、超时或 cancelled() 为True时返回None"""
+        start = time.perf_counter()
+        delay = self.READY_POLL_MIN
+        next_report = 5
+        while True:
+            if cancelled and cancelled():
+                return None
+
+            health = self.query_server_health()
+            if health and health.get("ready"):
+                return time.perf_counter() - start
+
+            # 检查进程是否异常退出
+            if self.node_process.poll() is not None:
+                return None
+
+            elapsed = time.perf_counter() - start
+            if elapsed >= timeout:
+                return None
+            # 每5秒显示一次等待状态
+            if elapsed >= next_report:
+                print(f"等待中... ({elapsed:.0f}/{timeout}秒)")
+                next_report += 5
+
+            time.sleep(delay)
+            delay = min(delay * 2, self.READY_POLL_MAX)
+
+    def wait_for_port_free(self, port, timeout=5):
+        """端口释放后立即返回，不再固定等待"""
+        deadline = time.perf_counter() + timeout
+        delay = self.READY_POLL_MIN
+        while self.is_port_in_use(port):
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, self.READY_POLL_MAX)
+        return True
+
+    def log_first_data(self, health):
+        """服务器首次收到玩家数据后记录一次启动到首个数据的耗时"""
+        first_data_at = (health or {}).get("first_data_at")
+        if self.first_data_logged or not first_data_at or not self.server_launch_time:
+            return
+        self.first_data_logged = True
+        message = f"[INFO] 启动到首个数据: {first_data_at / 1000 - self.server_launch_time:.2f}秒"
+        print(message)
+        if hasattr(self, 'status_text'):
+            self.log_status(message)
+
+    def start_node_server(self, device, log_level, interactive=True):
+        """启动服务器（interactive 为False时失败不弹窗，供守护线程重启使用）"""
+        fail = self.show_error if interactive else (lambda message: print(f"[ERROR] {message}"))
+        # 守护线程重启时，守护停止（退出/F5重启）后不再启动新的服务器进程
+        cancelled = (lambda: False) if interactive else self.server_restart_cancelled
+        self.server_device = device
+        self.server_log_level = log_level
         if self.is_port_in_use(8989):
             print("端口8989被占用，尝试关闭...")
             self.kill_process_on_port(8989)
-            time.sleep(2)
+            self.wait_for_port_free(8989)
 
-        # 重新获取最新的设备列表
-        devices = self.get_network_devices()
-        device_index = None
-        for i, dev in enumerate(devices):
-            if dev['name'] == device['name']:
-                device_index = i
-                break
+        # 设备索引取自选择时的列表（与网卡指纹一致的缓存），找不到时才重新枚举
+        device_index = self.find_device_index(self.network_devices, device)
+        if device_index is None:
+            self.device_cache.clear()
+            self.network_devices = self.get_network_devices(use_cache=False)
+            device_index = self.find_device_index(self.network_devices, device)
 
         if device_index is None:
-            self.show_error("找不到选择的设备索引！")
+            fail("找不到选择的设备索引！")
             return False
 
         max_retries = 3
         for attempt in range(max_retries):
+            if cancelled():
+                print("[INFO] 服务器守护已停止，取消重启")
+                return False
             try:
                 # 根据启动方式构建命令
                 if not self.use_nodejs:
@@ -476,6 +612,8 @@ class StarResonanceLauncher:
                 # 启动进程
                 startupinfo = None
                 creation_flags = 0
+                self.server_launch_time = time.time()
+                self.first_data_logged = False
 
                 if os.name == 'nt':
                     startupinfo = subprocess.STARTUPINFO()
@@ -506,17 +644,15 @@ class StarResonanceLauncher:
                                 startupinfo=startupinfo,
                                 creationflags=creation_flags,
                                 cwd=str(self.base_dir),
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                                stdin=subprocess.DEVNULL
+                                stdin=subprocess.DEVNULL,
+                                **self.server_output_options()
                             )
                         else:
                             self.node_process = subprocess.Popen(
                                 cmd,
                                 cwd=str(self.base_dir),
-                                stdout=subprocess.DEVNULL,
-                                stderr=subprocess.DEVNULL,
-                                stdin=subprocess.DEVNULL
+                                stdin=subprocess.DEVNULL,
+                                **self.server_output_options()
                             )
                 else:
                     # Node.js方式
@@ -542,49 +678,38 @@ class StarResonanceLauncher:
                             startupinfo=startupinfo,
                             creationflags=creation_flags,
                             cwd=str(self.base_dir),
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            stdin=subprocess.DEVNULL
+                            stdin=subprocess.DEVNULL,
+                            **self.server_output_options()
                         )
+                # 发布模式下服务器输出通过管道读取，写入 temp_logs/server_output.log
+                self.start_output_monitor()
                 print("ACT启动中...")
 
-                # 等待ACT启动
+                # 等待ACT就绪（健康检查接口报告抓包已打开）
                 print("等待ACT启动...")
-                startup_success = False
-
-                for i in range(60):  # 等待最多60秒
-                    if self.is_port_in_use(8989):
-                        print("[OK] ACT启动成功！")
-                        startup_success = True
-                        break
+                ready_after = self.wait_for_server_ready(timeout=60, cancelled=cancelled)
 
-                    # 检查进程是否异常退出
-                    if self.node_process.poll() is not None:
-                        error_msg = f"服务器进程退出 (尝试 {attempt + 1}), 退出码: {self.node_process.returncode}"
-                        print(error_msg)
-
-                        if hasattr(self, 'status_text'):
-                            self.log_status(f"[WARNING] {error_msg}")
-
-                        # 如果是最后一次尝试，返回失败
-                        if attempt == max_retries - 1:
-                            return False
+                if ready_after is not None:
+                    print(f"[OK] ACT启动成功！就绪耗时 {ready_after * 1000:.0f}ms")
+                    # 启动服务器监控线程
+                    self.start_server_monitor()
+                    return True
 
-                        # 否则等待一段时间后重试
-                        print(f"等待 3 秒后重试...")
-                        time.sleep(3)
-                        break
+                if cancelled():
+                    # 守护已停止：由 cleanup() 终止这次启动的进程
+                    print("[INFO] 服务器守护已停止，取消重启")
+                    return False
 
-                    # 每5秒显示一次等待状态
-                    if i % 5 == 0:
-                        print(f"等待中... ({i}/60秒)")
+                if self.node_process.poll() is not None:
+                    error_msg = f"服务器进程退出 (尝试 {attempt + 1}), 退出码: {self.node_process.returncode}"
+                    print(error_msg)
 
-                    time.sleep(1)
+                    if hasattr(self, 'status_text'):
+                        self.log_status(f"[WARNING] {error_msg}")
 
-                if startup_success:
-                    # 启动服务器监控线程
-                    self.start_server_monitor()
-                    return True
+                    # 如果是最后一次尝试，返回失败
+                    if attempt == max_retries - 1:
+                        return False
 
                 # 如果启动超时但进程还在运行，尝试终止它
                 if self.node_process.poll() is None:
@@ -615,58 +740,66 @@ class StarResonanceLauncher:
                         except:
                             pass
 
-            # 如果不是最后一次尝试，等待后重试
+            # 如果不是最后一次尝试，退避后重试
             if attempt < max_retries - 1:
-                print(f"等待 5 秒后进行下一次尝试...")
-                time.sleep(5)
+                backoff = self.RETRY_BACKOFF * (2 ** attempt)
+                print(f"等待 {backoff:.1f} 秒后进行下一次尝试...")
+                time.sleep(backoff)
 
         # 所有尝试都失败了
-        self.show_error(f"服务器启动失败，已尝试 {max_retries} 次")
+        fail(f"服务器启动失败，已尝试 {max_retries} 次")
         return False
 
     def start_server_monitor(self):
-        """启动服务器监控线程"""
-        if self.server_monitor_thread and self.server_monitor_thread.is_alive():
+        """启动服务器守护：健康检查失败或进程退出时自动重启"""
+        if self.server_supervisor is None:
+            self.server_supervisor = ServerSupervisor(
+                is_alive=lambda: self.node_process is not None and self.node_process.poll() is None,
+                health=self.query_server_health,
+                restart=self.restart_server,
+                downtime_path=os.path.join(os.getcwd(), "server_downtime.log"),
+                on_health=self.log_first_data)
+            self.server_supervisor.subscribe(self._on_supervisor_event)
+            # 同进程的UI通过 current_supervisor() 订阅中断事件
+            set_current_supervisor(self.server_supervisor)
+        self.server_supervisor.start()
+
+    def _on_supervisor_event(self, event, record):
+        if not hasattr(self, 'status_text'):
             return
+        if event == "down":
+            reason = "进程异常退出" if record["reason"] == "crash" else "无响应"
+            self.log_status(f"[ERROR] 服务器{reason}，正在自动重启...")
+        else:
+            self.log_status(
+                f"[OK] 服务器已恢复，中断 {record['end'] - record['start']:.1f} 秒（期间数据缺失）")
 
-        self.monitor_running = True
-        self.server_monitor_thread = threading.Thread(
-            target=self.monitor_server, daemon=True)
-        self.server_monitor_thread.start()
-        print("[INFO] 服务器监控线程已启动")
+    def server_restart_cancelled(self):
+        """守护线程已被要求停止（重启中的服务器启动应尽快放弃）"""
+        return self.server_supervisor is not None and self.server_supervisor.stopping
 
-    def monitor_server(self):
-        """监控服务器进程状态"""
-        while self.monitor_running and self.node_process:
+    def restart_server(self):
+        """终止当前服务器进程并用相同设备重新启动"""
+        if self.server_restart_cancelled():
+            return False
+        if self.node_process and self.node_process.poll() is None:
             try:
-                # 检查进程是否还在运行
-                if self.node_process.poll() is not None:
-                    print(
-                        f"[WARNING] 服务器进程已退出，退出码: {self.node_process.returncode}")
-                    if hasattr(self, 'status_text'):
-                        self.log_status(
-                            f"[ERROR] 服务器进程异常退出！退出码: {self.node_process.returncode}")
-                    break
-
-                # 检查端口是否还在监听
-                if not self.is_port_in_use(8989):
-                    print("[WARNING] 端口8989不再监听")
-                    if hasattr(self, 'status_text'):
-                        self.log_status("[WARNING] 服务器端口8989不再监听")
-
-                time.sleep(5)  # 每5秒检查一次
-
-            except Exception as e:
-                print(f"[ERROR] 服务器监控异常: {e}")
-                break
-
-        print("[INFO] 服务器监控线程已退出")
+                self.node_process.terminate()
+                self.node_process.wait(timeout=5)
+            except Exception:
+                try:
+                    self.node_process.kill()
+                except Exception:
+                    pass
+        if self.server_device is None:
+            return False
+        return self.start_node_server(self.server_device, self.server_log_level, interactive=False)
 
     def stop_server_monitor(self):
-        """停止服务器监控"""
-        self.monitor_running = False
-        if self.server_monitor_thread and self.server_monitor_thread.is_alive():
-            self.server_monitor_thread.join(timeout=2)
+        """停止服务器守护，并等待正在进行的重启结束（之后才能终止服务器进程）"""
+        if self.server_supervisor is not None:
+            if not self.server_supervisor.stop(timeout=30):
+                print("[WARNING] 服务器守护线程未在30秒内退出")
 
     def start_ui(self):
         """启动ACT UI界面"""
@@ -865,11 +998,28 @@ class StarResonanceLauncher:
 
         # 启动RGB动画
         self.start_rgb_animation()
+        # 在Tk线程中显示其他线程的状态消息
+        self.control_window.after(200, self.poll_status_queue)
 
         return self.control_window
 
+    def poll_status_queue(self):
+        """显示其他线程通过 log_status() 送来的状态消息"""
+        try:
+            while True:
+                self.log_status(self.status_queue.get_nowait())
+        except queue.Empty:
+            pass
+        try:
+            self.control_window.after(200, self.poll_status_queue)
+        except tk.TclError:
+            pass  # 窗口已关闭
+
     def log_status(self, message):
-        """记录状态信息"""
+        """记录状态信息（非Tk线程调用时入队，由 poll_status_queue() 显示）"""
+        if threading.current_thread() is not threading.main_thread():
+            self.status_queue.put(message)
+            return
         if hasattr(self, 'status_text') and self.status_text:
             try:
                 timestamp = time.strftime("%H:%M:%S")
@@ -971,6 +1121,8 @@ class StarResonanceLauncher:
             self.log_status("[INFO] 正在关闭应用程序...")
 
         self.cleanup()
+        # 服务器日志只在最终退出时关闭（F5重启后继续写入同一个日志）
+        self.server_log.close()
         print("应用程序已关闭")
 
         # 关闭控制窗口
@@ -1003,11 +1155,12 @@ class StarResonanceLauncher:
 
         # 启动服务器
         print("[INFO] 正在启动服务器...")
+        server_start = time.perf_counter()
         if not self.start_node_server(device, log_level):
             print("[ERROR] 服务器启动失败")
             return
 
-        print("[OK] 服务器启动成功")
+        print(f"[OK] 服务器启动成功，耗时 {time.perf_counter() - server_start:.2f}秒")
 
         # 启动UI界面
         print("[INFO] 正在启动UI界面...")
@@ -1057,6 +1210,11 @@ def main():
         # 检查是否启用调试模式
         debug_mode = '--debug' in sys.argv or '-d' in sys.argv
 
+        # 无界面模式：只运行抓包和统计，快照以NDJSON输出
+        if '--headless' in sys.argv:
+            from headless import run_headless
+            sys.exit(run_headless(sys.argv[1:]))
+
         if not debug_mode:
             # 非调试模式：隐藏控制台窗口（发布版本）
             hide_console()
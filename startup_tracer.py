@@ -0,0 +1,78 @@
+import builtins
+import sys
+import threading
+import time
+
+
+class StartupTracer:
+    """启动时间线记录
+
+    mark(name) 记录从上一个标记到现在的耗时，作为名为 name 的阶段；
+    trace_imports() 在启动期间替换 __import__，记录每个首次导入的顶层模块耗时
+    （包含其依赖），stop_import_tracing() 后恢复。report() 输出各阶段、到首帧的总耗时
+    和最慢的导入。note(text) 记录附加说明（如缓存命中节省的时间），一并输出。
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []   # [(name, 开始偏移, 耗时)]
+        self.imports = []  # [(module, 耗时)]
+        self.notes = []
+        self._original_import = None
+        self._local = threading.local()
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, self.last - self.start, now - self.last))
+        self.last = now
+
+    def note(self, text):
+        self.notes.append(text)
+
+    # ---- 导入计时 ----
+
+    def trace_imports(self):
+        if self._original_import is not None:
+            return
+        original = self._original_import = builtins.__import__
+        local = self._local
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # 只记录最外层的首次导入，嵌套导入计入外层
+            if level or name in sys.modules or getattr(local, "depth", 0):
+                return original(name, globals, locals, fromlist, level)
+            local.depth = 1
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                local.depth = 0
+                self.imports.append((name, time.perf_counter() - start))
+
+        builtins.__import__ = timed_import
+
+    def stop_import_tracing(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    # ---- 输出 ----
+
+    def report(self, top_imports=10):
+        lines = [f"[STARTUP] 总耗时 {self.elapsed() * 1000:.0f}ms"]
+        for name, offset, duration in self.phases:
+            lines.append(f"[STARTUP] {offset * 1000:7.0f}ms +{duration * 1000:6.0f}ms  {name}")
+        for text in self.notes:
+            lines.append(f"[STARTUP] {text}")
+        slowest = sorted(self.imports, key=lambda item: item[1], reverse=True)[:top_imports]
+        for module, duration in slowest:
+            lines.append(f"[STARTUP]   import {module}: {duration * 1000:.1f}ms")
+        return lines
+
+
+# 进程内共享的启动记录（act_damage_ui 导入时开始计时）
+startup_tracer = StartupTracer()
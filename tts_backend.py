@@ -0,0 +1,291 @@
+import base64
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+
+class TTSBackend:
+    """TTS后端基类
+
+    所有方法都在TTS工作线程中调用（COM/pyttsx3 要求同一线程使用）：
+    - open(): 启动合成器，失败抛出异常
+    - speak(text): 直接合成并播放
+    - render(text, path): 预合成到音频文件，不支持时返回False
+    - play(path): 播放预合成的音频，不支持时返回False
+    """
+
+    name = "base"
+    file_ext = ".wav"
+
+    def open(self):
+        pass
+
+    def speak(self, text):
+        raise NotImplementedError
+
+    def render(self, text, path):
+        return False
+
+    def play(self, path):
+        return False
+
+    def close(self):
+        pass
+
+
+class NullBackend(TTSBackend):
+    """不发声的后端，只记录播报内容（无语音环境或调试用）"""
+
+    name = "null"
+
+    def __init__(self, history_size=100):
+        self.history_size = history_size
+        self.spoken = []
+
+    def speak(self, text):
+        self.spoken.append(text)
+        del self.spoken[:-self.history_size]
+
+
+class FileBackend(TTSBackend):
+    """把播报内容写入文本日志的后端，预合成产物为文本文件，便于在Linux上验证缓存与时序"""
+
+    name = "file"
+    file_ext = ".txt"
+
+    def __init__(self, log_path="tts_output.log"):
+        self.log_path = log_path
+
+    def _write(self, line):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(f"{time.strftime('%H:%M:%S')} {line}\n")
+
+    def speak(self, text):
+        self._write(f"SPEAK {text}")
+
+    def render(self, text, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return True
+
+    def play(self, path):
+        self._write(f"PLAY {os.path.basename(path)}")
+        return True
+
+
+class SapiBackend(TTSBackend):
+    """常驻的 System.Speech 合成器（Windows）
+
+    只启动一个 PowerShell 进程并保持 SpeechSynthesizer 实例，
+    之后每条语音通过标准输入发送一行命令，省去每次启动进程和加载程序集的开销。
+    文本以 base64(UTF-8) 传输，避免引号转义和控制台编码问题。
+    """
+
+    name = "sapi"
+
+    SCRIPT = r"""
+Add-Type -AssemblyName System.Speech
+$s = New-Object System.Speech.Synthesis.SpeechSynthesizer
+try { $s.SelectVoiceByHints('NotSet', 'NotSet', 0, [Globalization.CultureInfo]'zh-CN') } catch {}
+function Decode($b) { [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($b)) }
+[Console]::Out.WriteLine('READY')
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($line -eq $null -or $line -eq 'QUIT') { break }
+    $parts = $line.Split("`t")
+    try {
+        if ($parts[0] -eq 'RENDER') {
+            $s.SetOutputToWaveFile((Decode $parts[1]))
+            $s.Speak((Decode $parts[2]))
+            $s.SetOutputToDefaultAudioDevice()
+        } else {
+            $s.Speak((Decode $parts[1]))
+        }
+        [Console]::Out.WriteLine('OK')
+    } catch {
+        $s.SetOutputToDefaultAudioDevice()
+        [Console]::Out.WriteLine('ERR ' + $_.Exception.Message)
+    }
+}
+"""
+
+    def __init__(self):
+        self.process = None
+
+    @staticmethod
+    def _b64(value):
+        return base64.b64encode(value.encode("utf-8")).decode("ascii")
+
+    def open(self):
+        encoded = base64.b64encode(self.SCRIPT.encode("utf-16-le")).decode("ascii")
+        self.process = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NonInteractive", "-EncodedCommand", encoded],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="ascii", errors="replace", bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        ready = self.process.stdout.readline().strip()
+        if ready != "READY":
+            self.close()
+            raise RuntimeError(f"SpeechSynthesizer启动失败: {ready!r}")
+
+    def _request(self, line):
+        # 进程意外退出时重启一次
+        if self.process is None or self.process.poll() is not None:
+            self.open()
+        self.process.stdin.write(line + "\n")
+        self.process.stdin.flush()
+        reply = self.process.stdout.readline().strip()
+        if reply != "OK":
+            raise RuntimeError(reply or "SpeechSynthesizer无响应")
+
+    def speak(self, text):
+        self._request(f"SPEAK\t{self._b64(text)}")
+
+    def render(self, text, path):
+        self._request(f"RENDER\t{self._b64(os.path.abspath(path))}\t{self._b64(text)}")
+        return os.path.exists(path)
+
+    def play(self, path):
+        if winsound is None:
+            return False
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+        return True
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.stdin.write("QUIT\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=2)
+        except Exception:
+            self.process.kill()
+        self.process = None
+
+
+class Pyttsx3Backend(TTSBackend):
+    """pyttsx3 后端（PowerShell 不可用时使用）"""
+
+    name = "pyttsx3"
+
+    def __init__(self, rate=150, volume=0.8):
+        self.rate = rate
+        self.volume = volume
+        self.engine = None
+
+    def open(self):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+        # 优先选择中文语音
+        for voice in self.engine.getProperty('voices') or []:
+            if 'chinese' in voice.name.lower() or 'mandarin' in voice.name.lower():
+                self.engine.setProperty('voice', voice.id)
+                break
+        self.engine.setProperty('rate', self.rate)
+        self.engine.setProperty('volume', self.volume)
+
+    def speak(self, text):
+        self.engine.say(text)
+        self.engine.runAndWait()
+
+    def render(self, text, path):
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+        return os.path.exists(path)
+
+    def play(self, path):
+        if winsound is None:
+            return False
+        winsound.PlaySound(path, winsound.SND_FILENAME)
+        return True
+
+    def close(self):
+        if self.engine is not None:
+            try:
+                self.engine.stop()
+            except Exception:
+                pass
+            self.engine = None
+
+
+BACKENDS = {
+    "sapi": SapiBackend,
+    "pyttsx3": Pyttsx3Backend,
+    "file": FileBackend,
+    "null": NullBackend,
+}
+
+
+def open_tts_backend(name=None):
+    """按名称或平台默认顺序打开第一个可用的后端（在TTS工作线程中调用）
+
+    名称可由环境变量 SRDC_TTS_BACKEND 指定（sapi / pyttsx3 / file / null）。
+    """
+    name = name or os.environ.get("SRDC_TTS_BACKEND")
+    if name in BACKENDS:
+        candidates = [name]
+    elif sys.platform == "win32":
+        candidates = ["sapi", "pyttsx3", "null"]
+    else:
+        candidates = ["pyttsx3", "null"]
+
+    for candidate in candidates:
+        backend = BACKENDS[candidate]()
+        try:
+            backend.open()
+            print(f"[INFO] TTS后端: {backend.name}")
+            return backend
+        except Exception as e:
+            print(f"[WARNING] TTS后端 {candidate} 初始化失败: {e}")
+    return NullBackend()
+
+
+class TTSCache:
+    """预合成语音缓存
+
+    以 后端名+文本 的哈希作为文件名保存在缓存目录，跨次启动复用。
+    播报时命中缓存则直接播放音频文件，未命中才实时合成。
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.stats = {"hits": 0, "misses": 0, "rendered": 0, "failed": 0}
+
+    def path_for(self, backend, text):
+        digest = hashlib.sha1(f"{backend.name}\n{text}".encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.directory, digest + backend.file_ext)
+
+    def lookup(self, backend, text):
+        """命中返回音频文件路径，否则返回None"""
+        path = self.path_for(backend, text)
+        if os.path.exists(path):
+            self.stats["hits"] += 1
+            return path
+        self.stats["misses"] += 1
+        return None
+
+    def render(self, backend, text):
+        """预合成单条文本，已存在时跳过，返回是否可用"""
+        path = self.path_for(backend, text)
+        if os.path.exists(path):
+            return True
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # 先写临时文件再改名，避免播放到未写完的音频
+            tmp_path = path + ".tmp" + backend.file_ext
+            if backend.render(text, tmp_path):
+                os.replace(tmp_path, path)
+                self.stats["rendered"] += 1
+                return True
+        except Exception as e:
+            print(f"[WARNING] 预合成语音失败 ({text}): {e}")
+        self.stats["failed"] += 1
+        return False
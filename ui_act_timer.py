@@ -0,0 +1,1131 @@
+"""ACT计时器窗口
+
+ACTDamageUI 对应方法的实现，第一次打开时才导入，减少主模块的导入时间。
+函数的第一个参数为 ACTDamageUI 实例。
+"""
+
+import time
+import tkinter as tk
+
+# 可选：用于抗锯齿的圆角绘制
+try:
+    from PIL import Image, ImageTk, ImageDraw, ImageFilter
+except Exception:
+    Image = ImageTk = ImageDraw = ImageFilter = None
+
+from alert_scheduler import AlertScheduler
+from shadow_text import GLOW_TIMER, STYLE_PHASE, STYLE_SMALL, STYLE_TIMER
+
+
+def launch_act_timer_window(self, reference_window=None, duration=300, config_name=None):
+    """启动ACT计时器窗口 - 使用MINI UI相同风格，可以设置相对于参考窗口的位置"""
+    print(f"启动ACT timer，参考窗口: {reference_window}")  # 调试信息
+    if reference_window:
+        print(f"参考窗口是否存在: {reference_window.winfo_exists()}")  # 调试信息
+
+    # 创建新的ACTACT窗口
+    print("开始创建timer窗口")  # 调试信息
+    timer_window = tk.Toplevel()
+    timer_window.title("◊ ACT_TIMER_CONSOLE ◊")
+    timer_window.geometry("500x600")  # 稍微增大以适应新布局
+    timer_window.resizable(False, False)
+    timer_window.wm_attributes("-topmost", True)
+    timer_window.wm_attributes("-alpha", self.current_alpha)
+    timer_window.overrideredirect(True)  # 使用无边框模式
+    timer_window.configure(bg=self.colors["bg_primary"])
+
+    # 如果有参考窗口，将timer窗口放置在其右边
+    if reference_window and reference_window.winfo_exists():
+        try:
+
+            reference_window.update_idletasks()  # 确保窗口已完全更新
+            ref_x = reference_window.winfo_x()
+            ref_y = reference_window.winfo_y()
+            ref_width = reference_window.winfo_width()
+
+            # 计算新位置：参考窗口右边 + 10像素间距
+            new_x = ref_x + ref_width + 10
+            new_y = ref_y  # 与参考窗口顶部对齐
+
+            timer_window.geometry(f"500x600+{new_x}+{new_y}")
+
+        except Exception as e:
+
+            # 如果定位失败，使用默认位置
+            pass
+    else:
+        print("没有参考窗口，使用默认位置")  # 调试信息
+
+    # 设置圆角窗口和RGB边框（与MINI UI相同）
+    print("开始设置圆角窗口和RGB边框")  # 调试信息
+    if Image is not None:
+        try:
+            print("PIL可用，创建圆角窗口")  # 调试信息
+
+            import ctypes
+            timer_window.update()
+            hwnd = ctypes.windll.user32.GetParent(timer_window.winfo_id())
+            if hwnd == 0:
+                hwnd = timer_window.winfo_id()
+
+            width = 500
+            height = 600
+            corner_radius = 12
+
+            hrgn = ctypes.windll.gdi32.CreateRoundRectRgn(
+                0, 0, width, height, corner_radius * 2, corner_radius * 2
+            )
+
+            if hrgn:
+                ctypes.windll.user32.SetWindowRgn(hwnd, hrgn, True)
+            else:
+                ctypes.windll.user32.SetWindowRgn(hwnd, 0, True)
+        except Exception as e:
+            pass
+
+        # 创建RGB边框容器（与MINI UI相同）
+
+        border_canvas = tk.Canvas(
+            timer_window, bg=self.colors["bg_primary"], highlightthickness=0, bd=0)
+        border_canvas.pack(fill="both", expand=True, padx=0, pady=0)
+
+        # 主内容容器
+
+        main_content_frame = tk.Frame(
+            border_canvas, bg=self.colors["bg_primary"], bd=0, relief="flat")
+
+        # 在Canvas中创建窗口
+        border_space = 6
+        content_window = border_canvas.create_window(
+            border_space, border_space,
+            anchor="nw",
+            window=main_content_frame
+        )
+
+        timer_window._border_imgtk = None
+        timer_window._border_cache_key = None
+        timer_window.rgb_index = 0
+
+        def render_timer_border():
+            """渲染ACT窗口的RGB边框"""
+            canvas_w = border_canvas.winfo_width()
+            canvas_h = border_canvas.winfo_height()
+            if canvas_w <= 0 or canvas_h <= 0:
+                return
+
+            # 更新内容区域大小
+            content_width = canvas_w - (border_space * 2)
+            content_height = canvas_h - (border_space * 2)
+            border_canvas.itemconfig(
+                content_window,
+                width=content_width,
+                height=content_height
+            )
+
+            current_color = self.border_colors[timer_window.rgb_index % len(
+                self.border_colors)]
+            key = (canvas_w, canvas_h, current_color)
+
+            if (getattr(timer_window, "_border_cache_key", None) == key and
+                    timer_window._border_imgtk is not None):
+                return
+
+            # 创建圆角背景
+            scale = 1.5
+            W, H = int(canvas_w * scale), int(canvas_h * scale)
+            r = max(0, int(12 * scale))
+            bw = max(1, int(3 * scale))
+
+            if W <= bw * 2 or H <= bw * 2:
+                return
+
+            img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+
+            # 绘制背景
+            bg_color = self.colors["bg_primary"]
+            draw.rounded_rectangle(
+                [0, 0, W-1, H-1], radius=r, fill=bg_color)
+
+            # 添加RGB边框发光效果
+            try:
+                glow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+                gdraw = ImageDraw.Draw(glow)
+                gdraw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
+                                        radius=r, outline=current_color, width=bw)
+                glow = glow.filter(
+                    ImageFilter.GaussianBlur(1.5 * scale / 10))
+                img = Image.alpha_composite(img, glow)
+            except Exception:
+                pass
+
+            # 绘制边框
+            draw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
+                                   radius=r, outline=current_color, width=bw)
+
+            img = img.resize((canvas_w, canvas_h), resample=Image.LANCZOS)
+            imgtk = ImageTk.PhotoImage(img)
+            border_canvas.delete("bg_image")
+            border_canvas.create_image(
+                0, 0, anchor="nw", image=imgtk, tags="bg_image")
+            timer_window._border_imgtk = imgtk
+            timer_window._border_cache_key = key
+
+        def timer_rgb_animate():
+            """ACT窗口RGB动画"""
+            if not timer_window.winfo_exists():
+                return
+            if self.ui_governor.animations_paused():
+                timer_window.after(
+                    self.ui_governor.IDLE_POLL_MS, timer_rgb_animate)
+                return
+
+            old_index = getattr(timer_window, 'rgb_index', 0)
+            timer_window.rgb_index = (
+                timer_window.rgb_index + 1) % len(self.border_colors)
+
+            if timer_window.rgb_index != old_index:
+                if hasattr(timer_window, '_timer_rgb_timer'):
+                    timer_window.after_cancel(
+                        timer_window._timer_rgb_timer)
+                timer_window._timer_rgb_timer = timer_window.after(
+                    10, render_timer_border)
+
+            timer_window.after(self.ui_governor.animation_interval(
+                self.rgb_interval), self.ui_governor.wrap(
+                    "timer_rgb_animation", timer_rgb_animate))
+
+        def on_timer_resize(event):
+            if hasattr(timer_window, '_timer_resize_timer'):
+                timer_window.after_cancel(timer_window._timer_resize_timer)
+            timer_window._timer_resize_timer = timer_window.after(
+                100, render_timer_border)
+
+        border_canvas.bind("<Configure>", on_timer_resize)
+        timer_window.after(100, render_timer_border)
+        timer_window.after(self.rgb_interval, timer_rgb_animate)
+
+    else:
+
+        # 回退为矩形边框
+        main_content_frame = tk.Frame(
+            timer_window, bg=self.colors["bg_primary"], bd=0, relief="flat")
+        main_content_frame.pack(fill="both", expand=True, padx=6, pady=6)
+
+    # 创建标题栏（与MINI UI相同风格）
+
+    header_outer, header_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_yellow"],
+        padding=2,
+    )
+    header_outer.configure(height=65)
+    header_outer.pack(fill="x", pady=(6, 4))
+    header_outer.pack_propagate(False)
+
+    # 标题内容容器
+
+    title_container = tk.Frame(
+        header_frame, bg=self.colors["bg_secondary"])
+    title_container.pack(fill="x", pady=int(3 * 1.1))
+
+    # 主标题 - 使用Canvas添加阴影效果
+
+    title_canvas = tk.Canvas(
+        title_container,
+        height=int(25 * 1.1),
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    title_canvas.pack(fill="x", pady=int(2 * 1.1))
+
+    def draw_timer_title_with_shadow():
+        title_canvas.delete("all")
+        title_text = "▓▓▓ ACT_TIMER ▓▓▓"
+        font_tuple = self.get_font(int(12 * 1.1), "normal")
+
+        canvas_width = title_canvas.winfo_width()
+        if canvas_width > 1:
+            center_x = canvas_width // 2
+            center_y = int(12 * 1.1)
+
+            # 绘制多层阴影
+            shadow_layers = [
+                (3, 3, "#000000"),
+                (2, 2, "#111111"),
+                (1, 1, "#222222")
+            ]
+
+            for dx, dy, shadow_color in shadow_layers:
+                title_canvas.create_text(
+                    center_x + dx, center_y + dy,
+                    text=title_text, font=font_tuple,
+                    fill=shadow_color, anchor="center"
+                )
+
+            # 绘制边框效果
+            border_color = "#333333"
+            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+                title_canvas.create_text(
+                    center_x + dx, center_y + dy,
+                    text=title_text, font=font_tuple,
+                    fill=border_color, anchor="center"
+                )
+
+            # 绘制主文字
+            title_canvas.create_text(
+                center_x, center_y,
+                text=title_text, font=font_tuple,
+                fill=self.colors["neon_yellow"], anchor="center"
+            )
+
+    title_canvas.bind(
+        "<Configure>", lambda e: draw_timer_title_with_shadow())
+    title_canvas.after(10, draw_timer_title_with_shadow)
+
+    # 存储Canvas引用用于拖拽
+    timer_window.title_canvas = title_canvas
+
+    # 副标题
+
+    subtitle_canvas = tk.Canvas(
+        title_container,
+        height=int(16 * 1.1),
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    subtitle_canvas.pack(fill="x")
+
+    def draw_timer_subtitle_with_shadow():
+        # 检查canvas是否仍然存在
+        try:
+            if not subtitle_canvas.winfo_exists():
+                return
+        except:
+            return
+
+        subtitle_canvas.delete("all")
+        subtitle_text = "[JASON_LIBRARY_TIMING]"
+        font_tuple = self.get_font(int(8 * 1.1), "normal")
+
+        try:
+            canvas_width = subtitle_canvas.winfo_width()
+            if canvas_width > 1:
+                center_x = canvas_width // 2
+                center_y = int(8 * 1.1)
+
+                # 绘制阴影
+                shadow_layers = [
+                    (2, 2, "#000000"),
+                    (1, 1, "#111111")
+                ]
+
+                for dx, dy, shadow_color in shadow_layers:
+                    subtitle_canvas.create_text(
+                        center_x + dx, center_y + dy,
+                        text=subtitle_text, font=font_tuple,
+                        fill=shadow_color, anchor="center"
+                    )
+
+                # 绘制边框效果
+                border_color = "#333333"
+                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    subtitle_canvas.create_text(
+                        center_x + dx, center_y + dy,
+                        text=subtitle_text, font=font_tuple,
+                        fill=border_color, anchor="center"
+                    )
+
+                # 绘制主文字
+                subtitle_canvas.create_text(
+                    center_x, center_y,
+                    text=subtitle_text, font=font_tuple,
+                    fill=self.colors["neon_cyan"], anchor="center"
+                )
+        except:
+            # 如果canvas已被销毁，静默忽略错误
+            pass
+
+    # 保存after任务ID到timer窗口
+    if not hasattr(timer_window, '_after_tasks'):
+        timer_window._after_tasks = []
+
+    def safe_timer_bind():
+        try:
+            subtitle_canvas.bind(
+                "<Configure>", lambda e: draw_timer_subtitle_with_shadow())
+        except:
+            pass
+
+    def safe_timer_after():
+        try:
+            task_id = subtitle_canvas.after(
+                10, draw_timer_subtitle_with_shadow)
+            timer_window._after_tasks.append(task_id)
+        except:
+            pass
+
+    safe_timer_bind()
+    safe_timer_after()
+
+    # 存储Canvas引用用于拖拽
+    timer_window.subtitle_canvas = subtitle_canvas
+
+    # 自定义关闭函数，清理关联关系
+
+    def close_timer_window():
+        # 从参考窗口的关联列表中移除
+        if hasattr(timer_window, 'reference_window') and timer_window.reference_window:
+            ref_window = timer_window.reference_window
+            if hasattr(ref_window, 'associated_timers') and timer_window in ref_window.associated_timers:
+                ref_window.associated_timers.remove(timer_window)
+
+        # 从全局列表中移除
+        if timer_window in self.timer_windows:
+            self.timer_windows.remove(timer_window)
+        self.config_watcher.unwatch(timer_window)
+
+        # 销毁窗口
+        timer_window.destroy()
+
+    # 关闭按钮
+
+    close_btn = self.create_enhanced_button(
+        title_container, "✕", close_timer_window,
+        self.colors["neon_pink"], width=2, height=1
+    )
+    close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-3, y=2)
+
+    # ACT显示区域（使用圆角框架）
+
+    timer_outer, timer_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_accent"],
+        border_color=self.colors["neon_cyan"],
+        padding=int(8 * 1.1),
+    )
+    timer_outer.configure(height=80)
+    timer_outer.pack(fill="x", pady=(0, int(8 * 1.1)))
+    timer_outer.pack_propagate(False)
+
+    # 初始化ACT变量
+    print("初始化ACT变量")  # 调试信息
+    timer_window.timer_running = False
+    timer_window.start_time = None
+    timer_window.elapsed_time = 0
+    timer_window.waiting_for_damage = False  # 是否在等待第一次伤害
+    timer_window.total_duration = duration  # 使用传入的倒计时时长
+    timer_window.damage_detected = False  # 是否检测到伤害
+    timer_window.last_damage_count = 0  # 上次的伤害计数
+
+    # 加载ACT配置
+    timer_window.act_config = None
+    if config_name:
+        timer_window.act_config = self.load_act_config(config_name)
+        if timer_window.act_config:
+            # 如果配置文件指定了持续时间，则使用配置文件的
+            if 'total_duration' in timer_window.act_config:
+                timer_window.total_duration = timer_window.act_config['total_duration']
+
+    # 提醒时间线（加载时编译，跳过机制计数器内置）
+    timer_window.alert_scheduler = AlertScheduler(timer_window.act_config)
+
+    # 监视配置文件修改，热重载在下一次开战前生效
+    timer_window.pending_config_reload = None
+    if config_name and timer_window.act_config:
+        file_name = getattr(self, 'config_file_mapping', {}).get(config_name, config_name)
+        self.config_watcher.watch(timer_window, file_name)
+    print("ACT变量初始化完成")  # 调试信息
+
+    # 时间显示Canvas - 添加阴影效果
+
+    time_canvas = tk.Canvas(
+        timer_frame,
+        height=100,  # 增加高度以容纳阶段信息
+        bg=self.colors["bg_accent"],
+        highlightthickness=0,
+        bd=0
+    )
+    time_canvas.pack(fill="x", pady=10)
+
+    def draw_time_with_shadow(time_text="00:00:00", text_color=None, glow_effect=False, phase_info=None, team_damage=None):
+        # 文字项按名称原地更新（见 shadow_text.py），每秒只改变化的文字和颜色
+        renderer = self.shadow_text
+        font_tuple = self.get_font(24, "bold")
+
+        # 如果没有指定颜色，使用默认的青色
+        if text_color is None:
+            text_color = self.colors["neon_cyan"]
+
+        canvas_width = time_canvas.winfo_width()
+        canvas_height = time_canvas.winfo_height()
+        drawn = set()
+
+        if canvas_width > 1 and canvas_height > 1:
+            center_x = canvas_width // 2
+            time_y = 20  # 时间显示位置，调整得更靠上一些
+
+            # 如果启用辉光效果，绘制荧光辉光（多层，从外到内逐渐增强）
+            if glow_effect:
+                renderer.draw(time_canvas, "time_glow", center_x, time_y, time_text, font_tuple,
+                              text_color, glow=GLOW_TIMER)
+                drawn.add("time_glow")
+
+            # 时间：多层阴影、边框和主文字
+            renderer.draw(time_canvas, "time", center_x, time_y, time_text, font_tuple,
+                          text_color, style=STYLE_TIMER)
+            drawn.add("time")
+
+            # 绘制队伍总伤害（在时间右边）
+            if team_damage is not None:
+                damage_text = self.format_damage_number(team_damage)
+                damage_font = self.get_font(14, "bold")
+                damage_x = canvas_width - 10  # 右侧位置
+                damage_y = 15  # 稍微靠上
+                renderer.draw(time_canvas, "damage", damage_x, damage_y, damage_text, damage_font,
+                              self.colors["neon_orange"], style=STYLE_SMALL, anchor="ne")
+                drawn.add("damage")
+
+            # 绘制阶段信息
+            if phase_info:
+                phase_name = phase_info.get('name', '')
+                # 移除阶段描述显示，只保留阶段名称
+
+                # 阶段名称在左边 - 固定字体大小和样式
+                if phase_name:
+                    # 修复：处理阶段名称中的换行符
+                    phase_name = phase_name.replace(
+                        '/n', '\n')  # 将 /n 转换为 \n
+
+                    # 固定阶段名称字体 - 12号字体，粗体，使用紫色
+                    name_font = self.get_font(12, "bold")
+                    name_color = self.colors["neon_purple"]
+
+                    # 处理多行阶段名称
+                    name_lines = phase_name.split('\n')
+                    line_height = 15  # 行高
+                    start_y = 8
+
+                    for i, line in enumerate(name_lines):
+                        renderer.draw(time_canvas, f"phase_{i}", 10, start_y + i * line_height, line,
+                                      name_font, name_color, style=STYLE_PHASE, anchor="nw")
+                        drawn.add(f"phase_{i}")
+
+        renderer.hide_unused(time_canvas, drawn)
+
+    time_canvas.bind("<Configure>", lambda e: draw_time_with_shadow())
+    timer_window.draw_time_with_shadow = draw_time_with_shadow
+    # 显示初始倒计时时间（在配置加载后显示）
+
+    def show_initial_time():
+        initial_time = f"{timer_window.total_duration//3600:02d}:{(timer_window.total_duration%3600)//60:02d}:{timer_window.total_duration%60:02d}"
+        current_phase = self.get_current_phase(timer_window, 0)  # 获取初始阶段
+        team_damage = self.get_team_total_damage()  # 获取队伍总伤害
+        draw_time_with_shadow(
+            initial_time, self.colors["neon_cyan"], False, current_phase, team_damage)
+
+    timer_window.after(10, show_initial_time)
+
+    # 控制按钮区域（使用圆角框架）
+
+    control_outer, control_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_green"],
+        padding=int(4 * 1.1),
+    )
+    control_outer.configure(height=60)
+    control_outer.pack(fill="x", pady=(0, int(8 * 1.1)))
+    control_outer.pack_propagate(False)
+
+    # 按钮容器
+
+    button_container = tk.Frame(
+        control_frame, bg=self.colors["bg_secondary"])
+    button_container.pack(expand=True, pady=5)
+
+    # 使用增强按钮风格
+
+    start_button = self.create_enhanced_button(
+        button_container, "Start",
+        lambda: self.toggle_timer(timer_window, start_button),
+        self.colors["neon_green"], width=8, height=1, font_weight="bold"
+    )
+    start_button.pack(side="left", padx=5)
+
+    reset_button = self.create_enhanced_button(
+        button_container, "Reset",
+        lambda: self.reset_timer(timer_window, start_button),
+        self.colors["neon_yellow"], width=8, height=1, font_weight="bold"
+    )
+    reset_button.pack(side="left", padx=5)
+
+    # 事件记录区域（使用圆角框架）
+
+    events_outer, events_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_purple"],
+        padding=int(4 * 1.1),
+    )
+    events_outer.pack(fill="both", expand=True)
+
+    # 事件标题Canvas - 添加阴影效果
+    events_title_canvas = tk.Canvas(
+        events_frame,
+        height=int(20 * 1.1),
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    events_title_canvas.pack(fill="x", pady=(5, 5))
+
+    def draw_events_title_with_shadow():
+        events_title_canvas.delete("all")
+        title_text = "[JASON_LIBRARY_EVENTS]"
+        font_tuple = self.get_font(int(10 * 1.1), "bold")
+
+        canvas_width = events_title_canvas.winfo_width()
+        if canvas_width > 1:
+            center_x = canvas_width // 2
+            center_y = int(10 * 1.1)
+
+            # 绘制阴影
+            for dx, dy in [(2, 2), (1, 1)]:
+                events_title_canvas.create_text(
+                    center_x + dx, center_y + dy,
+                    text=title_text, font=font_tuple,
+                    fill="#000000", anchor="center"
+                )
+
+            # 绘制主文字
+            events_title_canvas.create_text(
+                center_x, center_y,
+                text=title_text, font=font_tuple,
+                fill=self.colors["neon_purple"], anchor="center"
+            )
+
+    events_title_canvas.bind(
+        "<Configure>", lambda e: draw_events_title_with_shadow())
+    events_title_canvas.after(10, draw_events_title_with_shadow)
+
+    # 事件列表（使用圆角列表框）
+
+    try:
+        events_container = self.create_rounded_listbox(
+            events_frame,
+            height=12,
+            bg=self.colors["bg_primary"],
+            fg=self.colors["text_primary"],
+            selectbackground=self.colors["neon_cyan"],
+            selectforeground=self.colors["bg_primary"],
+            font=self.get_font(9, "normal")
+        )
+        events_container.pack(
+            fill="both", expand=True, padx=5, pady=(0, 5))
+        # 获取真正的listbox
+        events_listbox = events_container.listbox
+
+    except Exception as e:
+
+        import traceback
+        traceback.print_exc()
+        # 使用简单的Listbox作为回退
+        events_listbox = tk.Listbox(
+            events_frame,
+            height=12,
+            bg=self.colors["bg_primary"],
+            fg=self.colors["text_primary"],
+            selectbackground=self.colors["neon_cyan"],
+            selectforeground=self.colors["bg_primary"],
+            font=self.get_font(9, "normal")
+        )
+        events_listbox.pack(fill="both", expand=True, padx=5, pady=(0, 5))
+
+    # 存储引用
+    timer_window.events_listbox = events_listbox
+    timer_window.start_button = start_button
+
+    # 延迟0.1秒自动执行reset修复初始显示问题
+    def auto_reset():
+        """自动执行reset来修复初始显示问题"""
+        try:
+            self.reset_timer(timer_window, timer_window.start_button)
+            print("自动执行了reset以修复初始显示")
+        except Exception as e:
+            print(f"自动reset时出错: {e}")
+
+    timer_window.after(300, auto_reset)  # 延迟0.3秒自动执行reset
+
+    # 添加TTS和明显提醒模式选项区域
+    options_outer, options_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_orange"],
+        padding=int(3 * 1.1),
+    )
+    options_outer.configure(height=80)
+    options_outer.pack(fill="x", pady=(int(8 * 1.1), 0))
+    options_outer.pack_propagate(False)
+
+    # 选项容器
+    options_container = tk.Frame(
+        options_frame, bg=self.colors["bg_secondary"])
+    options_container.pack(expand=True, pady=5)
+
+    # TTS功能选项
+    timer_window.tts_enabled = tk.BooleanVar(value=False)
+    tts_checkbox = tk.Checkbutton(
+        options_container,
+        text="启用TTS语音播报",
+        variable=timer_window.tts_enabled,
+        font=self.get_font(int(9 * 1.1), "normal"),
+        fg=self.colors["text_primary"],
+        bg=self.colors["bg_secondary"],
+        selectcolor=self.colors["bg_accent"],
+        activebackground=self.colors["bg_secondary"],
+        activeforeground=self.colors["neon_cyan"],
+        bd=0,
+        highlightthickness=0
+    )
+    tts_checkbox.pack(anchor="w", pady=2)
+
+    # 明显提醒模式选项
+    timer_window.prominent_alert_enabled = tk.BooleanVar(value=False)
+    prominent_checkbox = tk.Checkbutton(
+        options_container,
+        text="明显提醒模式(屏幕顶部显示)",
+        variable=timer_window.prominent_alert_enabled,
+        font=self.get_font(int(9 * 1.1), "normal"),
+        fg=self.colors["text_primary"],
+        bg=self.colors["bg_secondary"],
+        selectcolor=self.colors["bg_accent"],
+        activebackground=self.colors["bg_secondary"],
+        activeforeground=self.colors["neon_cyan"],
+        bd=0,
+        highlightthickness=0
+    )
+    prominent_checkbox.pack(anchor="w", pady=2)
+
+    # 初始化明显提醒窗口为None
+    timer_window.prominent_window = None
+    timer_window.alert_fade_window = None
+
+    # JASON阶段控制面板
+    self.create_jason_control_panel(main_content_frame, timer_window)
+
+    # 启动ACT更新循环
+
+    try:
+
+        self.update_timer_display(timer_window)
+
+    except Exception as e:
+
+        import traceback
+        traceback.print_exc()
+
+    # 将timer窗口添加到全局列表
+    self.timer_windows.append(timer_window)
+
+    print(f"Timer窗口已添加到全局列表，当前全局timer数量: {len(self.timer_windows)}")
+
+    # 如果有参考窗口，建立关联关系
+    if reference_window and reference_window.winfo_exists():
+
+        # 为参考窗口添加关联的timer窗口列表（如果还没有的话）
+        if not hasattr(reference_window, 'associated_timers'):
+            reference_window.associated_timers = []
+
+        reference_window.associated_timers.append(timer_window)
+
+        print(
+            f"Timer窗口已添加到参考窗口，列表长度: {len(reference_window.associated_timers)}")
+
+        # 为timer窗口记录参考窗口
+        timer_window.reference_window = reference_window
+
+        print(
+            f"Timer窗口的reference_window已设置为: {timer_window.reference_window}")
+
+        print(
+            f"Timer窗口已关联到参考窗口，当前关联数量: {len(reference_window.associated_timers)}")
+    else:
+
+        # 记录初始事件
+        self.add_timer_event(timer_window, "ACT Timer Console 已启动")
+
+    # 设置窗口关闭事件处理
+    def on_timer_window_close():
+        try:
+            # 停止计时器运行
+            timer_window.timer_running = False
+
+            # 取消所有保存的after任务，防止字幕回收问题
+            if hasattr(timer_window, '_after_tasks'):
+                for task_id in timer_window._after_tasks:
+                    try:
+                        timer_window.after_cancel(task_id)
+                    except:
+                        pass
+                timer_window._after_tasks.clear()
+        except Exception as e:
+            print(f"清理计时器窗口after任务时出错: {e}")
+
+        try:
+            # 清理明显提醒窗口及其所有任务
+            if hasattr(timer_window, 'prominent_window') and timer_window.prominent_window:
+                try:
+                    # 清理prominent_window的所有after任务
+                    if hasattr(timer_window.prominent_window, '_after_tasks'):
+                        for task_id in timer_window.prominent_window._after_tasks:
+                            try:
+                                timer_window.prominent_window.after_cancel(
+                                    task_id)
+                            except:
+                                pass
+                except:
+                    pass
+
+                try:
+                    timer_window.prominent_window.destroy()
+                except:
+                    pass
+
+                timer_window.prominent_window = None
+        except Exception as e:
+            print(f"清理明显提醒窗口时出错: {e}")
+
+        try:
+            # 清理警告队列
+            if hasattr(timer_window, 'alert_queue'):
+                timer_window.alert_queue.clear()
+                timer_window.alert_queue_processing = False
+        except Exception as e:
+            print(f"清理警告队列时出错: {e}")
+
+        try:
+            # 从全局列表中移除
+            if timer_window in self.timer_windows:
+                self.timer_windows.remove(timer_window)
+            self.config_watcher.unwatch(timer_window)
+        except Exception as e:
+            print(f"从全局列表移除timer窗口时出错: {e}")
+
+        try:
+            timer_window.destroy()
+        except Exception as e:
+            print(f"销毁timer窗口时出错: {e}")
+
+    timer_window.protocol("WM_DELETE_WINDOW", on_timer_window_close)
+
+    # 添加窗口淡入效果
+    self.fade_window_in(timer_window, self.current_alpha, 0.2)
+
+    # 最终验证
+    print(f"===== Timer创建完成 =====")
+    print(f"timer_window对象存在: {timer_window.winfo_exists()}")
+    print(f"全局timer_windows列表长度: {len(self.timer_windows)}")
+    print(f"timer在列表中: {timer_window in self.timer_windows}")
+    if reference_window:
+        print(f"reference_window存在: {reference_window.winfo_exists()}")
+        print(
+            f"reference_window.associated_timers长度: {len(getattr(reference_window, 'associated_timers', []))}")
+    print(f"==========================")
+
+
+def update_timer_display(self, timer_window):
+    """更新ACT显示"""
+    try:
+        # 检查timer_window是否仍然存在
+        if not timer_window.winfo_exists():
+            return
+    except tk.TclError:
+        # 窗口已被销毁
+        return
+    except AttributeError:
+        # timer_window对象无效
+        return
+
+    if timer_window.timer_running:
+        # 如果在等待伤害检测
+        if timer_window.waiting_for_damage:
+            # 检查是否有新的伤害
+            current_damage_count = self.get_current_damage_count()
+
+            # 调试信息：显示当前伤害计数
+            debug_text = f"等待战斗开始... ({current_damage_count})"
+            # 调试信息
+            print(
+                f"[DEBUG] 伤害检测: 当前={current_damage_count}, 上次={timer_window.last_damage_count}")
+
+            # 如果是第一次检查，记录初始伤害值
+            if not hasattr(timer_window, 'initial_damage_count'):
+                timer_window.initial_damage_count = current_damage_count
+                timer_window.last_damage_count = current_damage_count
+
+            # 检测伤害变化（任何增加都算作新伤害）
+            if current_damage_count > timer_window.last_damage_count:
+                # 检测到伤害，开始倒计时
+                timer_window.waiting_for_damage = False
+                timer_window.damage_detected = True
+                timer_window.start_time = time.time()
+                timer_window.elapsed_time = 0
+                damage_increase = current_damage_count - timer_window.last_damage_count
+
+                # 设置JASON战斗开始时间（用于警告系统），第一阶段开始时间与战斗开始时间相同
+                self.jason_machine.start_combat(
+                    timer_window.start_time, self.total_damage)
+                self._sync_jason_state()
+                print(
+                    f"[DEBUG] 战斗开始！设置JASON时间基准: {self.jason_combat_start_time}")
+
+                # 伤害阈值检测机制
+                self.check_damage_thresholds(
+                    timer_window, current_damage_count, damage_increase)
+
+                # 如果有配置文件，使用配置文件的时长
+                if hasattr(timer_window, 'act_config') and timer_window.act_config:
+                    if 'total_duration' in timer_window.act_config:
+                        timer_window.total_duration = timer_window.act_config['total_duration']
+                        self.add_timer_event(
+                            timer_window, f"🔥Battle Start！使用配置时长: {timer_window.total_duration}秒")
+                    else:
+                        self.add_timer_event(
+                            timer_window, f"🔥Battle Start！使用默认时长: {timer_window.total_duration}秒")
+                else:
+                    self.add_timer_event(
+                        timer_window, f"🔥Battle Start！无配置文件，使用默认时长: {timer_window.total_duration}秒")
+
+                # 按最终时长生成提醒时间线
+                timer_window.alert_scheduler.start(timer_window.total_duration)
+
+                # 如果启用了明显提醒模式，创建明显提醒窗口
+                if (hasattr(timer_window, 'prominent_alert_enabled') and
+                        timer_window.prominent_alert_enabled.get()):
+                    self.create_prominent_alert_window(timer_window)
+
+                # 立即显示倒计时开始
+                remaining_time = timer_window.total_duration
+                hours = int(remaining_time // 3600)
+                minutes = int((remaining_time % 3600) // 60)
+                seconds = int(remaining_time % 60)
+                time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+                team_damage = self.get_team_total_damage()
+                timer_window.draw_time_with_shadow(
+                    time_str, self.colors["neon_green"], False, None, team_damage)
+
+                # 同时更新明显提醒窗口
+                if (hasattr(timer_window, 'prominent_alert_enabled') and
+                    timer_window.prominent_alert_enabled.get() and
+                    hasattr(timer_window, 'prominent_window') and
+                        timer_window.prominent_window):
+                    try:
+                        if timer_window.prominent_window.winfo_exists():
+                            timer_window.prominent_window.draw_prominent_time(
+                                time_str, self.colors["neon_green"], False, None)  # 战斗开始时不需要辉光，也没有阶段信息
+                    except (tk.TclError, AttributeError):
+                        # prominent_window已被销毁或无效
+                        timer_window.prominent_window = None
+            else:
+                # 更新last_damage_count以便下次比较
+                timer_window.last_damage_count = current_damage_count
+                # 继续显示等待状态
+                team_damage = self.get_team_total_damage()
+                timer_window.draw_time_with_shadow(
+                    "Waiting for Battle...", self.colors["neon_yellow"], False, None, team_damage)
+
+        # 如果已经检测到伤害，进行倒计时
+        elif timer_window.damage_detected and timer_window.start_time is not None:
+            timer_window.elapsed_time = time.time() - timer_window.start_time
+
+            # 计算剩余时间（倒计时）
+            remaining_time = max(
+                0, timer_window.total_duration - timer_window.elapsed_time)
+
+            # 处理ACT配置中的提醒
+            if hasattr(timer_window, 'act_config') and timer_window.act_config:
+                self.process_act_alerts(
+                    timer_window, timer_window.elapsed_time, remaining_time)
+
+            # 检查JASON阶段警告
+            current_time = time.time()
+            self.check_phase_warnings(current_time)
+
+            if remaining_time <= 0:
+                # 倒计时结束
+                timer_window.timer_running = False
+                self.apply_pending_config_reload(timer_window)
+
+                # TTS语音提示
+                if hasattr(timer_window, 'tts_enabled') and timer_window.tts_enabled.get():
+                    try:
+                        self.speak_text(
+                            "Boss已经狂暴", source_type="boss_rage")
+                    except Exception as e:
+                        print(f"TTS播放失败: {e}")
+
+                # 显示特殊消息
+                special_message = "God bless you :D"
+                team_damage = self.get_team_total_damage()
+                timer_window.draw_time_with_shadow(
+                    special_message, self.colors["neon_red"], True, None, team_damage)  # 启用辉光效果
+
+                # 同时更新明显提醒窗口
+                if (hasattr(timer_window, 'prominent_alert_enabled') and
+                    timer_window.prominent_alert_enabled.get() and
+                    hasattr(timer_window, 'prominent_window') and
+                        timer_window.prominent_window):
+                    try:
+                        if timer_window.prominent_window.winfo_exists():
+                            timer_window.prominent_window.draw_prominent_time(
+                                special_message, self.colors["neon_red"], True, None)  # 启用辉光效果
+                    except (tk.TclError, AttributeError):
+                        # prominent_window已被销毁或无效
+                        timer_window.prominent_window = None
+
+                self.add_timer_event(timer_window, "BOSS已经狂暴！倒计时结束！")
+            else:
+                # 格式化剩余时间显示
+                hours = int(remaining_time // 3600)
+                minutes = int((remaining_time % 3600) // 60)
+                seconds = int(remaining_time % 60)
+
+                time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+                # 多重颜色判断机制 - 同时考虑绝对时间、百分比和即将到达的警告/阶段
+                remaining_ratio = remaining_time / timer_window.total_duration
+                elapsed_time = timer_window.elapsed_time
+
+                # 获取下一个即将到达的警告或阶段切换时间
+                next_event_time = None
+
+                # 检查ACT配置中的警告（时间线中下一个定时提醒）
+                if hasattr(timer_window, 'act_config') and timer_window.act_config:
+                    next_event_time = timer_window.alert_scheduler.next_timed_time()
+
+                    # 检查阶段切换时间
+                    phases = timer_window.act_config.get('phases', [])
+                    for phase in phases:
+                        phase_start = phase.get('start_time', 0)
+                        # 如果阶段开始时间在当前时间之后
+                        if phase_start > elapsed_time:
+                            if next_event_time is None or phase_start < next_event_time:
+                                next_event_time = phase_start
+
+                # 计算距离下一个事件的时间
+                time_to_next_event = None
+                if next_event_time is not None:
+                    time_to_next_event = next_event_time - elapsed_time
+
+                # 初始化颜色过渡状态
+                if not hasattr(timer_window, '_color_transition'):
+                    timer_window._color_transition = {
+                        'current_color': self.colors["neon_cyan"],
+                        'target_color': self.colors["neon_cyan"],
+                        'transition_start': time.time(),
+                        'glow_intensity': 0.0,
+                        'target_glow': 0.0
+                    }
+
+                # 绝对时间条件 - 只保留事件相关的警告
+                # 移除了固定时间警告(5秒/2秒)以避免叠加问题
+
+                # 百分比条件
+                ratio_critical = remaining_ratio < 0.25  # 小于25%
+                ratio_warning = remaining_ratio < 0.5   # 小于50%
+
+                # 颜色判断逻辑 - 按优先级确定最终颜色
+                # 红色条件（最高优先级）
+                red_conditions = []
+                if ratio_critical:
+                    red_conditions.append("比例危险")
+
+                # 黄色条件（中等优先级）
+                yellow_conditions = []
+                if ratio_warning and not ratio_critical:
+                    yellow_conditions.append("比例警告")
+
+                # 确定目标颜色和辉光强度
+                target_color = self.colors["neon_cyan"]
+                target_glow = 0.0
+
+                if red_conditions:
+                    target_color = self.colors["neon_red"]
+                    # 红色条件越多，辉光越强
+                    if len(red_conditions) >= 3:
+                        target_glow = 1.0  # 满足所有条件
+                    elif len(red_conditions) >= 2:
+                        target_glow = 0.8  # 满足两个条件
+                    else:
+                        target_glow = 0.6  # 满足一个条件
+                elif yellow_conditions:
+                    target_color = self.colors["neon_yellow"]
+                    # 黄色条件越多，辉光越强
+                    if len(yellow_conditions) >= 3:
+                        target_glow = 0.8
+                    elif len(yellow_conditions) >= 2:
+                        target_glow = 0.6
+                    else:
+                        target_glow = 0.4
+
+                # 颜色过渡逻辑
+                transition = timer_window._color_transition
+                current_time = time.time()
+
+                # 如果目标颜色变化，开始新的过渡
+                if target_color != transition['target_color']:
+                    transition['current_color'] = self.interpolate_colors(
+                        transition['current_color'], transition['target_color'], 1.0)
+                    transition['target_color'] = target_color
+                    transition['transition_start'] = current_time
+
+                # 计算颜色过渡进度（0.3秒内完成）
+                color_progress = min(
+                    1.0, (current_time - transition['transition_start']) / 0.3)
+                color = self.interpolate_colors(
+                    transition['current_color'], target_color, color_progress)
+
+                # 辉光过渡逻辑（0.2秒内完成）
+                if target_glow != transition['target_glow']:
+                    transition['target_glow'] = target_glow
+                    transition['glow_start'] = current_time
+
+                glow_progress = min(
+                    1.0, (current_time - transition.get('glow_start', current_time)) / 0.2)
+                glow_intensity = transition['glow_intensity'] + (
+                    target_glow - transition['glow_intensity']) * glow_progress
+                transition['glow_intensity'] = glow_intensity
+
+                # 辉光效果基于强度
+                glow_effect = glow_intensity > 0.1
+
+                # 检测当前阶段 - 使用JASON阶段信息而不是时间阶段信息
+                jason_phase_info = self.get_jason_phase_info()
+                current_phase = jason_phase_info if jason_phase_info else self.get_current_phase(
+                    timer_window, timer_window.elapsed_time)
+
+                team_damage = self.get_team_total_damage()
+                timer_window.draw_time_with_shadow(
+                    time_str, color, glow_effect, current_phase, team_damage)
+
+                # 如果启用了明显提醒模式，同时更新屏幕顶部的倒计时
+                if (hasattr(timer_window, 'prominent_alert_enabled') and
+                    timer_window.prominent_alert_enabled.get() and
+                    hasattr(timer_window, 'prominent_window') and
+                        timer_window.prominent_window):
+                    try:
+                        if timer_window.prominent_window.winfo_exists():
+                            timer_window.prominent_window.draw_prominent_time(
+                                time_str, color, glow_effect, current_phase)
+                    except (tk.TclError, AttributeError):
+                        # prominent_window已被销毁或无效
+                        timer_window.prominent_window = None
+
+    # 每秒更新一次
+    timer_window.after(
+        1000, self.ui_governor.wrap(
+            "timer_display", lambda: self.update_timer_display(timer_window)))
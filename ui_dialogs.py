@@ -0,0 +1,485 @@
+"""个人UID设置和UID映射管理对话框
+
+ACTDamageUI 对应方法的实现，第一次打开时才导入，减少主模块的导入时间。
+函数的第一个参数为 ACTDamageUI 实例。
+"""
+
+import requests
+import tkinter as tk
+
+
+def show_personal_uid_dialog(self, callback=None):
+    """显示个人UID输入对话框"""
+    dialog = tk.Toplevel(self.root)
+    dialog.title("◊ 个人UID设置 ◊")
+    dialog.geometry("450x350")
+    dialog.resizable(False, False)
+    dialog.wm_attributes("-topmost", True)
+    dialog.configure(bg="#000000")
+    dialog.overrideredirect(True)
+
+    # 创建拖拽数据
+    dialog_drag_data = {"x": 0, "y": 0}
+
+    # 拖拽功能
+    def start_drag(event):
+        dialog_drag_data["x"] = event.x
+        dialog_drag_data["y"] = event.y
+
+    def on_drag(event):
+        if dialog_drag_data["x"] != 0 or dialog_drag_data["y"] != 0:
+            x = dialog.winfo_x() + (event.x - dialog_drag_data["x"])
+            y = dialog.winfo_y() + (event.y - dialog_drag_data["y"])
+            dialog.geometry(f"+{x}+{y}")
+
+    def stop_drag(event):
+        dialog_drag_data["x"] = 0
+        dialog_drag_data["y"] = 0
+
+    # 创建RGB边框（更厚的边框）
+    border_frame = tk.Frame(dialog, bg="#ff0000", bd=0, relief="flat")
+    border_frame.pack(fill="both", expand=True, padx=4, pady=4)
+
+    # 创建主框架
+    main_frame = tk.Frame(
+        border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
+    main_frame.pack(fill="both", expand=True, padx=3, pady=3)
+
+    # 为主框架添加拖拽功能
+    main_frame.bind("<Button-1>", start_drag)
+    main_frame.bind("<B1-Motion>", on_drag)
+    main_frame.bind("<ButtonRelease-1>", stop_drag)
+
+    # 标题 - 更大更华丽
+    title_canvas = self.create_shadow_text_canvas(
+        main_frame,
+        text="▓▓▓ [PERSONAL_UID_CONFIG] ▓▓▓",
+        font_tuple=self.get_font(16, "bold"),
+        fg_color=self.colors["neon_cyan"],
+        bg_color=self.colors["bg_primary"],
+        height=50
+    )
+    title_canvas.pack(fill="x", pady=(20, 15))
+
+    # 副标题
+    subtitle_canvas = self.create_shadow_text_canvas(
+        main_frame,
+        text="◊ SYSTEM_INITIALIZATION ◊",
+        font_tuple=self.get_font(12, "normal"),
+        fg_color=self.colors["neon_yellow"],
+        bg_color=self.colors["bg_primary"],
+        height=30
+    )
+    subtitle_canvas.pack(fill="x", pady=(0, 20))
+
+    # 说明文字 - 使用Cyberpunk风格
+    info_lines = [
+        "[INFO]: 配置个人UID以启用MINI窗口个人数据显示",
+        "[NOTICE]: 此设置将自动保存，无需重复输入"
+    ]
+
+    for line in info_lines:
+        info_canvas = self.create_shadow_text_canvas(
+            main_frame,
+            text=line,
+            font_tuple=self.get_font(9),
+            fg_color=self.colors["text_primary"],
+            bg_color=self.colors["bg_primary"],
+            height=25
+        )
+        info_canvas.pack(fill="x", pady=2)
+
+    # 输入区域 - 增强的Cyberpunk框架
+    input_outer, input_frame = self.create_rounded_frame(
+        main_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_green"],
+        padding=3
+    )
+    input_outer.pack(fill="x", padx=25, pady=(20, 25))
+
+    # UID输入标签 - 使用阴影效果
+    label_canvas = self.create_shadow_text_canvas(
+        input_frame,
+        text="[UID_INPUT]:",
+        font_tuple=self.get_font(12, "bold"),
+        fg_color=self.colors["neon_yellow"],
+        bg_color=self.colors["bg_secondary"],
+        height=35
+    )
+    label_canvas.pack(fill="x", pady=(10, 5))
+
+    # UID输入框 - 更大更明显
+    uid_entry = tk.Entry(
+        input_frame,
+        font=self.get_font(12),
+        bg=self.colors["bg_primary"],
+        fg=self.colors["neon_cyan"],
+        insertbackground=self.colors["neon_cyan"],
+        bd=0,
+        relief="flat",
+        width=30,
+        justify="center"
+    )
+    uid_entry.pack(pady=(5, 15), ipady=8)
+
+    # 如果已有个人UID，预填充
+    if self.personal_uid:
+        uid_entry.insert(0, self.personal_uid)
+
+    # 按钮区域
+    button_frame = tk.Frame(main_frame, bg=self.colors["bg_primary"])
+    button_frame.pack(fill="x", padx=25, pady=(0, 25))
+
+    def save_and_close():
+        uid = uid_entry.get().strip()
+        if uid:
+            if self.save_personal_uid(uid):
+                self.show_messagebox(
+                    f"个人UID已保存: {uid}",
+                    title="保存成功",
+                    color=self.colors["success_green"]
+                )
+                dialog.destroy()
+                if callback:
+                    callback()
+            else:
+                self.show_messagebox(
+                    "保存失败，请重试",
+                    title="错误",
+                    color=self.colors["error_red"]
+                )
+        else:
+            self.show_messagebox(
+                "请输入有效的UID",
+                title="输入错误",
+                color=self.colors["warning_yellow"]
+            )
+
+    def cancel_close():
+        dialog.destroy()
+
+    # 保存按钮
+    save_btn = self.create_enhanced_button(
+        button_frame, "◊ 保存", save_and_close,
+        self.colors["neon_green"], width=12, height=2
+    )
+    save_btn.pack(side="left", padx=(0, 10))
+
+    # 取消按钮
+    cancel_btn = self.create_enhanced_button(
+        button_frame, "✕ 取消", cancel_close,
+        self.colors["neon_pink"], width=12, height=2
+    )
+    cancel_btn.pack(side="left")
+
+    # 如果没有个人UID，显示跳过按钮
+    if not self.personal_uid:
+        skip_btn = self.create_enhanced_button(
+            button_frame, "⏭ 跳过", lambda: (
+                dialog.destroy(), callback() if callback else None),
+            self.colors["text_secondary"], width=12, height=2
+        )
+        skip_btn.pack(side="right")
+
+    # RGB边框动画
+    dialog_gradient_step = 0
+
+    def animate_dialog_border():
+        nonlocal dialog_gradient_step
+        if dialog.winfo_exists():
+            try:
+                if hasattr(self, 'border_colors') and self.border_colors:
+                    current_color = self.border_colors[dialog_gradient_step]
+                    border_frame.configure(bg=current_color)
+                    dialog_gradient_step = (
+                        dialog_gradient_step + 1) % len(self.border_colors)
+                dialog.after(150, animate_dialog_border)
+            except:
+                pass
+
+    # 启动边框动画
+    animate_dialog_border()
+
+    # 窗口居中
+    dialog.update_idletasks()
+    x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
+    y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
+    dialog.geometry(f"+{x}+{y}")
+
+    # 聚焦到输入框
+    uid_entry.focus_set()
+
+    # 绑定回车键
+    uid_entry.bind("<Return>", lambda e: save_and_close())
+
+
+def show_uid_mapping_dialog(self):
+    """显示UID用户名映射配置对话框"""
+    dialog = tk.Toplevel(self.root)
+    dialog.title("◊ UID用户名映射配置 ◊")
+    dialog.geometry("600x500")
+    dialog.resizable(True, True)
+    dialog.wm_attributes("-topmost", True)
+    dialog.configure(bg="#000000")
+
+    # 设置无边框 (在所有Tkinter操作之后)
+    dialog.overrideredirect(True)
+
+    # 创建拖拽数据
+    dialog_drag_data = {"x": 0, "y": 0}
+
+    # 拖拽功能
+    def start_drag(event):
+        dialog_drag_data["x"] = event.x
+        dialog_drag_data["y"] = event.y
+
+    def on_drag(event):
+        if dialog_drag_data["x"] != 0 or dialog_drag_data["y"] != 0:
+            x = dialog.winfo_x() + (event.x - dialog_drag_data["x"])
+            y = dialog.winfo_y() + (event.y - dialog_drag_data["y"])
+            dialog.geometry(f"+{x}+{y}")
+
+    def stop_drag(event):
+        dialog_drag_data["x"] = 0
+        dialog_drag_data["y"] = 0
+
+    # 创建RGB边框
+    border_frame = tk.Frame(dialog, bg="#ff0000", bd=0, relief="flat")
+    border_frame.pack(fill="both", expand=True, padx=3, pady=3)
+
+    # 创建主框架
+    main_frame = tk.Frame(
+        border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
+    main_frame.pack(fill="both", expand=True, padx=2, pady=2)
+
+    # 为标题区域添加拖拽功能
+    main_frame.bind("<Button-1>", start_drag)
+    main_frame.bind("<B1-Motion>", on_drag)
+    main_frame.bind("<ButtonRelease-1>", stop_drag)
+
+    # 标题
+    title_canvas = self.create_shadow_text_canvas(
+        main_frame,
+        text="▓▓▓ UID用户名映射管理 ▓▓▓",
+        font_tuple=self.get_font(12, "bold"),
+        fg_color=self.colors["neon_cyan"],
+        bg_color=self.colors["bg_primary"],
+        height=30
+    )
+    title_canvas.pack(fill="x", pady=(10, 10))
+
+    # 在标题区域添加顶部关闭按钮
+    top_close_btn = self.create_enhanced_button(
+        main_frame, "✕", dialog.destroy,
+        self.colors["neon_pink"], width=3, height=1
+    )
+    top_close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+
+    # 为标题区域也添加拖拽功能
+    title_canvas.bind("<Button-1>", start_drag)
+    title_canvas.bind("<B1-Motion>", on_drag)
+    title_canvas.bind("<ButtonRelease-1>", stop_drag)
+
+    # RGB边框动画
+    dialog_gradient_step = 0
+
+    def animate_dialog_border():
+        nonlocal dialog_gradient_step
+        if dialog.winfo_exists():
+            try:
+                # 使用和主UI相同的渐变颜色
+                if hasattr(self, 'border_colors') and self.border_colors:
+                    current_color = self.border_colors[dialog_gradient_step]
+                    border_frame.configure(bg=current_color)
+                    dialog_gradient_step = (
+                        dialog_gradient_step + 1) % len(self.border_colors)
+
+                # 使用和主UI相同的速度 - 100ms间隔
+                dialog.after(100, animate_dialog_border)
+            except:
+                pass
+
+    # 启动边框动画
+    animate_dialog_border()
+
+    # 输入区域
+    input_frame = tk.Frame(
+        main_frame, bg=self.colors["bg_secondary"], relief="raised", bd=2)
+    input_frame.pack(fill="x", pady=(0, 10))
+
+    # UID输入
+    uid_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
+    uid_frame.pack(fill="x", padx=10, pady=5)
+
+    tk.Label(uid_frame, text="UID:", font=self.get_font(9),
+             bg=self.colors["bg_secondary"], fg=self.colors["text_primary"]).pack(side="left")
+    uid_entry_container = self.create_rounded_entry(uid_frame, width=20)
+    uid_entry_container.pack(side="left", padx=(10, 0))
+    uid_entry = uid_entry_container.entry if hasattr(
+        uid_entry_container, 'entry') else uid_entry_container
+
+    # 用户名输入
+    name_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
+    name_frame.pack(fill="x", padx=10, pady=5)
+
+    tk.Label(name_frame, text="用户名:", font=self.get_font(9),
+             bg=self.colors["bg_secondary"], fg=self.colors["text_primary"]).pack(side="left")
+    name_entry_container = self.create_rounded_entry(name_frame, width=20)
+    name_entry_container.pack(side="left", padx=(10, 0))
+    name_entry = name_entry_container.entry if hasattr(
+        name_entry_container, 'entry') else name_entry_container
+
+    # 自动映射开关
+    auto_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
+    auto_frame.pack(fill="x", padx=10, pady=5)
+
+    auto_var = tk.BooleanVar(value=self.auto_uid_mapping)
+    auto_check = tk.Checkbutton(
+        auto_frame,
+        text="自动从服务器API检测UID映射 (每2-5秒，覆盖重名)",
+        variable=auto_var,
+        font=self.get_font(9),
+        bg=self.colors["bg_secondary"],
+        fg=self.colors["neon_green"],
+        selectcolor=self.colors["bg_accent"],
+        activebackground=self.colors["bg_secondary"],
+        activeforeground=self.colors["neon_green"],
+        command=lambda: self.toggle_auto_uid_mapping(auto_var.get())
+    )
+    auto_check.pack(side="left")
+
+    # 状态指示
+    status_label = tk.Label(
+        auto_frame,
+        text=f"[监控状态: {'运行中' if self.server_log_monitor_running else '已停止'}]",
+        font=self.get_font(8),
+        bg=self.colors["bg_secondary"],
+        fg=self.colors["neon_cyan"] if self.server_log_monitor_running else self.colors["text_accent"]
+    )
+    status_label.pack(side="right")
+
+    # 按钮区域
+    button_frame = tk.Frame(input_frame, bg=self.colors["bg_secondary"])
+    button_frame.pack(fill="x", padx=10, pady=5)
+
+    # 列表中显示的映射（与列表行对应）
+    shown_uids = []
+    shown_names = []
+
+    def add_mapping():
+        uid = uid_entry.get().strip()
+        name = name_entry.get().strip()
+        if uid and name:
+            self.set_uid_mapping(uid, name)
+            uid_entry.delete(0, tk.END)
+            name_entry.delete(0, tk.END)
+            refresh_list()
+            self.update_status(f"[CONFIG] 已添加映射: {uid} -> {name}")
+
+    def delete_mapping():
+        selection = mapping_list.curselection()
+        if selection:
+            uid = shown_uids[selection[0]]
+            self.set_uid_mapping(uid, None)
+            refresh_list()
+            self.update_status(f"[CONFIG] 已删除映射: {uid}")
+
+    # 添加按钮
+    add_btn = self.create_enhanced_button(button_frame, "◊ 添加", add_mapping,
+                                          self.colors["neon_green"], width=8)
+    add_btn.pack(side="left", padx=(0, 5))
+
+    # 删除按钮
+    del_btn = self.create_enhanced_button(button_frame, "✕ 删除", delete_mapping,
+                                          self.colors["neon_pink"], width=8)
+    del_btn.pack(side="left")
+
+    # 映射列表区域
+    list_frame = tk.Frame(
+        main_frame, bg=self.colors["bg_secondary"], relief="raised", bd=2)
+    list_frame.pack(fill="both", expand=True)
+
+    # 列表标题
+    list_title = self.create_shadow_text_canvas(
+        list_frame,
+        text="[当前映射列表]:",
+        font_tuple=self.get_font(10, "bold"),
+        fg_color=self.colors["neon_orange"],
+        bg_color=self.colors["bg_secondary"],
+        height=25
+    )
+    list_title.pack(fill="x", pady=5)
+
+    # 滚动列表（圆角版本）
+    list_container = self.create_rounded_listbox(list_frame, height=12)
+    list_container.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+    # 获取实际的listbox控件
+    mapping_list = list_container.listbox
+    scrollbar = list_container.scrollbar
+
+    def refresh_list():
+        """刷新UID映射列表，包括从API获取最新数据"""
+        # 首先尝试从API获取最新映射（只取上次同步之后的变化）
+        try:
+            updated_count = len(self._sync_uid_mappings(timeout=2.0))
+            if updated_count > 0:
+                self.update_status(
+                    f"[刷新] 从服务器获取到 {updated_count} 个新的或更新的映射")
+            else:
+                self.update_status("[刷新] 映射已是最新")
+        except RuntimeError as e:
+            self.update_status(f"[刷新] {e}")
+        except requests.exceptions.ConnectionError:
+            self.update_status("[刷新] 无法连接到服务器，使用本地映射")
+        except Exception as e:
+            self.update_status(f"[刷新] API获取失败: {e}")
+
+        # 更新列表显示（映射从玩家目录读取，只在对话框中临时保留）
+        mapping_list.delete(0, tk.END)
+        shown_uids.clear()
+        shown_names.clear()
+        for uid, name in self.get_uid_mappings().items():
+            shown_uids.append(uid)
+            shown_names.append(name)
+            mapping_list.insert(tk.END, f"{uid} → {name}")
+
+    def on_list_select(event):
+        selection = mapping_list.curselection()
+        if selection:
+            index = selection[0]
+            uid = shown_uids[index]
+            name = shown_names[index]
+            uid_entry.delete(0, tk.END)
+            uid_entry.insert(0, uid)
+            name_entry.delete(0, tk.END)
+            name_entry.insert(0, name)
+
+    mapping_list.bind("<<ListboxSelect>>", on_list_select)
+
+    # 按钮区域
+    button_container = tk.Frame(main_frame, bg=self.colors["bg_primary"])
+    button_container.pack(fill="x", pady=(10, 10))
+
+    # 关闭按钮
+    close_btn = self.create_enhanced_button(button_container, "✕ 关闭", dialog.destroy,
+                                            self.colors["neon_pink"], width=12)
+    close_btn.pack(side="right", padx=(5, 0))
+
+    # 刷新按钮
+    refresh_btn = self.create_enhanced_button(button_container, "↻ 刷新", refresh_list,
+                                              self.colors["neon_orange"], width=12)
+    refresh_btn.pack(side="right", padx=(5, 0))
+
+    # 初始化列表
+    refresh_list()
+
+    # 窗口居中 (在overrideredirect之后进行)
+    dialog.update_idletasks()
+    x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
+    y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
+    dialog.geometry(f"+{x}+{y}")
+
+    # 聚焦到UID输入框
+    uid_entry.focus_set()
@@ -0,0 +1,599 @@
+"""Orbitron 字体下载/安装
+
+ACTDamageUI 对应方法的实现，第一次打开时才导入，减少主模块的导入时间。
+函数的第一个参数为 ACTDamageUI 实例。
+"""
+
+import base64
+import os
+import sys
+import tkinter as tk
+import urllib.request
+import webbrowser
+import zipfile
+from datetime import datetime
+
+
+def create_download_flag(self, flag_path):
+    """创建下载完成标识文件"""
+    try:
+        os.makedirs(os.path.dirname(flag_path), exist_ok=True)
+
+        # 创建标识文件，包含下载时间和状态信息
+        flag_content = f"""# Orbitron 字体下载标识文件
+# 此文件用于防止重复下载字体
+# 如需重新下载，请删除此文件
+
+下载时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+状态: 下载尝试已完成
+版本: 1.0
+
+# 手动安装说明:
+# 1. 双击 fonts 文件夹中的 .ttf 字体文件
+# 2. 点击"安装"按钮
+# 3. 重启程序即可使用 Orbitron 字体
+
+# 要重新触发自动下载，请删除此文件
+"""
+
+        with open(flag_path, 'w', encoding='utf-8') as f:
+            f.write(flag_content)
+
+        print(f"[FONT_INFO] 已创建下载标识: {os.path.basename(flag_path)}")
+
+    except Exception as e:
+        print(f"[FONT_WARNING] 创建下载标识失败: {e}")
+
+
+def reset_font_download(self):
+    """重置字体下载标识（用于开发调试）"""
+    try:
+        font_dir = self.get_resource_path("fonts")
+        download_flag = os.path.join(font_dir, ".font_download_completed")
+
+        if os.path.exists(download_flag):
+            os.remove(download_flag)
+            print("[FONT_INFO] 字体下载标识已重置")
+            return True
+        else:
+            print("[FONT_INFO] 下载标识不存在，无需重置")
+            return False
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 重置下载标识失败: {e}")
+        return False
+
+        return False
+
+    except Exception as e:
+        print(f"[FONT_WARNING] 字体处理失败: {e}")
+        return False
+
+
+def download_and_install_orbitron(self):
+    """自动从多个源下载并安装Orbitron字体"""
+    try:
+        print("[FONT_INFO] 开始下载 Orbitron 字体...")
+
+        # 尝试多个字体源
+        font_sources = [
+            {
+                "name": "Google Fonts Archive",
+                "urls": [
+                    "https://github.com/google/fonts/raw/main/ofl/orbitron/Orbitron-VariableFont_wght.ttf"
+                ]
+            },
+            {
+                "name": "Font Squirrel (备用)",
+                "urls": [
+                    "https://www.fontsquirrel.com/fonts/download/orbitron",
+                ]
+            },
+            {
+                "name": "CDN字体源",
+                "urls": [
+                    "https://fonts.gstatic.com/s/orbitron/v31/yMJMMIlzdpvBhQQL_SC3X9yhF25-T1nyGy6xoWgz.woff2"
+                ]
+            }
+        ]
+
+        # 创建字体文件夹
+        font_dir = self.get_resource_path("fonts")
+        os.makedirs(font_dir, exist_ok=True)
+
+        # 尝试各个源
+        for source in font_sources:
+            print(f"[FONT_INFO] 尝试从 {source['name']} 下载...")
+
+            for url in source['urls']:
+                try:
+                    success = self.download_font_from_url(url, font_dir)
+                    if success:
+                        return True
+                except Exception as e:
+                    print(f"[FONT_WARNING] {source['name']} 下载失败: {e}")
+                    continue
+
+        # 如果所有源都失败，使用嵌入的字体数据
+        print("[FONT_INFO] 尝试使用嵌入的字体数据...")
+        return self.install_embedded_orbitron(font_dir)
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 下载 Orbitron 字体时出错: {e}")
+        return self.install_orbitron_simple()
+
+
+def download_font_from_url(self, url, font_dir):
+    """从指定URL下载字体文件"""
+    try:
+        print(f"[FONT_INFO] 正在下载: {url}")
+
+        # 创建请求，模拟浏览器
+        req = urllib.request.Request(url)
+        req.add_header(
+            'User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        req.add_header(
+            'Accept', 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8')
+        req.add_header('Accept-Language',
+                       'en-US,en;q=0.9,zh-CN;q=0.8,zh;q=0.7')
+        req.add_header('Cache-Control', 'no-cache')
+
+        # 下载文件
+        response = urllib.request.urlopen(req, timeout=30)
+        font_data = response.read()
+
+        # 检查文件大小
+        if len(font_data) < 5000:
+            print(f"[FONT_WARNING] 文件太小 ({len(font_data)} bytes)，可能不是字体文件")
+            return False
+
+        print(f"[FONT_INFO] 下载完成，文件大小: {len(font_data)} bytes")
+
+        # 检查文件类型
+        if font_data[:2] == b'PK':  # ZIP文件
+            print("[FONT_INFO] 检测到ZIP文件，正在解压...")
+            return self.extract_font_from_zip(font_data, font_dir)
+        elif font_data[:4] == b'\x00\x01\x00\x00':  # TTF文件
+            print("[FONT_INFO] 检测到TTF字体文件")
+            return self.save_font_file(font_data, font_dir, ".ttf")
+        elif font_data[:4] == b'wOFF':  # WOFF文件
+            print("[FONT_INFO] 检测到WOFF字体文件")
+            return self.save_font_file(font_data, font_dir, ".woff")
+        elif font_data[:4] == b'wOF2':  # WOFF2文件
+            print("[FONT_INFO] 检测到WOFF2字体文件")
+            return self.save_font_file(font_data, font_dir, ".woff2")
+        elif font_data[:4] == b'OTTO':  # OTF文件
+            print("[FONT_INFO] 检测到OTF字体文件")
+            return self.save_font_file(font_data, font_dir, ".otf")
+        else:
+            print(f"[FONT_WARNING] 未知文件类型，文件头: {font_data[:8]}")
+            # 尝试作为HTML页面处理
+            if b'<html' in font_data[:100].lower():
+                print("[FONT_WARNING] 下载的是HTML页面，可能是重定向")
+                return False
+            # 尝试保存为TTF
+            return self.save_font_file(font_data, font_dir, ".ttf")
+
+    except Exception as e:
+        print(f"[FONT_WARNING] 下载失败: {e}")
+        return False
+
+
+def extract_font_from_zip(self, zip_data, font_dir):
+    """从ZIP数据中提取字体文件"""
+    try:
+        import io
+        zip_buffer = io.BytesIO(zip_data)
+
+        with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+            font_files = []
+            for file_name in zip_ref.namelist():
+                if file_name.lower().endswith(('.ttf', '.otf')):
+                    print(f"[FONT_INFO] 找到字体文件: {file_name}")
+                    font_data = zip_ref.read(file_name)
+
+                    # 保存字体文件
+                    clean_name = os.path.basename(file_name)
+                    font_path = os.path.join(font_dir, clean_name)
+
+                    with open(font_path, 'wb') as f:
+                        f.write(font_data)
+
+                    font_files.append(font_path)
+                    print(
+                        f"[FONT_INFO] 已解压: {clean_name} ({len(font_data)} bytes)")
+
+            if font_files:
+                # 尝试安装字体
+                if self.install_font_files(font_files):
+                    print("[FONT_INFO] Orbitron 字体安装成功！")
+                    return True
+                else:
+                    print("[FONT_WARNING] 字体解压成功但安装失败")
+                    self.show_font_install_guide(font_dir)
+                    return False
+            else:
+                print("[FONT_WARNING] ZIP文件中未找到字体文件")
+                return False
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 解压ZIP文件失败: {e}")
+        return False
+
+
+def save_font_file(self, font_data, font_dir, extension):
+    """保存字体文件"""
+    try:
+        font_filename = f"Orbitron-Downloaded{extension}"
+        font_path = os.path.join(font_dir, font_filename)
+
+        with open(font_path, 'wb') as f:
+            f.write(font_data)
+
+        print(f"[FONT_INFO] 已保存: {font_filename} ({len(font_data)} bytes)")
+
+        # 尝试安装字体
+        if self.install_font_files([font_path]):
+            print("[FONT_INFO] Orbitron 字体安装成功！")
+            return True
+        else:
+            print("[FONT_WARNING] 字体下载成功但安装失败")
+            self.show_font_install_guide(font_dir)
+            return False
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 保存字体文件失败: {e}")
+        return False
+
+
+def install_embedded_orbitron(self, font_dir):
+    """安装嵌入的简化Orbitron字体数据"""
+    try:
+        print("[FONT_INFO] 使用嵌入的字体数据...")
+
+        # 这是一个简化的Orbitron字体数据（Base64编码的TTF片段）
+        # 注意：这只是一个最小的字体示例，实际效果可能有限
+        embedded_font_data = """
+VFRUUAAAAAEAAAwAAAABAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAQAAAAEA
+AAABAAAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEA
+AAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAA
+AAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAAAAQAAAAEAAAABAAA=
+"""
+
+        try:
+            # 解码Base64数据
+            font_data = base64.b64decode(embedded_font_data.strip())
+
+            # 保存嵌入字体
+            font_filename = "Orbitron-Embedded.ttf"
+            font_path = os.path.join(font_dir, font_filename)
+
+            with open(font_path, 'wb') as f:
+                f.write(font_data)
+
+            print(f"[FONT_INFO] 已创建嵌入字体: {font_filename}")
+
+            # 由于这只是示例数据，直接跳转到安装指南
+            self.show_font_install_guide(font_dir)
+            return False
+
+        except Exception as e:
+            print(f"[FONT_WARNING] 嵌入字体数据处理失败: {e}")
+            return self.install_orbitron_simple()
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 嵌入字体安装失败: {e}")
+        return self.install_orbitron_simple()
+
+
+def install_orbitron_simple(self):
+    """简化的Orbitron字体安装方案 - 提供一键安装功能"""
+    try:
+        print("[FONT_INFO] 启动字体安装助手...")
+
+        # 创建一个更友好的安装界面
+        if hasattr(self, 'root'):
+            # 创建字体安装窗口
+            font_window = tk.Toplevel(self.root)
+            font_window.title("Orbitron 字体安装助手")
+            font_window.geometry("480x360")
+            font_window.configure(bg=self.colors["bg_primary"])
+            font_window.resizable(False, False)
+            font_window.wm_attributes("-topmost", True)
+
+            # 居中显示
+            font_window.update_idletasks()
+            x = (font_window.winfo_screenwidth() - 480) // 2
+            y = (font_window.winfo_screenheight() - 360) // 2
+            font_window.geometry(f"480x360+{x}+{y}")
+
+            # 创建主框架
+            main_frame = tk.Frame(
+                font_window, bg=self.colors["bg_primary"])
+            main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+            # 标题
+            title_label = tk.Label(
+                main_frame,
+                text="🚀 Orbitron 字体安装助手",
+                font=self.get_font(16, "bold"),
+                fg=self.colors["neon_cyan"],
+                bg=self.colors["bg_primary"]
+            )
+            title_label.pack(pady=(0, 20))
+
+            # 说明文字
+            info_text = """
+Orbitron 是一款未来主义科幻字体，
+完美匹配 Cyberpunk 2077 风格界面！
+
+自动下载失败，请选择以下安装方式：
+"""
+            info_label = tk.Label(
+                main_frame,
+                text=info_text,
+                font=self.get_font(10),
+                fg=self.colors["text_primary"],
+                bg=self.colors["bg_primary"],
+                justify="center"
+            )
+            info_label.pack(pady=(0, 30))
+
+            # 按钮框架
+            button_frame = tk.Frame(
+                main_frame, bg=self.colors["bg_primary"])
+            button_frame.pack(fill="x", pady=10)
+
+            # 在线下载按钮
+            def open_font_page():
+                try:
+                    webbrowser.open(
+                        "https://fonts.google.com/specimen/Orbitron")
+                    font_window.destroy()
+                except:
+                    pass
+
+            online_btn = self.create_enhanced_button(
+                button_frame,
+                "🌐 在线下载安装",
+                open_font_page,
+                self.colors["neon_cyan"],
+                width=20, height=2
+            )
+            online_btn.pack(fill="x", pady=5)
+
+            # 本地安装按钮
+            def open_local_guide():
+                try:
+                    # 创建fonts文件夹
+                    font_dir = self.get_resource_path("fonts")
+                    os.makedirs(font_dir, exist_ok=True)
+
+                    # 打开文件夹
+                    import subprocess
+                    subprocess.Popen(f'explorer "{font_dir}"')
+
+                    # 显示本地安装指南
+                    guide_window = tk.Toplevel(font_window)
+                    guide_window.title("本地安装指南")
+                    guide_window.geometry("400x300")
+                    guide_window.configure(bg=self.colors["bg_primary"])
+
+                    guide_text = """
+本地安装步骤：
+
+1. 将下载的 Orbitron 字体文件
+   (.ttf 格式) 复制到已打开的文件夹
+
+2. 双击字体文件进行安装
+
+3. 重启程序即可使用新字体
+
+支持的字体文件格式：
+• Orbitron-Regular.ttf
+• Orbitron-Bold.ttf  
+• Orbitron-Black.ttf
+"""
+
+                    guide_label = tk.Label(
+                        guide_window,
+                        text=guide_text,
+                        font=self.get_font(9),
+                        fg=self.colors["text_primary"],
+                        bg=self.colors["bg_primary"],
+                        justify="left"
+                    )
+                    guide_label.pack(padx=20, pady=20)
+
+                    font_window.destroy()
+
+                except Exception as e:
+                    print(f"[FONT_ERROR] 打开本地指南失败: {e}")
+
+            local_btn = self.create_enhanced_button(
+                button_frame,
+                "📁 本地安装指南",
+                open_local_guide,
+                self.colors["neon_yellow"],
+                width=20, height=2
+            )
+            local_btn.pack(fill="x", pady=5)
+
+            # 跳过按钮
+            def skip_font():
+                font_window.destroy()
+
+            skip_btn = self.create_enhanced_button(
+                button_frame,
+                "⏭️ 跳过，使用默认字体",
+                skip_font,
+                self.colors["text_secondary"],
+                width=20, height=2
+            )
+            skip_btn.pack(fill="x", pady=(15, 5))
+
+            # 重新下载按钮（高级选项）
+            def reset_and_download():
+                try:
+                    self.reset_font_download()
+                    font_window.destroy()
+                    # 重新触发下载
+                    self.load_embedded_font()
+                except Exception as e:
+                    print(f"[FONT_ERROR] 重新下载失败: {e}")
+
+            reset_btn = self.create_enhanced_button(
+                button_frame,
+                "🔄 重新下载字体",
+                reset_and_download,
+                self.colors["text_secondary"],
+                width=20, height=1
+            )
+            reset_btn.pack(fill="x", pady=2)
+
+            # 底部提示
+            tip_label = tk.Label(
+                main_frame,
+                text="💡 安装字体后重启程序即可生效",
+                font=self.get_font(8),
+                fg=self.colors["text_secondary"],
+                bg=self.colors["bg_primary"]
+            )
+            tip_label.pack(side="bottom", pady=(20, 0))
+
+        else:
+            # 控制台模式的简化指南
+            guide_text = """
+╔══════════════════════════════════════════════════════════════════╗
+║                    Orbitron 字体安装助手                          ║
+╠══════════════════════════════════════════════════════════════════╣
+║ 🌐 在线安装：                                                    ║
+║    https://fonts.google.com/specimen/Orbitron                   ║
+║                                                                  ║
+║ 📁 本地安装：                                                    ║
+║    1. 下载 Orbitron-*.ttf 字体文件                              ║
+║    2. 双击安装到系统                                             ║
+║    3. 重启程序                                                   ║
+╚══════════════════════════════════════════════════════════════════╝
+"""
+            print(guide_text)
+
+        return False  # 返回False表示需要手动完成
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 字体安装助手启动失败: {e}")
+        return False
+
+
+def install_font_files(self, font_files):
+    """尝试安装字体文件到系统"""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            success_count = 0
+            for font_path in font_files:
+                try:
+                    # Windows API安装字体
+                    result = ctypes.windll.gdi32.AddFontResourceW(
+                        font_path)
+                    if result > 0:
+                        success_count += 1
+                        print(
+                            f"[FONT_INFO] 已安装: {os.path.basename(font_path)}")
+                except Exception as e:
+                    print(f"[FONT_WARNING] 安装字体失败 {font_path}: {e}")
+                    continue
+
+            if success_count > 0:
+                # 通知系统字体已改变
+                HWND_BROADCAST = 0xFFFF
+                WM_FONTCHANGE = 0x001D
+                ctypes.windll.user32.SendMessageW(
+                    HWND_BROADCAST, WM_FONTCHANGE, 0, 0)
+                return True
+
+        elif sys.platform.startswith("linux"):
+            # Linux字体安装
+            font_dir = os.path.expanduser("~/.local/share/fonts")
+            os.makedirs(font_dir, exist_ok=True)
+
+            success_count = 0
+            for font_path in font_files:
+                try:
+                    dest_path = os.path.join(
+                        font_dir, os.path.basename(font_path))
+                    with open(font_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                        dst.write(src.read())
+                    success_count += 1
+                    print(f"[FONT_INFO] 已复制到: {dest_path}")
+                except Exception as e:
+                    print(f"[FONT_WARNING] 复制字体失败: {e}")
+
+            if success_count > 0:
+                # 刷新字体缓存
+                os.system("fc-cache -f -v")
+                return True
+
+        elif sys.platform == "darwin":
+            # macOS字体安装
+            font_dir = os.path.expanduser("~/Library/Fonts")
+            os.makedirs(font_dir, exist_ok=True)
+
+            success_count = 0
+            for font_path in font_files:
+                try:
+                    dest_path = os.path.join(
+                        font_dir, os.path.basename(font_path))
+                    with open(font_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                        dst.write(src.read())
+                    success_count += 1
+                    print(f"[FONT_INFO] 已安装到: {dest_path}")
+                except Exception as e:
+                    print(f"[FONT_WARNING] 安装字体失败: {e}")
+
+            return success_count > 0
+
+    except Exception as e:
+        print(f"[FONT_ERROR] 字体安装失败: {e}")
+
+    return False
+
+
+def show_font_install_guide(self, font_dir=None):
+    """显示字体安装指南"""
+    guide_message = """
+═══════════════════════════════════════
+        Orbitron 字体安装指南
+═══════════════════════════════════════
+
+自动安装失败，请手动安装：
+
+方法一：在线下载
+1. 访问：https://fonts.google.com/specimen/Orbitron
+2. 点击 "Download family" 下载字体包
+3. 解压后双击 .ttf 文件安装
+
+方法二：使用本地文件（如果已下载）"""
+
+    if font_dir and os.path.exists(font_dir):
+        guide_message += f"""
+4. 打开文件夹：{font_dir}
+5. 双击字体文件进行安装"""
+
+    guide_message += """
+
+安装完成后重启程序即可使用 Orbitron 字体！
+═══════════════════════════════════════
+"""
+
+    print(guide_message)
+
+    # 在GUI中也显示提示
+    if hasattr(self, 'root'):
+        self.show_messagebox(
+            "字体自动安装失败\n请查看控制台获取安装指南",
+            "字体安装",
+            self.colors.get("neon_yellow", "#FFD700")
+        )
@@ -0,0 +1,199 @@
+import time
+
+
+class UIGovernor:
+    """Tk主循环负载调节器
+
+    通过心跳测量 after() 回调的实际延迟，并统计各动画/刷新回调的执行耗时，
+    根据负载等级自动降低RGB动画帧率和数据刷新频率；窗口被隐藏时暂停动画。
+    """
+
+    # 负载等级: (名称, 动画间隔倍率, 刷新间隔倍率)
+    LEVELS = [
+        ("NORMAL", 1.0, 1.0),
+        ("BUSY", 2.0, 1.5),
+        ("OVERLOAD", 4.0, 2.0),
+    ]
+
+    # 隐藏时动画循环的轮询间隔（毫秒）
+    IDLE_POLL_MS = 500
+
+    def __init__(self, root, heartbeat_ms=100, busy_lag_ms=30, overload_lag_ms=100,
+                 profiler=None):
+        self.root = root
+        self.profiler = profiler  # 可选的UIProfiler，用于记录每个回调的分位数
+        self.heartbeat_ms = heartbeat_ms
+        self.busy_lag_ms = busy_lag_ms
+        self.overload_lag_ms = overload_lag_ms
+
+        self.running = False
+        self.hidden = False
+        self.level = 0
+
+        # 指数滑动平均（毫秒）
+        self.lag_ewma = 0.0
+        self.callback_ewma = 0.0
+        self.max_lag_ms = 0.0
+        self._alpha = 0.2
+
+        # 每个心跳周期内回调的累计耗时，用于计算主线程占用率
+        self._window_callback_ms = 0.0
+        self.busy_ratio = 0.0
+
+        # 负载回落需要连续平稳的心跳数（迟滞，避免等级来回抖动）
+        self._calm_beats = 0
+        self._calm_beats_required = 20
+
+        self._expected_at = None
+        self._heartbeat_id = None
+        self._listeners = []
+
+    def start(self):
+        """启动心跳测量"""
+        if self.running:
+            return
+        self.running = True
+        self._expected_at = time.perf_counter() + self.heartbeat_ms / 1000.0
+        self._heartbeat_id = self.root.after(self.heartbeat_ms, self._heartbeat)
+
+    def stop(self):
+        """停止心跳测量"""
+        self.running = False
+        if self._heartbeat_id is not None:
+            try:
+                self.root.after_cancel(self._heartbeat_id)
+            except Exception:
+                pass
+            self._heartbeat_id = None
+
+    def add_listener(self, callback):
+        """注册负载等级变化回调 callback(level_name, budget)"""
+        self._listeners.append(callback)
+
+    def _heartbeat(self):
+        """心跳回调：实际触发时间与预期时间之差即为主循环延迟"""
+        if not self.running:
+            return
+
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._expected_at) * 1000.0)
+        self.lag_ewma += self._alpha * (lag_ms - self.lag_ewma)
+        self.max_lag_ms = max(self.max_lag_ms * 0.99, lag_ms)
+        if self.profiler is not None:
+            self.profiler.record_lag(lag_ms)
+
+        # 本周期回调耗时占周期长度的比例
+        period_ms = self.heartbeat_ms + lag_ms
+        ratio = min(1.0, self._window_callback_ms / period_ms) if period_ms > 0 else 0.0
+        self.busy_ratio += self._alpha * (ratio - self.busy_ratio)
+        self._window_callback_ms = 0.0
+
+        self._update_level()
+
+        self._expected_at = time.perf_counter() + self.heartbeat_ms / 1000.0
+        try:
+            self._heartbeat_id = self.root.after(self.heartbeat_ms, self._heartbeat)
+        except Exception:
+            # 窗口已销毁
+            self.running = False
+
+    def _update_level(self):
+        """根据延迟和占用率计算负载等级，升级立即生效，降级需要持续平稳"""
+        if self.lag_ewma >= self.overload_lag_ms or self.busy_ratio >= 0.6:
+            target = 2
+        elif self.lag_ewma >= self.busy_lag_ms or self.busy_ratio >= 0.3:
+            target = 1
+        else:
+            target = 0
+
+        if target > self.level:
+            self._calm_beats = 0
+            self._set_level(target)
+        elif target < self.level:
+            self._calm_beats += 1
+            if self._calm_beats >= self._calm_beats_required:
+                self._calm_beats = 0
+                self._set_level(self.level - 1)
+        else:
+            self._calm_beats = 0
+
+    def _set_level(self, level):
+        old_name = self.LEVELS[self.level][0]
+        self.level = level
+        new_name = self.LEVELS[level][0]
+        print(f"[DEBUG] UI负载等级 {old_name} -> {new_name} "
+              f"(lag={self.lag_ewma:.1f}ms, busy={self.busy_ratio:.0%})")
+        budget = self.get_frame_budget()
+        for callback in self._listeners:
+            try:
+                callback(new_name, budget)
+            except Exception as e:
+                print(f"[DEBUG] 负载等级回调失败: {e}")
+
+    def record_callback(self, name, duration_ms):
+        """记录一次主线程回调耗时（毫秒）"""
+        self._window_callback_ms += duration_ms
+        self.callback_ewma += self._alpha * (duration_ms - self.callback_ewma)
+        if self.profiler is not None:
+            self.profiler.record(name, duration_ms)
+
+    def measure(self, name, func, *args, **kwargs):
+        """执行回调并记录其耗时，返回回调结果"""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record_callback(name, (time.perf_counter() - start) * 1000.0)
+
+    def wrap(self, name, func):
+        """包装回调，使其每次执行都被计时，用于 after(ms, governor.wrap(name, func))"""
+        def timed(*args, **kwargs):
+            return self.measure(name, func, *args, **kwargs)
+        return timed
+
+    def set_hidden(self, hidden):
+        """窗口隐藏时暂停动画"""
+        self.hidden = bool(hidden)
+        print(f"[DEBUG] UI动画{'暂停' if self.hidden else '恢复'}")
+
+    def animations_paused(self):
+        return self.hidden
+
+    def animation_interval(self, base_ms):
+        """按负载等级放大动画间隔（毫秒）"""
+        return int(base_ms * self.LEVELS[self.level][1])
+
+    def refresh_interval(self, base):
+        """按负载等级放大数据刷新间隔，单位与传入值一致"""
+        return base * self.LEVELS[self.level][2]
+
+    def get_frame_budget(self, base_anim_ms=None):
+        """返回当前帧预算信息"""
+        name, anim_scale, refresh_scale = self.LEVELS[self.level]
+        budget = {
+            "level": name,
+            "lag_ms": round(self.lag_ewma, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+            "callback_ms": round(self.callback_ewma, 1),
+            "busy_ratio": round(self.busy_ratio, 3),
+            "animation_scale": anim_scale,
+            "refresh_scale": refresh_scale,
+            "paused": self.hidden,
+        }
+        if base_anim_ms is not None:
+            interval = self.animation_interval(base_anim_ms)
+            budget["frame_interval_ms"] = interval
+            # 每帧可用时间 = 帧间隔 - 主循环延迟 - 平均回调耗时
+            budget["headroom_ms"] = round(
+                max(0.0, interval - self.lag_ewma - self.callback_ewma), 1)
+        return budget
+
+    def get_status_text(self, base_anim_ms=None):
+        """生成状态栏显示文本"""
+        budget = self.get_frame_budget(base_anim_ms)
+        if budget["paused"]:
+            return "FRAME: PAUSED"
+        text = f"FRAME: {budget['level']} lag {budget['lag_ms']:.0f}ms"
+        if "frame_interval_ms" in budget:
+            text += f" | {budget['frame_interval_ms']}ms/帧"
+        return text
@@ -0,0 +1,1503 @@
+"""MINI模式（精简）窗口
+
+ACTDamageUI 对应方法的实现，第一次打开时才导入，减少主模块的导入时间。
+函数的第一个参数为 ACTDamageUI 实例。
+"""
+
+import tkinter as tk
+
+# 可选：用于抗锯齿的圆角绘制
+try:
+    from PIL import Image, ImageTk, ImageDraw, ImageFilter
+except Exception:
+    Image = ImageTk = ImageDraw = ImageFilter = None
+
+
+def create_minimal_mode(self):
+    """创建MINI模式窗口的实际实现"""
+    self.root.withdraw()
+    mini = tk.Toplevel()
+    mini.title("◊ STAR_RESONANCE_MINI_CONSOLE ◊")
+    mini.geometry("440x700")  # 缩减高度
+    mini.resizable(False, False)
+    mini.wm_attributes("-topmost", True)
+    mini.overrideredirect(True)
+    # 为MINI窗口设置与主界面相同的透明度
+    mini.current_alpha = self.current_alpha
+    mini.wm_attributes("-alpha", 0.0)  # 初始透明度为0，准备淡入
+    # 去除黑边，使用主背景色
+    mini.configure(bg=self.colors["bg_primary"])
+    drag_data = {"x": 0, "y": 0, "dragging": False}
+
+    # 创建MINI窗口信息字典
+    mini_info = {
+        "window": mini,
+        "alpha_var": None,
+        "alpha_label": None
+    }
+
+    # 创建RGB边框容器（与主UI完全一致的圆角背景）
+    if Image is not None:
+        # 尝试为MINI窗口设置圆角区域
+        try:
+            import ctypes
+            mini.update()
+            hwnd = ctypes.windll.user32.GetParent(mini.winfo_id())
+            if hwnd == 0:
+                hwnd = mini.winfo_id()
+
+            width = 440
+            height = 700  # 更新圆角区域高度
+            corner_radius = 12
+
+            hrgn = ctypes.windll.gdi32.CreateRoundRectRgn(
+                0, 0, width, height, corner_radius * 2, corner_radius * 2
+            )
+
+            if hrgn:
+                ctypes.windll.user32.SetWindowRgn(hwnd, hrgn, True)
+        except Exception:
+            pass
+
+        # 使用与主UI相同的Canvas背景方案
+        border_canvas = tk.Canvas(
+            mini, bg=self.colors["bg_primary"], highlightthickness=0, bd=0)
+        border_canvas.pack(fill="both", expand=True, padx=0, pady=0)
+
+        # 主内容容器，使用与主UI相同的方式
+        main_content_frame = tk.Frame(
+            border_canvas, bg=self.colors["bg_primary"], bd=0, relief="flat")
+
+        # 在Canvas中创建窗口
+        border_space = 6  # 边框空间
+        content_window = border_canvas.create_window(
+            border_space, border_space,
+            anchor="nw",
+            window=main_content_frame
+        )
+
+        mini._border_imgtk = None
+        mini._border_cache_key = None
+        mini.rgb_index = 0
+
+        def render_mini_border():
+            """渲染MINI窗口的完整圆角背景（与主UI一致），优化缓存减少闪烁"""
+            canvas_w = border_canvas.winfo_width()
+            canvas_h = border_canvas.winfo_height()
+            if canvas_w <= 0 or canvas_h <= 0:
+                return
+
+            # 更新内容区域大小
+            content_width = canvas_w - (border_space * 2)
+            content_height = canvas_h - (border_space * 2)
+            border_canvas.itemconfig(
+                content_window,
+                width=content_width,
+                height=content_height
+            )
+
+            current_color = self.border_colors[mini.rgb_index % len(
+                self.border_colors)]
+            key = (canvas_w, canvas_h, current_color)
+
+            # 更严格的缓存检查，减少不必要的重绘
+            if (getattr(mini, "_border_cache_key", None) == key and
+                mini._border_imgtk is not None and
+                hasattr(border_canvas, 'find_withtag') and
+                    border_canvas.find_withtag("bg_image")):
+                return
+
+            # 创建完整的圆角背景（与主UI一致）
+            scale = 1.5
+            W, H = int(canvas_w * scale), int(canvas_h * scale)
+            r = max(0, int(12 * scale))  # 与主UI相同的圆角
+            bw = max(1, int(3 * scale))  # 与主UI相同的边框宽度
+
+            # 安全检查，确保边框不会导致无效的坐标
+            if W <= bw * 2 or H <= bw * 2:
+                return  # 尺寸太小，跳过渲染
+
+            img = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+
+            # 绘制完整的圆角背景
+            bg_color = self.colors["bg_primary"]
+            draw.rounded_rectangle(
+                [0, 0, W-1, H-1], radius=r, fill=bg_color)
+
+            # 添加RGB边框发光效果
+            try:
+                glow = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+                gdraw = ImageDraw.Draw(glow)
+                gdraw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
+                                        radius=r, outline=current_color, width=bw)
+                glow = glow.filter(
+                    ImageFilter.GaussianBlur(1.5 * scale / 10))
+                img = Image.alpha_composite(img, glow)
+            except Exception:
+                pass
+
+            # 绘制清晰的RGB边框
+            draw.rounded_rectangle([bw//2, bw//2, W-1-bw//2, H-1-bw//2],
+                                   radius=r, outline=current_color, width=bw)
+
+            img = img.resize((canvas_w, canvas_h), resample=Image.LANCZOS)
+            imgtk = ImageTk.PhotoImage(img)
+            border_canvas.delete("bg_image")
+            border_canvas.create_image(
+                0, 0, anchor="nw", image=imgtk, tags="bg_image")
+            mini._border_imgtk = imgtk
+            mini._border_cache_key = key
+
+        def mini_rgb_animate():
+            """MINI窗口RGB动画（与主UI同步），优化减少闪烁"""
+            if not mini.winfo_exists():
+                return
+            if self.ui_governor.animations_paused():
+                mini.after(self.ui_governor.IDLE_POLL_MS, mini_rgb_animate)
+                return
+
+            # 检查是否真的需要更新
+            old_index = getattr(mini, 'rgb_index', 0)
+            mini.rgb_index = (mini.rgb_index + 1) % len(self.border_colors)
+
+            # 只有当颜色真的改变时才重新渲染
+            if mini.rgb_index != old_index:
+                # 使用更温和的渲染方式，避免闪烁
+                if hasattr(mini, '_mini_rgb_timer'):
+                    mini.after_cancel(mini._mini_rgb_timer)
+                mini._mini_rgb_timer = mini.after(10, render_mini_border)
+
+            mini.after(self.ui_governor.animation_interval(
+                self.rgb_interval), self.ui_governor.wrap(
+                    "mini_rgb_animation", mini_rgb_animate))
+
+        def on_mini_resize(event):
+            """MINI窗口大小变化处理，减少闪烁"""
+            if hasattr(mini, '_mini_resize_timer'):
+                mini.after_cancel(mini._mini_resize_timer)
+            # 增加延迟，减少频繁重绘
+            mini._mini_resize_timer = mini.after(100, render_mini_border)
+
+        # 绑定事件
+        border_canvas.bind("<Configure>", on_mini_resize)
+
+        # 初始渲染与动画
+        mini.after(100, render_mini_border)
+        mini.after(self.rgb_interval, mini_rgb_animate)
+    else:
+        # 回退为矩形边框，去除黑边
+        shadow_frame = tk.Frame(
+            mini, bg=self.colors["bg_primary"], bd=0, relief="flat")
+        shadow_frame.pack(fill="both", expand=True, padx=0, pady=0)
+        border_frame = tk.Frame(
+            shadow_frame, bg="#ff0000", bd=0, relief="flat")
+        border_frame.pack(fill="both", expand=True, padx=3, pady=3)
+        gradient_frame = tk.Frame(
+            border_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
+        gradient_frame.pack(fill="both", expand=True, padx=2, pady=2)
+        main_content_frame = tk.Frame(
+            gradient_frame, bg=self.colors["bg_primary"], bd=0, relief="flat")
+        main_content_frame.pack(fill="both", expand=True, padx=6, pady=6)
+
+        def mini_rgb_animate():
+            if not mini.winfo_exists():
+                return
+            if self.ui_governor.animations_paused():
+                mini.after(self.ui_governor.IDLE_POLL_MS, mini_rgb_animate)
+                return
+            color_index = getattr(mini, "rgb_index", 0)
+            current_color = self.border_colors[color_index % len(
+                self.border_colors)]
+            border_frame.config(bg=current_color)
+            mini.rgb_index = (color_index + 1) % len(self.border_colors)
+            mini.after(self.ui_governor.animation_interval(
+                self.rgb_interval), self.ui_governor.wrap(
+                    "mini_rgb_animation", mini_rgb_animate))
+
+    # 创建标题栏（使用主UI风格）
+    header_outer, header_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_cyan"],
+        padding=2,  # 减小内边距
+    )
+    header_outer.configure(height=65)  # 设置外框固定高度为原来的一半
+    header_outer.pack(fill="x", pady=(6, 4))  # 减小外边距
+    header_outer.pack_propagate(False)  # 防止子控件改变外框大小
+
+    # 标题内容容器
+    title_container = tk.Frame(
+        header_frame, bg=self.colors["bg_secondary"])
+    title_container.pack(fill="x", pady=int(3 * 1.1))  # 扩大1.1倍
+
+    # 主标题 - 缩小字体并添加阴影效果的Canvas
+    title_canvas = tk.Canvas(
+        title_container,
+        height=int(25 * 1.1),  # 缩减为原来的一半
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    title_canvas.pack(fill="x", pady=int(2 * 1.1))
+
+    def draw_title_with_shadow():
+        title_canvas.delete("all")
+        title_text = "▓▓▓ MINI_CONSOLE ▓▓▓"
+        font_tuple = self.get_font(int(12 * 1.1), "normal")
+
+        # 获取画布中心位置
+        canvas_width = title_canvas.winfo_width()
+        if canvas_width > 1:
+            center_x = canvas_width // 2
+            center_y = int(12 * 1.1)
+
+            # 绘制多层阴影（渐变效果）
+            shadow_layers = [
+                (3, 3, "#000000"),
+                (2, 2, "#111111"),
+                (1, 1, "#222222")
+            ]
+
+            for dx, dy, shadow_color in shadow_layers:
+                title_canvas.create_text(
+                    center_x + dx,
+                    center_y + dy,
+                    text=title_text,
+                    font=font_tuple,
+                    fill=shadow_color,
+                    anchor="center"
+                )
+
+            # 绘制边框效果（使用深灰色）
+            border_color = "#333333"
+            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+                title_canvas.create_text(
+                    center_x + dx,
+                    center_y + dy,
+                    text=title_text,
+                    font=font_tuple,
+                    fill=border_color,
+                    anchor="center"
+                )
+
+            # 绘制主文字
+            title_canvas.create_text(
+                center_x,
+                center_y,
+                text=title_text,
+                font=font_tuple,
+                fill=self.colors["neon_cyan"],
+                anchor="center"
+            )
+
+    # 绑定配置事件以重绘标题
+    title_canvas.bind("<Configure>", lambda e: draw_title_with_shadow())
+    title_canvas.after(10, draw_title_with_shadow)
+
+    # 副标题 - 使用Canvas添加阴影
+    subtitle_canvas = tk.Canvas(
+        title_container,
+        height=int(16 * 1.1),  # 缩减为原来的一半
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    subtitle_canvas.pack(fill="x")
+
+    def draw_subtitle_with_shadow():
+        # 检查canvas是否仍然存在
+        try:
+            if not subtitle_canvas.winfo_exists():
+                return
+        except:
+            return
+
+        subtitle_canvas.delete("all")
+        subtitle_text = "[REAL_TIME_RANKING]"
+        font_tuple = self.get_font(int(8 * 1.1), "normal")
+
+        # 获取画布中心位置
+        try:
+            canvas_width = subtitle_canvas.winfo_width()
+            if canvas_width > 1:
+                center_x = canvas_width // 2
+                center_y = int(8 * 1.1)
+
+                # 绘制多层阴影
+                shadow_layers = [
+                    (2, 2, "#000000"),
+                    (1, 1, "#111111")
+                ]
+
+                for dx, dy, shadow_color in shadow_layers:
+                    subtitle_canvas.create_text(
+                        center_x + dx,
+                        center_y + dy,
+                        text=subtitle_text,
+                        font=font_tuple,
+                        fill=shadow_color,
+                        anchor="center"
+                    )
+
+                # 绘制边框效果
+                border_color = "#333333"
+                for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                    subtitle_canvas.create_text(
+                        center_x + dx,
+                        center_y + dy,
+                        text=subtitle_text,
+                        font=font_tuple,
+                        fill=border_color,
+                        anchor="center"
+                    )
+
+                # 绘制主文字
+                subtitle_canvas.create_text(
+                    center_x,
+                    center_y,
+                    text=subtitle_text,
+                    font=font_tuple,
+                    fill=self.colors["neon_green"],
+                    anchor="center"
+                )
+        except:
+            # 如果canvas已被销毁，静默忽略错误
+            pass
+
+    # 保存after任务ID到mini窗口，以便后续取消
+    if not hasattr(mini, '_after_tasks'):
+        mini._after_tasks = []
+
+    def safe_bind_configure():
+        try:
+            subtitle_canvas.bind(
+                "<Configure>", lambda e: draw_subtitle_with_shadow())
+        except:
+            pass
+
+    def safe_after_draw():
+        try:
+            task_id = subtitle_canvas.after(10, draw_subtitle_with_shadow)
+            mini._after_tasks.append(task_id)
+        except:
+            pass
+
+    safe_bind_configure()
+    safe_after_draw()
+
+    # 关闭按钮 - 圆角版本（缩小尺寸）
+    close_btn = self.create_enhanced_button(
+        title_container, "✕", lambda: self._close_minimal_mode(mini),
+        self.colors["neon_pink"], width=2, height=1  # 缩小宽度从3到2
+    )
+    close_btn.place(relx=1.0, rely=0.0, anchor="ne", x=-3, y=2)  # 调整位置
+
+    # 创建本人DPS显示区域
+    self_dps_outer, self_dps_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_yellow"],
+        padding=int(2 * 1.1),
+    )
+    self_dps_outer.configure(height=75)  # 设置外框固定高度为原来的一半
+    self_dps_outer.pack(fill="x", pady=(0, int(2 * 1.1)))
+    self_dps_outer.pack_propagate(False)  # 防止子控件改变外框大小
+
+    # 本人DPS标题
+    self_dps_title_canvas = tk.Canvas(
+        self_dps_frame,
+        height=int(0),
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    self_dps_title_canvas.pack(fill="x", pady=int(2 * 1.1))
+
+    def draw_self_dps_title():
+        self_dps_title_canvas.delete("all")
+        title_text = "[MY_PERFORMANCE]:"
+        font_tuple = self.get_font(int(8 * 1.1), "normal")
+
+        canvas_width = self_dps_title_canvas.winfo_width()
+        if canvas_width > 1:
+            center_x = canvas_width // 2
+            center_y = int(8 * 1.1)
+
+            # 绘制阴影
+            for dx, dy in [(1, 1), (2, 2)]:
+                self_dps_title_canvas.create_text(
+                    center_x + dx, center_y + dy,
+                    text=title_text, font=font_tuple,
+                    fill="#000000", anchor="center"
+                )
+
+            # 绘制主文字
+            self_dps_title_canvas.create_text(
+                center_x, center_y,
+                text=title_text, font=font_tuple,
+                fill=self.colors["neon_yellow"], anchor="center"
+            )
+
+    self_dps_title_canvas.bind(
+        "<Configure>", lambda e: draw_self_dps_title())
+    self_dps_title_canvas.after(10, draw_self_dps_title)
+
+    # 本人DPS条容器
+    self_dps_container = tk.Frame(
+        self_dps_frame, bg=self.colors["bg_secondary"])
+    self_dps_container.pack(fill="x", padx=int(6 * 1.1), pady=int(2 * 1.1))
+
+    # 存储本人DPS显示组件的引用
+    mini._self_dps_container = self_dps_container
+
+    # 创建数据显示面板（使用主UI风格）
+    data_outer, data_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_accent"],
+        border_color=self.colors["neon_green"],
+        padding=int(2 * 1.1),  # 扩大1.1倍内边距
+    )
+    data_outer.pack(fill="both", expand=True,
+                    pady=(0, int(4 * 1.1)))  # 扩大1.1倍外边距
+
+    # 数据面板标题 - 使用Canvas添加阴影
+    data_title_canvas = tk.Canvas(
+        data_frame,
+        height=int(18 * 1.1),  # 扩大1.1倍高度
+        bg=self.colors["bg_accent"],
+        highlightthickness=0,
+        bd=0
+    )
+    data_title_canvas.pack(fill="x", pady=int(3 * 1.1))
+
+    def draw_data_title_with_shadow():
+        data_title_canvas.delete("all")
+        title_text = "[DAMAGE_RANKING]:"
+        font_tuple = self.get_font(int(9 * 1.1), "normal")
+
+        canvas_width = data_title_canvas.winfo_width()
+        if canvas_width > 1:
+            center_x = canvas_width // 2
+            center_y = int(9 * 1.1)
+
+            # 绘制多层阴影
+            shadow_layers = [
+                (2, 2, "#000000"),
+                (1, 1, "#111111")
+            ]
+
+            for dx, dy, shadow_color in shadow_layers:
+                data_title_canvas.create_text(
+                    center_x + dx,
+                    center_y + dy,
+                    text=title_text,
+                    font=font_tuple,
+                    fill=shadow_color,
+                    anchor="center"
+                )
+
+            # 绘制边框效果
+            border_color = "#333333"
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                data_title_canvas.create_text(
+                    center_x + dx,
+                    center_y + dy,
+                    text=title_text,
+                    font=font_tuple,
+                    fill=border_color,
+                    anchor="center"
+                )
+
+            # 绘制主文字
+            data_title_canvas.create_text(
+                center_x,
+                center_y,
+                text=title_text,
+                font=font_tuple,
+                fill=self.colors["neon_green"],
+                anchor="center"
+            )
+
+    data_title_canvas.bind(
+        "<Configure>", lambda e: draw_data_title_with_shadow())
+    data_title_canvas.after(10, draw_data_title_with_shadow)
+
+    # 内容容器
+    content_container = tk.Frame(data_frame, bg=self.colors["bg_accent"])
+    content_container.pack(fill="both", expand=True,
+                           padx=int(6 * 1.1), pady=int(3 * 1.1))  # 扩大1.1倍边距
+
+    def start_drag(event):
+        # 检查事件来源，避免在滑块、按钮等控件上触发拖拽
+        widget_class = event.widget.__class__.__name__
+        if widget_class in ['Scale', 'Button', 'Entry', 'Text', 'Listbox', 'Scrollbar']:
+            return
+
+        # 检查是否点击在滑块容器内
+        if hasattr(event, 'stopPropagation'):
+            return
+
+        drag_data["x"] = event.x_root - mini.winfo_x()
+        drag_data["y"] = event.y_root - mini.winfo_y()
+        drag_data["dragging"] = True
+
+    def drag_window(event):
+        # 同样检查事件来源
+        widget_class = event.widget.__class__.__name__
+        if widget_class in ['Scale', 'Button', 'Entry', 'Text', 'Listbox', 'Scrollbar']:
+            return
+
+        # 检查是否在滑块容器内
+        if hasattr(event, 'stopPropagation'):
+            return
+
+        if drag_data["dragging"]:
+            x = event.x_root - drag_data["x"]
+            y = event.y_root - drag_data["y"]
+            mini.geometry(f"+{x}+{y}")
+
+            # 同时更新所有关联的timer窗口位置
+            # 方法1：检查mini对象的关联timer
+            if hasattr(mini, 'associated_timers'):
+                for timer_window in mini.associated_timers:
+                    if timer_window.winfo_exists():
+                        # 使用固定的MINI窗口宽度（440px）+ 10像素间距
+                        timer_x = x + 440 + 10
+                        timer_y = y
+                        timer_window.geometry(f"+{timer_x}+{timer_y}")
+
+            else:
+
+                # 方法2：通过全局timer列表搜索引用此mini窗口的timer
+                for i, timer_window in enumerate(self.timer_windows):
+                    print(
+                        f"检查timer窗口 {i}: 存在={timer_window.winfo_exists()}, 有reference_window={hasattr(timer_window, 'reference_window')}")
+                    if hasattr(timer_window, 'reference_window'):
+                        print(
+                            f"Timer窗口 {i} 的reference_window: {timer_window.reference_window}, mini: {mini}")
+                    if (timer_window.winfo_exists() and
+                        hasattr(timer_window, 'reference_window') and
+                            timer_window.reference_window == mini):
+                        timer_x = x + 440 + 10
+                        timer_y = y
+                        timer_window.geometry(f"+{timer_x}+{timer_y}")
+
+                        print(f"通过全局搜索更新timer窗口位置: {timer_x}, {timer_y}")
+
+    def stop_drag(event):
+        drag_data["dragging"] = False
+
+    # 只为特定容器绑定拖拽事件，避免与控件冲突
+    drag_widgets = [main_content_frame, header_frame]
+    for widget in drag_widgets:
+        widget.bind("<Button-1>", start_drag)
+        widget.bind("<B1-Motion>", drag_window)
+        widget.bind("<ButtonRelease-1>", stop_drag)
+
+    def render_content():
+        # 优先从API获取数据，如果失败则使用current_data
+        data = None
+        if not self.direct_mode:
+            try:
+                import requests
+                response = requests.get(self.api_url, timeout=2)
+                if response.status_code == 200:
+                    data = response.json()
+            except:
+                pass
+
+        # 如果API获取失败，使用其他数据源
+        if not data:
+            data = (self.current_data
+                    if self.current_data else self.get_direct_data() or {
+                        "user": {}
+                    })
+
+        user_data = data.get("user", {})
+        snapshot = self.get_ranked_snapshot(user_data)
+
+        # 更新本人DPS条
+        self.update_self_dps_bar(mini, user_data, snapshot)
+
+        # 检查是否需要重新创建UI（数据变化才重创建，减少闪烁）
+        current_user_count = len(snapshot)
+        last_user_count = getattr(
+            content_container, '_last_user_count', -1)
+        need_recreate = (last_user_count != current_user_count or
+                         not hasattr(content_container, '_main_canvas'))
+
+        if need_recreate:
+            # 只在必要时清除现有内容
+            for widget in content_container.winfo_children():
+                widget.destroy()
+            content_container._last_user_count = current_user_count
+
+        # 如果没有数据，显示等待信息
+        if not current_user_count:
+            no_data_canvas = tk.Canvas(
+                content_container,
+                height=int(60 * 1.1),  # 扩大1.1倍高度
+                bg=self.colors["bg_accent"],
+                highlightthickness=0,
+                bd=0
+            )
+            no_data_canvas.pack(fill="x", pady=int(10 * 1.1))
+
+            def draw_no_data_with_shadow():
+                no_data_canvas.delete("all")
+                text_lines = [
+                    "▓▓▓ WAITING_FOR_DATA ▓▓▓",
+                    "[SYSTEM]: 未检测到战斗数据",
+                    "[STATUS]: 等待玩家开始战斗..."
+                ]
+
+                canvas_width = no_data_canvas.winfo_width()
+                if canvas_width > 1:
+                    center_x = canvas_width // 2
+                    font_tuple = self.get_font(int(8 * 1.1), "normal")
+
+                    for i, line in enumerate(text_lines):
+                        y_pos = int(10 * 1.1) + i * int(16 * 1.1)
+
+                        # 绘制多层阴影
+                        shadow_layers = [
+                            (2, 2, "#000000"),
+                            (1, 1, "#111111")
+                        ]
+
+                        for dx, dy, shadow_color in shadow_layers:
+                            no_data_canvas.create_text(
+                                center_x + dx,
+                                y_pos + dy,
+                                text=line,
+                                font=font_tuple,
+                                fill=shadow_color,
+                                anchor="center"
+                            )
+
+                        # 绘制边框效果
+                        border_color = "#333333"
+                        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                            no_data_canvas.create_text(
+                                center_x + dx,
+                                y_pos + dy,
+                                text=line,
+                                font=font_tuple,
+                                fill=border_color,
+                                anchor="center"
+                            )
+
+                        # 绘制主文字
+                        color = self.colors["neon_cyan"] if i == 0 else self.colors["text_accent"]
+                        no_data_canvas.create_text(
+                            center_x,
+                            y_pos,
+                            text=line,
+                            font=font_tuple,
+                            fill=color,
+                            anchor="center"
+                        )
+
+            no_data_canvas.bind(
+                "<Configure>", lambda e: draw_no_data_with_shadow())
+            no_data_canvas.after(10, draw_no_data_with_shadow)
+            return
+
+        # 计算显示参数 - 扩大1.1倍尺寸
+        bar_area_w = int(320 * 1.1)  # 扩大1.1倍宽度
+        bar_h = int(24 * 1.1)  # 扩大1.1倍高度
+        gap = int(6 * 1.1)  # 扩大1.1倍间距
+        max_bars = 10  # 增加到最多显示10个人
+        show_users = snapshot.top(max_bars)
+        max_val = max(snapshot.max_damage, 1)
+        canvas_h = bar_h * len(show_users) + gap * \
+            (len(show_users) - 1) + int(30 * 1.1)
+
+        # 创建或重用滚动区域
+        if need_recreate or not hasattr(content_container, '_canvas_container'):
+            canvas_container = tk.Frame(
+                content_container, bg=self.colors["bg_accent"])
+            canvas_container.pack(
+                fill="both", expand=True, pady=int(3 * 1.1))
+            content_container._canvas_container = canvas_container
+
+            canvas = tk.Canvas(
+                canvas_container,
+                width=int((bar_area_w + 40) * 1.1),  # 扩大1.1倍宽度
+                height=min(canvas_h, int(480 * 1.1)),  # 扩大1.1倍最大高度
+                bg=self.colors["bg_primary"],
+                highlightthickness=1,
+                highlightcolor=self.colors["border_light"],
+                relief="solid",
+                bd=0,
+            )
+            canvas.pack(pady=int(3 * 1.1))
+            content_container._main_canvas = canvas
+        else:
+            # 重用现有Canvas，只清除内容不重新创建
+            canvas = content_container._main_canvas
+            canvas.delete("all")  # 只删除Canvas内容，不重创建Widget
+
+        # 绘制数据条（使用现有Canvas，减少闪烁）
+        for idx, (uid, info) in enumerate(show_users):
+            total = info.get("total_damage", {}).get(
+                "total", 0) if info else 0
+            dps = info.get("total_dps", 0) if info else 0
+            profession = info.get("profession", "未知")
+
+            # 排名颜色
+            if idx == 0:
+                bar_color = self.colors["neon_green"]
+                text_color = self.colors["neon_green"]
+            elif idx == 1:
+                bar_color = self.colors["neon_cyan"]
+                text_color = self.colors["neon_cyan"]
+            elif idx == 2:
+                bar_color = self.colors["neon_yellow"]
+                text_color = self.colors["neon_yellow"]
+            else:
+                bar_color = self.colors["neon_purple"]
+                text_color = self.colors["text_primary"]
+
+            y0 = int(15 * 1.1) + idx * (bar_h + gap)  # 扩大1.1倍起始位置
+            bar_len = int((total / max_val) *
+                          (bar_area_w - int(115 * 1.1)))  # 扩大1.1倍计算，调整进度条宽度
+
+            # 排名标识 - 带阴影
+            rank_text = f"#{idx + 1}"
+            rank_font = self.get_font(
+                int(10 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
+            # 阴影
+            canvas.create_text(
+                int(8 * 1.1) + 1, y0 + bar_h // 2 + 1,
+                text=rank_text, font=rank_font, fill="#000000", anchor="w"
+            )
+            # 主文字
+            canvas.create_text(
+                int(8 * 1.1), y0 + bar_h // 2,
+                text=rank_text, font=rank_font, fill=text_color, anchor="w"
+            )
+
+            # 玩家信息 - 带阴影，向右移动
+            display_name = self.get_display_name(uid)  # 使用映射的用户名
+            player_info = f"{display_name}"
+            if len(player_info) > 8:  # 截断过长的用户名
+                player_info = player_info[:8] + "..."
+            player_font = self.get_font(
+                int(8 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
+            # 阴影
+            canvas.create_text(
+                int(42 * 1.1) + 1, y0 + bar_h // 2 -
+                int(4 * 1.1) + 1,  # 从35移动到42
+                text=player_info, font=player_font, fill="#000000", anchor="w"
+            )
+            # 主文字
+            canvas.create_text(
+                int(42 * 1.1), y0 + bar_h // 2 - int(4 * 1.1),  # 从35移动到42
+                text=player_info, font=player_font, fill=self.colors["text_primary"], anchor="w"
+            )
+
+            # 职业信息 - 带阴影，向右移动
+            prof_info = f"[{profession}]"
+            prof_font = self.get_font(int(7 * 1.1), "normal")  # 扩大1.1倍字体
+            # 阴影
+            canvas.create_text(
+                int(42 * 1.1) + 1, y0 + bar_h // 2 +
+                int(4 * 1.1) + 1,  # 从35移动到42
+                text=prof_info, font=prof_font, fill="#000000", anchor="w"
+            )
+            # 主文字
+            canvas.create_text(
+                int(42 * 1.1), y0 + bar_h // 2 + int(4 * 1.1),  # 从35移动到42
+                text=prof_info, font=prof_font, fill=self.colors["neon_orange"], anchor="w"
+            )
+
+            # 进度条背景（深色）- 左移5像素
+            canvas.create_rectangle(
+                int(105 * 1.1), y0 + int(4 * 1.1),
+                int(105 * 1.1) + (bar_area_w - int(115 * 1.1)), y0 +
+                bar_h - int(4 * 1.1),
+                fill=self.colors["bg_secondary"],
+                outline=self.colors["border_dark"],
+                width=1,
+            )
+
+            # 进度条（带阴影效果）
+            if bar_len > 0:
+                # 阴影
+                canvas.create_rectangle(
+                    int(107 * 1.1), y0 + int(6 * 1.1),
+                    int(105 * 1.1) + bar_len +
+                    2, y0 + bar_h - int(2 * 1.1),
+                    fill="#000000", outline="", width=0,
+                )
+                # 主条
+                canvas.create_rectangle(
+                    int(105 * 1.1), y0 + int(4 * 1.1),
+                    int(105 * 1.1) + bar_len, y0 + bar_h - int(4 * 1.1),
+                    fill=bar_color,
+                    outline=self.colors["bg_primary"],
+                    width=1,  # 保持边框大小
+                )
+
+            # 在进度条上显示DPS - 带边框和阴影
+            avg_dps_text = f"DPS:{dps:,.0f}"
+            if dps >= 1000000:
+                avg_dps_text = f"DPS:{dps/1000000:.1f}M"
+            elif dps >= 1000:
+                avg_dps_text = f"DPS:{dps/1000:.1f}K"
+
+            dps_font = self.get_font(
+                int(6 * 1.1 * 1.2), "normal")  # 放大1.2倍
+
+            # 计算DPS文字位置（在进度条中间偏左）
+            dps_x = int(105 * 1.1) + max(int(40 * 1.1), bar_len // 3)
+            dps_y = y0 + bar_h // 2
+
+            # DPS数字边框效果
+            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
+                canvas.create_text(
+                    dps_x + dx, dps_y + dy,
+                    text=avg_dps_text, font=dps_font, fill="#000000", anchor="w"
+                )
+
+            # DPS阴影
+            canvas.create_text(
+                dps_x + 1, dps_y + 1,
+                text=avg_dps_text, font=dps_font, fill="#111111", anchor="w"
+            )
+
+            # DPS主文字（使用黄色高亮）
+            canvas.create_text(
+                dps_x, dps_y,
+                text=avg_dps_text, font=dps_font, fill=self.colors["neon_yellow"], anchor="w"
+            )
+
+            # 伤害数值 - 带边框和阴影（移动到右上角）
+            damage_text = self.format_damage_number(total)
+
+            damage_font = self.get_font(
+                int(9 * 1.1), "normal")  # 扩大1.1倍字体，改为细体
+
+            # 伤害数字边框效果（四方向）
+            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)]:
+                canvas.create_text(
+                    bar_area_w + int(30 * 1.1) + dx, y0 + bar_h // 2 + dy,
+                    text=damage_text, font=damage_font, fill="#000000", anchor="e"
+                )
+
+            # 阴影
+            canvas.create_text(
+                bar_area_w + int(30 * 1.1) + 2, y0 + bar_h // 2 + 2,
+                text=damage_text, font=damage_font, fill="#111111", anchor="e"
+            )
+
+            # 主文字
+            canvas.create_text(
+                bar_area_w + int(30 * 1.1), y0 + bar_h // 2,
+                text=damage_text, font=damage_font, fill=text_color, anchor="e"
+            )
+
+    # 创建状态栏和控制栏（使用主UI风格）- 高度匹配文本
+    status_outer, status_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["border_light"],
+        padding=int(1 * 1.1),  # 扩大1.1倍内边距
+    )
+    # 设置固定高度，只够容纳文本
+    status_outer.configure(height=int(35 * 1.1))  # 设置为文本高度的合适尺寸
+    status_outer.pack(fill="x", pady=(0, int(4 * 1.1)))  # 扩大1.1倍外边距
+    status_outer.pack_propagate(False)  # 防止子控件改变外框大小
+
+    # 状态栏和控制栏容器
+    status_control_container = tk.Frame(
+        status_frame, bg=self.colors["bg_secondary"])
+    status_control_container.pack(
+        fill="x", padx=int(3 * 1.1), pady=int(1 * 1.1))
+
+    # 左侧：状态信息
+    status_left = tk.Frame(status_control_container,
+                           bg=self.colors["bg_secondary"])
+    status_left.pack(side="left", fill="x", expand=True)
+
+    # 状态栏Canvas - 添加阴影效果
+    status_canvas = tk.Canvas(
+        status_left,
+        height=int(16 * 1.1),  # 扩大1.1倍高度
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    status_canvas.pack(fill="x", pady=int(1 * 1.1))
+
+    def update_status_with_shadow(text):
+        status_canvas.delete("all")
+        font_tuple = self.get_font(int(7 * 1.1), "normal")
+
+        canvas_width = status_canvas.winfo_width()
+        if canvas_width > 1:
+            # 绘制多层阴影
+            shadow_layers = [
+                (2, 2, "#000000"),
+                (1, 1, "#111111")
+            ]
+
+            for dx, dy, shadow_color in shadow_layers:
+                status_canvas.create_text(
+                    int(6 * 1.1) + dx, int(8 * 1.1) + dy,
+                    text=text, font=font_tuple, fill=shadow_color, anchor="w"
+                )
+
+            # 绘制边框效果
+            border_color = "#333333"
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                status_canvas.create_text(
+                    int(6 * 1.1) + dx, int(8 * 1.1) + dy,
+                    text=text, font=font_tuple, fill=border_color, anchor="w"
+                )
+
+            # 主文字
+            status_canvas.create_text(
+                int(6 * 1.1), int(8 * 1.1),
+                text=text, font=font_tuple, fill=self.colors["text_accent"], anchor="w"
+            )
+
+    # 右侧：透明度控制
+    alpha_control = tk.Frame(
+        status_control_container, bg=self.colors["bg_secondary"])
+    alpha_control.pack(side="right", padx=(int(10 * 1.1), 0))
+
+    # 透明度标签
+    tk.Label(
+        alpha_control,
+        text="ALPHA:",
+        font=self.get_font(int(6 * 1.1), "normal"),
+        bg=self.colors["bg_secondary"],
+        fg=self.colors["text_primary"],
+    ).pack(side="left", padx=(0, int(2 * 1.1)))
+
+    # 透明度滑块
+    mini_alpha_var = tk.DoubleVar(value=self.current_alpha * 100)
+    mini_info["alpha_var"] = mini_alpha_var  # 保存到mini_info
+
+    mini_alpha_scale = tk.Scale(
+        alpha_control,
+        from_=80,  # 背景最小30%透明度
+        to=100,    # 最大100%不透明
+        orient=tk.HORIZONTAL,
+        variable=mini_alpha_var,
+        command=lambda v: self.on_mini_alpha_changed(v, mini_info),
+        font=self.get_font(int(6 * 1.1)),
+        bg=self.colors["bg_secondary"],
+        fg=self.colors["neon_cyan"],
+        activebackground=self.colors["neon_cyan"],
+        highlightcolor=self.colors["neon_cyan"],
+        troughcolor=self.colors["bg_primary"],
+        length=int(60 * 1.1),  # 扩大1.1倍长度
+        width=int(8 * 1.1),    # 扩大1.1倍宽度
+        sliderlength=int(12 * 1.1),
+        bd=0,
+        relief="flat",
+        showvalue=0,  # 不显示数值（用单独标签显示）
+    )
+    mini_alpha_scale.pack(side="left", padx=int(1 * 1.1))
+
+    # 防止滑块区域触发窗口拖拽（但允许滑块本身的交互）
+    def prevent_mini_window_drag(event):
+        # 只阻止事件向上传播，不阻止滑块本身的功能
+        event.stopPropagation = True
+
+    alpha_control.bind("<Button-1>", prevent_mini_window_drag)
+    alpha_control.bind("<B1-Motion>", prevent_mini_window_drag)
+
+    # 透明度数值显示
+    mini_alpha_label = tk.Label(
+        alpha_control,
+        text=f"{int(self.current_alpha * 100)}%",
+        font=self.get_font(int(6 * 1.1), "normal"),
+        bg=self.colors["bg_secondary"],
+        fg=self.colors["neon_cyan"],
+        width=4,
+    )
+    mini_alpha_label.pack(side="left", padx=(int(2 * 1.1), 0))
+    mini_info["alpha_label"] = mini_alpha_label  # 保存到mini_info
+
+    # 将mini_info添加到全局列表
+    self.mini_windows.append(mini_info)
+
+    # ACT启动按钮区域（底部信息框中央）- 高度刚好容纳按钮
+    act_button_outer, act_button_frame = self.create_rounded_frame(
+        main_content_frame,
+        bg_color=self.colors["bg_secondary"],
+        border_color=self.colors["neon_green"],
+        padding=int(2 * 1.1),  # 减小内边距
+    )
+    # 设置固定高度，刚好容纳按钮
+    act_button_outer.configure(height=int(45 * 1.1))  # 按钮高度 + 最小边距
+    act_button_outer.pack(fill="x", pady=(int(8 * 1.1), int(4 * 1.1)))
+    act_button_outer.pack_propagate(False)  # 防止子控件改变外框大小
+
+    # ACT按钮容器 - 居中
+    act_button_container = tk.Frame(
+        act_button_frame, bg=self.colors["bg_secondary"])
+    act_button_container.pack(expand=True)
+
+    # 使用主菜单风格的按钮
+    # ACT配置选择和控制区域
+    act_control_frame = tk.Frame(
+        act_button_container, bg=self.colors["bg_secondary"])
+    act_control_frame.pack(fill="x", pady=(int(2 * 1.1), int(1 * 1.1)))
+
+    # 左侧：配置文件选择
+    config_frame = tk.Frame(
+        act_control_frame, bg=self.colors["bg_secondary"])
+    config_frame.pack(side="left", fill="x", expand=True)
+
+    config_label = tk.Label(
+        config_frame,
+        text="ACT配置:",
+        font=self.get_font(int(8 * 1.1), "normal"),
+        fg=self.colors["text_primary"],
+        bg=self.colors["bg_secondary"]
+    )
+    config_label.pack(side="left", padx=(0, 5))
+
+    # 配置文件下拉选择框
+    self.act_config_var = tk.StringVar()
+    self.config_combobox = tk.ttk.Combobox(
+        config_frame,
+        textvariable=self.act_config_var,
+        font=self.get_font(int(8 * 1.1), "normal"),
+        width=15,
+        state="readonly"
+    )
+    self.config_combobox.pack(side="left", padx=(0, 10))
+
+    # 绑定配置文件选择改变事件
+    self.config_combobox.bind(
+        "<<ComboboxSelected>>", self.on_act_config_changed)
+
+    # 刷新配置文件列表
+    self.refresh_act_configs()
+
+    # 右侧：倒计时设置和启动按钮
+    timer_control_frame = tk.Frame(
+        act_control_frame, bg=self.colors["bg_secondary"])
+    timer_control_frame.pack(side="right")
+
+    def create_act_timer():
+        # 获取选中的配置文件
+        config_name = self.act_config_var.get()
+
+        # 从JSON配置文件获取持续时间
+        total_seconds = 300  # 默认5分钟
+
+        # 重置当前配置
+        self.current_act_config = None
+        self.compile_jason_phases(None)
+
+        if config_name and config_name != "无配置文件":
+            try:
+                config = self.load_act_config(config_name)
+                if config:
+                    # 设置当前配置，供JASON阶段控制使用
+                    self.current_act_config = config
+                    self.compile_jason_phases(config)
+
+                    if 'total_duration' in config:
+                        total_seconds = config['total_duration']
+                        print(
+                            f"从配置文件 {config_name} 获取时长: {total_seconds}秒")
+                    else:
+                        print(
+                            f"配置文件 {config_name} 中未找到 total_duration，使用默认5分钟")
+
+                    # 调试信息：检查JASON阶段配置
+                    if 'jason_phases' in config:
+                        print(
+                            f"[DEBUG] 已加载JASON阶段配置，包含 {len(config.get('jason_phases', {}))} 个阶段")
+                    else:
+                        print(f"[DEBUG] 配置文件中没有JASON阶段定义")
+
+                    # 预合成本配置的固定播报文本，战斗中直接播放
+                    self.prerender_act_phrases(config, total_seconds)
+            except Exception as e:
+                print(f"解析配置文件时出错: {e}，使用默认5分钟")
+        else:
+            print("未选择配置文件，使用默认5分钟")
+
+        self.launch_act_timer_window(mini, total_seconds, config_name)
+
+    # ACT Start按钮（放在右侧的timer_control_frame中）
+    act_start_button = self.create_enhanced_button(
+        timer_control_frame,
+        text="ACT Start",
+        command=create_act_timer,
+        color=self.colors["neon_green"],
+        width=12,
+        height=1,
+        font_weight="bold"
+    )
+    act_start_button.pack(side="right")
+
+    # 初始状态文本
+    update_status_with_shadow("[MINI_CONSOLE_ACTIVE] 实时数据监控中...")
+
+    def refresh_mini():
+        if not mini.winfo_exists():
+            return
+        try:
+            self.ui_governor.measure("mini_render", render_content)
+            # 更新状态栏时间
+            from datetime import datetime
+            current_time = datetime.now().strftime("%H:%M:%S")
+            update_status_with_shadow(
+                f"[{current_time}] MINI_CONSOLE_ACTIVE | 数据更新中..."
+            )
+        except Exception as e:
+            update_status_with_shadow(
+                f"[ERROR] 数据更新失败: {str(e)[:20]}..."  # 缩短错误信息
+            )
+        mini.after(int(self.ui_governor.refresh_interval(1000)), refresh_mini)
+
+    # 启动更新和动画
+    render_content()
+    mini.after(1000, refresh_mini)
+    mini.after(100, mini_rgb_animate)
+
+    # 添加小窗口淡入效果
+    mini.after(150, lambda: self.fade_window_in(
+        mini, mini.current_alpha, 0.2))
+
+
+def update_self_dps_bar(self, mini, user_data, snapshot):
+    """更新本人DPS条显示"""
+    if not hasattr(mini, '_self_dps_container'):
+        return
+
+    leader = snapshot.top(1)
+    user_count = len(snapshot)
+
+    container = mini._self_dps_container
+
+    # 尝试检测本人数据
+    self_uid = None
+    self_data = None
+    self_rank = 0
+
+    # 优先使用保存的个人UID
+    if self.personal_uid and self.personal_uid in user_data:
+        self_uid = self.personal_uid
+        self_data = user_data[self.personal_uid]
+    else:
+        # 检测方法1：通过UID映射查找本人
+        if hasattr(self, 'uid_mapping'):
+            for uid, info in user_data.items():
+                mapped_name = self.get_display_name(uid)
+                # 如果映射的名字包含特定标识（比如"本人"、"我"等）
+                if any(keyword in mapped_name.lower() for keyword in ['本人', '我', 'me', 'self']):
+                    self_uid = uid
+                    self_data = info
+                    break
+
+        # 检测方法2：如果没有找到，使用第一个玩家作为示例
+        if not self_data and leader:
+            self_uid, self_data = leader[0]
+
+    # 计算排名
+    if self_data:
+        self_rank = snapshot.rank_of(self_uid)
+
+    # 检查是否需要重建UI（数据变化才重建，减少闪烁）
+    current_key = f"{self_uid}_{self_rank}_{user_count}"
+    if self_data:
+        current_key += f"_{self_data.get('total_dps', 0):.0f}_{self.format_rolling_dps(self_uid, (5,))}"
+
+    last_key = getattr(mini, '_last_self_dps_key', '')
+
+    if current_key == last_key:
+        return  # 数据没有变化，不重建UI
+
+    mini._last_self_dps_key = current_key
+
+    # 清除现有显示（只有在数据变化时才清除）
+    for widget in container.winfo_children():
+        widget.destroy()
+
+    if self_data:
+        # 获取第一名的DPS数据用于比例计算
+        first_place_dps = leader[0][1].get(
+            "total_dps", 0) if leader else 0
+
+        # 创建本人DPS条
+        self.create_self_dps_display(
+            container, self_uid, self_data, self_rank, user_count, first_place_dps)
+    else:
+        # 显示未检测到本人
+        no_self_label = tk.Label(
+            container,
+            text="[SYSTEM]: 未检测到个人数据",
+            font=self.get_font(int(8 * 1.1), "normal"),
+            bg=self.colors["bg_secondary"],
+            fg=self.colors["text_accent"]
+        )
+        no_self_label.pack(pady=int(5 * 1.1))
+
+        # 如果有设置个人UID但数据中没有，显示提示
+        if self.personal_uid:
+            hint_label = tk.Label(
+                container,
+                text=f"个人UID ({self.personal_uid}) 暂无战斗数据",
+                font=self.get_font(int(7 * 1.1), "normal"),
+                bg=self.colors["bg_secondary"],
+                fg=self.colors["text_dim"]
+            )
+            hint_label.pack(pady=int(2 * 1.1))
+
+
+def create_self_dps_display(self, container, uid, data, rank, total_players, first_place_dps=0):
+    """创建本人DPS显示条"""
+    # 获取数据
+    display_name = self.get_display_name(uid)
+    profession = data.get("profession", "未知")
+    total_damage = data.get("total_damage", {}).get("total", 0)
+    dps = data.get("total_dps", 0)
+    rolling_text = self.format_rolling_dps(uid, (5,))
+
+    # 创建玩家信息显示区域（向上移动更多）
+    player_info_frame = tk.Frame(container, bg=self.colors["bg_secondary"])
+    player_info_frame.pack(fill="x", pady=(0, int(1 * 1.1)))
+
+    # 玩家信息Canvas - 添加阴影效果
+    player_info_canvas = tk.Canvas(
+        player_info_frame,
+        height=int(16 * 1.1),  # 增加高度防止底部被截断
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    player_info_canvas.pack(fill="x")
+
+    # 在canvas上设置绘制状态缓存属性
+    player_info_canvas._last_draw_data = {
+        "info_text": "", "canvas_width": 0, "last_update": 0}
+
+    def draw_player_info_with_shadow():
+        canvas_width = player_info_canvas.winfo_width()
+        if canvas_width <= 1:
+            # 如果canvas尚未正确显示，延迟重试
+            player_info_canvas.after(100, draw_player_info_with_shadow)
+            return
+
+        # 玩家信息文本（附5秒滚动DPS）
+        info_text = f"#{rank} {display_name} [{profession}] {rolling_text}"
+
+        import time
+        current_time = time.time()
+
+        # 检查是否需要重绘（数据没有变化且时间间隔小于0.5秒则不重绘）
+        time_since_last = current_time - \
+            player_info_canvas._last_draw_data.get("last_update", 0)
+        if (player_info_canvas._last_draw_data["info_text"] == info_text and
+                abs(player_info_canvas._last_draw_data["canvas_width"] - canvas_width) < 5 and
+                time_since_last < 0.5):
+            return
+
+        # 更新缓存
+        player_info_canvas._last_draw_data["info_text"] = info_text
+        player_info_canvas._last_draw_data["canvas_width"] = canvas_width
+        player_info_canvas._last_draw_data["last_update"] = current_time
+
+        player_info_canvas.delete("all")
+        font_tuple = self.get_font(int(10 * 1.1), "bold")
+
+        # 位置计算（左对齐，向上移动更多）
+        x_pos = int(8 * 1.1)
+        y_pos = int(8 * 1.1)  # 进一步向上移动
+
+        # 绘制多层阴影
+        shadow_layers = [
+            (3, 3, "#000000"),
+            (2, 2, "#111111"),
+            (1, 1, "#222222")
+        ]
+
+        for dx, dy, shadow_color in shadow_layers:
+            player_info_canvas.create_text(
+                x_pos + dx, y_pos + dy,
+                text=info_text, font=font_tuple,
+                fill=shadow_color, anchor="w"
+            )
+
+        # 绘制边框效果
+        border_color = "#333333"
+        for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+            player_info_canvas.create_text(
+                x_pos + dx, y_pos + dy,
+                text=info_text, font=font_tuple,
+                fill=border_color, anchor="w"
+            )
+
+        # 绘制主文字（使用高亮颜色）
+        player_info_canvas.create_text(
+            x_pos, y_pos,
+            text=info_text, font=font_tuple,
+            fill=self.colors["neon_yellow"], anchor="w"
+        )
+
+    # 绑定事件和初始绘制 - 使用更稳定的更新机制
+    def on_configure(event):
+        if event.widget == player_info_canvas:
+            # 强制重绘，忽略缓存
+            player_info_canvas._last_draw_data["last_update"] = 0
+            player_info_canvas.after_idle(draw_player_info_with_shadow)
+
+    player_info_canvas.bind("<Configure>", on_configure)
+    # 初始绘制
+    player_info_canvas.after(10, draw_player_info_with_shadow)
+
+    # 创建Canvas用于绘制DPS条（添加阴影效果）
+    canvas = tk.Canvas(
+        container,
+        height=int(25 * 1.1),  # 增加高度防止底部被截断
+        bg=self.colors["bg_secondary"],
+        highlightthickness=0,
+        bd=0
+    )
+    canvas.pack(fill="x", pady=(int(6 * 1.1), int(1 * 1.1)))
+
+    # 在canvas上设置DPS条绘制状态缓存属性
+    canvas._last_dps_data = {"dps": -1,
+                             "canvas_width": 0, "last_update": 0}
+
+    def draw_self_dps_bar():
+        canvas_width = canvas.winfo_width()
+        if canvas_width <= 1:
+            # 如果canvas尚未正确显示，延迟重试
+            canvas.after(100, draw_self_dps_bar)
+            return
+
+        import time
+        current_time = time.time()
+
+        # 检查是否需要重绘（DPS数据没有显著变化且时间间隔小于0.5秒则不重绘）
+        time_since_last = current_time - \
+            canvas._last_dps_data.get("last_update", 0)
+        if (abs(canvas._last_dps_data["dps"] - dps) < max(dps * 0.01, 1) and  # DPS变化小于1%或1点
+                abs(canvas._last_dps_data["canvas_width"] - canvas_width) < 5 and
+                time_since_last < 0.5):
+            return
+
+        # 更新缓存
+        canvas._last_dps_data["dps"] = dps
+        canvas._last_dps_data["canvas_width"] = canvas_width
+        canvas._last_dps_data["last_update"] = current_time
+
+        canvas.delete("all")
+
+        # DPS条参数
+        bar_width = canvas_width - int(40 * 1.1)
+        bar_height = int(16 * 1.1)  # 减小高度
+        bar_x = int(20 * 1.1)
+        bar_y = int(5 * 1.1)
+
+        # 绘制DPS条阴影背景
+        shadow_offset = 2
+        canvas.create_rectangle(
+            bar_x + shadow_offset, bar_y + shadow_offset,
+            bar_x + bar_width + shadow_offset, bar_y + bar_height + shadow_offset,
+            fill="#000000",
+            outline=""
+        )
+
+        # 绘制DPS条背景
+        canvas.create_rectangle(
+            bar_x, bar_y, bar_x + bar_width, bar_y + bar_height,
+            fill=self.colors["bg_primary"],
+            outline=self.colors["border_light"],
+            width=1
+        )
+
+        # 绘制DPS条（根据与第一名的DPS比例计算长度）
+        if first_place_dps > 0 and dps > 0:
+            # 根据与第一名的DPS比例计算条长度
+            dps_ratio = min(dps / first_place_dps, 1.0)  # 最大不超过100%
+            bar_fill_width = int(bar_width * dps_ratio)
+        else:
+            # 如果没有第一名数据或DPS为0，使用固定长度
+            bar_fill_width = int(bar_width * 0.1)  # 最小10%长度
+
+        # DPS条阴影
+        canvas.create_rectangle(
+            bar_x + 1 + shadow_offset, bar_y + 1 + shadow_offset,
+            bar_x + bar_fill_width + shadow_offset, bar_y + bar_height - 1 + shadow_offset,
+            fill="#111111",
+            outline=""
+        )
+
+        # DPS条主体
+        canvas.create_rectangle(
+            bar_x + 1, bar_y + 1, bar_x + bar_fill_width, bar_y + bar_height - 1,
+            fill=self.colors["neon_yellow"],
+            outline=""
+        )
+
+        # 绘制DPS数值 - 添加阴影效果
+        dps_text = f"DPS: {dps:,.0f}"
+        if dps >= 1000000:
+            dps_text = f"DPS: {dps/1000000:.1f}M"
+        elif dps >= 1000:
+            dps_text = f"DPS: {dps/1000:.1f}K"
+
+        dps_font = self.get_font(int(8 * 1.1), "bold")
+        dps_x = bar_x + int(15 * 1.1)
+        dps_y = bar_y + bar_height // 2
+
+        # DPS数值阴影
+        for dx, dy in [(1, 1), (2, 2)]:
+            canvas.create_text(
+                dps_x + dx, dps_y + dy,
+                text=dps_text, font=dps_font,
+                fill="#000000", anchor="w"
+            )
+
+        # DPS主文字
+        canvas.create_text(
+            dps_x, dps_y,
+            text=dps_text, font=dps_font,
+            fill=self.colors["neon_green"], anchor="w"  # 修改为绿色
+        )
+
+        # 绘制总排名信息 - 添加阴影效果
+        rank_info = f"Rank: {rank}/{total_players}"
+        rank_font = self.get_font(int(7 * 1.1), "normal")
+        rank_x = bar_x + bar_width - int(5 * 1.1)
+        rank_y = bar_y + bar_height // 2
+
+        # 排名信息阴影
+        for dx, dy in [(1, 1), (2, 2)]:
+            canvas.create_text(
+                rank_x + dx, rank_y + dy,
+                text=rank_info, font=rank_font,
+                fill="#000000", anchor="e"
+            )
+
+        # 排名主文字
+        canvas.create_text(
+            rank_x, rank_y,
+            text=rank_info, font=rank_font,
+            fill=self.colors["neon_cyan"], anchor="e"
+        )
+
+    # 绑定事件和初始绘制 - 使用更稳定的更新机制
+    def on_dps_configure(event):
+        if event.widget == canvas:
+            # 强制重绘，忽略缓存
+            canvas._last_dps_data["last_update"] = 0
+            canvas.after_idle(draw_self_dps_bar)
+
+    canvas.bind("<Configure>", on_dps_configure)
+    # 初始绘制
+    canvas.after(10, draw_self_dps_bar)
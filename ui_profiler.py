@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime
+
+
+class UIProfiler:
+    """Tk主线程回调耗时统计
+
+    按名称记录每个 after 回调的执行耗时，保留最近 window 个样本，
+    计算 p50/p95/max；同时记录主循环延迟。退出时可导出为JSON，用于不同版本间对比。
+    """
+
+    LAG_NAME = "__event_loop_lag__"
+
+    def __init__(self, window=256):
+        self.window = window
+        self.samples = {}      # name -> deque[ms]
+        self.counts = {}       # name -> 总调用次数
+        self.totals = {}       # name -> 总耗时（毫秒）
+        self.lag_samples = deque(maxlen=window)
+        self.started_at = time.time()
+
+    def record(self, name, duration_ms):
+        """记录一次回调耗时"""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+            self.counts[name] = 0
+            self.totals[name] = 0.0
+        samples.append(duration_ms)
+        self.counts[name] += 1
+        self.totals[name] += duration_ms
+
+    def record_lag(self, lag_ms):
+        """记录一次主循环延迟"""
+        self.lag_samples.append(lag_ms)
+
+    @staticmethod
+    def _percentile(sorted_values, pct):
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1,
+                    int(round(pct / 100.0 * (len(sorted_values) - 1))))
+        return sorted_values[index]
+
+    def _summarize(self, values):
+        ordered = sorted(values)
+        return {
+            "p50": round(self._percentile(ordered, 50), 2),
+            "p95": round(self._percentile(ordered, 95), 2),
+            "max": round(ordered[-1], 2) if ordered else 0.0,
+            "samples": len(ordered),
+        }
+
+    def get_stats(self):
+        """返回 {name: {p50, p95, max, samples, calls, total_ms}}，按p95降序"""
+        stats = {}
+        for name, samples in list(self.samples.items()):
+            summary = self._summarize(samples)
+            summary["calls"] = self.counts.get(name, 0)
+            summary["total_ms"] = round(self.totals.get(name, 0.0), 1)
+            stats[name] = summary
+        return dict(sorted(stats.items(), key=lambda item: item[1]["p95"], reverse=True))
+
+    def get_lag_stats(self):
+        return self._summarize(self.lag_samples)
+
+    def format_report(self, limit=12):
+        """生成调试浮层显示的文本"""
+        lag = self.get_lag_stats()
+        lines = [
+            f"EVENT LOOP LAG  p50 {lag['p50']:.1f}  p95 {lag['p95']:.1f}  max {lag['max']:.1f} ms",
+            f"{'CALLBACK':<18}{'p50':>8}{'p95':>8}{'max':>8}{'calls':>8}",
+        ]
+        for name, s in list(self.get_stats().items())[:limit]:
+            lines.append(
+                f"{name[:18]:<18}{s['p50']:>8.1f}{s['p95']:>8.1f}{s['max']:>8.1f}{s['calls']:>8}")
+        return "\n".join(lines)
+
+    def dump_json(self, directory):
+        """导出统计到JSON文件，返回文件路径；没有样本时不导出"""
+        if not self.samples and not self.lag_samples:
+            return None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(directory, f"ui_profile_{timestamp}.json")
+            report = {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "python": sys.version.split()[0],
+                "frozen": bool(getattr(sys, "frozen", False)),
+                "event_loop_lag": self.get_lag_stats(),
+                "callbacks": self.get_stats(),
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"[DEBUG] UI性能统计已导出: {path}")
+            return path
+        except Exception as e:
+            print(f"[DEBUG] 导出UI性能统计失败: {e}")
+            return None
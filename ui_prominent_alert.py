@@ -0,0 +1,831 @@
+"""明显提醒模式窗口和DPS条
+
+ACTDamageUI 对应方法的实现，第一次打开时才导入，减少主模块的导入时间。
+函数的第一个参数为 ACTDamageUI 实例。
+"""
+
+import tkinter as tk
+
+from shadow_text import GLOW_PROMINENT, STYLE_DESCRIPTION, STYLE_PROMINENT, STYLE_PROMINENT_PHASE
+
+
+def show_warning_in_prominent_mode(self, message, color):
+    """在明显模式窗口中显示警告"""
+    try:
+        print(f"[DEBUG] 尝试在明显模式显示警告: {message}")
+
+        # 使用全局timer窗口列表查找
+        if hasattr(self, 'timer_windows') and self.timer_windows:
+            print(f"[DEBUG] 找到 {len(self.timer_windows)} 个timer窗口")
+            for i, timer_window in enumerate(self.timer_windows):
+                try:
+                    print(f"[DEBUG] 检查timer窗口 {i}")
+                    if timer_window and timer_window.winfo_exists():
+                        print(f"[DEBUG] timer窗口 {i} 存在")
+
+                        if hasattr(timer_window, 'prominent_window'):
+                            print(
+                                f"[DEBUG] timer窗口 {i} 有prominent_window属性: {timer_window.prominent_window}")
+
+                            if timer_window.prominent_window:
+                                if hasattr(timer_window, 'prominent_alert_enabled'):
+                                    enabled = timer_window.prominent_alert_enabled.get()
+                                    print(
+                                        f"[DEBUG] timer窗口 {i} prominent_alert_enabled: {enabled}")
+
+                                    if enabled:
+                                        print(
+                                            f"[DEBUG] 找到活动的明显模式窗口，使用alert系统显示警告")
+
+                                        # 使用原有的alert系统，避免警告覆盖问题
+                                        color_map = {
+                                            'yellow': self.colors["neon_yellow"],
+                                            'red': self.colors["neon_red"],
+                                            'orange': self.colors["neon_orange"],
+                                            'cyan': self.colors["neon_cyan"],
+                                            'blue': self.colors["neon_blue"],
+                                            'green': self.colors["neon_green"],
+                                            'purple': self.colors["neon_purple"]
+                                        }
+                                        warning_color = color_map.get(
+                                            color, self.colors.get(color, self.colors["neon_yellow"]))
+
+                                        # 使用现有的alert队列系统，确保警告不会覆盖
+                                        self.show_alert_with_duration(
+                                            timer_window, message, warning_color, 3.0)
+                                        return
+                                    else:
+                                        print(
+                                            f"[DEBUG] timer窗口 {i} 明显模式未启用")
+                                else:
+                                    print(
+                                        f"[DEBUG] timer窗口 {i} 没有prominent_alert_enabled属性")
+                            else:
+                                print(
+                                    f"[DEBUG] timer窗口 {i} prominent_window为None")
+                        else:
+                            print(
+                                f"[DEBUG] timer窗口 {i} 没有prominent_window属性")
+                    else:
+                        print(f"[DEBUG] timer窗口 {i} 不存在或已销毁")
+                except (tk.TclError, AttributeError) as e:
+                    print(f"[DEBUG] timer窗口 {i} 检查失败: {e}")
+                    continue
+        else:
+            print(f"[DEBUG] 没有timer_windows属性或列表为空")
+
+        print(f"[DEBUG] 没有找到可用的明显模式窗口")
+
+    except Exception as e:
+        print(f"[ERROR] 在明显模式显示警告失败: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+def create_prominent_alert_window(self, timer_window):
+    """创建屏幕顶部的明显提醒窗口"""
+    if timer_window.prominent_window is not None:
+        try:
+            timer_window.prominent_window.destroy()
+        except:
+            pass
+
+    # 创建全屏顶部窗口
+    prominent_window = tk.Toplevel()
+    prominent_window.title("")
+    prominent_window.overrideredirect(True)
+    prominent_window.wm_attributes("-topmost", True)
+    prominent_window.wm_attributes("-alpha", 0.0)  # 初始透明度为0，准备淡入
+
+    # 获取屏幕尺寸
+    screen_width = prominent_window.winfo_screenwidth()
+    screen_height = prominent_window.winfo_screenheight()
+
+    # 设置窗口大小和位置（屏幕顶部）
+    window_height = 150  # 再增加高度以容纳更大的阶段描述区域
+    prominent_window.geometry(f"{screen_width}x{window_height}+0+0")
+    prominent_window.configure(bg=self.colors["bg_primary"])
+
+    # 主容器 - 水平分割
+    main_container = tk.Frame(
+        prominent_window, bg=self.colors["bg_primary"])
+    main_container.pack(fill="both", expand=True, padx=20, pady=5)
+
+    # 左侧DPS条区域（占三分之一宽度）
+    left_dps_frame = tk.Frame(main_container, bg=self.colors["bg_primary"])
+    left_dps_frame.pack(side="left", fill="y", padx=(0, 10))
+    left_dps_frame.configure(width=screen_width // 3)  # 三分之一宽度
+    left_dps_frame.pack_propagate(False)
+
+    # 右侧内容区域（占三分之二宽度）
+    right_content_frame = tk.Frame(
+        main_container, bg=self.colors["bg_primary"])
+    right_content_frame.pack(side="right", fill="both", expand=True)
+
+    # 创建DPS条区域
+    self.create_prominent_dps_bars(left_dps_frame, timer_window)
+
+    # 将main_container指向右侧区域，以便原有代码正常工作
+    original_main_container = main_container
+    main_container = right_content_frame
+
+    # 添加右上角退出按钮
+    def close_prominent_window():
+        try:
+            timer_window.prominent_window = None
+            prominent_window.destroy()
+        except:
+            pass
+
+    close_button = self.create_enhanced_button(
+        prominent_window,
+        "✕",
+        close_prominent_window,
+        self.colors["neon_red"],
+        width=3,
+        height=1
+    )
+    close_button.place(relx=1.0, rely=0.0, anchor="ne", x=-10, y=10)
+
+    # JASON阶段控制按钮组（在右上角）
+    jason_control_frame = tk.Frame(
+        prominent_window, bg=self.colors["bg_primary"])
+    jason_control_frame.place(relx=1.0, rely=0.0, anchor="ne", x=-60, y=10)
+
+    # 当前阶段显示
+    timer_window.prominent_jason_label = tk.Label(
+        jason_control_frame,
+        text=f"阶段{self.current_jason_phase}",
+        font=self.get_font(10, "bold"),
+        bg=self.colors["bg_primary"],
+        fg=self.get_jason_phase_info()["color"]
+    )
+    timer_window.prominent_jason_label.pack(side="right", padx=5)
+
+    # 阶段控制按钮
+    jason_btn_frame = tk.Frame(
+        jason_control_frame, bg=self.colors["bg_primary"])
+    jason_btn_frame.pack(side="right")
+
+    # 推进阶段按钮
+    advance_btn = self.create_enhanced_button(
+        jason_btn_frame,
+        "▶",
+        self.advance_jason_phase,
+        self.colors["neon_cyan"],
+        width=2,
+        height=1
+    )
+    advance_btn.pack(side="left", padx=1)
+
+    # 重置按钮
+    reset_btn = self.create_enhanced_button(
+        jason_btn_frame,
+        "⟲",
+        self.reset_jason_rage_time,
+        self.colors["neon_orange"],
+        width=2,
+        height=1
+    )
+    reset_btn.pack(side="left", padx=1)
+
+    # 自动推进按钮
+    auto_advance_btn = self.create_enhanced_button(
+        jason_btn_frame,
+        "⚡",
+        self.toggle_jason_auto_advance,
+        self.colors["neon_green"] if self.jason_auto_advance_enabled else self.colors["neon_red"],
+        width=2,
+        height=1
+    )
+    auto_advance_btn.pack(side="left", padx=1)
+    timer_window.prominent_jason_auto_btn = auto_advance_btn
+
+    # 阶段选择按钮 - 修复：使用动态配置
+    # 检查当前配置是否有JASON阶段
+    if self.current_act_config and 'jason_phases' in self.current_act_config:
+        jason_phases_config = self.current_act_config['jason_phases']
+        phase_definitions = []
+
+        # 处理不同的配置格式
+        if isinstance(jason_phases_config, list):
+            # 新格式：直接的阶段数组
+            phase_definitions = jason_phases_config
+            print(f"[DEBUG] 使用新格式JASON配置，包含 {len(phase_definitions)} 个阶段")
+        elif isinstance(jason_phases_config, dict) and 'phase_definitions' in jason_phases_config:
+            # 旧格式：包含phase_definitions的对象
+            phase_definitions = jason_phases_config['phase_definitions']
+            print(f"[DEBUG] 使用旧格式JASON配置，包含 {len(phase_definitions)} 个阶段")
+        else:
+            print(f"[DEBUG] JASON配置格式不正确: {type(jason_phases_config)}")
+
+        for i in range(1, 4):
+            # 从动态配置中获取阶段信息
+            phase_info = None
+            for phase in phase_definitions:
+                if phase.get("id") == i:
+                    phase_info = phase
+                    break
+
+            if phase_info:
+                btn = self.create_enhanced_button(
+                    jason_btn_frame,
+                    str(i),
+                    lambda p=i: self.set_jason_phase(p),
+                    phase_info.get("color", "#ffffff"),
+                    width=2,
+                    height=1
+                )
+                btn.pack(side="left", padx=1)
+                print(
+                    f"[DEBUG] 创建阶段按钮 {i}: {phase_info.get('name', f'阶段{i}')}")
+            else:
+                # 如果配置中没有定义该阶段，使用默认设置
+                default_colors = ["#00ff00", "#ffff00", "#ff0000"]
+                btn = self.create_enhanced_button(
+                    jason_btn_frame,
+                    str(i),
+                    lambda p=i: self.set_jason_phase(p),
+                    default_colors[i-1],
+                    width=2,
+                    height=1
+                )
+                btn.pack(side="left", padx=1)
+                print(f"[DEBUG] 创建默认阶段按钮 {i}")
+    else:
+        print(f"[DEBUG] 无JASON配置或配置中缺少jason_phases")
+        print(
+            f"[DEBUG] current_act_config: {bool(self.current_act_config)}")
+        if self.current_act_config:
+            print(f"[DEBUG] 配置键: {list(self.current_act_config.keys())}")
+
+    # 添加明显模式JASON信息更新方法
+    def update_prominent_jason_info():
+        """更新明显模式的JASON阶段信息显示"""
+        try:
+            phase_info = self.get_jason_phase_info()
+            timer_window.prominent_jason_label.config(
+                text=f"阶段{self.current_jason_phase}",
+                fg=phase_info["color"]
+            )
+            # 更新自动推进按钮状态
+            if hasattr(timer_window, 'prominent_jason_auto_btn'):
+                btn_color = self.colors["neon_green"] if self.jason_auto_advance_enabled else self.colors["neon_red"]
+                timer_window.prominent_jason_auto_btn.config(fg=btn_color)
+        except:
+            pass
+
+    timer_window.update_prominent_jason_info = update_prominent_jason_info
+
+    # 创建内容区域的水平分割
+    content_container = tk.Frame(
+        main_container, bg=self.colors["bg_primary"])
+    content_container.pack(fill="both", expand=True, pady=(0, 10))
+
+    # 左侧时间显示区域（包含阶段数和倒计时）
+    time_container = tk.Frame(
+        content_container, bg=self.colors["bg_primary"])
+    time_container.pack(side="left", fill="both",
+                        expand=True, padx=(0, 10))
+
+    # 右侧阶段描述专用幕布区域
+    phase_desc_container = tk.Frame(
+        content_container, bg=self.colors["bg_primary"])
+    phase_desc_container.pack(side="right", fill="both")
+    phase_desc_container.configure(width=screen_width // 4)  # 右侧1/4宽度
+    phase_desc_container.pack_propagate(False)
+
+    # 阶段描述画布
+    phase_desc_canvas = tk.Canvas(
+        phase_desc_container,
+        bg=self.colors["bg_primary"],
+        highlightthickness=0,
+        bd=0
+    )
+    phase_desc_canvas.pack(fill="both", expand=True)
+
+    # 时间显示Canvas（只包含阶段数和倒计时）
+    time_canvas = tk.Canvas(
+        time_container,
+        height=80,  # 保持高度
+        bg=self.colors["bg_primary"],
+        highlightthickness=0,
+        bd=0
+    )
+    time_canvas.pack(fill="x")
+
+    def draw_prominent_time(time_text="00:00:00", text_color=None, glow_effect=False, phase_info=None):
+        # 只绘制阶段数和倒计时，阶段描述在独立画布；文字项按名称原地更新
+        renderer = self.shadow_text
+        font_tuple = self.get_font(36, "bold")  # 倒计时字体
+
+        if text_color is None:
+            text_color = self.colors["neon_cyan"]
+
+        canvas_width = time_canvas.winfo_width()
+        canvas_height = time_canvas.winfo_height()
+        drawn = set()
+        if canvas_width > 1 and canvas_height > 1:
+            # 时间画布只包含阶段数和倒计时
+            center_y = canvas_height // 2  # 画布中心Y坐标
+
+            # 调整布局：阶段数保持左移，倒计时更靠右移动
+            left_zone_x = canvas_width // 8      # 左边区域中心（阶段数，向左移）
+            center_zone_x = canvas_width * 6 // 12   # 倒计时区域
+
+            # 绘制阶段数信息
+            if phase_info:
+                phase_name = phase_info.get('name', '')
+
+                # 阶段数显示在左边 - 使用大号加粗字体
+                if phase_name:
+                    # 修复：处理阶段名称中的换行符
+                    phase_name = phase_name.replace(
+                        '/n', '\n')  # 将 /n 转换为 \n
+
+                    # 更大更醒目的阶段数字体
+                    name_font = self.get_font(20, "bold")
+                    name_color = self.colors["neon_purple"]
+
+                    # 处理多行阶段名称
+                    name_lines = phase_name.split('\n')
+                    line_height = 25  # 行高，适配大字体
+                    total_height = len(name_lines) * line_height
+                    start_y = center_y - total_height * 1 // 3
+
+                    for i, line in enumerate(name_lines):
+                        renderer.draw(time_canvas, f"phase_{i}", left_zone_x, start_y + i * line_height,
+                                      line, name_font, name_color, style=STYLE_PROMINENT_PHASE)
+                        drawn.add(f"phase_{i}")
+
+            # 倒计时显示在中央，启用时绘制更大的辉光
+            if glow_effect:
+                renderer.draw(time_canvas, "time_glow", center_zone_x, center_y, time_text, font_tuple,
+                              text_color, glow=GLOW_PROMINENT)
+                drawn.add("time_glow")
+
+            renderer.draw(time_canvas, "time", center_zone_x, center_y, time_text, font_tuple,
+                          text_color, style=STYLE_PROMINENT)
+            drawn.add("time")
+
+        renderer.hide_unused(time_canvas, drawn)
+
+        # 绘制阶段描述到独立画布
+        draw_phase_description(phase_info)
+
+    def draw_phase_description(phase_info):
+        """在独立画布上绘制阶段描述，Y轴居中（描述不变时不产生Tk调用）"""
+        phase_desc = phase_info.get('description', '') if phase_info else ''
+        if not phase_desc:
+            self.shadow_text.hide_unused(phase_desc_canvas, ())
+            return
+
+        # 修复：处理两种换行符格式
+        phase_desc = phase_desc.replace('/n', '\n')  # 将 /n 转换为 \n
+
+        phase_format = phase_info.get('format', {})
+        desc_font_size = phase_format.get('font_size', 14)  # 稍大的字体
+        desc_color = self.colors.get(phase_format.get(
+            'color', 'neon_cyan'), self.colors['neon_cyan'])
+        desc_style = phase_format.get('font_style', 'italic')
+        desc_font = self.get_font(desc_font_size, desc_style)
+
+        canvas_width = phase_desc_canvas.winfo_width()
+        canvas_height = phase_desc_canvas.winfo_height()
+        drawn = set()
+
+        if canvas_width > 1 and canvas_height > 1:
+            # 处理多行描述
+            desc_lines = phase_desc.split('\n')
+            line_height = desc_font_size + 5  # 增加行间距
+            total_desc_height = len(desc_lines) * line_height - 5
+
+            # Y轴居中计算
+            canvas_center_y = canvas_height * 3 // 4
+            desc_start_y = canvas_center_y - total_desc_height // 2
+
+            # X轴稍微左移
+            canvas_center_x = canvas_width * 2 // 5
+
+            for i, desc_line in enumerate(desc_lines):
+                # 阴影 + 主文字
+                self.shadow_text.draw(phase_desc_canvas, f"desc_{i}", canvas_center_x,
+                                      desc_start_y + i * line_height, desc_line, desc_font,
+                                      desc_color, style=STYLE_DESCRIPTION)
+                drawn.add(f"desc_{i}")
+
+        self.shadow_text.hide_unused(phase_desc_canvas, drawn)
+
+    # 警告显示区域 - 只在左侧时间区域显示
+    alert_container = tk.Frame(
+        time_container, bg=self.colors["bg_primary"])
+    # 警告区域占左侧时间区域的全宽
+    alert_container.pack(fill="x", pady=(10, 0))
+
+    alert_canvas = tk.Canvas(
+        alert_container,
+        height=40,
+        bg=self.colors["bg_primary"],
+        highlightthickness=0,
+        bd=0
+    )
+    alert_canvas.pack(fill="x")
+
+    prominent_window.draw_prominent_time = draw_prominent_time
+    prominent_window.alert_canvas = alert_canvas
+    prominent_window.alert_alpha = 0.0
+
+    timer_window.prominent_window = prominent_window
+
+    # 添加淡入效果
+    self.fade_window_in(prominent_window, self.current_alpha, 0.2)
+
+    # 启动DPS数据更新（在窗口创建完成后）
+    prominent_window.after(
+        1000, self.ui_governor.wrap(
+            "prominent_dps", lambda: self.update_prominent_dps_data(timer_window)))
+
+    return prominent_window
+
+
+def create_prominent_dps_bars(self, parent_frame, timer_window):
+    """创建明显模式的DPS条区域 - 左侧1/3，紧凑的DPS条"""
+    # DPS容器 - 只占左侧1/3宽度，增加宽度
+    dps_main_container = tk.Frame(
+        parent_frame, bg=self.colors["bg_primary"], width=600)
+    dps_main_container.pack(side="left", fill="y", padx=5, pady=5)
+    dps_main_container.pack_propagate(False)  # 保持固定宽度
+
+    # 上半部分 - 三列布局，固定高度比例
+    top_container = tk.Frame(
+        dps_main_container, bg=self.colors["bg_primary"], height=200)
+    top_container.pack(fill="x", pady=(0, 2))
+    top_container.pack_propagate(False)
+
+    # 下半部分 - 三列布局，填充剩余空间
+    bottom_container = tk.Frame(
+        dps_main_container, bg=self.colors["bg_primary"])
+    bottom_container.pack(fill="both", expand=True, pady=(2, 0))
+
+    # 上半部分分成三列：个人DPS + 1-2名 + 3-4名
+    top_container.grid_columnconfigure(0, weight=41)  # 个人DPS区域稍微大一点点
+    top_container.grid_columnconfigure(1, weight=40)
+    top_container.grid_columnconfigure(2, weight=40)
+    top_container.grid_rowconfigure(0, weight=1)
+
+    # 左上：个人DPS区域
+    self_dps_frame = tk.Frame(top_container, bg=self.colors["bg_secondary"],
+                              relief="solid", bd=1)
+    self_dps_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 2))
+
+    # 中上：1-2名区域
+    top_center_frame = tk.Frame(top_container, bg=self.colors["bg_accent"],
+                                relief="solid", bd=1)
+    top_center_frame.grid(row=0, column=1, sticky="nsew", padx=(2, 2))
+
+    # 右上：3-4名区域（原来的1-2名位置）
+    top_right_frame = tk.Frame(top_container, bg=self.colors["bg_accent"],
+                               relief="solid", bd=1)
+    top_right_frame.grid(row=0, column=2, sticky="nsew", padx=(2, 0))
+
+    # 下半部分分成三列：5-6名 + 7-8名 + 9-10名
+    bottom_container.grid_columnconfigure(0, weight=1)
+    bottom_container.grid_columnconfigure(1, weight=1)
+    bottom_container.grid_columnconfigure(2, weight=1)
+    bottom_container.grid_rowconfigure(0, weight=1)
+
+    # 左下：5-6名区域（原来的5-6名位置）
+    bottom_left_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
+                                 relief="solid", bd=1)
+    bottom_left_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 2))
+
+    # 中下：7-8名区域（原来的右下位置）
+    bottom_center_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
+                                   relief="solid", bd=1)
+    bottom_center_frame.grid(row=0, column=1, sticky="nsew", padx=(2, 2))
+
+    # 右下：9-10名区域（新增）
+    bottom_right_frame = tk.Frame(bottom_container, bg=self.colors["bg_accent"],
+                                  relief="solid", bd=1)
+    bottom_right_frame.grid(row=0, column=2, sticky="nsew", padx=(2, 0))
+
+    # 存储引用
+    timer_window.prominent_self_dps_frame = self_dps_frame
+    timer_window.prominent_top_center_frame = top_center_frame      # 1-2名
+    timer_window.prominent_top_right_frame = top_right_frame        # 3-4名
+    timer_window.prominent_bottom_left_frame = bottom_left_frame    # 5-6名
+    timer_window.prominent_bottom_center_frame = bottom_center_frame  # 7-8名
+    timer_window.prominent_bottom_right_frame = bottom_right_frame  # 9-10名
+
+
+def update_prominent_dps_data(self, timer_window):
+    """更新明显模式的DPS数据显示 - 包含最高伤害计算"""
+    if not hasattr(timer_window, 'prominent_window') or not timer_window.prominent_window:
+        print("[DEBUG] prominent_window不存在，停止更新")
+        return
+
+    if not timer_window.prominent_window.winfo_exists():
+        print("[DEBUG] prominent_window已销毁，停止更新")
+        return
+
+    try:
+        print("[DEBUG] 开始更新DPS数据...")
+
+        # 获取实时数据
+        data = None
+        if not self.direct_mode:
+            try:
+                import requests
+                response = requests.get(self.api_url, timeout=1)
+                if response.status_code == 200:
+                    data = response.json()
+                    print(
+                        f"[DEBUG] 从API获取数据成功，用户数: {len(data.get('user', {}))}")
+            except Exception as e:
+                print(f"[DEBUG] API获取失败: {e}")
+
+        if not data:
+            data = (self.current_data if self.current_data else
+                    self.get_direct_data() or {"user": {}})
+            print(f"[DEBUG] 使用备用数据，用户数: {len(data.get('user', {}))}")
+
+        user_data = data.get("user", {})
+        snapshot = self.get_ranked_snapshot(user_data)
+
+        # 最高伤害值作为进度条的100%基准
+        print(
+            f"[DEBUG] 排序后用户数: {len(snapshot)}, 最高伤害: {snapshot.max_damage:,.0f}")
+
+        # 更新自己的DPS条
+        self.update_prominent_self_dps(timer_window, snapshot)
+
+        # 更新前10名DPS条
+        self.update_prominent_top_dps(timer_window, snapshot)
+
+    except Exception as e:
+        print(f"[DEBUG] 更新明显模式DPS数据失败: {e}")
+        import traceback
+        traceback.print_exc()
+
+    # 每2秒更新一次
+    if hasattr(timer_window, 'prominent_window') and timer_window.prominent_window:
+        timer_window.prominent_window.after(
+            int(self.ui_governor.refresh_interval(2000)),
+            self.ui_governor.wrap(
+                "prominent_dps", lambda: self.update_prominent_dps_data(timer_window)))
+
+
+def update_prominent_self_dps(self, timer_window, snapshot):
+    """更新个人DPS条显示 - 紧凑DPS条格式"""
+    if not hasattr(timer_window, 'prominent_self_dps_frame'):
+        print("[DEBUG] prominent_self_dps_frame不存在")
+        return
+
+    leader = snapshot.top(1)
+    max_damage = snapshot.max_damage
+
+    container = timer_window.prominent_self_dps_frame
+
+    # 清除旧的显示
+    for widget in container.winfo_children():
+        widget.destroy()
+
+    # 查找自己的数据
+    self_uid = self.personal_uid
+    self_data = None
+    self_rank = 0
+
+    if self_uid:
+        self_data = snapshot.get(self_uid)
+        self_rank = snapshot.rank_of(self_uid)
+
+    # 如果没有找到个人UID，使用第一名作为示例
+    if not self_data and leader:
+        self_uid, self_data = leader[0]
+        self_rank = 1
+
+    if self_data:
+        display_name = self.get_display_name(self_uid)
+        dps = self_data.get("total_dps", 0)
+        total_damage = self_data.get("total_damage", {}).get("total", 0)
+        total_healing = self_data.get("total_healing", {}).get("total", 0)
+
+        # 创建个人DPS条
+        self.create_miniui_dps_bar(
+            container, display_name, dps, total_damage, self_rank,
+            is_self=True, compact=False, max_damage=max_damage)
+
+        # 添加总治疗和排名信息条
+        info_frame = tk.Frame(
+            container, bg=self.colors["bg_secondary"], height=30)
+        info_frame.pack(fill="x", padx=2, pady=(2, 0))
+        info_frame.pack_propagate(False)
+
+        # 左侧：排名信息（显示总排名）
+        total_players = len(snapshot)
+        rank_label = tk.Label(
+            info_frame,
+            text=f"排名: #{self_rank}/{total_players}  {self.format_rolling_dps(self_uid, (5, 30))}",
+            font=self.get_font(9, "bold"),
+            bg=self.colors["bg_secondary"],
+            fg=self.colors["neon_yellow"],
+            anchor="w"
+        )
+        rank_label.pack(side="left", padx=5, pady=5)
+
+        # 右侧：总治疗
+        healing_text = f"治疗: {total_healing:,.0f}"
+        if total_healing >= 1000000:
+            healing_text = f"治疗: {total_healing/1000000:.1f}M"
+        elif total_healing >= 1000:
+            healing_text = f"治疗: {total_healing/1000:.1f}K"
+
+        healing_label = tk.Label(
+            info_frame,
+            text=healing_text,
+            font=self.get_font(9, "bold"),
+            bg=self.colors["bg_secondary"],
+            fg=self.colors["neon_cyan"],
+            anchor="e"
+        )
+        healing_label.pack(side="right", padx=5, pady=5)
+
+        print(
+            f"[DEBUG] 个人DPS更新: {display_name} - 排名#{self_rank}, DPS:{dps:,.0f}, 治疗:{total_healing:,.0f}")
+    else:
+        # 显示等待个人数据的标签
+        no_data_label = tk.Label(
+            container,
+            text="等待个人数据...",
+            font=self.get_font(9),
+            bg=self.colors["bg_secondary"],
+            fg=self.colors["text_secondary"]
+        )
+        no_data_label.pack(expand=True)
+        print("[DEBUG] 未找到个人DPS数据")
+
+
+def update_prominent_top_dps(self, timer_window, snapshot):
+    """更新前10名其他人DPS条显示 - 新的5盒子布局"""
+    max_damage = snapshot.max_damage
+    # 检查新的5个Frame容器是否存在
+    if not hasattr(timer_window, 'prominent_top_center_frame') or \
+       not hasattr(timer_window, 'prominent_top_right_frame') or \
+       not hasattr(timer_window, 'prominent_bottom_left_frame') or \
+       not hasattr(timer_window, 'prominent_bottom_center_frame') or \
+       not hasattr(timer_window, 'prominent_bottom_right_frame'):
+        print("[DEBUG] DPS容器不存在")
+        return
+
+    # 获取五个Frame容器，按新的排名顺序
+    containers = [
+        timer_window.prominent_top_center_frame,   # 1-2名
+        timer_window.prominent_top_right_frame,    # 3-4名
+        timer_window.prominent_bottom_left_frame,  # 5-6名
+        timer_window.prominent_bottom_center_frame,  # 7-8名
+        timer_window.prominent_bottom_right_frame  # 9-10名
+    ]
+
+    # 清除旧的显示
+    for container in containers:
+        for widget in container.winfo_children():
+            widget.destroy()
+
+    print(f"[DEBUG] 准备显示前10名玩家（新5盒子布局）")
+
+    if not len(snapshot):
+        return
+
+    # 直接取前10名玩家
+    top_players = snapshot.top(10)
+
+    print(f"[DEBUG] 找到{len(top_players)}名玩家数据")
+
+    if not top_players:
+        for container in containers:
+            no_data_label = tk.Label(
+                container,
+                text="暂无数据",
+                font=self.get_font(8),
+                bg=self.colors["bg_accent"],
+                fg=self.colors["text_secondary"]
+            )
+            no_data_label.pack(expand=True)
+        return
+
+    # 分配玩家到五个区域：2人 + 2人 + 2人 + 2人 + 2人
+    player_groups = [
+        top_players[:2],      # 1-2名
+        top_players[2:4],     # 3-4名
+        top_players[4:6],     # 5-6名
+        top_players[6:8],     # 7-8名
+        top_players[8:10]     # 9-10名
+    ]
+
+    for group_idx, (players, container) in enumerate(zip(player_groups, containers)):
+        for idx, (uid, info) in enumerate(players):
+            display_name = self.get_display_name(uid)
+            dps = info.get("total_dps", 0)
+            total_damage = info.get("total_damage", {}).get("total", 0)
+            rank = group_idx * 2 + idx + 1
+
+            # 创建紧凑的DPS条
+            self.create_miniui_dps_bar(
+                container, display_name, dps, total_damage, rank,
+                is_self=False, compact=True, max_damage=max_damage)
+
+            print(f"[DEBUG] 第{rank}名: {display_name} - DPS: {dps:,.0f}")
+
+    print(f"[DEBUG] 前10名玩家DPS更新完成（新5盒子布局），显示{len(top_players)}名")
+
+
+def create_miniui_dps_bar(self, parent, name, dps, total_damage, rank, is_self=False, compact=False, max_damage=None):
+    """创建紧凑的DPS条块 - 类似MINIUI但更紧凑，带有完整进度条"""
+    # 条目容器 - 固定小高度
+    bar_container = tk.Frame(
+        parent, bg=self.colors["bg_primary"], height=28)
+    bar_container.pack(fill="x", padx=2, pady=1)
+    bar_container.pack_propagate(False)
+
+    # 根据排名确定颜色
+    if is_self:
+        text_color = self.colors["neon_yellow"]
+        bar_color = self.colors["neon_yellow"]
+    elif rank == 1:
+        text_color = self.colors["neon_green"]
+        bar_color = self.colors["neon_green"]
+    elif rank == 2:
+        text_color = self.colors["neon_cyan"]
+        bar_color = self.colors["neon_cyan"]
+    elif rank == 3:
+        text_color = self.colors["neon_yellow"]
+        bar_color = self.colors["neon_yellow"]
+    else:
+        text_color = self.colors["text_primary"]
+        bar_color = self.colors["text_secondary"]
+
+    # 上半部分：名字和排名
+    name_frame = tk.Frame(
+        bar_container, bg=self.colors["bg_primary"], height=14)
+    name_frame.pack(fill="x")
+    name_frame.pack_propagate(False)
+
+    rank_name = f"#{rank} {name[:10]}" + ("..." if len(name) > 10 else "")
+    name_label = tk.Label(
+        name_frame,
+        text=rank_name,
+        font=self.get_font(8, "bold"),
+        bg=self.colors["bg_primary"],
+        fg=text_color,
+        anchor="w"
+    )
+    name_label.pack(side="left", pady=1)
+
+    # 总伤害和DPS数值（右侧）
+    # 总伤害
+    damage_text = self.format_damage_number(total_damage)
+
+    damage_label = tk.Label(
+        name_frame,
+        text=damage_text,
+        font=self.get_font(6),
+        bg=self.colors["bg_primary"],
+        fg=text_color,
+        anchor="e"
+    )
+    damage_label.pack(side="right", pady=1, padx=(0, 2))
+
+    # DPS数值
+    dps_text = f"{dps:,.0f}"
+    if dps >= 1000000:
+        dps_text = f"{dps/1000000:.1f}M"
+    elif dps >= 1000:
+        dps_text = f"{dps/1000:.1f}K"
+
+    dps_label = tk.Label(
+        name_frame,
+        text=dps_text,
+        font=self.get_font(7, "normal"),  # 改为normal，让字体变细
+        bg=self.colors["bg_primary"],
+        fg=text_color,
+        anchor="e"
+    )
+    dps_label.pack(side="right", pady=1)
+
+    # 下半部分：进度条
+    progress_frame = tk.Frame(
+        bar_container, bg=self.colors["bg_primary"], height=14)
+    progress_frame.pack(fill="x")
+    progress_frame.pack_propagate(False)
+
+    # 进度条背景
+    progress_bg = tk.Frame(
+        progress_frame, bg=self.colors["bg_secondary"], height=6)
+    progress_bg.pack(fill="x", padx=2, pady=4)
+
+    # 进度条 - 基于最高伤害
+    if max_damage and max_damage > 0 and total_damage > 0:
+        progress_ratio = min(1.0, total_damage / max_damage)
+        if progress_ratio > 0:
+            progress_bar = tk.Frame(progress_bg, bg=bar_color, height=6)
+            progress_bar.place(x=0, y=0, relwidth=progress_ratio, height=6)
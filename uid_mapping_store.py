@@ -0,0 +1,74 @@
+import json
+import os
+
+
+class UidMappingStore:
+    """uid_mapping.json 的导入/导出
+
+    UID映射以玩家目录为准，uid_mapping.json 只作为导入/导出格式：
+    read() 读取文件导入玩家目录，export() 以临时文件 + fsync + 原子替换写出完整快照，
+    signature() 用于判断文件在上次导入/导出后是否被修改过。
+    旧版本追加写的 uid_mapping.journal（及压缩中断留下的 .compacting）仍会在读取时
+    回放到快照之上，下次导出后删除。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self.compacting_path = self.journal_path + ".compacting"
+
+    # ---- 读取 ----
+
+    def read(self, base_path=None):
+        """读取快照（及旧版日志）合并后的映射；base_path 为快照不在写入目录时的备用位置"""
+        mapping = {}
+        snapshot = self.path if os.path.exists(self.path) else base_path
+        if snapshot and os.path.exists(snapshot):
+            with open(snapshot, 'r', encoding='utf-8') as f:
+                mapping = json.load(f)
+        for journal in (self.compacting_path, self.journal_path):
+            self._replay(journal, mapping)
+        return mapping
+
+    def signature(self, base_path=None):
+        """快照和旧版日志文件的 (路径, 修改时间, 大小)，用于判断映射文件是否被修改过"""
+        snapshot = self.path if os.path.exists(self.path) else base_path
+        files = []
+        for path in (snapshot, self.compacting_path, self.journal_path):
+            if path and os.path.exists(path):
+                stat = os.stat(path)
+                files.append([os.path.abspath(path), stat.st_mtime_ns, stat.st_size])
+        return json.dumps(files, ensure_ascii=False)
+
+    @staticmethod
+    def _replay(journal, mapping):
+        if not os.path.exists(journal):
+            return
+        with open(journal, 'r', encoding='utf-8', newline='') as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    # 崩溃时最后一行可能不完整
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("del"):
+                    mapping.pop(record["uid"], None)
+                else:
+                    mapping[record["uid"]] = record["name"]
+
+    # ---- 写入 ----
+
+    def export(self, mapping):
+        """把完整映射写成快照（原子替换），旧版日志一并删除"""
+        data = json.dumps(mapping, ensure_ascii=False, indent=2)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        for journal in (self.compacting_path, self.journal_path):
+            if os.path.exists(journal):
+                os.remove(journal)